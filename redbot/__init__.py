@@ -279,10 +279,21 @@ def _update_logger_class():
     maybe_update_logger_class()
 
 
+def _maybe_enable_startup_profiler():
+    # The flag is checked before the arguments are parsed,
+    # so that the time taken by the imports done until then is recorded too.
+    if "--profile-startup" in _sys.argv:
+        from redbot._startup_profiler import startup_profiler
+
+        startup_profiler.enable()
+
+
 def _early_init():
     # This function replaces logger so we preferrably (though not necessarily) want that to happen
     # before importing anything that calls `logging.getLogger()`, i.e. `asyncio`.
     _update_logger_class()
+    # The startup profiler calls `logging.getLogger()`, so it's enabled after the above.
+    _maybe_enable_startup_profiler()
     _update_event_loop_policy()
     _ensure_no_colorama()
 
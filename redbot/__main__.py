@@ -25,6 +25,7 @@ import rich
 
 import redbot.logging
 from redbot import __version__
+from redbot._startup_profiler import startup_profiler
 from redbot.core.bot import Red, ExitCodes, _NoOwnerSet
 from redbot.core.cli import interactive_config, confirm, parse_cli_flags
 from redbot.setup import get_data_dir, get_name, save_config
@@ -307,10 +308,24 @@ async def run_bot(red: Red, cli_flags: Namespace) -> None:
     interrupt running forever, then trigger our cleanup process, and does not
     need additional handling in this function.
     """
+    startup_profiler.begin("run_bot")
 
     driver_cls = drivers.get_driver_class()
 
-    await driver_cls.initialize(**data_manager.storage_details())
+    storage_details = data_manager.storage_details()
+    if cli_flags.cluster_count > 1:
+        if data_manager.storage_type() != drivers.BackendType.POSTGRES.value:
+            log.critical(
+                "Running the bot in several clusters requires an instance"
+                " using the PostgreSQL backend."
+            )
+            sys.exit(1)
+        # The other clusters write to the same database, so nothing can be cached.
+        cli_flags.no_config_cache = True
+    if cli_flags.no_config_cache:
+        storage_details = {**storage_details, "cache_max_size": 0}
+    with startup_profiler.phase("driver_initialize"):
+        await driver_cls.initialize(**storage_details)
 
     redbot.logging.init_logging(
         level=cli_flags.logging_level,
@@ -482,6 +497,8 @@ def main():
     red = None  # Error handling for users misusing the bot
     cli_flags = parse_cli_flags(sys.argv[1:])
     handle_early_exit_flags(cli_flags)
+    if cli_flags.profile_startup:
+        startup_profiler.enable()
     if cli_flags.edit:
         early_exit_runner(cli_flags, edit_instance)
         return
@@ -0,0 +1,245 @@
+"""Profiler of Red's startup, enabled with the ``--profile-startup`` flag.
+
+It records the wall time of the startup phases, of the import and setup of
+each package, of adding each cog, and of every module import, from as early
+as ``redbot.__main__`` can enable it until the bot is ready. The report is
+written to the logs directory as ``startup_profile.json`` along with a
+human-readable ``startup_profile.txt`` summary.
+
+This module must not import anything from Red, as it's set up before the rest
+of Red is imported.
+"""
+import contextlib
+import importlib.abc
+import json
+import logging
+import platform
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+__all__ = ("StartupProfiler", "startup_profiler")
+
+log = logging.getLogger("red.startup_profiler")
+
+#: How many of the slowest entries of each kind are listed in the summary.
+SUMMARY_SIZE = 15
+
+
+class _TimedLoader:
+    """Wrapper of a module loader which times the execution of the module."""
+
+    def __init__(self, loader: importlib.abc.Loader, profiler: "StartupProfiler") -> None:
+        self._loader = loader
+        self._profiler = profiler
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._loader, name)
+
+    def create_module(self, spec):
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module) -> None:
+        profiler = self._profiler
+        # Time spent importing other modules is excluded from this module's own time.
+        import_stack = profiler._import_stacks.setdefault(threading.get_ident(), [])
+        import_stack.append(0.0)
+        start = time.perf_counter()
+        try:
+            self._loader.exec_module(module)
+        finally:
+            cumulative = time.perf_counter() - start
+            nested = import_stack.pop()
+            if import_stack:
+                import_stack[-1] += cumulative
+            profiler.imports[module.__name__] = {
+                "self": cumulative - nested,
+                "cumulative": cumulative,
+            }
+
+
+class _ImportTimer(importlib.abc.MetaPathFinder):
+    """Finder which wraps the loaders found by the other finders in `_TimedLoader`."""
+
+    def __init__(self, profiler: "StartupProfiler") -> None:
+        self._profiler = profiler
+        self._finding = set()
+
+    def find_spec(self, fullname, path, target=None):
+        if fullname in self._finding:
+            return None
+        self._finding.add(fullname)
+        try:
+            for finder in sys.meta_path:
+                find_spec = getattr(finder, "find_spec", None)
+                if finder is self or find_spec is None:
+                    continue
+                spec = find_spec(fullname, path, target)
+                if spec is not None:
+                    break
+            else:
+                return None
+        finally:
+            self._finding.discard(fullname)
+        if getattr(spec.loader, "exec_module", None) is not None:
+            spec.loader = _TimedLoader(spec.loader, self._profiler)
+        return spec
+
+
+class StartupProfiler:
+    """Recorder of the time the steps of the startup take.
+
+    All of the methods do nothing until the profiler is enabled.
+
+    Attributes
+    ----------
+    enabled : bool
+        Whether the profiler is recording.
+    phases : List[Dict[str, Any]]
+        The recorded phases, in the order they started, with their ``name``,
+        ``depth`` (how many phases were running when they started), ``start``
+        (relative to the start of the profiler) and ``duration``, in seconds.
+    packages : Dict[str, Dict[str, float]]
+        The ``import`` and ``setup`` time of each loaded package.
+    cogs : Dict[str, float]
+        The time taken to add each cog, which is mostly spent in ``cog_load()``.
+    imports : Dict[str, Dict[str, float]]
+        The ``self`` and ``cumulative`` import time of each imported module.
+    """
+
+    def __init__(self) -> None:
+        self.enabled = False
+        self.phases: List[Dict[str, Any]] = []
+        self.packages: Dict[str, Dict[str, float]] = {}
+        self.cogs: Dict[str, float] = {}
+        self.imports: Dict[str, Dict[str, float]] = {}
+        self._origin = time.perf_counter()
+        self._started_at = time.time()
+        self._open_phases: Dict[str, Dict[str, Any]] = {}
+        self._import_stacks: Dict[int, List[float]] = {}
+        self._import_timer: Optional[_ImportTimer] = None
+
+    def enable(self) -> None:
+        """Start recording, including the time taken by the imports from now on."""
+        if self.enabled:
+            return
+        self.enabled = True
+        self._import_timer = _ImportTimer(self)
+        sys.meta_path.insert(0, self._import_timer)
+
+    def _now(self) -> float:
+        return time.perf_counter() - self._origin
+
+    def begin(self, name: str) -> None:
+        """Mark the start of a phase."""
+        if not self.enabled or name in self._open_phases:
+            return
+        phase = {"name": name, "depth": len(self._open_phases), "start": self._now()}
+        self._open_phases[name] = phase
+        self.phases.append(phase)
+
+    def end(self, name: str) -> None:
+        """Mark the end of a phase, if it was started."""
+        phase = self._open_phases.pop(name, None)
+        if phase is not None:
+            phase["duration"] = self._now() - phase["start"]
+
+    @contextlib.contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Record the time spent in the ``with`` block as a phase."""
+        self.begin(name)
+        try:
+            yield
+        finally:
+            self.end(name)
+
+    def record_package(self, package: str, step: str, duration: float) -> None:
+        """Record the time a step of loading a package took."""
+        if self.enabled:
+            self.packages.setdefault(package, {})[step] = duration
+
+    def record_cog(self, cog_name: str, duration: float) -> None:
+        """Record the time adding a cog took."""
+        if self.enabled:
+            self.cogs[cog_name] = duration
+
+    def to_dict(self) -> Dict[str, Any]:
+        from redbot import __version__
+
+        return {
+            "red_version": __version__,
+            "python_version": platform.python_version(),
+            "started_at": self._started_at,
+            "time_to_ready": self._now(),
+            "phases": self.phases,
+            "packages": self.packages,
+            "cogs": self.cogs,
+            "imports": self.imports,
+        }
+
+    def finish(self, location: Path) -> None:
+        """Stop recording and write the report to the given directory.
+
+        Phases which are still running are ended first.
+        """
+        if not self.enabled:
+            return
+        for name in list(self._open_phases):
+            self.end(name)
+        self.enabled = False
+        with contextlib.suppress(ValueError):
+            sys.meta_path.remove(self._import_timer)
+
+        report = self.to_dict()
+        summary = _format_summary(report)
+        try:
+            location.mkdir(parents=True, exist_ok=True)
+            with (location / "startup_profile.json").open("w", encoding="utf-8") as fp:
+                json.dump(report, fp, indent=4)
+            (location / "startup_profile.txt").write_text(summary, encoding="utf-8")
+        except OSError:
+            log.exception("Failed to write the startup profile to %s", location)
+        log.info("Startup profile:\n%s", summary)
+
+
+def _format_summary(report: Dict[str, Any]) -> str:
+    lines = [
+        f"Red {report['red_version']} on Python {report['python_version']},"
+        f" ready after {report['time_to_ready']:.3f}s",
+        "",
+        "Phases:",
+    ]
+    for phase in report["phases"]:
+        name = "  " * phase["depth"] + phase["name"]
+        lines.append(f"  {name:<40} {phase['start']:>9.3f}s +{phase['duration']:.3f}s")
+
+    packages = sorted(
+        report["packages"].items(), key=lambda item: sum(item[1].values()), reverse=True
+    )
+    lines += ["", "Slowest packages (import, setup):"]
+    for package, steps in packages[:SUMMARY_SIZE]:
+        lines.append(
+            f"  {package:<40} {steps.get('import', 0):>9.3f}s {steps.get('setup', 0):>9.3f}s"
+        )
+
+    cogs = sorted(report["cogs"].items(), key=lambda item: item[1], reverse=True)
+    lines += ["", "Slowest cogs to add (cog_load):"]
+    for cog_name, duration in cogs[:SUMMARY_SIZE]:
+        lines.append(f"  {cog_name:<40} {duration:>9.3f}s")
+
+    imports = sorted(report["imports"].items(), key=lambda item: item[1]["self"], reverse=True)
+    redbot_imports = [item for item in imports if item[0].partition(".")[0] == "redbot"]
+    other_imports = [item for item in imports if item[0].partition(".")[0] != "redbot"]
+    for title, entries in (
+        ("Slowest imports of Red modules (self, cumulative):", redbot_imports),
+        ("Slowest imports of other modules (self, cumulative):", other_imports),
+    ):
+        lines += ["", title]
+        for name, times in entries[:SUMMARY_SIZE]:
+            lines.append(f"  {name:<40} {times['self']:>9.3f}s {times['cumulative']:>9.3f}s")
+    return "\n".join(lines) + "\n"
+
+
+startup_profiler = StartupProfiler()
@@ -135,19 +135,17 @@ class Alias(commands.Cog):
     async def get_prefix(self, message: discord.Message) -> str:
         """
         Tries to determine what prefix is used in a message object.
-            Looks to identify from longest prefix to smallest.
+            Uses the same prefix as the bot, which has usually parsed
+            the message already, so the prefixes aren't resolved again.
 
             Will raise ValueError if no prefix is found.
         :param message: Message object
         :return:
         """
-        content = message.content
-        prefix_list = await self.bot.command_prefix(self.bot, message)
-        prefixes = sorted(prefix_list, key=lambda pfx: len(pfx), reverse=True)
-        for p in prefixes:
-            if content.startswith(p):
-                return p
-        raise ValueError("No prefix found.")
+        ctx = await self.bot.get_context(message)
+        if ctx.prefix is None:
+            raise ValueError("No prefix found.")
+        return ctx.prefix
 
     async def call_alias(self, message: discord.Message, prefix: str, alias: AliasEntry):
         new_message = copy(message)
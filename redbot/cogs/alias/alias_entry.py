@@ -119,8 +119,7 @@ class AliasCache:
         for alias in await self.config.entries():
             self._aliases[None][alias["name"]] = AliasEntry.from_json(alias)
 
-        all_guilds = await self.config.all_guilds()
-        async for guild_id, guild_data in AsyncIter(all_guilds.items(), steps=100):
+        async for guild_id, guild_data in self.config.iter_guilds(batch=100):
             if guild_id not in self._aliases:
                 self._aliases[guild_id] = {}
             for alias in guild_data["entries"]:
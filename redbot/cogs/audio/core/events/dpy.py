@@ -415,6 +415,7 @@ class DpyEvents(MixinMeta, metaclass=CompositeMetaClass):
     async def cog_unload(self) -> None:
         if not self.cog_cleaned_up:
             self.bot.dispatch("red_audio_unload", self)
+            self.bot.metrics.unregister("red_audio_players")
             await self.session.close()
             if self.player_automated_timer_task:
                 self.player_automated_timer_task.cancel()
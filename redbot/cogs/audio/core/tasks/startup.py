@@ -2,7 +2,7 @@ import asyncio
 import itertools
 from pathlib import Path
 
-from typing import Optional
+from typing import Dict, Optional
 
 import lavalink
 from lavalink import NodeNotFound, PlayerNotFound
@@ -29,8 +29,19 @@ class StartUpTasks(MixinMeta, metaclass=CompositeMetaClass):
         # If it waits for ready in startup, we cause a deadlock during initial load
         # as initial load happens before the bot can ever be ready.
         lavalink.set_logging_level(self.bot._cli_flags.logging_level)
+        self.bot.metrics.gauge(
+            "red_audio_players",
+            "Audio players, by whether they're playing.",
+            ["state"],
+            function=self._player_counts,
+        )
         self.cog_init_task = asyncio.create_task(self.initialize())
 
+    def _player_counts(self) -> Dict[str, int]:
+        total = len(lavalink.all_players())
+        playing = len(lavalink.active_players())
+        return {"playing": playing, "idle": total - playing}
+
     async def initialize(self) -> None:
         await self.bot.wait_until_red_ready()
         # Unlike most cases, we want the cache to exit before migration.
@@ -3,13 +3,14 @@ import re
 import random
 from datetime import datetime, timedelta
 from inspect import Parameter
-from typing import Iterable, List, Mapping, Tuple, Dict, Set, Literal, Union
+from typing import FrozenSet, Iterable, List, Mapping, Tuple, Dict, Set, Literal, Union
 from urllib.parse import quote_plus
 
 import discord
 from fuzzywuzzy import process
 
 from redbot.core import Config, checks, commands
+from redbot.core._cache import BoundedCache
 from redbot.core.i18n import Translator, cog_i18n
 from redbot.core.utils import menus, AsyncIter
 from redbot.core.utils.chat_formatting import box, pagify, escape, humanize_list
@@ -51,12 +52,24 @@ class CommandObj:
         self.config = kwargs.get("config")
         self.bot = kwargs.get("bot")
         self.db = self.config.guild
+        # Guild ID -> names of its custom commands, dropped by `create` and `delete`.
+        self._names: BoundedCache[int, FrozenSet[str]] = BoundedCache(
+            "customcom_names", maxsize=25_000, ttl=6 * 60 * 60
+        )
 
     @staticmethod
     async def get_commands(config) -> dict:
         _commands = await config.commands()
         return {k: v for k, v in _commands.items() if _commands[k]}
 
+    async def get_names(self, guild: discord.Guild) -> FrozenSet[str]:
+        """Get the names of the custom commands of a guild, from the cache if possible."""
+        try:
+            return self._names[guild.id]
+        except KeyError:
+            names = self._names[guild.id] = frozenset(await self.get_commands(self.db(guild)))
+            return names
+
     async def redact_author_ids(self, user_id: int):
         all_guilds = await self.config.all_guilds()
 
@@ -160,6 +173,7 @@ class CommandObj:
             "response": response,
         }
         await self.db(ctx.guild).commands.set_raw(command, value=ccinfo)
+        self._names.pop(ctx.guild.id, None)
 
     async def edit(
         self,
@@ -229,6 +243,7 @@ class CommandObj:
         if not await self.db(ctx.guild).commands.get_raw(command, default=None):
             raise NotFound()
         await self.db(ctx.guild).commands.set_raw(command, value=None)
+        self._names.pop(ctx.guild.id, None)
 
 
 @cog_i18n(_)
@@ -854,7 +869,7 @@ class CustomCommands(commands.Cog):
             A set of all custom command names.
 
         """
-        return set(await CommandObj.get_commands(self.config.guild(guild)))
+        return set(await self.commandobj.get_names(guild))
 
     @staticmethod
     def prepare_command_list(
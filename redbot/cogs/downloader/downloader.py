@@ -212,12 +212,14 @@ class Downloader(commands.Cog):
             The modules to check off.
 
         """
+        cog_names = []
         async with self.config.all() as global_data:
             installed_cogs = global_data["installed_cogs"]
             installed_libraries = global_data["installed_libraries"]
             for module in modules:
                 if module.type == InstallableType.COG:
                     installed = installed_cogs
+                    cog_names.append(module.name)
                 elif module.type == InstallableType.SHARED_LIBRARY:
                     installed = installed_libraries
                 else:
@@ -225,6 +227,9 @@ class Downloader(commands.Cog):
                 module_json = module.to_json()
                 repo_json = installed.setdefault(module.repo_name, {})
                 repo_json[module.name] = module_json
+        for name in cog_names:
+            # The commands of the new version will only be known once it's loaded
+            await self.bot._lazy_packages.invalidate(name)
 
     async def _remove_from_installed(self, modules: Iterable[InstalledModule]) -> None:
         """Remove modules from the saved list
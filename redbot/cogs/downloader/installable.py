@@ -58,6 +58,9 @@ class Installable(RepoJSONMixin):
     required_cogs : `dict`
         In the form :code:`{cog_name : repo_url}`, these are cogs which are
         required for this installation.
+    load_after : `tuple` of `str`
+        Names of the packages which should be loaded before this one,
+        when the bot loads cogs concurrently on startup.
     requirements : `tuple` of `str`
         Required libraries for this installation.
     tags : `tuple` of `str`
@@ -94,6 +97,7 @@ class Installable(RepoJSONMixin):
         self.hidden: bool
         self.disabled: bool
         self.required_cogs: Dict[str, str]  # Cog name -> repo URL
+        self.load_after: Tuple[str, ...]
         self.requirements: Tuple[str, ...]
         self.tags: Tuple[str, ...]
         self.type: InstallableType
@@ -301,12 +301,15 @@ class Economy(commands.Cog):
         if await bank.is_global():  # Role payouts will not be used
 
             # Gets the latest time the user used the command successfully and adds the global payday time
-            next_payday = (
-                await self.config.user(author).next_payday() + await self.config.PAYDAY_TIME()
+            last_payday, payday_time, payday_credits = await self.config.get_many(
+                self.config.user(author).next_payday,
+                self.config.PAYDAY_TIME,
+                self.config.PAYDAY_CREDITS,
             )
+            next_payday = last_payday + payday_time
             if cur_time >= next_payday:
                 try:
-                    await bank.deposit_credits(author, await self.config.PAYDAY_CREDITS())
+                    await bank.deposit_credits(author, payday_credits)
                 except errors.BalanceTooHigh as exc:
                     await bank.set_balance(author, exc.max_balance)
                     await ctx.send(
@@ -332,7 +335,7 @@ class Economy(commands.Cog):
                     ).format(
                         author=author,
                         currency=credits_name,
-                        amount=humanize_number(await self.config.PAYDAY_CREDITS()),
+                        amount=humanize_number(payday_credits),
                         new_balance=humanize_number(await bank.get_balance(author)),
                         pos=humanize_number(pos) if pos else pos,
                     )
@@ -347,18 +350,17 @@ class Economy(commands.Cog):
                 )
         else:
             # Gets the users latest successfully payday and adds the guilds payday time
-            next_payday = (
-                await self.config.member(author).next_payday()
-                + await self.config.guild(guild).PAYDAY_TIME()
+            last_payday, payday_time = await self.config.get_many(
+                self.config.member(author).next_payday, self.config.guild(guild).PAYDAY_TIME
             )
+            next_payday = last_payday + payday_time
             if cur_time >= next_payday:
-                credit_amount = await self.config.guild(guild).PAYDAY_CREDITS()
-                for role in author.roles:
-                    role_credits = await self.config.role(
-                        role
-                    ).PAYDAY_CREDITS()  # Nice variable name
-                    if role_credits > credit_amount:
-                        credit_amount = role_credits
+                # The guild's payday credits, followed by those of each of the author's roles
+                credit_amounts = await self.config.get_many(
+                    self.config.guild(guild).PAYDAY_CREDITS,
+                    *(self.config.role(role).PAYDAY_CREDITS for role in author.roles),
+                )
+                credit_amount = max(credit_amounts)
                 try:
                     await bank.deposit_credits(author, credit_amount)
                 except errors.BalanceTooHigh as exc:
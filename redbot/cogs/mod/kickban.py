@@ -7,7 +7,6 @@ from typing import Dict, List, Optional, Tuple, Union
 import discord
 from redbot.core import commands, i18n, checks, modlog
 from redbot.core.commands import UserInputOptional, RawUserIdConverter
-from redbot.core.utils import AsyncIter
 from redbot.core.utils.chat_formatting import (
     pagify,
     humanize_number,
@@ -231,8 +230,7 @@ class KickBanMixin(MixinMeta):
             await asyncio.sleep(60)
 
     async def _check_tempban_expirations(self) -> None:
-        guilds_data = await self.config.all_guilds()
-        async for guild_id, guild_data in AsyncIter(guilds_data.items(), steps=100):
+        async for guild_id, guild_data in self.config.iter_guilds(batch=100):
             if not (guild := self.bot.get_guild(guild_id)):
                 continue
             if guild.unavailable or not guild.me.guild_permissions.ban_members:
@@ -0,0 +1,196 @@
+"""Bounded in-memory caches.
+
+`BoundedCache` is a mapping which holds at most ``maxsize`` entries,
+evicting the least recently used one to make room for a new one, and
+which can also drop the entries that haven't been used for ``ttl`` seconds.
+It counts its hits, misses, evictions and expirations, which are reported
+by ``[p]debuginfo caches``.
+
+Lookups with ``cache[key]`` (and `get()`) are the ones counted as hits or
+misses and the ones which mark an entry as recently used. Membership tests,
+iteration and `items()` don't touch the statistics or the order of the
+entries, and iterate over a snapshot, so the cache can be changed while
+iterating over it.
+"""
+import sys
+import time
+from collections import OrderedDict
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    Iterator,
+    List,
+    MutableMapping,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+
+__all__ = ("BoundedCache",)
+
+_KT = TypeVar("_KT", bound=Hashable)
+_VT = TypeVar("_VT")
+
+
+def _approximate_size(obj: Any) -> int:
+    size = sys.getsizeof(obj)
+    if isinstance(obj, (tuple, list, set, frozenset)):
+        size += sum(sys.getsizeof(item) for item in obj)
+    return size
+
+
+class BoundedCache(MutableMapping[_KT, _VT]):
+    """A mapping with LRU eviction, an optional idle TTL and hit/miss counters.
+
+    Parameters
+    ----------
+    name : str
+        The name of the cache, as shown in reports.
+    maxsize : int
+        The maximum number of entries.
+    ttl : Optional[float]
+        If given, entries which haven't been looked up or set
+        for this many seconds are dropped.
+    clock : Callable[[], float]
+        The function giving the current time, in seconds, for the TTL.
+        Defaults to `time.monotonic`.
+
+    Attributes
+    ----------
+    hits : int
+        How many lookups found their key.
+    misses : int
+        How many lookups didn't find their key.
+    evictions : int
+        How many entries were dropped to make room for new ones.
+    expirations : int
+        How many entries were dropped because they weren't used for ``ttl`` seconds.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        maxsize: int,
+        ttl: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self.name = name
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._clock = clock
+        # key -> (value, time of last use), in the order of last use
+        self._data: "OrderedDict[_KT, Tuple[_VT, float]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def _expire(self) -> None:
+        if self.ttl is None:
+            return
+        # Entries are ordered by their last use, so the expired ones are at the front.
+        deadline = self._clock() - self.ttl
+        data = self._data
+        while data:
+            key, (_, last_used) = next(iter(data.items()))
+            if last_used > deadline:
+                break
+            del data[key]
+            self.expirations += 1
+
+    def __getitem__(self, key: _KT) -> _VT:
+        self._expire()
+        try:
+            value, _ = self._data[key]
+        except KeyError:
+            self.misses += 1
+            raise
+        self.hits += 1
+        if self.ttl is not None:
+            self._data[key] = (value, self._clock())
+        self._data.move_to_end(key)
+        return value
+
+    def __setitem__(self, key: _KT, value: _VT) -> None:
+        self._expire()
+        data = self._data
+        data[key] = (value, self._clock() if self.ttl is not None else 0.0)
+        data.move_to_end(key)
+        while len(data) > self.maxsize:
+            data.popitem(last=False)
+            self.evictions += 1
+
+    def __delitem__(self, key: _KT) -> None:
+        del self._data[key]
+
+    def __contains__(self, key: object) -> bool:
+        self._expire()
+        return key in self._data
+
+    def __iter__(self) -> Iterator[_KT]:
+        self._expire()
+        return iter(list(self._data))
+
+    def __len__(self) -> int:
+        self._expire()
+        return len(self._data)
+
+    def pop(self, key: _KT, *args: Any) -> _VT:
+        try:
+            value, _ = self._data.pop(key)
+        except KeyError:
+            if args:
+                return args[0]
+            raise
+        return value
+
+    def items(self) -> List[Tuple[_KT, _VT]]:
+        self._expire()
+        return [(key, value) for key, (value, _) in self._data.items()]
+
+    def values(self) -> List[_VT]:
+        self._expire()
+        return [value for value, _ in self._data.values()]
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    def reset_stats(self) -> None:
+        """Reset the hit, miss, eviction and expiration counters."""
+        self.hits = self.misses = self.evictions = self.expirations = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """The fraction of lookups which found their key, or 0 if there were none."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def approximate_size(self) -> int:
+        """Get an estimate of the memory used by the entries, in bytes.
+
+        This goes over every entry, so it's meant for reports, not hot paths.
+        """
+        self._expire()
+        return sys.getsizeof(self._data) + sum(
+            _approximate_size(key) + _approximate_size(value)
+            for key, (value, _) in self._data.items()
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "entries": len(self),
+            "maxsize": self.maxsize,
+            "ttl": self.ttl,
+            "approximate_bytes": self.approximate_size(),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hit_rate,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+        }
@@ -0,0 +1,167 @@
+"""Running the shards of one bot in several processes.
+
+When Red is started with ``--cluster-count N --cluster-id I --shard-count S``,
+the process only runs its share of the ``S`` shards: each of the ``N`` clusters
+gets a contiguous range of shard ids. All clusters share the same instance,
+which has to use the PostgreSQL backend, so that they all see the same data.
+
+What each process keeps in memory, such as the settings caches and the
+loaded packages, is kept in sync over a `ClusterBus`: every cluster listens
+on a Unix socket in the instance's data directory, and the others send it
+a line of JSON for each owner action it should replay, e.g. loading a cog
+or changing a global setting.
+"""
+import asyncio
+import json
+import logging
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set
+
+__all__ = ("ClusterBus", "shard_ids_for_cluster", "shard_id_for_guild")
+
+log = logging.getLogger("red.cluster")
+
+Handler = Callable[[Dict[str, Any]], Awaitable[None]]
+
+
+def shard_ids_for_cluster(shard_count: int, cluster_count: int, cluster_id: int) -> List[int]:
+    """Get the ids of the shards a cluster runs.
+
+    The shards are split in contiguous ranges,
+    the first ``shard_count % cluster_count`` clusters getting one more.
+
+    Parameters
+    ----------
+    shard_count : int
+        The total number of shards.
+    cluster_count : int
+        The number of clusters.
+    cluster_id : int
+        The id of the cluster, between 0 and ``cluster_count - 1``.
+
+    Returns
+    -------
+    List[int]
+        The ids of the cluster's shards.
+
+    Raises
+    ------
+    ValueError
+        If the cluster id is out of range or there are fewer shards than clusters.
+    """
+    if not 0 <= cluster_id < cluster_count:
+        raise ValueError("The cluster id has to be between 0 and the cluster count minus one.")
+    if shard_count < cluster_count:
+        raise ValueError("The shard count can't be lower than the cluster count.")
+    per_cluster, remainder = divmod(shard_count, cluster_count)
+    start = cluster_id * per_cluster + min(cluster_id, remainder)
+    end = start + per_cluster + (cluster_id < remainder)
+    return list(range(start, end))
+
+
+def shard_id_for_guild(guild_id: int, shard_count: int) -> int:
+    """Get the id of the shard Discord sends the events of a guild to."""
+    return (guild_id >> 22) % shard_count
+
+
+class ClusterBus:
+    """A channel between the clusters of a bot, over Unix sockets.
+
+    Messages are fire-and-forget: a cluster which isn't running
+    when a message is sent doesn't get it, which is fine as it
+    reads everything from the shared Config on startup.
+
+    Parameters
+    ----------
+    socket_dir : Path
+        The directory holding the sockets of all the clusters.
+    cluster_id : int
+        The id of this cluster.
+    cluster_count : int
+        The number of clusters.
+    """
+
+    def __init__(self, socket_dir: Path, cluster_id: int, cluster_count: int) -> None:
+        self.socket_dir = socket_dir
+        self.cluster_id = cluster_id
+        self.cluster_count = cluster_count
+        self._handlers: Dict[str, Handler] = {}
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._pending: Set[asyncio.Task] = set()
+
+    def _socket_path(self, cluster_id: int) -> Path:
+        return self.socket_dir / f"cluster-{cluster_id}.sock"
+
+    def add_handler(self, event: str, handler: Handler) -> None:
+        """Set the coroutine function handling the messages of an event."""
+        self._handlers[event] = handler
+
+    async def start(self) -> None:
+        """Start listening for the messages of the other clusters."""
+        self.socket_dir.mkdir(parents=True, exist_ok=True)
+        path = self._socket_path(self.cluster_id)
+        # A socket left behind by a process which didn't exit cleanly.
+        path.unlink(missing_ok=True)
+        self._server = await asyncio.start_unix_server(self._handle_connection, path=str(path))
+
+    async def stop(self) -> None:
+        """Stop listening and wait for the messages being sent."""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+            self._socket_path(self.cluster_id).unlink(missing_ok=True)
+        if self._pending:
+            await asyncio.gather(*self._pending, return_exceptions=True)
+
+    async def broadcast(self, event: str, payload: Dict[str, Any]) -> None:
+        """Send a message to all of the other clusters."""
+        message = json.dumps({"event": event, "origin": self.cluster_id, "payload": payload})
+        await asyncio.gather(
+            *(
+                self._send(cluster_id, message.encode() + b"\n")
+                for cluster_id in range(self.cluster_count)
+                if cluster_id != self.cluster_id
+            )
+        )
+
+    def broadcast_soon(self, event: str, payload: Dict[str, Any]) -> None:
+        """Send a message to all of the other clusters without waiting for it to be sent."""
+        task = asyncio.create_task(self.broadcast(event, payload))
+        self._pending.add(task)
+        task.add_done_callback(self._pending.discard)
+
+    async def _send(self, cluster_id: int, data: bytes) -> None:
+        try:
+            _reader, writer = await asyncio.open_unix_connection(
+                str(self._socket_path(cluster_id))
+            )
+        except (FileNotFoundError, ConnectionRefusedError):
+            log.debug("Cluster %s isn't running, not sending it the message.", cluster_id)
+            return
+        try:
+            writer.write(data)
+            await writer.drain()
+        except OSError:
+            log.warning("Failed to send a message to cluster %s.", cluster_id, exc_info=True)
+        finally:
+            writer.close()
+
+    async def _handle_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        try:
+            async for line in reader:
+                try:
+                    message = json.loads(line)
+                    handler = self._handlers[message["event"]]
+                except (ValueError, KeyError):
+                    log.warning("Ignoring an invalid message from another cluster: %r", line)
+                    continue
+                log.debug("Received %s from cluster %s.", message["event"], message.get("origin"))
+                try:
+                    await handler(message["payload"])
+                except Exception:
+                    log.exception("Failed to handle %s from another cluster.", message["event"])
+        finally:
+            writer.close()
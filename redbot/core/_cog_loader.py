@@ -0,0 +1,148 @@
+"""Concurrent loading of packages at startup.
+
+Packages are loaded as soon as the packages they should be loaded after
+have finished loading, with at most a given number of them loading at
+the same time. A package declares those with the ``load_after`` key of
+its ``info.json``, which is only an ordering hint: a package is still
+loaded if one of them failed to load or isn't being loaded at all.
+"""
+import asyncio
+import json
+import logging
+import time
+from importlib.machinery import ModuleSpec
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+import rich
+from rich import box
+from rich.table import Table
+
+if TYPE_CHECKING:
+    from .bot import Red
+
+__all__ = ("load_packages_concurrently",)
+
+log = logging.getLogger("red")
+
+
+def get_load_after(spec: ModuleSpec) -> Tuple[str, ...]:
+    """Get the packages which should be loaded before the given package."""
+    if not spec.origin:
+        return ()
+    info_file = Path(spec.origin).parent / "info.json"
+    try:
+        with info_file.open(encoding="utf-8") as fp:
+            info = json.load(fp)
+    except FileNotFoundError:
+        return ()
+    except (OSError, ValueError):
+        log.warning(
+            "Invalid info.json file for package %s, ignoring its load_after key.", spec.name
+        )
+        return ()
+    load_after = info.get("load_after", []) if isinstance(info, dict) else []
+    if not isinstance(load_after, list) or not all(isinstance(p, str) for p in load_after):
+        log.warning("Invalid load_after key in info.json of package %s, ignoring it.", spec.name)
+        return ()
+    return tuple(load_after)
+
+
+def _break_cycles(dependencies: Dict[str, List[str]]) -> None:
+    # Kahn's algorithm: whatever can't be ordered is part of, or depends on, a cycle.
+    remaining = {package: set(deps) for package, deps in dependencies.items()}
+    ready = [package for package, deps in remaining.items() if not deps]
+    while ready:
+        done = ready.pop()
+        del remaining[done]
+        for package, deps in remaining.items():
+            if done in deps:
+                deps.discard(done)
+                if not deps:
+                    ready.append(package)
+    if remaining:
+        log.warning(
+            "The load_after keys of these packages can't be honoured because of a cycle,"
+            " they will be loaded in any order: %s",
+            ", ".join(sorted(remaining)),
+        )
+        for package in remaining:
+            dependencies[package] = [p for p in dependencies[package] if p not in remaining]
+
+
+async def load_packages_concurrently(bot: "Red", packages: List[str], workers: int) -> List[str]:
+    """Load packages, up to ``workers`` at a time.
+
+    Permissions are loaded before any other package,
+    and a table of the time each package took to load is printed afterwards.
+
+    Parameters
+    ----------
+    bot : Red
+        The bot to load the packages into.
+    packages : List[str]
+        The names of the packages to load.
+    workers : int
+        The maximum number of packages to load at the same time.
+
+    Returns
+    -------
+    List[str]
+        The names of the packages which failed to load.
+    """
+    specs: Dict[str, Optional[ModuleSpec]] = {}
+    dependencies: Dict[str, List[str]] = {}
+    for package in packages:
+        spec = specs[package] = await bot._find_package_on_startup(package)
+        load_after = get_load_after(spec) if spec is not None else ()
+        dependencies[package] = [p for p in load_after if p in packages and p != package]
+    if "permissions" in dependencies:
+        # Load permissions first, for security reasons
+        dependencies["permissions"] = []
+        for package, deps in dependencies.items():
+            if package != "permissions":
+                deps.append("permissions")
+    _break_cycles(dependencies)
+
+    finished = {package: asyncio.Event() for package in packages}
+    results: Dict[str, Tuple[bool, float]] = {}
+    semaphore = asyncio.Semaphore(workers)
+
+    async def load(package: str) -> None:
+        try:
+            for dependency in dependencies[package]:
+                await finished[dependency].wait()
+            spec = specs[package]
+            if spec is None:
+                results[package] = (False, 0.0)
+                return
+            async with semaphore:
+                start = time.perf_counter()
+                loaded = await bot._load_spec_on_startup(package, spec)
+                results[package] = (loaded, time.perf_counter() - start)
+        finally:
+            finished[package].set()
+
+    start = time.perf_counter()
+    await asyncio.gather(*(load(package) for package in packages))
+    _print_load_times(results, time.perf_counter() - start, workers)
+    return [package for package, (loaded, _) in results.items() if not loaded]
+
+
+def _print_load_times(
+    results: Dict[str, Tuple[bool, float]], total_time: float, workers: int
+) -> None:
+    table = Table(title="Package load times", box=box.MINIMAL)
+    table.add_column("Package", style="red")
+    table.add_column("Status")
+    table.add_column("Load time", justify="right")
+    for package, (loaded, duration) in sorted(
+        results.items(), key=lambda item: item[1][1], reverse=True
+    ):
+        table.add_row(package, "loaded" if loaded else "failed", f"{duration:.3f}s")
+    rich_console = rich.get_console()
+    rich_console.print(table)
+    rich_console.print(
+        f"Loaded packages in {total_time:.3f}s with {workers} workers"
+        f" ({sum(duration for _, duration in results.values()):.3f}s of loading in total)"
+    )
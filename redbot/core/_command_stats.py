@@ -0,0 +1,241 @@
+"""Latency statistics of commands.
+
+Each command invocation is split into phases:
+
+- ``checks``: the global checks, the cog's check and the command's checks;
+- ``permissions``: `Requires.verify`, i.e. the privilege levels, the user
+  permissions and the rules of the Permissions cog;
+- ``conversion``: parsing and converting the arguments, which can include
+  fetching members or messages from Discord;
+- ``callback``: the rest, mostly the command's callback and its hooks.
+
+The last durations of each command are kept, by qualified name, to
+compute rolling percentiles, and invocations which took longer than
+the threshold are logged with their breakdown to ``red.slow_commands``,
+which also has its own log file.
+
+Only the invoked command's own checks and conversion are attributed to
+its phases: the checks a command runs while it's executing, e.g. when
+sending help, are part of its callback.
+"""
+import asyncio
+import contextlib
+import logging
+import time
+from collections import deque
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    ContextManager,
+    Deque,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+)
+
+if TYPE_CHECKING:
+    from .commands import Context
+
+__all__ = ("CommandStats", "CommandStatsCollector", "CommandTrace", "PHASES", "command_stats")
+
+log = logging.getLogger("red.slow_commands")
+
+PHASES: Tuple[str, ...] = ("checks", "permissions", "conversion", "callback")
+#: How many of the last durations of each command are kept for the percentiles.
+WINDOW = 500
+
+
+class CommandTrace:
+    """The phase timings of one command invocation."""
+
+    __slots__ = ("phases", "recording", "task", "timer", "_current_phase")
+
+    def __init__(self, timer: Callable[[], float] = time.perf_counter) -> None:
+        self.phases: Dict[str, float] = dict.fromkeys(PHASES, 0.0)
+        #: Whether the checks and conversion which run now belong to the invocation.
+        self.recording = True
+        self.task = asyncio.current_task()
+        self.timer = timer
+        self._current_phase: Optional[str] = None
+
+
+class _PhaseTimer:
+    __slots__ = ("trace", "phase", "start")
+
+    def __init__(self, trace: CommandTrace, phase: str) -> None:
+        self.trace = trace
+        self.phase = phase
+
+    def __enter__(self) -> None:
+        self.trace._current_phase = self.phase
+        self.start = self.trace.timer()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.trace.phases[self.phase] += self.trace.timer() - self.start
+        self.trace._current_phase = None
+
+
+class CommandStats:
+    """Statistics of one command."""
+
+    __slots__ = ("calls", "failures", "max_duration", "phase_totals", "durations")
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.failures = 0
+        self.max_duration = 0.0
+        self.phase_totals: Dict[str, float] = dict.fromkeys(PHASES, 0.0)
+        self.durations: Deque[float] = deque(maxlen=WINDOW)
+
+    def add(self, duration: float, phases: Dict[str, float], failed: bool) -> None:
+        self.calls += 1
+        self.failures += failed
+        self.max_duration = max(self.max_duration, duration)
+        for phase, phase_duration in phases.items():
+            self.phase_totals[phase] += phase_duration
+        self.durations.append(duration)
+
+    def percentile(self, pct: float) -> float:
+        """Get a percentile of the last durations, using the nearest-rank method."""
+        if not self.durations:
+            return 0.0
+        durations = sorted(self.durations)
+        rank = max(1, -(-len(durations) * pct // 100))
+        return durations[int(rank) - 1]
+
+    def phase_mean(self, phase: str) -> float:
+        return self.phase_totals[phase] / self.calls if self.calls else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "failures": self.failures,
+            "max_duration": self.max_duration,
+            "p50_duration": self.percentile(50),
+            "p95_duration": self.percentile(95),
+            "p99_duration": self.percentile(99),
+            "phase_means": {phase: self.phase_mean(phase) for phase in PHASES},
+        }
+
+
+class CommandStatsCollector:
+    """Per-command latency statistics.
+
+    Parameters
+    ----------
+    timer : Callable[[], float]
+        The function giving the current time, in seconds, for timing the phases.
+        Defaults to `time.perf_counter`.
+
+    Attributes
+    ----------
+    slow_threshold : float
+        How long, in seconds, an invocation can take before it's logged as slow.
+        ``0`` disables the slow command log.
+    started_at : float
+        When the statistics were last reset, as a UNIX timestamp.
+
+    """
+
+    def __init__(self, timer: Callable[[], float] = time.perf_counter) -> None:
+        self.slow_threshold = 5.0
+        self._timer = timer
+        self.started_at = time.time()
+        self._stats: Dict[str, CommandStats] = {}
+
+    def start(self, ctx: "Context") -> CommandTrace:
+        """Start tracing an invocation."""
+        trace = ctx._command_trace = CommandTrace(self._timer)
+        return trace
+
+    @staticmethod
+    def phase(ctx: "Context", phase: str) -> ContextManager[None]:
+        """Time a phase of the invocation the context is for.
+
+        Nothing is recorded when the context isn't being traced, when the phase
+        is nested in another one, or when the code runs after the invocation's
+        checks and conversion, e.g. in its callback or in another task.
+        """
+        trace = getattr(ctx, "_command_trace", None)
+        if (
+            trace is None
+            or not trace.recording
+            or trace._current_phase is not None
+            or trace.task is not asyncio.current_task()
+        ):
+            return contextlib.nullcontext()
+        return _PhaseTimer(trace, phase)
+
+    def finish(self, ctx: "Context", trace: CommandTrace, duration: float) -> None:
+        """Record an invocation which has finished.
+
+        Parameters
+        ----------
+        ctx : Context
+            The invocation context, whose command is the invoked subcommand.
+        trace : CommandTrace
+            The value returned by `start`.
+        duration : float
+            How long the invocation took, in seconds.
+
+        """
+        trace.recording = False
+        phases = trace.phases
+        phases["callback"] = max(0.0, duration - sum(phases.values()))
+        name = ctx.command.qualified_name
+        try:
+            stats = self._stats[name]
+        except KeyError:
+            stats = self._stats[name] = CommandStats()
+        stats.add(duration, phases, ctx.command_failed)
+
+        if self.slow_threshold and duration >= self.slow_threshold:
+            log.warning(
+                "%s took %.2fs (%s), invoked by %s in channel %s of guild %s.",
+                name,
+                duration,
+                ", ".join(f"{phase} {phases[phase]:.3f}s" for phase in PHASES),
+                ctx.author.id,
+                ctx.channel.id,
+                ctx.guild.id if ctx.guild is not None else None,
+            )
+
+    def reset(self) -> None:
+        self._stats.clear()
+        self.started_at = time.time()
+
+    def get(self, name: str) -> Optional[CommandStats]:
+        """Get the statistics of a command by qualified name."""
+        return self._stats.get(name)
+
+    def top(self, limit: Optional[int] = None) -> List[Tuple[str, CommandStats]]:
+        """Get the statistics, slowest first.
+
+        Parameters
+        ----------
+        limit : Optional[int]
+            How many entries to return. Defaults to all of them.
+
+        Returns
+        -------
+        List[Tuple[str, CommandStats]]
+            ``(qualified_name, stats)`` tuples, sorted by the 95th percentile
+            of their duration.
+
+        """
+        entries = sorted(
+            self._stats.items(), key=lambda item: item[1].percentile(95), reverse=True
+        )
+        return entries[:limit]
+
+    def to_dict(self, limit: Optional[int] = None) -> Dict[str, Any]:
+        return {
+            "slow_threshold": self.slow_threshold,
+            "started_at": self.started_at,
+            "commands": [{"command": name, **stats.to_dict()} for name, stats in self.top(limit)],
+        }
+
+
+command_stats = CommandStatsCollector()
@@ -0,0 +1,176 @@
+"""Sampling profiler for Config operations.
+
+When enabled, a random sample of Config reads, writes and clears is
+timed and recorded per cog, category and operation. Unsampled
+operations only pay for a single random number, so a low sample rate
+keeps the overhead negligible. Totals are estimated by weighting each
+sample by the inverse of the sample rate it was taken at.
+"""
+import bisect
+import json
+import random
+import time
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from .drivers import IdentifierData
+
+__all__ = ["ConfigStats", "OpStats", "config_stats"]
+
+#: Upper bounds of the latency histogram buckets, in seconds.
+LATENCY_BUCKETS: Tuple[float, ...] = (
+    0.0001,
+    0.00025,
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    float("inf"),
+)
+
+StatsKey = Tuple[str, str, str]
+
+
+class OpStats:
+    """Statistics of one operation on one category of one cog."""
+
+    __slots__ = ("samples", "estimated_count", "estimated_bytes", "total_time", "histogram")
+
+    def __init__(self) -> None:
+        self.samples = 0
+        self.estimated_count = 0.0
+        self.estimated_bytes = 0.0
+        self.total_time = 0.0
+        self.histogram = [0] * len(LATENCY_BUCKETS)
+
+    def add(self, duration: float, nbytes: int, weight: float) -> None:
+        self.samples += 1
+        self.estimated_count += weight
+        self.estimated_bytes += nbytes * weight
+        self.total_time += duration
+        self.histogram[bisect.bisect_left(LATENCY_BUCKETS, duration)] += 1
+
+    def percentile(self, pct: float) -> float:
+        """Get the upper bound of the bucket holding the given latency percentile."""
+        threshold = self.samples * pct / 100
+        seen = 0
+        for bound, count in zip(LATENCY_BUCKETS, self.histogram):
+            seen += count
+            if count and seen >= threshold:
+                return bound
+        return 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "samples": self.samples,
+            "estimated_count": round(self.estimated_count),
+            "estimated_bytes": round(self.estimated_bytes),
+            "mean_latency": self.total_time / self.samples if self.samples else 0.0,
+            "p50_latency": self.percentile(50),
+            "p95_latency": self.percentile(95),
+            "p99_latency": self.percentile(99),
+            "histogram": dict(zip(map(str, LATENCY_BUCKETS), self.histogram)),
+        }
+
+
+class ConfigStats:
+    """Per-cog statistics of Config operations.
+
+    Attributes
+    ----------
+    sample_rate : float
+        The fraction of operations to record, between 0 and 1.
+        ``0`` disables the profiler.
+    started_at : float
+        When the statistics were last reset, as a UNIX timestamp.
+
+    """
+
+    def __init__(self) -> None:
+        self.sample_rate = 0.0
+        self.started_at = time.time()
+        self._stats: Dict[StatsKey, OpStats] = {}
+
+    def start(self) -> Optional[float]:
+        """Decide whether to sample the operation which is about to run.
+
+        Returns
+        -------
+        Optional[float]
+            The start time to pass to `record`, or ``None`` if the
+            operation should not be sampled.
+
+        """
+        if self.sample_rate and random.random() < self.sample_rate:
+            return time.perf_counter()
+        return None
+
+    def record(self, identifier_data: "IdentifierData", op: str, start: float, data: Any) -> None:
+        """Record a sampled operation.
+
+        Parameters
+        ----------
+        identifier_data : IdentifierData
+            Where the operation was made.
+        op : str
+            The kind of operation, such as ``"get"``.
+        start : float
+            The value returned by `start`.
+        data : Any
+            The data which was read or written, or ``...`` if there was none.
+
+        """
+        duration = time.perf_counter() - start
+        nbytes = 0 if data is ... else len(json.dumps(data, default=repr))
+        key = (identifier_data.cog_name, identifier_data.category or "-", op)
+        try:
+            stats = self._stats[key]
+        except KeyError:
+            stats = self._stats[key] = OpStats()
+        stats.add(duration, nbytes, 1 / self.sample_rate if self.sample_rate else 1.0)
+
+    def reset(self) -> None:
+        self._stats.clear()
+        self.started_at = time.time()
+
+    def top(self, limit: Optional[int] = None) -> List[Tuple[StatsKey, OpStats]]:
+        """Get the statistics, busiest first.
+
+        Parameters
+        ----------
+        limit : Optional[int]
+            How many entries to return. Defaults to all of them.
+
+        Returns
+        -------
+        List[Tuple[Tuple[str, str, str], OpStats]]
+            ``((cog_name, category, op), stats)`` tuples, sorted by the
+            estimated time spent on them.
+
+        """
+        entries = sorted(
+            self._stats.items(),
+            key=lambda item: item[1].total_time / item[1].samples * item[1].estimated_count,
+            reverse=True,
+        )
+        return entries[:limit]
+
+    def to_dict(self, limit: Optional[int] = None) -> Dict[str, Any]:
+        return {
+            "sample_rate": self.sample_rate,
+            "started_at": self.started_at,
+            "operations": [
+                {"cog_name": cog_name, "category": category, "op": op, **stats.to_dict()}
+                for (cog_name, category, op), stats in self.top(limit)
+            ],
+        }
+
+
+config_stats = ConfigStats()
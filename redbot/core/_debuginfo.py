@@ -11,7 +11,7 @@ import pip
 import psutil
 
 from redbot import __version__
-from redbot.core import data_manager
+from redbot.core import data_manager, drivers
 from redbot.core.bot import Red
 from redbot.core.utils.chat_formatting import box
 
@@ -161,6 +161,19 @@ class DebugInfo:
             parts.append(f"Disabled intents: {disabled_intents}")
 
         parts.append(f"Storage type: {data_manager.storage_type()}")
+        if self.bot is not None:
+            cache_stats = drivers.get_driver_class().cache_stats()
+            if cache_stats is not None:
+                parts.append(
+                    "Storage cache: {hits} hits, {misses} misses, {documents} documents"
+                    " ({size}/{max_size})".format(
+                        hits=cache_stats["hits"],
+                        misses=cache_stats["misses"],
+                        documents=cache_stats["documents"],
+                        size=_datasize(cache_stats["size"]),
+                        max_size=_datasize(cache_stats["max_size"]),
+                    )
+                )
         parts.append(f"Data path: {data_manager.basic_config['DATA_PATH']}")
         parts.append(f"Metadata file: {data_manager.config_file}")
 
@@ -0,0 +1,265 @@
+"""Loading of packages on the first use of their commands.
+
+Whenever a package is loaded, a manifest of its top-level commands (names,
+aliases, signatures and help) is saved. When the bot is started with
+``--lazy-cogs``, packages with a manifest aren't loaded on startup; stub
+commands made from the manifest are registered in their place instead.
+The first time one of the stubs is invoked, the package is loaded, which
+replaces the stubs with the real commands, and the message is processed
+again.
+
+Packages which have to run before any of their commands are used, i.e.
+the ones with event listeners, application commands, RPC handlers or
+background loops, never get a manifest and are always loaded on startup.
+"""
+import asyncio
+import inspect
+import logging
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+import discord
+from discord.ext import tasks
+
+from . import commands
+from .i18n import Translator
+
+if TYPE_CHECKING:
+    from types import ModuleType
+
+    from .bot import Red
+
+__all__ = ("LazyCommand", "LazyPackages")
+
+log = logging.getLogger("red.lazy_cogs")
+
+_ = Translator("LazyCogs", __file__)
+
+
+class LazyCommand(commands.Command):
+    """A stub for a top-level command of a package which hasn't been loaded yet.
+
+    Attributes
+    ----------
+    package : str
+        The name of the package providing the real command.
+    lazy_cog_name : Optional[str]
+        The name of the cog the real command belongs to, if any.
+    """
+
+    def __init__(self, *args, package: str, lazy_cog_name: Optional[str], **kwargs):
+        self.package = package
+        self.lazy_cog_name = lazy_cog_name
+        super().__init__(*args, **kwargs)
+
+
+def _belongs_to(module_name: Optional[str], lib: "ModuleType") -> bool:
+    return module_name is not None and (
+        module_name == lib.__name__ or module_name.startswith(lib.__name__ + ".")
+    )
+
+
+def _has_background_loops(cog: commands.Cog) -> bool:
+    return any(
+        isinstance(value, tasks.Loop)
+        for cls in inspect.getmro(type(cog))
+        for value in vars(cls).values()
+    )
+
+
+def build_manifest(bot: "Red", lib: "ModuleType") -> Optional[Dict[str, Any]]:
+    """Build the manifest of a package which has just been loaded.
+
+    Parameters
+    ----------
+    bot : Red
+        The bot the package was loaded into.
+    lib : ModuleType
+        The package's module.
+
+    Returns
+    -------
+    Optional[Dict[str, Any]]
+        The manifest, or ``None`` if the package has to be loaded on startup.
+    """
+    cogs = [cog for cog in bot.cogs.values() if _belongs_to(type(cog).__module__, lib)]
+    for cog in cogs:
+        if (
+            cog.__cog_app_commands__
+            or cog.__cog_is_app_commands_group__
+            or bot.rpc_handlers.get(cog.__cog_name__.upper())
+            or _has_background_loops(cog)
+        ):
+            return None
+    for listeners in bot.extra_events.values():
+        if any(_belongs_to(getattr(listener, "__module__", None), lib) for listener in listeners):
+            return None
+    if any(_belongs_to(command.module, lib) for command in bot.tree.walk_commands()):
+        return None
+
+    entries = []
+    for command in bot.commands:
+        if not _belongs_to(command.module, lib):
+            continue
+        if isinstance(command, (commands.HybridCommand, commands.HybridGroup)):
+            return None
+        requires = command.requires
+        entries.append(
+            {
+                "name": command.name,
+                "aliases": list(command.aliases),
+                "signature": command.signature,
+                "help": command.help,
+                "brief": command.short_doc,
+                "hidden": command.hidden,
+                "cog_name": command.cog_name,
+                "privilege_level": (
+                    requires.privilege_level.name if requires.privilege_level is not None else None
+                ),
+                "user_perms": (
+                    requires.user_perms.value if requires.user_perms is not None else None
+                ),
+            }
+        )
+    if not entries:
+        return None
+    return {"commands": entries}
+
+
+class LazyPackages:
+    """Keeps track of the packages which are only loaded once their commands are used."""
+
+    def __init__(self, bot: "Red"):
+        self._bot = bot
+        self._config = bot._config
+        self._stubs: Dict[str, List[LazyCommand]] = {}
+        self._locks: Dict[str, asyncio.Lock] = {}
+
+    def is_lazy(self, package: str) -> bool:
+        """Whether the package is waiting for one of its commands to be used to be loaded."""
+        return package in self._stubs
+
+    def get_packages(self) -> List[str]:
+        """Get the names of the packages which are waiting to be loaded."""
+        return list(self._stubs)
+
+    def get_commands_by_cog(self) -> Dict[str, List[LazyCommand]]:
+        """Get the stub commands of the cogs which haven't been loaded yet, by cog name."""
+        by_cog: Dict[str, List[LazyCommand]] = {}
+        for stubs in self._stubs.values():
+            for stub in stubs:
+                if stub.lazy_cog_name is not None:
+                    by_cog.setdefault(stub.lazy_cog_name, []).append(stub)
+        return by_cog
+
+    async def save_manifest(self, package: str, lib: "ModuleType") -> None:
+        """Save the manifest of a package which has just been loaded."""
+        try:
+            manifest = build_manifest(self._bot, lib)
+        except Exception:
+            log.exception("Failed to build the command manifest of package %s", package)
+            manifest = None
+        async with self._config.command_manifests() as manifests:
+            if manifest is None:
+                manifests.pop(package, None)
+            else:
+                manifests[package] = manifest
+
+    async def invalidate(self, package: str) -> None:
+        """Forget the manifest of a package, so that it's loaded on the next startup."""
+        await self._config.command_manifests.clear_raw(package)
+
+    async def add_stubs(self, package: str) -> bool:
+        """Register the stub commands of a package instead of loading it.
+
+        Returns
+        -------
+        bool
+            Whether the stubs were registered. If they weren't,
+            the package should be loaded right away.
+        """
+        try:
+            manifest = await self._config.command_manifests.get_raw(package)
+        except KeyError:
+            return False
+        if any(
+            self._bot.get_command(name) is not None
+            for entry in manifest["commands"]
+            for name in (entry["name"], *entry["aliases"])
+        ):
+            log.warning(
+                "The commands of package %s conflict with loaded commands,"
+                " it will be loaded right away.",
+                package,
+            )
+            return False
+
+        stubs = self._stubs[package] = []
+        for entry in manifest["commands"]:
+            stub = self._make_stub(package, entry)
+            self._bot.add_command(stub)
+            stubs.append(stub)
+        return True
+
+    def remove_stubs(self, package: str) -> None:
+        """Remove the stub commands of a package, if it has any."""
+        for stub in self._stubs.pop(package, ()):
+            if self._bot.all_commands.get(stub.name) is stub:
+                self._bot.remove_command(stub.name)
+
+    def _make_stub(self, package: str, entry: Dict[str, Any]) -> LazyCommand:
+        async def callback(ctx: commands.Context) -> None:
+            await self._load_and_reinvoke(ctx, package)
+
+        if entry["privilege_level"] is not None:
+            callback.__requires_privilege_level__ = commands.PrivilegeLevel[
+                entry["privilege_level"]
+            ]
+        if entry["user_perms"] is not None:
+            callback.__requires_user_perms__ = discord.Permissions(entry["user_perms"])
+        return LazyCommand(
+            callback,
+            name=entry["name"],
+            aliases=entry["aliases"],
+            usage=entry["signature"],
+            help_override=entry["help"],
+            brief=entry["brief"],
+            hidden=entry["hidden"],
+            package=package,
+            lazy_cog_name=entry["cog_name"],
+        )
+
+    async def load(self, package: str) -> None:
+        """Load a package which is waiting for one of its commands to be used.
+
+        If the package fails to load, it's removed from the packages
+        loaded on startup and the exception is re-raised.
+        """
+        async with self._locks.setdefault(package, asyncio.Lock()):
+            if not self.is_lazy(package):
+                return
+            try:
+                spec = await self._bot._cog_mgr.find_cog(package)
+                if spec is None:
+                    raise RuntimeError(f"package {package} was not found in any cog path")
+                await self._bot.load_extension(spec)
+            except Exception:
+                self.remove_stubs(package)
+                await self._bot.remove_loaded_package(package)
+                raise
+
+    async def load_all(self) -> None:
+        """Load all of the packages which are waiting for one of their commands to be used."""
+        for package in self.get_packages():
+            try:
+                await self.load(package)
+            except Exception as e:
+                log.exception("Failed to load package %s", package, exc_info=e)
+
+    async def _load_and_reinvoke(self, ctx: commands.Context, package: str) -> None:
+        try:
+            await self.load(package)
+        except Exception as e:
+            log.exception("Failed to load package %s on first use", package, exc_info=e)
+            await ctx.send(_("This command is currently unavailable, please try again later."))
+            return
+        await self._bot.process_commands(ctx.message)
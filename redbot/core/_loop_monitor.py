@@ -0,0 +1,454 @@
+"""Monitor of the event loop's responsiveness.
+
+A heartbeat task measures how late the loop wakes it up, and a watchdog
+thread captures the loop's stack when the heartbeat is late by more than
+the threshold, so that stalls can be reported along with where they
+happened. Both are cheap, so they always run.
+
+Each step of the event listeners and of the tasks, i.e. the code they run
+between two awaits, holds the event loop, and nothing else can run until
+it's done. When step attribution is enabled, the monitor also times these
+steps and records, per listener and per task, how many times they ran, how
+long they held the loop in total and their longest step, in one-minute
+buckets kept for an hour.
+
+Timing a step costs a couple of ``time.perf_counter()`` calls and a dict
+lookup, plus driving the coroutine from Python rather than from C, so step
+attribution is disabled by default.
+
+Timed tasks are instances of `TimedTask`, whose ``get_coro()`` returns the
+task's own coroutine rather than the wrapper timing it.
+"""
+import asyncio
+import collections
+import logging
+import sys
+import threading
+import time
+import traceback
+import types
+from typing import Any, Callable, Coroutine, Deque, Dict, List, NamedTuple, Optional, Tuple
+
+__all__ = ("CallbackStats", "LagStats", "LoopMonitor", "Stall", "TimedTask", "loop_monitor")
+
+log = logging.getLogger("red.loop_monitor")
+
+#: How often the heartbeat task runs, in seconds.
+HEARTBEAT_INTERVAL = 0.1
+#: How many minutes of statistics are kept.
+MAX_WINDOW = 60
+#: How many stack frames are kept for each stall.
+STACK_LIMIT = 25
+
+#: ``(kind, owner, name)``, e.g. ``("listener", "Alias", "Alias.on_message_without_command")``.
+CallbackKey = Tuple[str, str, str]
+
+
+class CallbackStats:
+    """Statistics of a listener or a task."""
+
+    __slots__ = ("calls", "steps", "busy_time", "max_step")
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.steps = 0
+        self.busy_time = 0.0
+        self.max_step = 0.0
+
+    def merge(self, other: "CallbackStats") -> None:
+        self.calls += other.calls
+        self.steps += other.steps
+        self.busy_time += other.busy_time
+        self.max_step = max(self.max_step, other.max_step)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "steps": self.steps,
+            "busy_time": self.busy_time,
+            "max_step": self.max_step,
+        }
+
+
+class LagStats:
+    """Statistics of how late the event loop ran the heartbeat."""
+
+    __slots__ = ("samples", "total_lag", "max_lag")
+
+    def __init__(self) -> None:
+        self.samples = 0
+        self.total_lag = 0.0
+        self.max_lag = 0.0
+
+    def merge(self, other: "LagStats") -> None:
+        self.samples += other.samples
+        self.total_lag += other.total_lag
+        self.max_lag = max(self.max_lag, other.max_lag)
+
+    @property
+    def mean_lag(self) -> float:
+        return self.total_lag / self.samples if self.samples else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"samples": self.samples, "mean_lag": self.mean_lag, "max_lag": self.max_lag}
+
+
+class Stall(NamedTuple):
+    """A time the event loop was held for longer than the threshold."""
+
+    #: When the stall ended, as a UNIX timestamp.
+    timestamp: float
+    duration: float
+    #: ``None`` if the stall couldn't be attributed to a listener or a task.
+    key: Optional[CallbackKey]
+    #: The stack of the event loop's thread during the stall, if it was captured.
+    stack: Optional[str]
+
+
+@types.coroutine
+def _drive(coro: Coroutine, monitor: "LoopMonitor", key: CallbackKey):
+    # Does what `await coro` does, timing each step of the coroutine.
+    value = None
+    error = None
+    first = True
+    while True:
+        start = monitor._step_started = time.perf_counter()
+        try:
+            if error is None:
+                yielded = coro.send(value)
+            else:
+                yielded = coro.throw(error)
+        except BaseException as e:
+            monitor._record(key, start, time.perf_counter() - start, first)
+            if isinstance(e, StopIteration):
+                return e.value
+            raise
+        monitor._record(key, start, time.perf_counter() - start, first)
+        first = False
+        try:
+            value = yield yielded
+            error = None
+        except GeneratorExit:
+            coro.close()
+            raise
+        except BaseException as e:
+            value = None
+            error = e
+
+
+async def _timed(coro: Coroutine, monitor: "LoopMonitor", key: CallbackKey) -> Any:
+    return await _drive(coro, monitor, key)
+
+
+class TimedTask(asyncio.Task):
+    """A task whose steps are timed by the loop monitor."""
+
+    def __init__(self, coro: Coroutine, *, original_coro: Coroutine, **kwargs: Any) -> None:
+        super().__init__(coro, **kwargs)
+        self._original_coro = original_coro
+
+    def get_coro(self) -> Coroutine:
+        # The coroutine the task was created with, not the wrapper timing it.
+        return self._original_coro
+
+
+def _get_owner(func: Any) -> str:
+    owner = getattr(func, "__self__", None)
+    if owner is not None and hasattr(owner, "qualified_name"):
+        return owner.qualified_name
+    return getattr(func, "__module__", None) or "-"
+
+
+class LoopMonitor:
+    """Monitor of the event loop's lag and, optionally, of the steps of listeners and tasks.
+
+    Attributes
+    ----------
+    threshold : float
+        How long, in seconds, the event loop can be held
+        before it's reported as a stall. Must be positive.
+    stalls : Deque[Stall]
+        The most recent stalls.
+    on_stall : Optional[Callable[[Stall], None]]
+        Called from the event loop's thread for each stall.
+
+    """
+
+    def __init__(self) -> None:
+        self.threshold = 1.0
+        self.stalls: Deque[Stall] = collections.deque(maxlen=20)
+        self.on_stall: Optional[Callable[[Stall], None]] = None
+        self.started_at = time.time()
+        self._running = False
+        self._attributing_steps = False
+        self._callback_buckets: Dict[int, Dict[CallbackKey, CallbackStats]] = {}
+        self._lag_buckets: Dict[int, LagStats] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._previous_task_factory = None
+        self._heartbeat_task: Optional[asyncio.Task] = None
+        self._watchdog: Optional[threading.Thread] = None
+        self._stop_watchdog = threading.Event()
+        self._loop_thread_id = 0
+        self._last_beat = 0.0
+        # When the step of a listener or task which is running started, 0 if none is running
+        self._step_started = 0.0
+        # The stack captured by the watchdog during the stall which hasn't been reported yet
+        self._captured_stack: Optional[str] = None
+        # The heartbeat which was late because of the last stall reported by a listener or task
+        self._reported_beat = 0.0
+
+    @property
+    def running(self) -> bool:
+        return self._running
+
+    @property
+    def attributing_steps(self) -> bool:
+        return self._attributing_steps
+
+    def start(self) -> None:
+        """Start monitoring the running event loop's lag."""
+        if self._running:
+            return
+        self._running = True
+        self._loop = loop = asyncio.get_running_loop()
+        self._loop_thread_id = threading.get_ident()
+        self._last_beat = time.perf_counter()
+        # The heartbeat is created before step attribution can set the task factory,
+        # so that it isn't timed itself.
+        self._heartbeat_task = loop.create_task(self._heartbeat())
+        self._stop_watchdog = threading.Event()
+        self._watchdog = threading.Thread(
+            target=self._watch, args=(self._stop_watchdog,), name="red-loop-monitor", daemon=True
+        )
+        self._watchdog.start()
+
+    def stop(self) -> None:
+        """Stop monitoring the event loop. The statistics are kept."""
+        if not self._running:
+            return
+        self.set_step_attribution(False)
+        self._running = False
+        self._stop_watchdog.set()
+        if self._heartbeat_task is not None:
+            self._heartbeat_task.cancel()
+
+    def set_step_attribution(self, enabled: bool) -> None:
+        """Enable or disable timing each step of the listeners and tasks.
+
+        Parameters
+        ----------
+        enabled : bool
+            Whether to time the steps.
+
+        Raises
+        ------
+        RuntimeError
+            Step attribution was enabled while the monitor isn't running.
+
+        """
+        if enabled == self._attributing_steps:
+            return
+        if enabled:
+            if not self._running:
+                raise RuntimeError("The loop monitor isn't running.")
+            self._previous_task_factory = self._loop.get_task_factory()
+            self._loop.set_task_factory(self._task_factory)
+        elif self._loop.get_task_factory() == self._task_factory:
+            self._loop.set_task_factory(self._previous_task_factory)
+        self._attributing_steps = enabled
+
+    def reset(self) -> None:
+        self._callback_buckets.clear()
+        self._lag_buckets.clear()
+        self.stalls.clear()
+        self.started_at = time.time()
+
+    def time_listener(
+        self, coro: Coroutine, listener: Callable[..., Coroutine], event_name: str
+    ) -> Coroutine:
+        """Time the coroutine running a listener, if step attribution is enabled.
+
+        Parameters
+        ----------
+        coro : Coroutine
+            The coroutine to time.
+        listener : Callable[..., Coroutine]
+            The listener run by the coroutine.
+        event_name : str
+            The name of the event the listener is run for.
+
+        Returns
+        -------
+        Coroutine
+            The coroutine to run instead.
+
+        """
+        if not self._attributing_steps:
+            return coro
+        name = listener.__qualname__
+        if getattr(listener, "__name__", None) != event_name:
+            name = f"{name} ({event_name})"
+        key = ("listener", _get_owner(listener), name)
+        return _timed(coro, self, key)
+
+    def _task_factory(self, loop: asyncio.AbstractEventLoop, coro: Coroutine, **kwargs):
+        if self._previous_task_factory is not None:
+            # Tasks created by another factory aren't timed, as that would change
+            # what their `get_coro()` returns.
+            return self._previous_task_factory(loop, coro, **kwargs)
+        if not asyncio.iscoroutine(coro) or getattr(coro, "cr_code", None) is _timed.__code__:
+            return asyncio.Task(coro, loop=loop, **kwargs)
+        frame = getattr(coro, "cr_frame", None)
+        module = frame.f_globals.get("__name__", "-") if frame is not None else "-"
+        name = getattr(coro, "__qualname__", None) or type(coro).__name__
+        timed = _timed(coro, self, ("task", module, name))
+        return TimedTask(timed, loop=loop, original_coro=coro, **kwargs)
+
+    def _record(self, key: CallbackKey, start: float, duration: float, first: bool) -> None:
+        self._step_started = 0.0
+        bucket = self._callback_buckets.get(int(start // 60))
+        if bucket is None:
+            bucket = self._new_bucket(self._callback_buckets, int(start // 60), dict)
+        stats = bucket.get(key)
+        if stats is None:
+            stats = bucket[key] = CallbackStats()
+        if first:
+            stats.calls += 1
+        stats.steps += 1
+        stats.busy_time += duration
+        if duration > stats.max_step:
+            stats.max_step = duration
+        if duration >= self.threshold:
+            self._report_stall(key, duration)
+
+    @staticmethod
+    def _new_bucket(buckets: Dict[int, Any], minute: int, factory: Callable[[], Any]) -> Any:
+        for old_minute in [m for m in buckets if m <= minute - MAX_WINDOW]:
+            del buckets[old_minute]
+        bucket = buckets[minute] = factory()
+        return bucket
+
+    def _report_stall(self, key: Optional[CallbackKey], duration: float) -> None:
+        stack = self._captured_stack
+        self._captured_stack = None
+        self._reported_beat = self._last_beat
+        stall = Stall(time.time(), duration, key, stack)
+        self.stalls.append(stall)
+        if key is None:
+            log.warning("The event loop was blocked for %.3fs.", duration)
+        else:
+            log.warning(
+                "The %s %s of %s held the event loop for %.3fs.", key[0], key[2], key[1], duration
+            )
+        if stack is not None:
+            log.warning("Stack of the event loop's thread during the stall:\n%s", stack)
+        if self.on_stall is not None:
+            try:
+                self.on_stall(stall)
+            except Exception:
+                log.exception("Failed to handle an event loop stall")
+
+    async def _heartbeat(self) -> None:
+        while True:
+            start = self._last_beat = time.perf_counter()
+            await asyncio.sleep(HEARTBEAT_INTERVAL)
+            lag = max(time.perf_counter() - start - HEARTBEAT_INTERVAL, 0.0)
+            minute = int(start // 60)
+            stats = self._lag_buckets.get(minute)
+            if stats is None:
+                stats = self._new_bucket(self._lag_buckets, minute, LagStats)
+            stats.samples += 1
+            stats.total_lag += lag
+            if lag > stats.max_lag:
+                stats.max_lag = lag
+            if lag >= self.threshold and self._reported_beat != start:
+                # None of the timed listeners and tasks reported it, so it was a plain callback
+                self._report_stall(None, lag)
+            self._captured_stack = None
+
+    def _watch(self, stop: threading.Event) -> None:
+        reported = None
+        while not stop.wait(max(min(self.threshold / 2, HEARTBEAT_INTERVAL), 0.01)):
+            step_started = self._step_started
+            if step_started:
+                blocked_since = step_started
+            else:
+                # Not in a step of a listener or a task, the heartbeat is all we know about
+                blocked_since = self._last_beat + HEARTBEAT_INTERVAL
+            if time.perf_counter() - blocked_since < self.threshold or blocked_since == reported:
+                continue
+            reported = blocked_since
+            frame = sys._current_frames().get(self._loop_thread_id)
+            if frame is not None:
+                self._captured_stack = "".join(traceback.format_stack(frame, limit=STACK_LIMIT))
+
+    def _window(self, minutes: int) -> range:
+        now = int(time.perf_counter() // 60)
+        return range(now - min(minutes, MAX_WINDOW) + 1, now + 1)
+
+    def top(
+        self, minutes: int = 10, limit: Optional[int] = None
+    ) -> List[Tuple[CallbackKey, CallbackStats]]:
+        """Get the listeners and tasks with the longest steps over the last minutes.
+
+        Parameters
+        ----------
+        minutes : int
+            How many of the last minutes to include, at most `MAX_WINDOW`.
+        limit : Optional[int]
+            How many entries to return. Defaults to all of them.
+
+        Returns
+        -------
+        List[Tuple[Tuple[str, str, str], CallbackStats]]
+            ``((kind, owner, name), stats)`` tuples, sorted by their longest step.
+
+        """
+        merged: Dict[CallbackKey, CallbackStats] = {}
+        for minute in self._window(minutes):
+            for key, stats in self._callback_buckets.get(minute, {}).items():
+                try:
+                    merged[key].merge(stats)
+                except KeyError:
+                    merged[key] = CallbackStats()
+                    merged[key].merge(stats)
+        entries = sorted(
+            merged.items(), key=lambda item: (item[1].max_step, item[1].busy_time), reverse=True
+        )
+        return entries[:limit]
+
+    def lag(self, minutes: int = 10) -> LagStats:
+        """Get the statistics of the event loop's lag over the last minutes."""
+        merged = LagStats()
+        for minute in self._window(minutes):
+            stats = self._lag_buckets.get(minute)
+            if stats is not None:
+                merged.merge(stats)
+        return merged
+
+    def to_dict(self, minutes: int = 10, limit: Optional[int] = None) -> Dict[str, Any]:
+        return {
+            "running": self._running,
+            "attributing_steps": self._attributing_steps,
+            "threshold": self.threshold,
+            "started_at": self.started_at,
+            "lag": self.lag(minutes).to_dict(),
+            "callbacks": [
+                {"kind": kind, "owner": owner, "name": name, **stats.to_dict()}
+                for (kind, owner, name), stats in self.top(minutes, limit)
+            ],
+            "stalls": [
+                {
+                    "timestamp": stall.timestamp,
+                    "duration": stall.duration,
+                    "kind": stall.key[0] if stall.key else None,
+                    "owner": stall.key[1] if stall.key else None,
+                    "name": stall.key[2] if stall.key else None,
+                    "stack": stall.stack,
+                }
+                for stall in self.stalls
+            ],
+        }
+
+
+loop_monitor = LoopMonitor()
@@ -3,7 +3,7 @@ from __future__ import annotations
 import asyncio
 import logging
 from datetime import datetime, timezone
-from typing import Union, List, Optional, TYPE_CHECKING, Literal
+from typing import Callable, Union, List, Optional, TYPE_CHECKING, Literal
 from functools import wraps
 
 import discord
@@ -17,6 +17,7 @@ from .errors import BankPruneError
 
 if TYPE_CHECKING:
     from .bot import Red
+    from .config import Group
 
 _ = Translator("Bank API", __file__)
 
@@ -78,6 +79,21 @@ _data_deletion_lock = asyncio.Lock()
 
 _cache_is_global = None
 _cache = {"bank_name": None, "currency": None, "default_balance": None, "max_balance": None}
+# Called after the global settings cached above changed, when the bot runs in several clusters.
+# See `Red._start_cluster()`.
+_change_hook: Optional[Callable[[], None]] = None
+
+
+def _clear_cache() -> None:
+    global _cache_is_global
+    _cache_is_global = None
+    for key in _cache:
+        _cache[key] = None
+
+
+def _changed() -> None:
+    if _change_hook is not None:
+        _change_hook()
 
 
 async def _init():
@@ -330,20 +346,57 @@ async def set_balance(member: Union[discord.Member, discord.User], amount: int)
         raise errors.BalanceTooHigh(
             user=member.display_name, max_balance=max_bal, currency_name=currency
         )
+    group = await _get_account_group(member)
+    await group.balance.set(amount)
+    await _init_account_details(group, member)
+
+    return amount
+
+
+async def _get_account_group(member: Union[discord.Member, discord.User]) -> Group:
     if await is_global():
-        group = _config.user(member)
+        return _config.user(member)
     else:
-        group = _config.member(member)
-    await group.balance.set(amount)
+        return _config.member(member)
 
-    if await group.created_at() == 0:
-        time = _encoded_current_time()
-        await group.created_at.set(time)
 
-    if await group.name() == "":
-        await group.name.set(member.display_name)
+async def _init_account_details(group: Group, member: Union[discord.Member, discord.User]) -> None:
+    created_at, name = await _config.get_many(group.created_at, group.name)
+    to_set = {}
+    if created_at == 0:
+        to_set[group.created_at] = _encoded_current_time()
+    if name == "":
+        to_set[group.name] = member.display_name
+    if to_set:
+        await _config.set_many(to_set)
 
-    return amount
+
+async def _change_balance(member: Union[discord.Member, discord.User], delta: int) -> int:
+    # The bounds are checked by the storage backend in the same atomic operation as the
+    # increment, so that an invalid balance is never stored, even by several processes at once.
+    guild = getattr(member, "guild", None)
+    group = await _get_account_group(member)
+    default = await get_default_balance(guild)
+    max_bal = await get_max_balance(guild)
+    try:
+        new_balance = await group.balance.inc(
+            delta, default=default, min_value=0, max_value=max_bal
+        )
+    except errors.OutOfRangeError as exc:
+        if exc.current + delta < 0:
+            raise ValueError(
+                "Insufficient funds {} > {}".format(
+                    humanize_number(-delta, override_locale="en_US"),
+                    humanize_number(exc.current, override_locale="en_US"),
+                )
+            )
+        currency = await get_currency_name(guild)
+        raise errors.BalanceTooHigh(
+            user=member.display_name, max_balance=max_bal, currency_name=currency
+        )
+
+    await _init_account_details(group, member)
+    return new_balance
 
 
 def _invalid_amount(amount: int) -> bool:
@@ -383,16 +436,7 @@ async def withdraw_credits(member: discord.Member, amount: int) -> int:
             )
         )
 
-    bal = await get_balance(member)
-    if amount > bal:
-        raise ValueError(
-            "Insufficient funds {} > {}".format(
-                humanize_number(amount, override_locale="en_US"),
-                humanize_number(bal, override_locale="en_US"),
-            )
-        )
-
-    return await set_balance(member, bal - amount)
+    return await _change_balance(member, -amount)
 
 
 async def deposit_credits(member: discord.Member, amount: int) -> int:
@@ -427,8 +471,7 @@ async def deposit_credits(member: discord.Member, amount: int) -> int:
             )
         )
 
-    bal = await get_balance(member)
-    return await set_balance(member, amount + bal)
+    return await _change_balance(member, amount)
 
 
 async def transfer_credits(
@@ -727,6 +770,7 @@ async def set_global(global_: bool) -> bool:
 
     await _config.is_global.set(global_)
     _cache_is_global = global_
+    _changed()
     return global_
 
 
@@ -787,6 +831,7 @@ async def set_bank_name(name: str, guild: discord.Guild = None) -> str:
         await _config.bank_name.set(name)
         global _cache
         _cache["bank_name"] = name
+        _changed()
     elif guild is not None:
         await _config.guild(guild).bank_name.set(name)
     else:
@@ -851,6 +896,7 @@ async def set_currency_name(name: str, guild: discord.Guild = None) -> str:
         await _config.currency.set(name)
         global _cache
         _cache["currency"] = name
+        _changed()
     elif guild is not None:
         await _config.guild(guild).currency.set(name)
     else:
@@ -929,6 +975,7 @@ async def set_max_balance(amount: int, guild: discord.Guild = None) -> int:
         await _config.max_balance.set(amount)
         global _cache
         _cache["max_balance"] = amount
+        _changed()
     elif guild is not None:
         await _config.guild(guild).max_balance.set(amount)
     else:
@@ -1009,6 +1056,7 @@ async def set_default_balance(amount: int, guild: discord.Guild = None) -> int:
         await _config.default_balance.set(amount)
         global _cache
         _cache["default_balance"] = amount
+        _changed()
     elif guild is not None:
         await _config.guild(guild).default_balance.set(amount)
     else:
@@ -6,6 +6,7 @@ import os
 import platform
 import shutil
 import sys
+import time
 import contextlib
 import weakref
 import functools
@@ -26,6 +27,7 @@ from typing import (
     Callable,
     Awaitable,
     Any,
+    Hashable,
     Literal,
     MutableMapping,
     Set,
@@ -37,11 +39,23 @@ from types import MappingProxyType
 import discord
 from discord.ext import commands as dpy_commands
 from discord.ext.commands import when_mentioned_or
+from discord.ext.commands.view import StringView  # DEP-WARN
 
 from . import Config, i18n, commands, errors, drivers, modlog, bank
+from .._startup_profiler import startup_profiler
+from ._cache import BoundedCache
+from ._cluster import ClusterBus, shard_ids_for_cluster
+from ._cog_loader import load_packages_concurrently
+from ._command_stats import command_stats
+from ._lazy_cogs import LazyPackages
+from ._config_stats import config_stats
+from ._loop_monitor import Stall, loop_monitor
+from .config import Value
+from .metrics import MetricsRegistry
 from .cog_manager import CogManager, CogManagerUI
+from .commands.help import HELP_CACHE_SIZE
 from .core_commands import Core
-from .data_manager import cog_data_path
+from .data_manager import cog_data_path, core_data_path
 from .dev_commands import Dev
 from .events import init_events
 from .global_checks import init_global_checks
@@ -49,12 +63,16 @@ from .settings_caches import (
     PrefixManager,
     IgnoreManager,
     WhitelistBlacklistManager,
+    AccessPolicyCache,
+    PrivilegeCache,
     DisabledCogCache,
+    DisabledCommandCache,
     I18nManager,
 )
 from .rpc import RPCMixin
 from .utils import can_user_send_messages_in, common_filters, AsyncIter
-from .utils._internal_utils import send_to_owners_with_prefix_replaced
+from .utils._internal_utils import CommandIndex, send_to_owners_with_prefix_replaced
+from .utils.chat_formatting import box
 
 if TYPE_CHECKING:
     from discord.ext.commands.hybrid import CommandCallback, ContextT, P
@@ -73,6 +91,12 @@ __all__ = ("Red", "ExitCodes")
 
 NotMessage = namedtuple("NotMessage", "guild")
 
+# How a message was parsed by `Red.get_context()`, see `Red._parsed_messages`.
+_ParsedMessage = namedtuple("_ParsedMessage", "content prefix invoked_with previous index")
+_PARSED_MESSAGES_MAX_SIZE = 256
+# Minimum time between two notifications of the owners about event loop stalls, in seconds.
+_LOOP_STALL_NOTIFICATION_COOLDOWN = 600
+
 DataDeletionResults = namedtuple("DataDeletionResults", "failed_modules failed_cogs unhandled")
 
 PreInvokeCoroutine = Callable[[commands.Context], Awaitable[Any]]
@@ -143,6 +167,12 @@ class Red(
             datarequests__allow_user_requests=True,
             datarequests__user_requests_are_strict=True,
             use_buttons=False,
+            config_stats_sample_rate=0.0,
+            loop_monitor_threshold=1.0,
+            loop_monitor_attribution=False,
+            loop_monitor_notify_owners=False,
+            slow_command_threshold=5.0,
+            command_manifests={},
         )
 
         self._config.register_guild(
@@ -181,10 +211,21 @@ class Red(
         self._config.register_custom(SHARED_API_TOKENS)
         self._prefix_cache = PrefixManager(self._config, cli_flags)
         self._disabled_cog_cache = DisabledCogCache(self._config)
+        self._disabled_command_cache = DisabledCommandCache(self._config)
+        self._lazy_packages = LazyPackages(self)
         self._ignored_cache = IgnoreManager(self._config)
         self._whiteblacklist_cache = WhitelistBlacklistManager(self._config)
+        self._access_policy_cache = AccessPolicyCache(
+            self._config, self._ignored_cache, self._whiteblacklist_cache
+        )
         self._i18n_cache = I18nManager(self._config)
+        self._privilege_cache = PrivilegeCache(self._config)
         self._bypass_cooldowns = False
+        # Message ID -> how it was parsed, so that `on_message_without_command` listeners
+        # calling `get_context()` don't resolve the prefixes again.
+        self._parsed_messages: "OrderedDict[int, _ParsedMessage]" = OrderedDict()
+        self._loop_stall_notifications = False
+        self._last_loop_stall_notification = float("-inf")
 
         async def prefix_manager(bot, message) -> List[str]:
             prefixes = await self._prefix_cache.get_prefixes(message.guild)
@@ -227,6 +268,19 @@ class Red(
         self._uptime = None
         self._checked_time_accuracy = None
 
+        if cli_flags.shard_count is not None:
+            kwargs["shard_count"] = cli_flags.shard_count
+            kwargs["shard_ids"] = shard_ids_for_cluster(
+                cli_flags.shard_count, cli_flags.cluster_count, cli_flags.cluster_id
+            )
+        self._cluster: Optional[ClusterBus] = None
+        # Built on the first fuzzy command search after the commands change.
+        self._command_index: Optional[CommandIndex] = None
+        # Rendered help pages, cleared when the commands or their states change.
+        self._help_cache: BoundedCache[Hashable, Any] = BoundedCache(
+            "help_pages", maxsize=HELP_CACHE_SIZE
+        )
+
         self._main_dir = bot_dir
         self._cog_mgr = CogManager()
         self._use_team_features = cli_flags.use_team_features
@@ -242,6 +296,9 @@ class Red(
 
         self._deletion_requests: MutableMapping[int, asyncio.Lock] = weakref.WeakValueDictionary()
 
+        self.metrics = MetricsRegistry()
+        self._init_metrics()
+
     def set_help_formatter(self, formatter: commands.help.HelpFormatterABC):
         """
         Set's Red's help formatter.
@@ -555,6 +612,7 @@ class Red(
         """
         to_add: Set[int] = {getattr(uor, "id", uor) for uor in users_or_roles}
         await self._whiteblacklist_cache.add_to_blacklist(guild, to_add)
+        self._access_policy_cache.invalidate(guild.id if guild else None)
 
     async def remove_from_blacklist(
         self, users_or_roles: Iterable[UserOrRole], *, guild: Optional[discord.Guild] = None
@@ -578,6 +636,7 @@ class Red(
         """
         to_remove: Set[int] = {getattr(uor, "id", uor) for uor in users_or_roles}
         await self._whiteblacklist_cache.remove_from_blacklist(guild, to_remove)
+        self._access_policy_cache.invalidate(guild.id if guild else None)
 
     async def get_blacklist(self, guild: Optional[discord.Guild] = None) -> Set[int]:
         """
@@ -607,6 +666,7 @@ class Red(
             If not passed, the global blocklist will be cleared.
         """
         await self._whiteblacklist_cache.clear_blacklist(guild)
+        self._access_policy_cache.invalidate(guild.id if guild else None)
 
     async def add_to_whitelist(
         self, users_or_roles: Iterable[UserOrRole], *, guild: Optional[discord.Guild] = None
@@ -630,6 +690,7 @@ class Red(
         """
         to_add: Set[int] = {getattr(uor, "id", uor) for uor in users_or_roles}
         await self._whiteblacklist_cache.add_to_whitelist(guild, to_add)
+        self._access_policy_cache.invalidate(guild.id if guild else None)
 
     async def remove_from_whitelist(
         self, users_or_roles: Iterable[UserOrRole], *, guild: Optional[discord.Guild] = None
@@ -653,6 +714,7 @@ class Red(
         """
         to_remove: Set[int] = {getattr(uor, "id", uor) for uor in users_or_roles}
         await self._whiteblacklist_cache.remove_from_whitelist(guild, to_remove)
+        self._access_policy_cache.invalidate(guild.id if guild else None)
 
     async def get_whitelist(self, guild: Optional[discord.Guild] = None):
         """
@@ -682,6 +744,7 @@ class Red(
             If not passed, the global allowlist will be cleared.
         """
         await self._whiteblacklist_cache.clear_whitelist(guild)
+        self._access_policy_cache.invalidate(guild.id if guild else None)
 
     async def allowed_by_whitelist_blacklist(
         self,
@@ -826,13 +889,12 @@ class Red(
             assert isinstance(channel, (discord.TextChannel, discord.VoiceChannel, discord.Thread))
             if not can_user_send_messages_in(guild.me, channel):
                 return False
-            if not (await self.ignored_channel_or_guild(message)):
-                return False
 
-        if not (await self.allowed_by_whitelist_blacklist(message.author)):
-            return False
-
-        return True
+        # This is the same as checking `ignored_channel_or_guild()`
+        # and `allowed_by_whitelist_blacklist()`, but with the settings
+        # already compiled into a policy for the guild.
+        policy = await self._access_policy_cache.get_policy(guild)
+        return policy.allows(message, self.owner_ids)
 
     async def ignored_channel_or_guild(
         self, ctx: Union[commands.Context, discord.Message]
@@ -1115,6 +1177,17 @@ class Red(
         i18n_regional_format = await self._config.regional_format()
         i18n.set_regional_format(i18n_regional_format)
 
+        config_stats.sample_rate = await self._config.config_stats_sample_rate()
+        command_stats.slow_threshold = await self._config.slow_command_threshold()
+        loop_monitor.threshold = await self._config.loop_monitor_threshold()
+        loop_monitor.on_stall = self._on_loop_stall
+        self._loop_stall_notifications = await self._config.loop_monitor_notify_owners()
+        loop_monitor.start()
+        loop_monitor.set_step_attribution(await self._config.loop_monitor_attribution())
+
+        if self._cli_flags.cluster_count > 1:
+            await self._start_cluster()
+
     async def _pre_connect(self) -> None:
         """
         This should only be run once, prior to connecting to Discord gateway.
@@ -1124,8 +1197,10 @@ class Red(
         if self._cli_flags.dev:
             await self.add_cog(Dev())
 
-        await modlog._init(self)
-        await bank._init()
+        with startup_profiler.phase("modlog_init"):
+            await modlog._init(self)
+        with startup_profiler.phase("bank_init"):
+            await bank._init()
 
         packages = OrderedDict()
 
@@ -1188,43 +1263,112 @@ class Red(
             )
 
         if packages:
-            # Load permissions first, for security reasons
-            try:
-                packages.move_to_end("permissions", last=False)
-            except KeyError:
-                pass
+            lazy_packages = []
+            if self._cli_flags.lazy_cogs:
+                manifests = await self._config.command_manifests()
+                # Permissions has to be loaded for its rules to apply to the stub commands
+                lazy_packages = [p for p in packages if p != "permissions" and p in manifests]
+            to_load = [p for p in packages if p not in lazy_packages]
 
-            to_remove = []
             log.info("Loading packages...")
-            for package in packages:
-                try:
-                    spec = await self._cog_mgr.find_cog(package)
-                    if spec is None:
-                        log.error(
-                            "Failed to load package %s (package was not found in any cog path)",
-                            package,
-                        )
-                        await self.remove_loaded_package(package)
+            startup_profiler.begin("load_packages")
+            if self._cli_flags.cog_load_workers:
+                to_remove = await load_packages_concurrently(
+                    self, to_load, self._cli_flags.cog_load_workers
+                )
+            else:
+                # Load permissions first, for security reasons
+                if "permissions" in to_load:
+                    to_load.remove("permissions")
+                    to_load.insert(0, "permissions")
+
+                to_remove = []
+                for package in to_load:
+                    if not await self._load_package_on_startup(package):
                         to_remove.append(package)
-                        continue
-                    await asyncio.wait_for(self.load_extension(spec), 30)
-                except asyncio.TimeoutError:
-                    log.exception("Failed to load package %s (timeout)", package)
-                    to_remove.append(package)
-                except Exception as e:
-                    log.exception("Failed to load package %s", package, exc_info=e)
-                    await self.remove_loaded_package(package)
+            for package in lazy_packages:
+                if await self._lazy_packages.add_stubs(package):
+                    continue
+                if not await self._load_package_on_startup(package):
                     to_remove.append(package)
+            startup_profiler.end("load_packages")
             for package in to_remove:
                 del packages[package]
+            if self._lazy_packages.get_packages():
+                log.info(
+                    "Packages which will be loaded on first use: "
+                    + ", ".join(self._lazy_packages.get_packages())
+                )
         if packages:
             log.info("Loaded packages: " + ", ".join(packages))
         else:
             log.info("No packages were loaded.")
 
         if self.rpc_enabled:
+            if self._cli_flags.rpc_metrics:
+                self.rpc.add_metrics_route(self.metrics)
             await self.rpc.initialize(self.rpc_port)
 
+    async def _load_package_on_startup(self, package: str) -> bool:
+        """
+        Load a package when the bot starts, logging any failure.
+
+        Returns
+        -------
+        bool
+            Whether the package was loaded.
+        """
+        spec = await self._find_package_on_startup(package)
+        if spec is None:
+            return False
+        return await self._load_spec_on_startup(package, spec)
+
+    async def _find_package_on_startup(self, package: str) -> Optional[ModuleSpec]:
+        """
+        Find a package to load when the bot starts, logging any failure.
+
+        Returns
+        -------
+        Optional[ModuleSpec]
+            The package's spec, ``None`` if it failed to be found.
+            The package is then removed from the loaded packages.
+        """
+        try:
+            spec = await self._cog_mgr.find_cog(package)
+        except Exception as e:
+            # Finding a core package imports it.
+            log.exception("Failed to load package %s", package, exc_info=e)
+            await self.remove_loaded_package(package)
+            return None
+        if spec is None:
+            log.error(
+                "Failed to load package %s (package was not found in any cog path)",
+                package,
+            )
+            await self.remove_loaded_package(package)
+        return spec
+
+    async def _load_spec_on_startup(self, package: str, spec: ModuleSpec) -> bool:
+        """
+        Load a package found by `_find_package_on_startup()` when the bot starts,
+        logging any failure.
+
+        Returns
+        -------
+        bool
+            Whether the package was loaded.
+        """
+        try:
+            await asyncio.wait_for(self.load_extension(spec), 30)
+        except asyncio.TimeoutError:
+            log.exception("Failed to load package %s (timeout)", package)
+            return False
+        except Exception as e:
+            log.exception("Failed to load package %s", package, exc_info=e)
+            await self.remove_loaded_package(package)
+            return False
+        return True
+
     def _setup_owners(self) -> None:
         if self.application.team:
             if self._use_team_features:
@@ -1237,14 +1381,19 @@ class Red(
 
     async def start(self, token: str) -> None:
         # Overriding start to call _pre_login() before login()
-        await self._pre_login()
-        await self.login(token)
+        with startup_profiler.phase("pre_login"):
+            await self._pre_login()
+        with startup_profiler.phase("login"):
+            await self.login(token)
         # Pre-connect actions are done by setup_hook() which is called at the end of d.py's login()
+        # The connect phase is ended by the on_ready event, as connect() only returns on shutdown
+        startup_profiler.begin("connect")
         await self.connect()
 
     async def setup_hook(self) -> None:
         self._setup_owners()
-        await self._pre_connect()
+        with startup_profiler.phase("pre_connect"):
+            await self._pre_connect()
 
     async def send_help_for(
         self,
@@ -1304,11 +1453,10 @@ class Red(
             `discord.DMChannel`, or `discord.PartialMessageable`.
         """
 
-        async def get_command_setting(guild_id: int) -> Optional[bool]:
+        def command_setting(guild_id: int) -> List[Value]:
             if command is None:
-                return None
-            scope = self._config.custom(COMMAND_SCOPE, command.qualified_name, guild_id)
-            return await scope.embeds()
+                return []
+            return [self._config.custom(COMMAND_SCOPE, command.qualified_name, guild_id).embeds]
 
         # using dpy_commands.Context to keep the Messageable contract in full
         if isinstance(channel, dpy_commands.Context):
@@ -1326,30 +1474,27 @@ class Red(
                 "You cannot pass a GroupChannel, DMChannel, or PartialMessageable to this method."
             )
 
+        # The settings are checked from most to least specific,
+        # but they're all fetched at once to avoid a round trip for each of them.
         if isinstance(channel, (discord.TextChannel, discord.VoiceChannel, discord.Thread)):
             channel_id = channel.parent_id if isinstance(channel, discord.Thread) else channel.id
 
             if check_permissions and not channel.permissions_for(channel.guild.me).embed_links:
                 return False
 
-            channel_setting = await self._config.channel_from_id(channel_id).embeds()
-            if channel_setting is not None:
-                return channel_setting
-
-            if (command_setting := await get_command_setting(channel.guild.id)) is not None:
-                return command_setting
-
-            if (guild_setting := await self._config.guild(channel.guild).embeds()) is not None:
-                return guild_setting
+            settings = [
+                self._config.channel_from_id(channel_id).embeds,
+                *command_setting(channel.guild.id),
+                self._config.guild(channel.guild).embeds,
+            ]
         else:
-            user = channel
-            if (user_setting := await self._config.user(user).embeds()) is not None:
-                return user_setting
+            settings = [self._config.user(channel).embeds]
 
-        if (global_command_setting := await get_command_setting(0)) is not None:
-            return global_command_setting
-
-        global_setting = await self._config.embeds()
+        settings += [*command_setting(0), self._config.embeds]
+        *specific_settings, global_setting = await self._config.get_many(*settings)
+        for setting in specific_settings:
+            if setting is not None:
+                return setting
         return global_setting
 
     async def use_buttons(self) -> bool:
@@ -1417,25 +1562,18 @@ class Red(
     async def is_admin(self, member: discord.Member) -> bool:
         """Checks if a member is an admin of their guild."""
         try:
-            for snowflake in await self._config.guild(member.guild).admin_role():
-                if member.get_role(snowflake):
-                    return True
+            level = await self._privilege_cache.get_level(member)
         except AttributeError:  # someone passed a webhook to this
-            pass
-        return False
+            return False
+        return level >= commands.PrivilegeLevel.ADMIN
 
     async def is_mod(self, member: discord.Member) -> bool:
         """Checks if a member is a mod or admin of their guild."""
         try:
-            for snowflake in await self._config.guild(member.guild).admin_role():
-                if member.get_role(snowflake):
-                    return True
-            for snowflake in await self._config.guild(member.guild).mod_role():
-                if member.get_role(snowflake):
-                    return True
+            level = await self._privilege_cache.get_level(member)
         except AttributeError:  # someone passed a webhook to this
-            pass
-        return False
+            return False
+        return level >= commands.PrivilegeLevel.MOD
 
     async def get_admin_roles(self, guild: discord.Guild) -> List[discord.Role]:
         """
@@ -1575,7 +1713,35 @@ class Red(
             self.dispatch("red_api_tokens_update", service, MappingProxyType({}))
 
     async def get_context(self, message, /, *, cls=commands.Context):
-        return await super().get_context(message, cls=cls)
+        """
+        Same as base method, but remembers how recent messages were parsed.
+
+        Getting the context of a message again, such as from an
+        ``on_message_without_command`` listener, doesn't resolve the prefixes
+        again. A new context is still returned each time, so listeners can
+        modify it freely.
+        """
+        if isinstance(message, discord.Interaction):
+            return await super().get_context(message, cls=cls)
+
+        parsed = self._parsed_messages.get(message.id)
+        # Copies of a message, such as the ones Alias makes, have the same ID.
+        if parsed is None or parsed.content != message.content:
+            ctx = await super().get_context(message, cls=cls)
+            self._parsed_messages[message.id] = _ParsedMessage(
+                message.content, ctx.prefix, ctx.invoked_with, ctx.view.previous, ctx.view.index
+            )
+            if len(self._parsed_messages) > _PARSED_MESSAGES_MAX_SIZE:
+                self._parsed_messages.popitem(last=False)
+            return ctx
+
+        view = StringView(message.content)
+        view.previous, view.index = parsed.previous, parsed.index
+        ctx = cls(prefix=parsed.prefix, view=view, bot=self, message=message)
+        if parsed.invoked_with is not None:
+            ctx.invoked_with = parsed.invoked_with
+            ctx.command = self.all_commands.get(parsed.invoked_with)
+        return ctx
 
     async def process_commands(self, message: discord.Message, /):
         """
@@ -1600,6 +1766,35 @@ class Red(
         if ctx is None or ctx.valid is False:
             self.dispatch("message_without_command", message)
 
+    async def can_run(self, ctx: commands.Context, /, *, call_once: bool = False) -> bool:
+        """
+        Same as base method, but records the time the global checks take
+        in the statistics of the invoked command.
+        """
+        with command_stats.phase(ctx, "checks"):
+            return await super().can_run(ctx, call_once=call_once)
+
+    async def invoke(self, ctx: commands.Context, /) -> None:
+        """
+        Same as base method, but records the outcome and duration
+        of the command in the bot's metrics and command statistics.
+        """
+        if ctx.command is None:
+            await super().invoke(ctx)
+            return
+        trace = command_stats.start(ctx)
+        start = time.perf_counter()
+        try:
+            await super().invoke(ctx)
+        finally:
+            duration = time.perf_counter() - start
+            command_stats.finish(ctx, trace, duration)
+            # This is the invoked subcommand, if there's one.
+            name = ctx.command.qualified_name
+            status = "failure" if ctx.command_failed else "success"
+            self._commands_metric.labels(name, status).inc()
+            self._command_duration_metric.labels(name).observe(duration)
+
     @staticmethod
     def list_packages():
         """Lists packages present in the cogs folder"""
@@ -1623,20 +1818,26 @@ class Red(
         name = spec.name.split(".")[-1]
         if name in self.extensions:
             raise errors.PackageAlreadyLoaded(spec)
+        self._lazy_packages.remove_stubs(name)
 
+        start = time.perf_counter()
         lib = spec.loader.load_module()
+        startup_profiler.record_package(name, "import", time.perf_counter() - start)
         if not hasattr(lib, "setup"):
             del lib
             raise discord.ClientException(f"extension {name} does not have a setup function")
 
         try:
+            start = time.perf_counter()
             await lib.setup(self)
+            startup_profiler.record_package(name, "setup", time.perf_counter() - start)
         except Exception as e:
             await self._remove_module_references(lib.__name__)
             await self._call_module_finalizers(lib, name)
             raise
         else:
             self._BotBase__extensions[name] = lib
+            await self._lazy_packages.save_manifest(name, lib)
 
     async def remove_cog(
         self,
@@ -1784,7 +1985,9 @@ class Red(
                     self.add_permissions_hook(hook)
                     added_hooks.append(hook)
 
+            start = time.perf_counter()
             await super().add_cog(cog, guild=guild, guilds=guilds)
+            startup_profiler.record_cog(cog_name, time.perf_counter() - start)
             self.dispatch("cog_add", cog)
             if "permissions" not in self.extensions:
                 cog.requires.ready_event.set()
@@ -1806,6 +2009,8 @@ class Red(
             raise RuntimeError("Commands must be instances of `redbot.core.commands.Command`")
 
         super().add_command(command)
+        self._command_index = None
+        self._help_cache.clear()
 
         permissions_not_loaded = "permissions" not in self.extensions
         self.dispatch("command_add", command)
@@ -1821,6 +2026,8 @@ class Red(
         command = super().remove_command(name)
         if command is None:
             return None
+        self._command_index = None
+        self._help_cache.clear()
         command.requires.reset()
         if isinstance(command, commands.Group):
             for subcommand in command.walk_commands():
@@ -2043,8 +2250,223 @@ class Red(
         await asyncio.sleep(delay)
         await _delete_helper(message)
 
+    def _schedule_event(self, coro, event_name: str, *args, **kwargs) -> asyncio.Task:  # DEP-WARN
+        # Same as base method, but lets the loop monitor time the listener.
+        # This overrides an undocumented method of `discord.Client` and uses its `_run_event()`,
+        # if either changes upstream, listeners will silently stop being timed or stop running.
+        wrapped = loop_monitor.time_listener(
+            self._run_event(coro, event_name, *args, **kwargs), coro, event_name
+        )
+        return self.loop.create_task(wrapped, name=f"discord.py: {event_name}")
+
+    def _init_metrics(self) -> None:
+        metrics = self.metrics
+        self._commands_metric = metrics.counter(
+            "red_commands_total",
+            "Invoked commands, by command and outcome.",
+            ["command", "status"],
+        )
+        self._command_duration_metric = metrics.histogram(
+            "red_command_duration_seconds", "Time commands took to run, by command.", ["command"]
+        )
+        self._messages_metric = metrics.counter("red_messages_total", "Received messages.")
+        metrics.gauge(
+            "red_gateway_latency_seconds",
+            "Latency of the gateway heartbeats, by shard.",
+            ["shard"],
+            function=lambda: dict(self.latencies),
+        )
+        metrics.gauge("red_guilds", "Guilds the bot is in.", function=lambda: len(self.guilds))
+
+        def event_loop_lag() -> Dict[str, float]:
+            if not loop_monitor.running:
+                return {}
+            lag = loop_monitor.lag(1)
+            return {"mean": lag.mean_lag, "max": lag.max_lag}
+
+        metrics.gauge(
+            "red_event_loop_lag_seconds",
+            "Lag of the event loop over the last minute.",
+            ["stat"],
+            function=event_loop_lag,
+        )
+        metrics.counter(
+            "red_config_operations_total",
+            "Estimated Config operations, by cog, category and operation,"
+            " when the Config profiler is enabled.",
+            ["cog", "category", "op"],
+            function=lambda: {key: stats.estimated_count for key, stats in config_stats.top()},
+        )
+
+        def settings_cache_stat(attribute: str) -> Callable[[], Dict[str, float]]:
+            return lambda: {
+                cache.name: getattr(cache, attribute) for cache in self._get_settings_caches()
+            }
+
+        metrics.counter(
+            "red_settings_cache_hits_total",
+            "Lookups which found their entry, by settings cache.",
+            ["cache"],
+            function=settings_cache_stat("hits"),
+        )
+        metrics.counter(
+            "red_settings_cache_misses_total",
+            "Lookups which didn't find their entry, by settings cache.",
+            ["cache"],
+            function=settings_cache_stat("misses"),
+        )
+        metrics.counter(
+            "red_settings_cache_evictions_total",
+            "Entries dropped to make room for new ones, by settings cache.",
+            ["cache"],
+            function=settings_cache_stat("evictions"),
+        )
+        metrics.gauge(
+            "red_settings_cache_entries",
+            "Entries, by settings cache.",
+            ["cache"],
+            function=lambda: {cache.name: len(cache) for cache in self._get_settings_caches()},
+        )
+
+    def _get_command_index(self) -> CommandIndex:
+        """Get the index of all of the bot's commands used by fuzzy command searches."""
+        if self._command_index is None:
+            self._command_index = CommandIndex(self.walk_commands())
+        return self._command_index
+
+    def _get_settings_caches(self) -> List[BoundedCache]:
+        """Get the caches of the core settings, for reports."""
+        return [
+            self._prefix_cache._cached,
+            self._i18n_cache._guild_locale,
+            self._i18n_cache._guild_regional_format,
+            self._ignored_cache._cached_guilds,
+            self._ignored_cache._cached_channels,
+            self._whiteblacklist_cache._cached_whitelist,
+            self._whiteblacklist_cache._cached_blacklist,
+            self._access_policy_cache._cached_policies,
+            self._privilege_cache._cached_role_ids,
+            self._privilege_cache._cached_levels,
+            self._disabled_cog_cache._disable_map,
+        ]
+
+    def _on_loop_stall(self, stall: Stall) -> None:
+        now = time.monotonic()
+        if (
+            not self._loop_stall_notifications
+            or not self._red_ready.is_set()
+            or now - self._last_loop_stall_notification < _LOOP_STALL_NOTIFICATION_COOLDOWN
+        ):
+            return
+        self._last_loop_stall_notification = now
+        if stall.key is None:
+            content = f"The event loop was blocked for {stall.duration:.2f}s."
+        else:
+            kind, owner, name = stall.key
+            content = (
+                f"The {kind} `{name}` of `{owner}`"
+                f" held the event loop for {stall.duration:.2f}s."
+            )
+        if stall.stack:
+            content += "\n" + box(stall.stack[-1500:], lang="py")
+        content += "\nUse `[p]debuginfo loop` to see the slowest listeners and tasks."
+        asyncio.create_task(send_to_owners_with_prefix_replaced(self, content))
+
+    async def _start_cluster(self) -> None:
+        bus = ClusterBus(
+            core_data_path() / "cluster",
+            self._cli_flags.cluster_id,
+            self._cli_flags.cluster_count,
+        )
+
+        def settings_changed(guild_id: Optional[int]) -> None:
+            bus.broadcast_soon("settings_changed", {"guild_id": guild_id})
+
+        for manager in (
+            self._prefix_cache,
+            self._i18n_cache,
+            self._ignored_cache,
+            self._whiteblacklist_cache,
+            self._disabled_cog_cache,
+        ):
+            manager._change_hook = settings_changed
+        bank._change_hook = lambda: bus.broadcast_soon("bank_changed", {})
+
+        async def on_settings_changed(payload: Dict[str, Any]) -> None:
+            self._forget_guild_settings(payload["guild_id"])
+
+        async def on_bank_changed(payload: Dict[str, Any]) -> None:
+            bank._clear_cache()
+
+        async def on_command_state_changed(payload: Dict[str, Any]) -> None:
+            await self._disabled_command_cache.reload_globally_disabled()
+            command = self.get_command(payload["command"])
+            if command is not None:
+                command.enabled = payload["enabled"]
+            self._help_cache.clear()
+
+        async def on_presence_changed(payload: Dict[str, Any]) -> None:
+            status = payload["status"]
+            await self.change_presence(
+                status=None if status is None else discord.Status(status),
+                activity=discord.activity.create_activity(payload["activity"], self._connection),
+            )
+
+        def on_packages(method_name: str) -> Callable[[Dict[str, Any]], Awaitable[None]]:
+            async def handler(payload: Dict[str, Any]) -> None:
+                await getattr(self.get_cog("Core"), method_name)(payload["packages"])
+
+            return handler
+
+        bus.add_handler("settings_changed", on_settings_changed)
+        bus.add_handler("bank_changed", on_bank_changed)
+        bus.add_handler("command_state_changed", on_command_state_changed)
+        bus.add_handler("presence_changed", on_presence_changed)
+        bus.add_handler("load", on_packages("_load"))
+        bus.add_handler("unload", on_packages("_unload"))
+        bus.add_handler("reload", on_packages("_reload"))
+        await bus.start()
+        self._cluster = bus
+        log.info(
+            "Running shards %s to %s as cluster %s of %s.",
+            self.shard_ids[0],
+            self.shard_ids[-1],
+            self._cli_flags.cluster_id,
+            self._cli_flags.cluster_count,
+        )
+
+    async def _notify_cluster(self, event: str, **payload: Any) -> None:
+        """Have the other clusters replay an owner action, if the bot runs in several clusters."""
+        if self._cluster is not None:
+            await self._cluster.broadcast(event, payload)
+
+    def _forget_guild_settings(self, guild_id: Optional[int]) -> None:
+        """
+        Drop the cached settings of a guild, or of all guilds if ``guild_id`` is ``None``,
+        after another cluster changed them.
+        """
+        if guild_id is None:
+            # The global settings are the defaults of the guild settings.
+            for cache in self._get_settings_caches():
+                cache.clear()
+            self._i18n_cache.forget_global()
+            self._access_policy_cache.invalidate()
+            return
+        self._prefix_cache.forget_guild(guild_id)
+        self._i18n_cache.forget_guild(guild_id)
+        self._whiteblacklist_cache.forget_guild(guild_id)
+        self._disabled_cog_cache.forget_guild(guild_id)
+        guild = self.get_guild(guild_id)
+        if guild is not None:
+            self._ignored_cache.forget_guild(guild)
+        self._access_policy_cache.invalidate(guild_id)
+        self._privilege_cache.invalidate(guild_id)
+
     async def close(self):
         """Logs out of Discord and closes all connections."""
+        loop_monitor.stop()
+        if self._cluster is not None:
+            await self._cluster.stop()
         await super().close()
         await drivers.get_driver_class().teardown()
         try:
@@ -2094,6 +2516,7 @@ class Red(
                         ids.remove(user_id)
 
         await self._whiteblacklist_cache.discord_deleted_user(user_id)
+        self._access_policy_cache.invalidate()
 
     async def handle_data_deletion_request(
         self,
@@ -2123,6 +2546,8 @@ class Red(
             and cogs that didn't handle data deletion request.
         """
         await self.wait_until_red_ready()
+        # The cogs which haven't been used yet may have data about the user too
+        await self._lazy_packages.load_all()
         lock = self._deletion_requests.setdefault(user_id, asyncio.Lock())
         async with lock:
             return await self._handle_data_deletion_request(requester=requester, user_id=user_id)
@@ -95,6 +95,13 @@ def non_negative_int(arg: str) -> int:
     return x
 
 
+def positive_int(arg: str) -> int:
+    x = non_negative_int(arg)
+    if x < 1:
+        raise argparse.ArgumentTypeError("The argument has to be a positive integer.")
+    return x
+
+
 def message_cache_size_int(arg: str) -> int:
     x = non_negative_int(arg)
     if x < 1000:
@@ -188,6 +195,52 @@ def parse_cli_flags(args):
     parser.add_argument(
         "--unload-cogs", type=str, nargs="+", help="Force unloading specified cogs."
     )
+    parser.add_argument(
+        "--cog-load-workers",
+        type=non_negative_int,
+        default=0,
+        help="Load up to this many cogs at the same time on startup and show how long"
+        " each of them took to load. Cogs which need other cogs to be loaded first"
+        " can list them in the load_after key of their info.json."
+        " Defaults to 0, which loads cogs one at a time.",
+    )
+    parser.add_argument(
+        "--lazy-cogs",
+        action="store_true",
+        help="Only load cogs the first time one of their commands is used, which makes"
+        " startup faster. This only applies to cogs which have already been loaded once"
+        " and which don't listen to events or run background tasks, the other cogs are"
+        " loaded on startup as usual.",
+    )
+    parser.add_argument(
+        "--profile-startup",
+        action="store_true",
+        help="Record how long each step of the startup takes, including the loading of"
+        " each cog and the imports, and write a report to the logs directory once the bot"
+        " is ready.",
+    )
+    parser.add_argument(
+        "--shard-count",
+        type=positive_int,
+        default=None,
+        help="The total number of shards to run the bot with, across all of its clusters."
+        " Defaults to the number recommended by Discord.",
+    )
+    parser.add_argument(
+        "--cluster-count",
+        type=positive_int,
+        default=1,
+        help="Split the shards between this many processes, each of them started with"
+        " a different --cluster-id. This requires --shard-count and an instance"
+        " using the PostgreSQL backend. Defaults to 1, which runs all of the shards"
+        " in this process.",
+    )
+    parser.add_argument(
+        "--cluster-id",
+        type=non_negative_int,
+        default=0,
+        help="The id of this process' cluster, from 0 to --cluster-count minus one.",
+    )
     parser.add_argument(
         "--dry-run",
         action="store_true",
@@ -221,6 +274,12 @@ def parse_cli_flags(args):
         default=6133,
         help="The port of the built-in RPC server to use. Default to 6133.",
     )
+    parser.add_argument(
+        "--rpc-metrics",
+        action="store_true",
+        help="Serve metrics in the Prometheus text format at /metrics on the built-in"
+        " RPC server. This only works with the --rpc argument passed.",
+    )
     parser.add_argument("--token", type=str, help="Run Red with the given token.")
     parser.add_argument(
         "--no-instance",
@@ -255,6 +314,12 @@ def parse_cli_flags(args):
     parser.add_argument(
         "--no-message-cache", action="store_true", help="Disable the internal message cache."
     )
+    parser.add_argument(
+        "--no-config-cache",
+        action="store_true",
+        help="Disable the storage backend's in-memory cache of Config data."
+        " Currently only used by the PostgreSQL backend.",
+    )
     parser.add_argument(
         "--disable-intent",
         action="append",
@@ -298,6 +363,13 @@ def parse_cli_flags(args):
 
     args = parser.parse_args(args)
 
+    if args.cluster_count > 1 and args.shard_count is None:
+        parser.error("--cluster-count requires --shard-count.")
+    if args.cluster_id >= args.cluster_count:
+        parser.error("--cluster-id has to be lower than --cluster-count.")
+    if args.shard_count is not None and args.shard_count < args.cluster_count:
+        parser.error("--shard-count can't be lower than --cluster-count.")
+
     if args.prefix:
         args.prefix = sorted(args.prefix, reverse=True)
     else:
@@ -439,7 +439,7 @@ class CogManagerUI(commands.Cog):
         """
         Lists all loaded and available cogs.
         """
-        loaded = set(ctx.bot.extensions.keys())
+        loaded = {*ctx.bot.extensions.keys(), *ctx.bot._lazy_packages.get_packages()}
 
         all_cogs = set(await ctx.bot._cog_mgr.available_modules())
 
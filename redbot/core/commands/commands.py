@@ -45,6 +45,7 @@ from discord.ext.commands import (
 )
 
 from .errors import ConversionFailure
+from .._command_stats import command_stats
 from .requires import PermState, PrivilegeLevel, Requires, PermStateAllowedStates
 from ..i18n import Translator
 
@@ -425,7 +426,8 @@ class Command(CogCommandMixin, DPYCommand):
             a result of this call. For most cases this should be
             ``False``. Defaults to ``False``.
         """
-        ret = await super().can_run(ctx)
+        with command_stats.phase(ctx, "checks"):
+            ret = await super().can_run(ctx)
         if ret is False:
             return False
 
@@ -449,12 +451,14 @@ class Command(CogCommandMixin, DPYCommand):
 
         if self.parent is None and self.cog is not None:
             # For top-level commands, we need to check the cog's requires too
-            ret = await self.cog.requires.verify(ctx)
+            with command_stats.phase(ctx, "permissions"):
+                ret = await self.cog.requires.verify(ctx)
             if ret is False:
                 return False
 
         try:
-            return await self.requires.verify(ctx)
+            with command_stats.phase(ctx, "permissions"):
+                return await self.requires.verify(ctx)
         finally:
             ctx.command = original_command
             if not change_permission_state:
@@ -462,6 +466,10 @@ class Command(CogCommandMixin, DPYCommand):
 
     async def prepare(self, ctx, /):
         ctx.command = self
+        trace = getattr(ctx, "_command_trace", None)
+        if trace is not None:
+            # A subcommand is being prepared after its group's callback.
+            trace.recording = True
 
         if not self.enabled:
             raise DisabledCommand(f"{self.name} command is disabled")
@@ -474,12 +482,16 @@ class Command(CogCommandMixin, DPYCommand):
 
         try:
             if self.cooldown_after_parsing:
-                await self._parse_arguments(ctx)
+                with command_stats.phase(ctx, "conversion"):
+                    await self._parse_arguments(ctx)
                 self._prepare_cooldowns(ctx)
             else:
                 self._prepare_cooldowns(ctx)
-                await self._parse_arguments(ctx)
+                with command_stats.phase(ctx, "conversion"):
+                    await self._parse_arguments(ctx)
 
+            if trace is not None:
+                trace.recording = False
             await self.call_before_hooks(ctx)
         except:
             if self._max_concurrency is not None:
@@ -29,19 +29,33 @@
 
 import abc
 import asyncio
+import copy
+import functools
+import time
 from collections import namedtuple
 from dataclasses import dataclass, asdict as dc_asdict
 from enum import Enum
-from typing import Union, List, AsyncIterator, Iterable, cast
+from typing import (
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Hashable,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Union,
+    cast,
+)
 
 import discord
 from discord.ext import commands as dpy_commands
 
 from . import commands
 from .context import Context
-from ..i18n import Translator
+from ..i18n import Translator, get_locale, get_regional_format
 from ..utils.views import SimpleMenu
-from ..utils import can_user_react_in, menus
+from ..utils import bounded_gather, can_user_react_in, menus
 from ..utils.mod import mass_purge
 from ..utils._internal_utils import fuzzy_command_search, format_fuzzy_results
 from ..utils.chat_formatting import (
@@ -66,6 +80,17 @@ SupportsCanSee = Union[commands.Command, commands.Group, dpy_commands.bot.BotBas
 EmbedField = namedtuple("EmbedField", "name value inline")
 EMPTY_STRING = "\N{ZERO WIDTH SPACE}"
 
+#: How many objects' checks are run at once when filtering the help.
+HELP_CHECK_CONCURRENCY = 16
+#: How many rendered help pages are kept.
+HELP_CACHE_SIZE = 250
+#: How long, in seconds, rendered help is reused for. The cache is cleared
+#: when commands or the permission rules change, but checks of 3rd party cogs
+#: can depend on anything, so their results are only trusted for this long.
+HELP_CACHE_MAX_AGE = 300
+
+RenderedHelp = Tuple[List[Union[str, discord.Embed]], bool]
+
 
 class HelpMenuSetting(Enum):
     disabled = 0
@@ -291,9 +316,24 @@ class RedHelpFormatter(HelpFormatterABC):
         }
 
     async def get_bot_help_mapping(self, ctx, help_settings: HelpSettings):
+        # The stubs of the commands of cogs which will be loaded on first use
+        # are listed under the names of their cogs.
+        lazy_commands = ctx.bot._lazy_packages.get_commands_by_cog()
+        lazy_stubs = {com for stubs in lazy_commands.values() for com in stubs}
         sorted_iterable = []
-        for cogname, cog in (*sorted(ctx.bot.cogs.items()), (None, None)):
-            cm = await self.get_cog_help_mapping(ctx, cog, help_settings=help_settings)
+        for cogname in (*sorted(ctx.bot.cogs.keys() | lazy_commands.keys()), None):
+            cog = ctx.bot.get_cog(cogname) if cogname is not None else None
+            if cog is None and cogname is not None:
+                cm = {
+                    com.name: com
+                    async for com in self.help_filter_func(
+                        ctx, lazy_commands[cogname], help_settings=help_settings
+                    )
+                }
+            else:
+                cm = await self.get_cog_help_mapping(ctx, cog, help_settings=help_settings)
+                if cog is None:
+                    cm = {name: com for name, com in cm.items() if com not in lazy_stubs}
             if cm:
                 sorted_iterable.append((cogname, cm))
         return sorted_iterable
@@ -325,6 +365,16 @@ class RedHelpFormatter(HelpFormatterABC):
     async def format_command_help(
         self, ctx: Context, obj: commands.Command, help_settings: HelpSettings
     ):
+        await self._send_rendered_help(
+            ctx,
+            ("command", obj.qualified_name),
+            help_settings,
+            functools.partial(self._render_command_help, ctx, obj, help_settings),
+        )
+
+    async def _render_command_help(
+        self, ctx: Context, obj: commands.Command, help_settings: HelpSettings
+    ) -> Optional[Tuple[List[Union[str, discord.Embed]], bool]]:
         send = help_settings.verify_exists
         if not send:
             async for __ in self.help_filter_func(
@@ -339,7 +389,7 @@ class RedHelpFormatter(HelpFormatterABC):
                 send = True
 
         if not send:
-            return
+            return None
 
         command = obj
 
@@ -427,7 +477,7 @@ class RedHelpFormatter(HelpFormatterABC):
                     field = EmbedField(title, page, False)
                     emb["fields"].append(field)
 
-            await self.make_and_send_embeds(ctx, emb, help_settings=help_settings)
+            return await self.make_embeds(ctx, emb, help_settings=help_settings), True
 
         else:  # Code blocks:
 
@@ -463,8 +513,7 @@ class RedHelpFormatter(HelpFormatterABC):
                     ),
                 )
             )
-            pages = [box(p) for p in pagify(to_page)]
-            await self.send_pages(ctx, pages, embed=False, help_settings=help_settings)
+            return [box(p) for p in pagify(to_page)], False
 
     @staticmethod
     def group_embed_fields(fields: List[EmbedField], max_chars=1000):
@@ -490,6 +539,12 @@ class RedHelpFormatter(HelpFormatterABC):
         return ret
 
     async def make_and_send_embeds(self, ctx, embed_dict: dict, help_settings: HelpSettings):
+        pages = await self.make_embeds(ctx, embed_dict, help_settings=help_settings)
+        await self.send_pages(ctx, pages, embed=True, help_settings=help_settings)
+
+    async def make_embeds(
+        self, ctx, embed_dict: dict, help_settings: HelpSettings
+    ) -> List[discord.Embed]:
         pages = []
 
         page_char_limit = help_settings.page_char_limit
@@ -557,12 +612,22 @@ class RedHelpFormatter(HelpFormatterABC):
 
             pages.append(embed)
 
-        await self.send_pages(ctx, pages, embed=True, help_settings=help_settings)
+        return pages
 
     async def format_cog_help(self, ctx: Context, obj: commands.Cog, help_settings: HelpSettings):
+        await self._send_rendered_help(
+            ctx,
+            ("cog", obj.qualified_name),
+            help_settings,
+            functools.partial(self._render_cog_help, ctx, obj, help_settings),
+        )
+
+    async def _render_cog_help(
+        self, ctx: Context, obj: commands.Cog, help_settings: HelpSettings
+    ) -> Optional[Tuple[List[Union[str, discord.Embed]], bool]]:
         coms = await self.get_cog_help_mapping(ctx, obj, help_settings=help_settings)
         if not (coms or help_settings.verify_exists):
-            return
+            return None
 
         description = obj.format_help_for_context(ctx)
         tagline = (help_settings.tagline) or self.get_default_tagline(ctx)
@@ -601,7 +666,7 @@ class RedHelpFormatter(HelpFormatterABC):
                     field = EmbedField(title, page, False)
                     emb["fields"].append(field)
 
-            await self.make_and_send_embeds(ctx, emb, help_settings=help_settings)
+            return await self.make_embeds(ctx, emb, help_settings=help_settings), True
 
         else:
             subtext = None
@@ -624,13 +689,22 @@ class RedHelpFormatter(HelpFormatterABC):
                 )
 
             to_page = "\n\n".join(filter(None, (description, subtext_header, subtext)))
-            pages = [box(p) for p in pagify(to_page)]
-            await self.send_pages(ctx, pages, embed=False, help_settings=help_settings)
+            return [box(p) for p in pagify(to_page)], False
 
     async def format_bot_help(self, ctx: Context, help_settings: HelpSettings):
+        await self._send_rendered_help(
+            ctx,
+            ("bot",),
+            help_settings,
+            functools.partial(self._render_bot_help, ctx, help_settings),
+        )
+
+    async def _render_bot_help(
+        self, ctx: Context, help_settings: HelpSettings
+    ) -> Optional[Tuple[List[Union[str, discord.Embed]], bool]]:
         coms = await self.get_bot_help_mapping(ctx, help_settings=help_settings)
         if not coms:
-            return
+            return None
 
         description = ctx.bot.description or ""
         tagline = (help_settings.tagline) or self.get_default_tagline(ctx)
@@ -663,7 +737,7 @@ class RedHelpFormatter(HelpFormatterABC):
                     field = EmbedField(title, page, False)
                     emb["fields"].append(field)
 
-            await self.make_and_send_embeds(ctx, emb, help_settings=help_settings)
+            return await self.make_embeds(ctx, emb, help_settings=help_settings), True
 
         else:
             to_join = []
@@ -696,8 +770,7 @@ class RedHelpFormatter(HelpFormatterABC):
 
             to_join.append(f"\n{tagline}")
             to_page = "\n".join(to_join)
-            pages = [box(p) for p in pagify(to_page)]
-            await self.send_pages(ctx, pages, embed=False, help_settings=help_settings)
+            return [box(p) for p in pagify(to_page)], False
 
     @staticmethod
     async def help_filter_func(
@@ -713,38 +786,119 @@ class RedHelpFormatter(HelpFormatterABC):
         verify_checks = help_settings.verify_checks
 
         # TODO: Settings for this in core bot db
-        for obj in objects:
-            if verify_checks and not show_hidden:
-                # Default Red behavior, can_see includes a can_run check.
-                if await obj.can_see(ctx) and getattr(obj, "enabled", True):
-                    yield obj
-            elif verify_checks:
-                try:
-                    can_run = await obj.can_run(ctx)
-                except discord.DiscordException:
-                    can_run = False
-                if can_run and getattr(obj, "enabled", True):
-                    yield obj
-            elif not show_hidden:
-                if not getattr(obj, "hidden", False):  # Cog compatibility
+        if not verify_checks:
+            for obj in objects:
+                if show_hidden or not getattr(obj, "hidden", False):  # Cog compatibility
                     yield obj
-            else:
+            return
+
+        async def is_visible(obj: SupportsCanSee, obj_ctx: Context) -> bool:
+            if not show_hidden:
+                # Default Red behavior, can_see includes a can_run check.
+                return await obj.can_see(obj_ctx) and getattr(obj, "enabled", True)
+            try:
+                can_run = await obj.can_run(obj_ctx)
+            except discord.DiscordException:
+                can_run = False
+            return can_run and getattr(obj, "enabled", True)
+
+        objects = list(objects)
+        if len(objects) == 1:
+            results = [await is_visible(objects[0], ctx)]
+        else:
+            # The checks of each object run concurrently, and they change
+            # the context's command while they run, so each gets its own copy.
+            results = await bounded_gather(
+                *(is_visible(obj, copy.copy(ctx)) for obj in objects),
+                limit=HELP_CHECK_CONCURRENCY,
+            )
+        for obj, visible in zip(objects, results):
+            if visible:
                 yield obj
 
     async def embed_requested(self, ctx: Context) -> bool:
         return await ctx.bot.embed_requested(channel=ctx, command=red_help)
 
+    async def _get_help_cache_key(
+        self, ctx: Context, target: Tuple[str, ...], help_settings: HelpSettings
+    ) -> Hashable:
+        """
+        Gets the key of rendered help, which covers everything the help's content depends on.
+        """
+        use_embeds = await self.embed_requested(ctx)
+        key = (
+            target,
+            ctx.guild.id if ctx.guild else None,
+            help_settings,
+            ctx.clean_prefix,
+            get_locale(),
+            get_regional_format(),
+            use_embeds,
+            (await ctx.embed_color()).value if use_embeds else None,
+            ctx.me.display_name,
+            str(ctx.me.display_avatar),
+        )
+        if not help_settings.verify_checks:
+            # Without the checks, everyone gets the same help.
+            return key
+
+        # The checks can depend on anything about the author and the channel, since cogs can
+        # add their own, so the help is only shared by the same author in the same channel.
+        author = ctx.author
+        if isinstance(author, discord.Member):
+            # Rules can target the author, their roles and their voice channel.
+            voice = author.voice
+            # DEP-WARN: Member._roles is the cheapest way to get the role IDs.
+            privilege = (
+                author.id,
+                tuple(author._roles),
+                voice.channel.id if voice is not None and voice.channel else None,
+                await ctx.bot._privilege_cache.get_level(author),
+            )
+        else:
+            privilege = (author.id,)
+        return key + (
+            ctx.channel.id,
+            await ctx.bot.is_owner(author),
+            privilege,
+            ctx.permissions.value,
+            ctx.bot_permissions.value,
+            commands.Requires._rules_version,
+            commands.Requires._role_positions_version,
+        )
+
+    async def _send_rendered_help(
+        self,
+        ctx: Context,
+        target: Tuple[str, ...],
+        help_settings: HelpSettings,
+        render: Callable[[], Awaitable[Optional[RenderedHelp]]],
+    ):
+        """
+        Sends the help for the target, rendering it only if it isn't cached.
+        """
+        cache = ctx.bot._help_cache
+        key = await self._get_help_cache_key(ctx, target, help_settings)
+        entry = cache.get(key)
+        if entry is not None and time.monotonic() - entry[0] < HELP_CACHE_MAX_AGE:
+            rendered = entry[1]
+        else:
+            rendered = await render()
+            cache[key] = (time.monotonic(), rendered)
+        if rendered is None:
+            return
+        pages, embed = rendered
+        if embed:
+            # Menus and the page numbers can change the embeds which are sent.
+            pages = [page.copy() for page in pages]
+        await self.send_pages(ctx, pages, embed=embed, help_settings=help_settings)
+
     async def command_not_found(self, ctx, help_for, help_settings: HelpSettings):
         """
         Sends an error, fuzzy help, or stays quiet based on settings
         """
         fuzzy_commands = await fuzzy_command_search(
-            ctx,
-            help_for,
-            commands=self.help_filter_func(
-                ctx, ctx.bot.walk_commands(), help_settings=help_settings
-            ),
-            min_score=75,
+            ctx, help_for, min_score=75, help_settings=help_settings
         )
         use_embeds = await self.embed_requested(ctx)
         if fuzzy_commands:
@@ -9,7 +9,7 @@ checks like bot permissions checks.
 import asyncio
 import enum
 import inspect
-from collections import ChainMap
+from collections import ChainMap, OrderedDict
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -17,6 +17,8 @@ from typing import (
     Callable,
     ClassVar,
     Dict,
+    FrozenSet,
+    Hashable,
     List,
     Mapping,
     Optional,
@@ -124,18 +126,8 @@ class PrivilegeLevel(enum.IntEnum):
         elif ctx.author == ctx.guild.owner:
             return cls.GUILD_OWNER
 
-        # The following is simply an optimised way to check if the user has the
-        # admin or mod role.
-        guild_settings = ctx.bot._config.guild(ctx.guild)
-
-        for snowflake in await guild_settings.admin_role():
-            if ctx.author.get_role(snowflake):
-                return cls.ADMIN
-        for snowflake in await guild_settings.mod_role():
-            if ctx.author.get_role(snowflake):
-                return cls.MOD
-
-        return cls.NONE
+        # The bot caches which of the admin and mod roles the user has.
+        return await ctx.bot._privilege_cache.get_level(ctx.author)
 
     def __repr__(self) -> str:
         return f"<{self.__class__.__name__}.{self.name}>"
@@ -315,6 +307,16 @@ class Requires:
     global rules.
     """
 
+    RULE_CACHE_SIZE: ClassVar[int] = 128
+    """How many resolved rules each Requires object remembers."""
+
+    # Bumped when roles are reordered, which changes the order rules are
+    # checked in, so that rules resolved before that aren't reused.
+    _role_positions_version: ClassVar[int] = 0
+    # Bumped whenever the rules of any Requires object change,
+    # so that results derived from them, like rendered help, can be dropped.
+    _rules_version: ClassVar[int] = 0
+
     def __init__(
         self,
         privilege_level: Optional[PrivilegeLevel],
@@ -341,6 +343,9 @@ class Requires:
             self.bot_perms = bot_perms
         self._global_rules: _RulesDict = _RulesDict()
         self._guild_rules: _IntKeyDict[_RulesDict] = _IntKeyDict[_RulesDict]()
+        # Guild ID -> IDs of the models with a global or guild rule
+        self._rule_index: Dict[int, FrozenSet[int]] = {}
+        self._rule_cache: "OrderedDict[Hashable, PermState]" = OrderedDict()
 
     @staticmethod
     def get_decorator(
@@ -425,6 +430,7 @@ class Requires:
             rules.pop(model_id, None)
         else:
             rules[model_id] = rule
+        self._invalidate_rules(guild_id)
 
     def clear_all_rules(self, guild_id: int, *, preserve_default_rule: bool = True) -> None:
         """Clear all rules of a particular scope.
@@ -451,6 +457,7 @@ class Requires:
         rules.clear()
         if default is not None and preserve_default_rule:
             rules[self.DEFAULT] = default
+        self._invalidate_rules(guild_id)
 
     def reset(self) -> None:
         """Reset this Requires object to its original state.
@@ -460,8 +467,36 @@ class Requires:
         """
         self._guild_rules.clear()  # pylint: disable=no-member
         self._global_rules.clear()  # pylint: disable=no-member
+        self._invalidate_rules(self.GLOBAL)
         self.ready_event.clear()
 
+    @classmethod
+    def role_positions_changed(cls) -> None:
+        """Forget the rules resolved by all Requires objects before roles were reordered.
+
+        The bot calls this when a role's position changes.
+        """
+        cls._role_positions_version += 1
+
+    def _invalidate_rules(self, guild_id: int) -> None:
+        Requires._rules_version += 1
+        if guild_id:
+            self._rule_index.pop(guild_id, None)
+        else:
+            self._rule_index.clear()
+        self._rule_cache.clear()
+
+    def _get_rule_index(self, guild_id: int) -> FrozenSet[int]:
+        try:
+            return self._rule_index[guild_id]
+        except KeyError:
+            pass
+        model_ids = set(self._global_rules)
+        model_ids.update(self._guild_rules.get(guild_id, ()))
+        model_ids.discard(self.DEFAULT)
+        index = self._rule_index[guild_id] = frozenset(model_ids)
+        return index
+
     async def verify(self, ctx: "Context") -> bool:
         """Check if the given context passes the requirements.
 
@@ -576,35 +611,79 @@ class Requires:
                 return rule
             return self.get_rule(self.DEFAULT, self.GLOBAL)
 
-        rules_chain = [self._global_rules]
-        guild_rules = self._guild_rules.get(ctx.guild.id)
-        if guild_rules:
-            rules_chain.append(guild_rules)
+        rule_index = self._get_rule_index(guild.id)
+        if not rule_index:
+            return self._get_default_rule(guild.id)
 
-        channels = []
-        if author.voice is not None:
-            channels.append(author.voice.channel)
+        voice = getattr(author, "voice", None)
+        voice_channel_id = voice.channel.id if voice is not None and voice.channel else None
         if isinstance(ctx.channel, discord.Thread):
-            channels.append(ctx.channel.parent)
+            channel_id = ctx.channel.parent_id
         else:
-            channels.append(ctx.channel)
+            channel_id = ctx.channel.id
         category = ctx.channel.category
-        if category is not None:
-            channels.append(category)
-
-        # We want author roles sorted highest to lowest, and exclude the @everyone role
-        author_roles = reversed(author.roles[1:])
-
-        model_chain = [author, *channels, *author_roles, guild]
+        category_id = category.id if category is not None else None
+        # DEP-WARN
+        # This uses member._roles, a sorted `discord.utils.SnowflakeList`,
+        # whose contents make up the author's role signature.
+        author_role_ids = getattr(author, "_roles", ())
+
+        key = (
+            guild.id,
+            author.id,
+            voice_channel_id,
+            channel_id,
+            category_id,
+            tuple(author_role_ids),
+            self._role_positions_version,
+        )
+        try:
+            rule = self._rule_cache[key]
+        except KeyError:
+            pass
+        else:
+            self._rule_cache.move_to_end(key)
+            return rule
+
+        # Only the roles which have a rule matter, and of those, the highest one
+        # is checked first. The @everyone role is excluded, as it's not in `_roles`.
+        ruled_roles = filter(None, map(guild.get_role, rule_index.intersection(author_role_ids)))
+        model_ids = [
+            author.id,
+            *(
+                model_id
+                for model_id in (voice_channel_id, channel_id, category_id)
+                if model_id is not None
+            ),
+            *(role.id for role in sorted(ruled_roles, reverse=True)),
+            guild.id,
+        ]
+
+        rule = self._find_rule(guild.id, model_ids)
+        if rule is None:
+            rule = self._get_default_rule(guild.id)
+
+        self._rule_cache[key] = rule
+        if len(self._rule_cache) > self.RULE_CACHE_SIZE:
+            self._rule_cache.popitem(last=False)
+        return rule
+
+    def _find_rule(self, guild_id: int, model_ids: List[int]) -> Optional[PermState]:
+        rules_chain = [self._global_rules]
+        guild_rules = self._guild_rules.get(guild_id)
+        if guild_rules:
+            rules_chain.append(guild_rules)
 
         for rules in rules_chain:
-            for model in model_chain:
-                rule = rules.get(model.id)
+            for model_id in model_ids:
+                rule = rules.get(model_id)
                 if rule is not None:
                     return rule
-            del model_chain[-1]  # We don't check for the guild in guild rules
+            del model_ids[-1]  # We don't check for the guild in guild rules
+        return None
 
-        default_rule = self.get_rule(self.DEFAULT, guild.id)
+    def _get_default_rule(self, guild_id: int) -> PermState:
+        default_rule = self.get_rule(self.DEFAULT, guild_id)
         if default_rule is PermState.NORMAL:
             default_rule = self.get_rule(self.DEFAULT, self.GLOBAL)
         return default_rule
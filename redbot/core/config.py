@@ -4,11 +4,16 @@ import json
 import logging
 import pickle
 import weakref
+from pathlib import Path
 from typing import (
     Any,
     AsyncContextManager,
+    AsyncIterator,
     Awaitable,
     Dict,
+    Iterator,
+    List,
+    Mapping,
     MutableMapping,
     Optional,
     Tuple,
@@ -19,9 +24,10 @@ from typing import (
 
 import discord
 
+from ._config_stats import config_stats
 from .drivers import IdentifierData, get_driver, ConfigCategory, BaseDriver
 
-__all__ = ["Config", "get_latest_confs", "migrate"]
+__all__ = ["Config", "FrozenDict", "FrozenList", "get_latest_confs", "migrate"]
 
 log = logging.getLogger("red.config")
 
@@ -66,6 +72,111 @@ def get_latest_confs() -> Tuple["Config"]:
     return tuple(ret)
 
 
+class FrozenDict(collections.abc.Mapping):
+    """A read-only view of a `dict` stored in Config.
+
+    Views are returned by `Value.view`, `Group.view_raw` and the ``all_*``
+    methods of `Config` when ``as_views`` is passed. They wrap the stored data
+    without copying it, and registered defaults are mixed in lazily, as
+    keys are looked up. Nested `dict` and `list` values are returned as views
+    too.
+
+    Views can't be modified. Use `to_dict` to get a mutable deep copy, or
+    set the new value through Config instead.
+
+    .. warning::
+
+        A view isn't a snapshot. Depending on the driver, it may reflect
+        changes made to the data after it was retrieved, so don't keep views
+        around for longer than needed.
+    """
+
+    __slots__ = ("_data", "_defaults")
+
+    def __init__(self, data: Mapping[str, Any], defaults: Optional[Mapping[str, Any]] = None):
+        self._data = data
+        self._defaults = defaults if defaults is not None else {}
+
+    def __getitem__(self, key: str) -> Any:
+        try:
+            value = self._data[key]
+        except KeyError:
+            return _freeze(self._defaults[key])
+        if isinstance(value, dict):
+            default = self._defaults.get(key)
+            return FrozenDict(value, default if isinstance(default, dict) else None)
+        return _freeze(value)
+
+    def __iter__(self) -> Iterator[str]:
+        yield from self._data
+        for key in self._defaults:
+            if key not in self._data:
+                yield key
+
+    def __len__(self) -> int:
+        return len(self._data) + sum(1 for key in self._defaults if key not in self._data)
+
+    def __repr__(self) -> str:
+        return f"FrozenDict({dict(self.items())!r})"
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Get a mutable deep copy of this view, with defaults mixed in."""
+        return {
+            key: value.to_dict() if isinstance(value, FrozenDict) else _thaw(value)
+            for key, value in self.items()
+        }
+
+
+class FrozenList(collections.abc.Sequence):
+    """A read-only view of a `list` stored in Config.
+
+    See `FrozenDict` for more details.
+    """
+
+    __slots__ = ("_data",)
+
+    def __init__(self, data: list):
+        self._data = data
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return FrozenList(self._data[index])
+        return _freeze(self._data[index])
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (list, FrozenList)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"FrozenList({list(self)!r})"
+
+    def to_list(self) -> list:
+        """Get a mutable deep copy of this view."""
+        return [_thaw(value) for value in self]
+
+
+def _freeze(value: Any) -> Any:
+    if isinstance(value, dict):
+        return FrozenDict(value)
+    if isinstance(value, list):
+        return FrozenList(value)
+    return value
+
+
+def _thaw(value: Any) -> Any:
+    if isinstance(value, FrozenDict):
+        return value.to_dict()
+    if isinstance(value, FrozenList):
+        return value.to_list()
+    return value
+
+
 class _ValueCtxManager(Awaitable[_T], AsyncContextManager[_T]):  # pylint: disable=duplicate-bases
     """Context manager implementation of config values.
 
@@ -173,11 +284,52 @@ class Value:
         return self._config._lock_cache.setdefault(self.identifier_data, asyncio.Lock())
 
     async def _get(self, default=...):
+        start = config_stats.start()
         try:
-            ret = await self.driver.get(self.identifier_data)
+            raw = await self.driver.get(self.identifier_data)
         except KeyError:
-            return default if default is not ... else self.default
-        return ret
+            raw = ...
+        if start is not None:
+            config_stats.record(self.identifier_data, "get", start, raw)
+        return self._from_raw(raw, default)
+
+    def _from_raw(self, raw, default=...):
+        # `raw` is what the driver returned for this value, or `...` if nothing is stored.
+        if raw is not ...:
+            return raw
+        if default is not ...:
+            return default
+        if isinstance(self.default, (dict, list)):
+            # Registered defaults are shared, so callers must get their own copy.
+            return pickle.loads(pickle.dumps(self.default, -1))
+        return self.default
+
+    async def view(self, default=...) -> Any:
+        """Get a read-only view of this data element.
+
+        This is an alternative to `__call__` for reading large values without
+        copying them. If the value is a `dict` or a `list`, it is returned as a
+        `FrozenDict` or `FrozenList` which wraps the stored data. Other values
+        are returned as-is.
+
+        To modify the value, use `__call__` as a context manager, or `set`.
+
+        Parameters
+        ----------
+        default : `object`, optional
+            Same as the ``default`` parameter of `__call__`.
+
+        Returns
+        -------
+        Any
+            The read-only value.
+
+        """
+        try:
+            ret = await self.driver.get_view(self.identifier_data)
+        except KeyError:
+            ret = default if default is not ... else self.default
+        return _freeze(ret)
 
     def __call__(self, default=..., *, acquire_lock: bool = True) -> _ValueCtxManager[Any]:
         """Get the literal value of this data element.
@@ -255,13 +407,111 @@ class Value:
         """
         if isinstance(value, dict):
             value = _str_key_dict(value)
+        start = config_stats.start()
         await self.driver.set(self.identifier_data, value=value)
+        if start is not None:
+            config_stats.record(self.identifier_data, "set", start, value)
 
     async def clear(self):
         """
         Clears the value from record for the data element pointed to by `identifiers`.
         """
+        start = config_stats.start()
         await self.driver.clear(self.identifier_data)
+        if start is not None:
+            config_stats.record(self.identifier_data, "clear", start, ...)
+
+    async def inc(
+        self,
+        delta: Union[int, float] = 1,
+        default=...,
+        *,
+        min_value: Optional[Union[int, float]] = None,
+        max_value: Optional[Union[int, float]] = None,
+    ) -> Union[int, float]:
+        """Increment the number pointed to by `identifiers`.
+
+        Unlike getting the value and setting it again, this is a single
+        atomic operation for the storage backend, so no lock is needed and
+        no increments are lost when several callers (or bot processes)
+        update the same value at once.
+
+        Example
+        -------
+        ::
+
+            # Adds 1 to the guild's case counter and returns the new count
+            case_number = await config.guild(some_guild).case_count.inc()
+
+            # Takes 5 from the member's tokens, unless they have less than 5
+            tokens = await config.member(some_member).tokens.inc(-5, min_value=0)
+
+        Parameters
+        ----------
+        delta : Union[int, float]
+            The amount to increment by. Use a negative number to decrement.
+            Defaults to ``1``.
+        default : Union[int, float], optional
+            The value to increment when there's no value stored. This
+            overrides the registered default.
+        min_value : Optional[Union[int, float]]
+            The lowest value the number may be incremented to.
+        max_value : Optional[Union[int, float]]
+            The highest value the number may be incremented to.
+
+        Returns
+        -------
+        Union[int, float]
+            The new value.
+
+        Raises
+        ------
+        TypeError
+            If ``delta``, the default or a bound is not a number.
+        `redbot.core.errors.StoredTypeError`
+            If the stored value is not a number.
+        `redbot.core.errors.OutOfRangeError`
+            If the new value would be lower than ``min_value`` or higher
+            than ``max_value``. The stored value is left unchanged.
+
+        """
+        default = default if default is not ... else self.default
+        bounds = [bound for bound in (min_value, max_value) if bound is not None]
+        for number in (delta, default, *bounds):
+            if isinstance(number, bool) or not isinstance(number, (int, float)):
+                raise TypeError(f"Expected a number, got {number!r}.")
+        return await self.driver.inc(
+            self.identifier_data, delta, default, min_value=min_value, max_value=max_value
+        )
+
+    async def toggle(self, default=...) -> bool:
+        """Toggle the boolean pointed to by `identifiers`.
+
+        Like `inc`, this is a single atomic operation for the storage backend.
+
+        Parameters
+        ----------
+        default : bool, optional
+            The value to toggle when there's no value stored. This
+            overrides the registered default.
+
+        Returns
+        -------
+        bool
+            The new value.
+
+        Raises
+        ------
+        TypeError
+            If the default is not a boolean.
+        `redbot.core.errors.StoredTypeError`
+            If the stored value is not a boolean.
+
+        """
+        default = default if default is not ... else self.default
+        if not isinstance(default, bool):
+            raise TypeError(f"Expected a boolean, got {default!r}.")
+        return await self.driver.toggle(self.identifier_data, default)
 
 
 class Group(Value):
@@ -300,14 +550,31 @@ class Group(Value):
     def defaults(self):
         return pickle.loads(pickle.dumps(self._defaults, -1))
 
-    async def _get(self, default: Dict[str, Any] = ...) -> Dict[str, Any]:
+    def _from_raw(self, raw, default: Dict[str, Any] = ...) -> Dict[str, Any]:
         default = default if default is not ... else self.defaults
-        raw = await super()._get(default)
+        raw = super()._from_raw(raw, default)
         if isinstance(raw, dict):
             return self.nested_update(raw, default)
         else:
             return raw
 
+    async def view(self, default: Dict[str, Any] = ...) -> Any:
+        """Get a read-only view of this group's data.
+
+        Registered defaults are mixed in the same way as in `all`, but without
+        copying either the stored data or the defaults.
+
+        See `Value.view` for more details.
+        """
+        default = default if default is not ... else self._defaults
+        try:
+            raw = await self.driver.get_view(self.identifier_data)
+        except KeyError:
+            raw = default
+        if isinstance(raw, dict):
+            return FrozenDict(raw, default if isinstance(default, dict) else None)
+        return _freeze(raw)
+
     # noinspection PyTypeChecker
     def __getattr__(self, item: str) -> Union["Group", Value]:
         """Get an attribute of this group.
@@ -383,7 +650,10 @@ class Group(Value):
         """
         path = tuple(str(p) for p in nested_path)
         identifier_data = self.identifier_data.get_child(*path)
+        start = config_stats.start()
         await self.driver.clear(identifier_data)
+        if start is not None:
+            config_stats.record(identifier_data, "clear", start, ...)
 
     def is_group(self, item: Any) -> bool:
         """A helper method for `__getattr__`. Most developers will have no need
@@ -491,27 +761,66 @@ class Group(Value):
         path = tuple(str(p) for p in nested_path)
 
         if default is ...:
-            poss_default = self.defaults
-            for ident in path:
-                try:
-                    poss_default = poss_default[ident]
-                except KeyError:
-                    break
-            else:
-                default = poss_default
+            default = self._get_raw_default(path)
+            if default is not ...:
+                default = pickle.loads(pickle.dumps(default, -1))
 
         identifier_data = self.identifier_data.get_child(*path)
+        start = config_stats.start()
         try:
             raw = await self.driver.get(identifier_data)
         except KeyError:
+            if start is not None:
+                config_stats.record(identifier_data, "get", start, ...)
             if default is not ...:
                 return default
             raise
         else:
+            if start is not None:
+                config_stats.record(identifier_data, "get", start, raw)
             if isinstance(default, dict):
                 return self.nested_update(raw, default)
             return raw
 
+    async def view_raw(self, *nested_path: Any, default=...) -> Any:
+        """
+        Get a read-only view of the data at the given path.
+
+        This is the `view` counterpart of `get_raw`, and takes the same
+        parameters.
+
+        Raises
+        ------
+        KeyError
+            If the value does not exist yet in Config's internal storage.
+
+        """
+        path = tuple(str(p) for p in nested_path)
+
+        if default is ...:
+            default = self._get_raw_default(path)
+
+        identifier_data = self.identifier_data.get_child(*path)
+        try:
+            raw = await self.driver.get_view(identifier_data)
+        except KeyError:
+            if default is not ...:
+                return _freeze(default)
+            raise
+        if isinstance(raw, dict) and isinstance(default, dict):
+            return FrozenDict(raw, default)
+        return _freeze(raw)
+
+    def _get_raw_default(self, path: Tuple[str, ...]) -> Any:
+        # This returns the registered default itself, callers must not modify it.
+        poss_default = self._defaults
+        for ident in path:
+            try:
+                poss_default = poss_default[ident]
+            except (KeyError, TypeError):
+                return ...
+        return poss_default
+
     def all(self, *, acquire_lock: bool = True) -> _ValueCtxManager[Dict[str, Any]]:
         """Get a dictionary representation of this group's data.
 
@@ -587,7 +896,10 @@ class Group(Value):
         identifier_data = self.identifier_data.get_child(*path)
         if isinstance(value, dict):
             value = _str_key_dict(value)
+        start = config_stats.start()
         await self.driver.set(identifier_data, value=value)
+        if start is not None:
+            config_stats.record(identifier_data, "set", start, value)
 
 
 class Config(metaclass=ConfigMeta):
@@ -936,7 +1248,8 @@ class Config(metaclass=ConfigMeta):
             # Don't mix in defaults with groups higher than the document level
             defaults = {}
         else:
-            defaults = self.defaults.get(category, {})
+            # Groups and values don't modify their defaults, so they can share ours.
+            defaults = self._defaults.get(category, {})
         return Group(
             identifier_data=identifier_data,
             defaults=defaults,
@@ -1168,7 +1481,83 @@ class Config(metaclass=ConfigMeta):
             raise ValueError(f"Group identifier not initialized: {group_identifier}")
         return self._get_base_group(str(group_identifier), *map(str, identifiers))
 
-    async def _all_from_scope(self, scope: str) -> Dict[int, Dict[Any, Any]]:
+    async def get_many(self, *values: Union[Group, Value]) -> List[Any]:
+        """Get several values in one go.
+
+        This is equivalent to awaiting each of the given values in turn, but
+        drivers may fetch them all with a single query, which avoids a round
+        trip for each value.
+
+        Example
+        -------
+        ::
+
+            next_payday, payday_time = await conf.get_many(
+                conf.user(ctx.author).next_payday, conf.PAYDAY_TIME
+            )
+
+        Parameters
+        ----------
+        *values : `Value`
+            The values to get. They must belong to this Config object.
+
+        Returns
+        -------
+        List[Any]
+            The value of each of the given values, in the same order.
+
+        Raises
+        ------
+        ValueError
+            If one of the values belongs to a different Config object.
+
+        """
+        for value in values:
+            if value._config is not self:
+                raise ValueError("All values must belong to this Config object.")
+        raw_values = await self.driver.get_many([value.identifier_data for value in values])
+        return [value._from_raw(raw_values.get(value.identifier_data, ...)) for value in values]
+
+    async def set_many(self, values: Mapping[Union[Group, Value], Any]) -> None:
+        """Set several values in one go.
+
+        This is equivalent to calling `Value.set` for each of the given values
+        in turn, but drivers may write them all with a single query or
+        transaction.
+
+        Example
+        -------
+        ::
+
+            await conf.set_many({conf.PAYDAY_TIME: 300, conf.PAYDAY_CREDITS: 120})
+
+        Parameters
+        ----------
+        values : Mapping[`Value`, Any]
+            A mapping of the values to set to their new literal values. The
+            values must belong to this Config object.
+
+        Raises
+        ------
+        ValueError
+            If one of the values belongs to a different Config object, or a
+            `Group` is set to something other than a `dict`.
+
+        """
+        items = []
+        for value_obj, value in values.items():
+            if value_obj._config is not self:
+                raise ValueError("All values must belong to this Config object.")
+            if isinstance(value, dict):
+                value = _str_key_dict(value)
+            elif isinstance(value_obj, Group):
+                raise ValueError("You may only set the value of a group to be a dict.")
+            items.append((value_obj.identifier_data, value))
+        await self.driver.set_many(items)
+
+    async def _all_from_scope(
+        self, scope: str, *, as_views: bool = False
+    ) -> Dict[int, Dict[Any, Any]]:
         """Get a dict of all values from a particular scope of data.
 
         :code:`scope` must be one of the constants attributed to
@@ -1178,24 +1567,35 @@ class Config(metaclass=ConfigMeta):
 
         Default values are also mixed into the data if they have not yet been
         overwritten.
+
+        When ``as_views`` is ``True``, the values of the returned dict
+        are `FrozenDict` views instead of copies.
         """
         group = self._get_base_group(scope)
         ret = {}
-        defaults = self.defaults.get(scope, {})
+        defaults = self._defaults.get(scope, {})
 
+        start = config_stats.start()
         try:
-            dict_ = await self.driver.get(group.identifier_data)
+            if as_views:
+                dict_ = await self.driver.get_view(group.identifier_data)
+            else:
+                dict_ = await self.driver.get(group.identifier_data)
         except KeyError:
-            pass
-        else:
-            for k, v in dict_.items():
-                data = pickle.loads(pickle.dumps(defaults, -1))
-                data.update(v)
-                ret[int(k)] = data
+            dict_ = {}
+        if start is not None:
+            config_stats.record(group.identifier_data, "get_all", start, dict_)
+        for k, v in dict_.items():
+            if as_views:
+                ret[int(k)] = FrozenDict(v, defaults)
+                continue
+            data = pickle.loads(pickle.dumps(defaults, -1))
+            data.update(v)
+            ret[int(k)] = data
 
         return ret
 
-    async def all_guilds(self) -> dict:
+    async def all_guilds(self, *, as_views: bool = False) -> dict:
         """Get all guild data as a dict.
 
         Note
@@ -1203,6 +1603,13 @@ class Config(metaclass=ConfigMeta):
         The return value of this method will include registered defaults for
         values which have not yet been set.
 
+        Parameters
+        ----------
+        as_views : bool
+            Set to ``True`` to get read-only `FrozenDict` views of the data
+            instead of copies. This is much cheaper for large scopes.
+            Defaults to ``False``.
+
         Returns
         -------
         dict
@@ -1210,9 +1617,9 @@ class Config(metaclass=ConfigMeta):
             :code:`GUILD_ID -> data`.
 
         """
-        return await self._all_from_scope(self.GUILD)
+        return await self._all_from_scope(self.GUILD, as_views=as_views)
 
-    async def all_channels(self) -> dict:
+    async def all_channels(self, *, as_views: bool = False) -> dict:
         """Get all channel data as a dict.
 
         Note
@@ -1220,6 +1627,13 @@ class Config(metaclass=ConfigMeta):
         The return value of this method will include registered defaults for
         values which have not yet been set.
 
+        Parameters
+        ----------
+        as_views : bool
+            Set to ``True`` to get read-only `FrozenDict` views of the data
+            instead of copies. This is much cheaper for large scopes.
+            Defaults to ``False``.
+
         Returns
         -------
         dict
@@ -1227,9 +1641,9 @@ class Config(metaclass=ConfigMeta):
             :code:`CHANNEL_ID -> data`.
 
         """
-        return await self._all_from_scope(self.CHANNEL)
+        return await self._all_from_scope(self.CHANNEL, as_views=as_views)
 
-    async def all_roles(self) -> dict:
+    async def all_roles(self, *, as_views: bool = False) -> dict:
         """Get all role data as a dict.
 
         Note
@@ -1237,6 +1651,13 @@ class Config(metaclass=ConfigMeta):
         The return value of this method will include registered defaults for
         values which have not yet been set.
 
+        Parameters
+        ----------
+        as_views : bool
+            Set to ``True`` to get read-only `FrozenDict` views of the data
+            instead of copies. This is much cheaper for large scopes.
+            Defaults to ``False``.
+
         Returns
         -------
         dict
@@ -1244,9 +1665,9 @@ class Config(metaclass=ConfigMeta):
             :code:`ROLE_ID -> data`.
 
         """
-        return await self._all_from_scope(self.ROLE)
+        return await self._all_from_scope(self.ROLE, as_views=as_views)
 
-    async def all_users(self) -> dict:
+    async def all_users(self, *, as_views: bool = False) -> dict:
         """Get all user data as a dict.
 
         Note
@@ -1254,6 +1675,13 @@ class Config(metaclass=ConfigMeta):
         The return value of this method will include registered defaults for
         values which have not yet been set.
 
+        Parameters
+        ----------
+        as_views : bool
+            Set to ``True`` to get read-only `FrozenDict` views of the data
+            instead of copies. This is much cheaper for large scopes.
+            Defaults to ``False``.
+
         Returns
         -------
         dict
@@ -1261,18 +1689,21 @@ class Config(metaclass=ConfigMeta):
             :code:`USER_ID -> data`.
 
         """
-        return await self._all_from_scope(self.USER)
+        return await self._all_from_scope(self.USER, as_views=as_views)
 
-    def _all_members_from_guild(self, guild_data: dict) -> dict:
+    def _all_members_from_guild(self, guild_data: dict, *, as_views: bool = False) -> dict:
         ret = {}
-        defaults = self.defaults.get(self.MEMBER, {})
+        defaults = self._defaults.get(self.MEMBER, {})
         for member_id, member_data in guild_data.items():
+            if as_views:
+                ret[int(member_id)] = FrozenDict(member_data, defaults)
+                continue
             new_member_data = pickle.loads(pickle.dumps(defaults, -1))
             new_member_data.update(member_data)
             ret[int(member_id)] = new_member_data
         return ret
 
-    async def all_members(self, guild: discord.Guild = None) -> dict:
+    async def all_members(self, guild: discord.Guild = None, *, as_views: bool = False) -> dict:
         """Get data for all members.
 
         If :code:`guild` is specified, only the data for the members of that
@@ -1290,6 +1721,10 @@ class Config(metaclass=ConfigMeta):
         guild : `discord.Guild`, optional
             The guild to get the member data from. Can be omitted if data
             from every member of all guilds is desired.
+        as_views : bool
+            Set to ``True`` to get read-only `FrozenDict` views of each
+            member's data instead of copies. This is much cheaper for large
+            guilds. Defaults to ``False``.
 
         Returns
         -------
@@ -1297,25 +1732,148 @@ class Config(metaclass=ConfigMeta):
             A dictionary of all specified member data.
 
         """
-        ret = {}
+        get = self.driver.get_view if as_views else self.driver.get
         if guild is None:
             group = self._get_base_group(self.MEMBER)
-            try:
-                dict_ = await self.driver.get(group.identifier_data)
-            except KeyError:
-                pass
-            else:
-                for guild_id, guild_data in dict_.items():
-                    ret[int(guild_id)] = self._all_members_from_guild(guild_data)
         else:
             group = self._get_base_group(self.MEMBER, str(guild.id))
-            try:
-                guild_data = await self.driver.get(group.identifier_data)
-            except KeyError:
-                pass
+        start = config_stats.start()
+        try:
+            dict_ = await get(group.identifier_data)
+        except KeyError:
+            dict_ = {}
+        if start is not None:
+            config_stats.record(group.identifier_data, "get_all", start, dict_)
+
+        if guild is not None:
+            return self._all_members_from_guild(dict_, as_views=as_views)
+        return {
+            int(guild_id): self._all_members_from_guild(guild_data, as_views=as_views)
+            for guild_id, guild_data in dict_.items()
+        }
+
+    async def _iter_scope(
+        self, scope: str, *primary_keys: str, batch: int
+    ) -> AsyncIterator[Tuple[Tuple[int, ...], Dict[str, Any]]]:
+        """Iterate over all documents from a particular scope of data.
+
+        Documents are fetched lazily, ``batch`` at a time, and registered
+        defaults are mixed into each document as it is yielded, the same way
+        as in `_all_from_scope`.
+        """
+        if batch < 1:
+            raise ValueError("Batch size must be higher than or equal to 1")
+        group = self._get_base_group(scope, *primary_keys)
+        defaults = self._defaults.get(scope, {})
+        async for pkey, document in self.driver.aiter_documents(
+            group.identifier_data, batch_size=batch
+        ):
+            data = pickle.loads(pickle.dumps(defaults, -1))
+            data.update(document)
+            yield tuple(map(int, pkey)), data
+
+    async def iter_guilds(self, *, batch: int = 500) -> AsyncIterator[Tuple[int, Dict[str, Any]]]:
+        """Iterate over all guild data.
+
+        Unlike `all_guilds`, this doesn't load all of the data at once,
+        which is much cheaper for bots in many guilds::
+
+            async for guild_id, guild_data in config.iter_guilds():
+                ...
+
+        Note
+        ----
+        The yielded data will include registered defaults for values which
+        have not yet been set.
+
+        Parameters
+        ----------
+        batch : int
+            How many guilds to fetch from the storage backend at a time.
+            Defaults to 500.
+
+        Yields
+        ------
+        Tuple[int, dict]
+            ``(GUILD_ID, data)`` pairs.
+
+        """
+        async for (guild_id,), data in self._iter_scope(self.GUILD, batch=batch):
+            yield guild_id, data
+
+    async def iter_channels(
+        self, *, batch: int = 500
+    ) -> AsyncIterator[Tuple[int, Dict[str, Any]]]:
+        """Iterate over all channel data.
+
+        See `iter_guilds` for more details.
+
+        Yields
+        ------
+        Tuple[int, dict]
+            ``(CHANNEL_ID, data)`` pairs.
+
+        """
+        async for (channel_id,), data in self._iter_scope(self.CHANNEL, batch=batch):
+            yield channel_id, data
+
+    async def iter_roles(self, *, batch: int = 500) -> AsyncIterator[Tuple[int, Dict[str, Any]]]:
+        """Iterate over all role data.
+
+        See `iter_guilds` for more details.
+
+        Yields
+        ------
+        Tuple[int, dict]
+            ``(ROLE_ID, data)`` pairs.
+
+        """
+        async for (role_id,), data in self._iter_scope(self.ROLE, batch=batch):
+            yield role_id, data
+
+    async def iter_users(self, *, batch: int = 500) -> AsyncIterator[Tuple[int, Dict[str, Any]]]:
+        """Iterate over all user data.
+
+        See `iter_guilds` for more details.
+
+        Yields
+        ------
+        Tuple[int, dict]
+            ``(USER_ID, data)`` pairs.
+
+        """
+        async for (user_id,), data in self._iter_scope(self.USER, batch=batch):
+            yield user_id, data
+
+    async def iter_members(
+        self, guild: Optional[discord.Guild] = None, *, batch: int = 500
+    ) -> AsyncIterator[Tuple[int, int, Dict[str, Any]]]:
+        """Iterate over member data.
+
+        See `iter_guilds` for more details.
+
+        Parameters
+        ----------
+        guild : `discord.Guild`, optional
+            The guild to get the member data from. Can be omitted to iterate
+            over members of all guilds.
+        batch : int
+            How many members to fetch from the storage backend at a time.
+            Defaults to 500.
+
+        Yields
+        ------
+        Tuple[int, int, dict]
+            ``(GUILD_ID, MEMBER_ID, data)`` tuples.
+
+        """
+        primary_keys = () if guild is None else (str(guild.id),)
+        async for pkey, data in self._iter_scope(self.MEMBER, *primary_keys, batch=batch):
+            if guild is None:
+                guild_id, member_id = pkey
             else:
-                ret = self._all_members_from_guild(guild_data)
-        return ret
+                guild_id, member_id = guild.id, pkey[0]
+            yield guild_id, member_id, data
 
     async def _clear_scope(self, *scopes: str):
         """Clear all data in a particular scope.
@@ -1522,14 +2080,26 @@ class Config(metaclass=ConfigMeta):
             return self._lock_cache.setdefault(id_data, asyncio.Lock())
 
 
-async def migrate(cur_driver_cls: Type[BaseDriver], new_driver_cls: Type[BaseDriver]) -> None:
-    """Migrate from one driver type to another."""
+async def migrate(
+    cur_driver_cls: Type[BaseDriver],
+    new_driver_cls: Type[BaseDriver],
+    *,
+    workers: int = 1,
+    checkpoint_path: Optional[Path] = None,
+) -> None:
+    """Migrate from one driver type to another.
+
+    See `BaseDriver.migrate_to` for the meaning of ``workers`` and
+    ``checkpoint_path``.
+    """
     # Get custom group data
     core_conf = Config.get_core_conf(allow_old=True)
     core_conf.init_custom("CUSTOM_GROUPS", 2)
     all_custom_group_data = await core_conf.custom("CUSTOM_GROUPS").all()
 
-    await cur_driver_cls.migrate_to(new_driver_cls, all_custom_group_data)
+    await cur_driver_cls.migrate_to(
+        new_driver_cls, all_custom_group_data, workers=workers, checkpoint_path=checkpoint_path
+    )
 
 
 def _str_key_dict(value: Dict[Any, _T]) -> Dict[str, _T]:
@@ -24,6 +24,7 @@ from redbot.core.commands import GuildConverter, RawUserIdConverter
 from string import ascii_letters, digits
 from typing import (
     TYPE_CHECKING,
+    Any,
     Union,
     Tuple,
     List,
@@ -50,6 +51,9 @@ from . import (
     bank,
     modlog,
 )
+from ._command_stats import PHASES, command_stats
+from ._config_stats import config_stats
+from ._loop_monitor import loop_monitor
 from ._diagnoser import IssueDiagnoser
 from .utils import AsyncIter, can_user_send_messages_in
 from .utils._internal_utils import fetch_latest_red_version_info
@@ -132,6 +136,10 @@ class CoreLogic:
         self.bot.register_rpc_handler(self._prefixes)
         self.bot.register_rpc_handler(self._version_info)
         self.bot.register_rpc_handler(self._invite_url)
+        self.bot.register_rpc_handler(self._config_stats)
+        self.bot.register_rpc_handler(self._loop_stats)
+        self.bot.register_rpc_handler(self._cache_stats)
+        self.bot.register_rpc_handler(self._command_stats)
 
     async def _load(self, pkg_names: Iterable[str]) -> Dict[str, Union[List[str], Dict[str, str]]]:
         """
@@ -295,6 +303,10 @@ class CoreLogic:
                 await bot.unload_extension(name)
                 await bot.remove_loaded_package(name)
                 unloaded_packages.append(name)
+            elif bot._lazy_packages.is_lazy(name):
+                bot._lazy_packages.remove_stubs(name)
+                await bot.remove_loaded_package(name)
+                unloaded_packages.append(name)
             else:
                 notloaded_packages.append(name)
 
@@ -381,6 +393,76 @@ class CoreLogic:
         """
         return await self.bot.get_invite_url()
 
+    async def _config_stats(self, limit: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Statistics of Config operations, as collected by the Config profiler.
+
+        Parameters
+        ----------
+        limit : Optional[int]
+            How many of the busiest entries to return. Defaults to all of them.
+
+        Returns
+        -------
+        dict
+            ``sample_rate``, ``started_at`` and ``operations`` keys. Each operation
+            is a dict with the cog, category and kind of operation, the estimated
+            number of operations and bytes, and latency percentiles in seconds.
+        """
+        return config_stats.to_dict(limit)
+
+    async def _loop_stats(self, minutes: int = 10, limit: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Statistics of the event loop, as collected by the loop monitor.
+
+        Parameters
+        ----------
+        minutes : int
+            How many of the last minutes to include, up to 60.
+        limit : Optional[int]
+            How many of the slowest listeners and tasks to return. Defaults to all of them.
+
+        Returns
+        -------
+        dict
+            ``running``, ``threshold``, ``started_at``, ``lag``, ``callbacks`` and
+            ``stalls`` keys. Each callback is a dict with the kind (listener or task),
+            owner and name of the callback, how many times it ran, and how long it
+            held the event loop in total and at most, in seconds.
+        """
+        return loop_monitor.to_dict(minutes, limit)
+
+    async def _cache_stats(self) -> List[Dict[str, Any]]:
+        """
+        Statistics of the caches of the core settings.
+
+        Returns
+        -------
+        list
+            A dict for each cache with its name, number of entries, maximum number
+            of entries, idle TTL, approximate size in bytes, hits, misses, hit rate,
+            evictions and expirations.
+        """
+        return [cache.to_dict() for cache in self.bot._get_settings_caches()]
+
+    async def _command_stats(self, limit: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Latency statistics of the commands which were invoked.
+
+        Parameters
+        ----------
+        limit : Optional[int]
+            How many of the slowest commands to return. Defaults to all of them.
+
+        Returns
+        -------
+        dict
+            ``slow_threshold``, ``started_at`` and ``commands`` keys. Each command
+            is a dict with its qualified name, number of calls and failures, duration
+            percentiles over its last calls and mean duration of each phase, in seconds.
+        """
+        return command_stats.to_dict(limit)
+
     @staticmethod
     async def _can_get_invite_url(ctx):
         is_owner = await ctx.bot.is_owner(ctx.author)
@@ -1721,6 +1803,8 @@ class Core(commands.commands._RuleDropper, commands.Cog, CoreLogic):
         cogs = tuple(map(lambda cog: cog.rstrip(","), cogs))
         async with ctx.typing():
             outcomes = await self._load(cogs)
+            if outcomes["loaded_packages"]:
+                await ctx.bot._notify_cluster("load", packages=outcomes["loaded_packages"])
 
         output = []
 
@@ -1831,6 +1915,8 @@ class Core(commands.commands._RuleDropper, commands.Cog, CoreLogic):
         """
         cogs = tuple(map(lambda cog: cog.rstrip(","), cogs))
         outcomes = await self._unload(cogs)
+        if outcomes["unloaded_packages"]:
+            await ctx.bot._notify_cluster("unload", packages=outcomes["unloaded_packages"])
 
         output = []
 
@@ -1880,6 +1966,8 @@ class Core(commands.commands._RuleDropper, commands.Cog, CoreLogic):
         cogs = tuple(map(lambda cog: cog.rstrip(","), cogs))
         async with ctx.typing():
             outcomes = await self._reload(cogs)
+            if outcomes["loaded_packages"]:
+                await ctx.bot._notify_cluster("reload", packages=outcomes["loaded_packages"])
 
         output = []
 
@@ -2654,12 +2742,12 @@ class Core(commands.commands._RuleDropper, commands.Cog, CoreLogic):
                 await ctx.send(_("The maximum length of the stream title is 128 characters."))
                 return
             activity = discord.Streaming(url=streamer, name=stream_title)
-            await ctx.bot.change_presence(status=status, activity=activity)
+            await self._change_presence(status=status, activity=activity)
         elif streamer is not None:
             await ctx.send_help()
             return
         else:
-            await ctx.bot.change_presence(activity=None, status=status)
+            await self._change_presence(activity=None, status=status)
         await ctx.send(_("Done."))
 
     @_set_status.command(name="playing", aliases=["game"])
@@ -2688,7 +2776,7 @@ class Core(commands.commands._RuleDropper, commands.Cog, CoreLogic):
         else:
             game = None
         status = ctx.bot.guilds[0].me.status if len(ctx.bot.guilds) > 0 else discord.Status.online
-        await ctx.bot.change_presence(status=status, activity=game)
+        await self._change_presence(status=status, activity=game)
         if game:
             await ctx.send(_("Status set to `Playing {game.name}`.").format(game=game))
         else:
@@ -2719,7 +2807,7 @@ class Core(commands.commands._RuleDropper, commands.Cog, CoreLogic):
             activity = discord.Activity(name=listening, type=discord.ActivityType.listening)
         else:
             activity = None
-        await ctx.bot.change_presence(status=status, activity=activity)
+        await self._change_presence(status=status, activity=activity)
         if activity:
             await ctx.send(_("Status set to `Listening to {listening}`.").format(listening=listening))
         else:
@@ -2752,7 +2840,7 @@ class Core(commands.commands._RuleDropper, commands.Cog, CoreLogic):
             activity = discord.Activity(name=watching, type=discord.ActivityType.watching)
         else:
             activity = None
-        await ctx.bot.change_presence(status=status, activity=activity)
+        await self._change_presence(status=status, activity=activity)
         if activity:
             await ctx.send(_("Status set to `Watching {watching}`.").format(watching=watching))
         else:
@@ -2787,7 +2875,7 @@ class Core(commands.commands._RuleDropper, commands.Cog, CoreLogic):
             activity = discord.Activity(name=competing, type=discord.ActivityType.competing)
         else:
             activity = None
-        await ctx.bot.change_presence(status=status, activity=activity)
+        await self._change_presence(status=status, activity=activity)
         if activity:
             await ctx.send(
                 _("Status set to `Competing in {competing}`.").format(competing=competing)
@@ -2795,9 +2883,23 @@ class Core(commands.commands._RuleDropper, commands.Cog, CoreLogic):
         else:
             await ctx.send(_("Competing cleared."))
 
+    async def _change_presence(
+        self,
+        *,
+        status: Optional[discord.Status],
+        activity: Optional[discord.BaseActivity],
+    ) -> None:
+        """Change the bot's presence, in this cluster and the other ones."""
+        await self.bot.change_presence(status=status, activity=activity)
+        await self.bot._notify_cluster(
+            "presence_changed",
+            status=None if status is None else str(status),
+            activity=None if activity is None else activity.to_dict(),
+        )
+
     async def _set_my_status(self, ctx: commands.Context, status: discord.Status):
         game = ctx.bot.guilds[0].me.activity if len(ctx.bot.guilds) > 0 else None
-        await ctx.bot.change_presence(status=status, activity=game)
+        await self._change_presence(status=status, activity=game)
         return await ctx.send(_("Status changed to {}.").format(status))
 
     @_set_status.command(name="online")
@@ -2863,6 +2965,8 @@ class Core(commands.commands._RuleDropper, commands.Cog, CoreLogic):
             if role.id in roles:
                 return await ctx.send(_("This role is already an admin role."))
             roles.append(role.id)
+        ctx.bot._access_policy_cache.invalidate(ctx.guild.id)
+        ctx.bot._privilege_cache.invalidate(ctx.guild.id)
         await ctx.send(_("That role is now considered an admin role."))
 
     @_set_roles.command(name="addmodrole")
@@ -2890,6 +2994,7 @@ class Core(commands.commands._RuleDropper, commands.Cog, CoreLogic):
             if role.id in roles:
                 return await ctx.send(_("This role is already a mod role."))
             roles.append(role.id)
+        ctx.bot._privilege_cache.invalidate(ctx.guild.id)
         await ctx.send(_("That role is now considered a mod role."))
 
     @_set_roles.command(
@@ -2912,6 +3017,8 @@ class Core(commands.commands._RuleDropper, commands.Cog, CoreLogic):
             if role.id not in roles:
                 return await ctx.send(_("That role was not an admin role to begin with."))
             roles.remove(role.id)
+        ctx.bot._access_policy_cache.invalidate(ctx.guild.id)
+        ctx.bot._privilege_cache.invalidate(ctx.guild.id)
         await ctx.send(_("That role is no longer considered an admin role."))
 
     @_set_roles.command(
@@ -2934,6 +3041,7 @@ class Core(commands.commands._RuleDropper, commands.Cog, CoreLogic):
             if role.id not in roles:
                 return await ctx.send(_("That role was not a mod role to begin with."))
             roles.remove(role.id)
+        ctx.bot._privilege_cache.invalidate(ctx.guild.id)
         await ctx.send(_("That role is no longer considered a mod role."))
 
     # -- End Set Roles Commands -- ###
@@ -4239,7 +4347,7 @@ class Core(commands.commands._RuleDropper, commands.Cog, CoreLogic):
         msg = _("Data path: {path}").format(path=data_dir)
         await ctx.send(box(msg))
 
-    @commands.command(hidden=True)
+    @commands.group(hidden=True, invoke_without_command=True)
     @checks.is_owner()
     async def debuginfo(self, ctx: commands.Context):
         """Shows debug information useful for debugging."""
@@ -4247,6 +4355,330 @@ class Core(commands.commands._RuleDropper, commands.Cog, CoreLogic):
 
         await ctx.send(await DebugInfo(self.bot).get_text())
 
+    @debuginfo.group(name="config", invoke_without_command=True)
+    async def debuginfo_config(self, ctx: commands.Context, limit: int = 15):
+        """
+        Shows which cogs spend the most time on Config operations.
+
+        The statistics are collected by sampling Config operations.
+        Use `[p]debuginfo config samplerate` to enable sampling.
+
+        **Arguments:**
+            - `[limit]` - How many entries to show. Defaults to 15.
+        """
+        if not config_stats.sample_rate and not config_stats.top(1):
+            await ctx.send(
+                _(
+                    "The Config profiler is disabled."
+                    " Use `{prefix}debuginfo config samplerate` to enable it."
+                ).format(prefix=ctx.clean_prefix)
+            )
+            return
+
+        lines = [
+            "{:<20} {:<20} {:<8} {:>10} {:>10} {:>8} {:>8}".format(
+                "Cog", "Category", "Op", "Ops", "Bytes", "p50 ms", "p99 ms"
+            )
+        ]
+        for (cog_name, category, op), stats in config_stats.top(limit):
+            lines.append(
+                "{:<20} {:<20} {:<8} {:>10} {:>10} {:>8.2f} {:>8.2f}".format(
+                    cog_name[:20],
+                    category[:20],
+                    op,
+                    humanize_number(round(stats.estimated_count)),
+                    humanize_number(round(stats.estimated_bytes)),
+                    stats.percentile(50) * 1000,
+                    stats.percentile(99) * 1000,
+                )
+            )
+        since = datetime.datetime.fromtimestamp(config_stats.started_at, datetime.timezone.utc)
+        header = _(
+            "Sample rate: {rate:.2%}. Counts are estimates, collected since {since}."
+        ).format(rate=config_stats.sample_rate, since=discord.utils.format_dt(since, "R"))
+        await ctx.send(header)
+        for page in pagify("\n".join(lines), ["\n"], shorten_by=16):
+            await ctx.send(box(page))
+
+    @debuginfo_config.command(name="samplerate")
+    async def debuginfo_config_samplerate(self, ctx: commands.Context, rate: float):
+        """
+        Sets the fraction of Config operations the profiler samples.
+
+        Sampling a small fraction of operations, such as 0.01, keeps the overhead negligible.
+
+        **Arguments:**
+            - `<rate>` - A number between 0 and 1. Use 0 to disable the profiler.
+        """
+        if not 0 <= rate <= 1:
+            await ctx.send(_("The sample rate must be between 0 and 1."))
+            return
+        config_stats.sample_rate = rate
+        await ctx.bot._config.config_stats_sample_rate.set(rate)
+        if rate:
+            await ctx.send(
+                _("The Config profiler will sample {rate:.2%} of operations.").format(rate=rate)
+            )
+        else:
+            await ctx.send(_("The Config profiler has been disabled."))
+
+    @debuginfo_config.command(name="reset")
+    async def debuginfo_config_reset(self, ctx: commands.Context):
+        """Clears the statistics collected by the Config profiler."""
+        config_stats.reset()
+        await ctx.send(_("The Config profiler's statistics have been cleared."))
+
+    @debuginfo.group(name="caches", invoke_without_command=True)
+    async def debuginfo_caches(self, ctx: commands.Context):
+        """
+        Shows the size and hit rate of the caches of the core settings.
+
+        Entries which weren't used for a while, or which belong to guilds the bot left
+        and channels which were deleted, are dropped from these caches.
+        """
+        lines = [
+            "{:<20} {:>15} {:>10} {:>8} {:>10} {:>10}".format(
+                "Cache", "Entries", "KiB", "Hit %", "Misses", "Evictions"
+            )
+        ]
+        for cache in ctx.bot._get_settings_caches():
+            lines.append(
+                "{:<20} {:>15} {:>10} {:>8.2%} {:>10} {:>10}".format(
+                    cache.name[:20],
+                    f"{humanize_number(len(cache))}/{humanize_number(cache.maxsize)}",
+                    humanize_number(round(cache.approximate_size() / 1024)),
+                    cache.hit_rate,
+                    humanize_number(cache.misses),
+                    humanize_number(cache.evictions + cache.expirations),
+                )
+            )
+        for page in pagify("\n".join(lines), ["\n"], shorten_by=16):
+            await ctx.send(box(page))
+
+    @debuginfo_caches.command(name="reset")
+    async def debuginfo_caches_reset(self, ctx: commands.Context):
+        """Clears the hit and miss counters of the caches of the core settings."""
+        for cache in ctx.bot._get_settings_caches():
+            cache.reset_stats()
+        await ctx.send(_("The cache statistics have been cleared."))
+
+    @debuginfo.group(name="loop", invoke_without_command=True)
+    async def debuginfo_loop(self, ctx: commands.Context, minutes: int = 10, limit: int = 15):
+        """
+        Shows the listeners and tasks which held the event loop the longest.
+
+        While a listener or a task runs the code between two awaits, nothing else can run,
+        which makes the bot unresponsive if it takes too long.
+
+        The listeners and tasks are only timed while step attribution is enabled,
+        see `[p]debuginfo loop attribution`.
+
+        **Arguments:**
+            - `[minutes]` - How many of the last minutes to include, up to 60. Defaults to 10.
+            - `[limit]` - How many entries to show. Defaults to 15.
+        """
+        lag = loop_monitor.lag(minutes)
+        header = _(
+            "Event loop lag over the last {minutes} minutes:"
+            " {mean:.2f} ms on average, {max:.2f} ms at most."
+        ).format(minutes=minutes, mean=lag.mean_lag * 1000, max=lag.max_lag * 1000)
+        if not loop_monitor.attributing_steps:
+            header += "\n" + _(
+                "Listeners and tasks aren't being timed."
+                " Use `{prefix}debuginfo loop attribution yes` to time them."
+            ).format(prefix=ctx.clean_prefix)
+            await ctx.send(header)
+            return
+        lines = [
+            "{:<8} {:<20} {:<30} {:>8} {:>10} {:>8}".format(
+                "Kind", "Owner", "Name", "Calls", "Total ms", "Max ms"
+            )
+        ]
+        for (kind, owner, name), stats in loop_monitor.top(minutes, limit):
+            lines.append(
+                "{:<8} {:<20} {:<30} {:>8} {:>10.1f} {:>8.1f}".format(
+                    kind,
+                    owner[-20:],
+                    name[-30:],
+                    humanize_number(stats.calls),
+                    stats.busy_time * 1000,
+                    stats.max_step * 1000,
+                )
+            )
+        await ctx.send(header)
+        for page in pagify("\n".join(lines), ["\n"], shorten_by=16):
+            await ctx.send(box(page))
+
+    @debuginfo_loop.command(name="threshold")
+    async def debuginfo_loop_threshold(self, ctx: commands.Context, seconds: float):
+        """
+        Sets how long a listener or a task can hold the event loop before it's reported.
+
+        Reports are logged with the stack of the code which held the event loop.
+
+        **Arguments:**
+            - `<seconds>` - The threshold in seconds. Defaults to 1.
+        """
+        if seconds <= 0:
+            await ctx.send(_("The threshold must be positive."))
+            return
+        loop_monitor.threshold = seconds
+        await ctx.bot._config.loop_monitor_threshold.set(seconds)
+        await ctx.send(
+            _("The event loop being held for {seconds} seconds or more will be reported.").format(
+                seconds=seconds
+            )
+        )
+
+    @debuginfo_loop.command(name="attribution")
+    async def debuginfo_loop_attribution(self, ctx: commands.Context, enabled: bool):
+        """
+        Sets whether the listeners and tasks should be timed.
+
+        This shows which listener or task held the event loop,
+        but makes every listener and task a little slower.
+        The event loop's lag is measured either way.
+
+        **Arguments:**
+            - `<enabled>` - Whether to time the listeners and tasks.
+        """
+        loop_monitor.set_step_attribution(enabled)
+        await ctx.bot._config.loop_monitor_attribution.set(enabled)
+        if enabled:
+            await ctx.send(_("The listeners and tasks will be timed."))
+        else:
+            await ctx.send(_("The listeners and tasks will no longer be timed."))
+
+    @debuginfo_loop.command(name="notify")
+    async def debuginfo_loop_notify(self, ctx: commands.Context, enabled: bool):
+        """
+        Sets whether the owners should be notified when the event loop is held for too long.
+
+        Notifications are sent at most once every 10 minutes.
+
+        **Arguments:**
+            - `<enabled>` - Whether to notify the owners.
+        """
+        ctx.bot._loop_stall_notifications = enabled
+        await ctx.bot._config.loop_monitor_notify_owners.set(enabled)
+        if enabled:
+            await ctx.send(_("The owners will be notified when the event loop is held too long."))
+        else:
+            await ctx.send(
+                _("The owners will no longer be notified when the event loop is held too long.")
+            )
+
+    @debuginfo_loop.command(name="stalls")
+    async def debuginfo_loop_stalls(self, ctx: commands.Context):
+        """Shows the last 5 times the event loop was held for longer than the threshold."""
+        if not loop_monitor.stalls:
+            await ctx.send(_("The event loop hasn't been held for longer than the threshold."))
+            return
+        for stall in list(loop_monitor.stalls)[:-6:-1]:
+            when = discord.utils.format_dt(
+                datetime.datetime.fromtimestamp(stall.timestamp, datetime.timezone.utc)
+            )
+            if stall.key is None:
+                content = _("{when}: the event loop was blocked for {duration:.2f}s.").format(
+                    when=when, duration=stall.duration
+                )
+            else:
+                kind, owner, name = stall.key
+                content = _(
+                    "{when}: the {kind} `{name}` of `{owner}` held it for {duration:.2f}s."
+                ).format(when=when, kind=kind, name=name, owner=owner, duration=stall.duration)
+            if stall.stack:
+                content += "\n" + box(stall.stack[-1500:], lang="py")
+            await ctx.send(content)
+
+    @debuginfo_loop.command(name="reset")
+    async def debuginfo_loop_reset(self, ctx: commands.Context):
+        """Clears the statistics collected by the event loop monitor."""
+        loop_monitor.reset()
+        await ctx.send(_("The event loop monitor's statistics have been cleared."))
+
+    @commands.group(hidden=True)
+    @checks.is_owner()
+    async def perf(self, ctx: commands.Context):
+        """Shows performance statistics of the bot."""
+
+    @perf.group(name="commands", invoke_without_command=True)
+    async def perf_commands(self, ctx: commands.Context, limit: int = 15):
+        """
+        Shows the slowest commands and where they spend their time.
+
+        Each invocation is split into the global and command checks, the permission checks,
+        the conversion of the arguments and the rest, mostly the command's callback.
+        The percentiles are over the last 500 invocations of each command,
+        the phases are the average over all of them.
+
+        **Arguments:**
+            - `[limit]` - How many commands to show. Defaults to 15.
+        """
+        entries = command_stats.top(limit)
+        if not entries:
+            await ctx.send(_("No commands have been invoked since the statistics were cleared."))
+            return
+
+        columns = ("p50 ms", "p95 ms", "p99 ms", "Checks", "Perms", "Convert", "Rest")
+        lines = [
+            "{:<24} {:>7}".format("Command", "Calls")
+            + "".join(f" {column:>8}" for column in columns)
+        ]
+        for name, stats in entries:
+            durations = [stats.percentile(pct) for pct in (50, 95, 99)]
+            durations.extend(stats.phase_mean(phase) for phase in PHASES)
+            lines.append(
+                "{:<24} {:>7}".format(name[-24:], humanize_number(stats.calls))
+                + "".join(f" {duration * 1000:>8.1f}" for duration in durations)
+            )
+        since = datetime.datetime.fromtimestamp(command_stats.started_at, datetime.timezone.utc)
+        if command_stats.slow_threshold:
+            slow_log = _(
+                "Invocations taking {seconds} seconds or more are logged to `red.slow_commands`."
+            ).format(seconds=command_stats.slow_threshold)
+        else:
+            slow_log = _("The slow command log is disabled.")
+        await ctx.send(
+            _("Statistics collected since {since}.").format(
+                since=discord.utils.format_dt(since, "R")
+            )
+            + " "
+            + slow_log
+        )
+        for page in pagify("\n".join(lines), ["\n"], shorten_by=16):
+            await ctx.send(box(page))
+
+    @perf_commands.command(name="threshold")
+    async def perf_commands_threshold(self, ctx: commands.Context, seconds: float):
+        """
+        Sets how long a command can take before it's logged as slow.
+
+        Slow commands are logged with the time each phase took, in the `slow-commands` log file.
+
+        **Arguments:**
+            - `<seconds>` - The threshold in seconds. Use 0 to disable the slow command log.
+        """
+        if seconds < 0:
+            await ctx.send(_("The threshold can't be negative."))
+            return
+        command_stats.slow_threshold = seconds
+        await ctx.bot._config.slow_command_threshold.set(seconds)
+        if seconds:
+            await ctx.send(
+                _("Commands taking {seconds} seconds or more will be logged.").format(
+                    seconds=seconds
+                )
+            )
+        else:
+            await ctx.send(_("The slow command log has been disabled."))
+
+    @perf_commands.command(name="reset")
+    async def perf_commands_reset(self, ctx: commands.Context):
+        """Clears the latency statistics of the commands."""
+        command_stats.reset()
+        await ctx.send(_("The command statistics have been cleared."))
+
     # You may ask why this command is owner-only,
     # cause after all it could be quite useful to guild owners!
     # Truth to be told, that would require us to make some part of this
@@ -4717,6 +5149,7 @@ class Core(commands.commands._RuleDropper, commands.Cog, CoreLogic):
         if isinstance(cog, commands.commands._RuleDropper):
             return await ctx.send(_("You can't disable this cog by default."))
         await self.bot._disabled_cog_cache.default_disable(cogname)
+        self.bot._help_cache.clear()
         await ctx.send(_("{cogname} has been set as disabled by default.").format(cogname=cogname))
 
     @checks.is_owner()
@@ -4738,6 +5171,7 @@ class Core(commands.commands._RuleDropper, commands.Cog, CoreLogic):
         """
         cogname = cog.qualified_name
         await self.bot._disabled_cog_cache.default_enable(cogname)
+        self.bot._help_cache.clear()
         await ctx.send(_("{cogname} has been set as enabled by default.").format(cogname=cogname))
 
     @commands.guild_only()
@@ -4758,6 +5192,7 @@ class Core(commands.commands._RuleDropper, commands.Cog, CoreLogic):
         if isinstance(cog, commands.commands._RuleDropper):
             return await ctx.send(_("You can't disable this cog as you would lock yourself out."))
         if await self.bot._disabled_cog_cache.disable_cog_in_guild(cogname, ctx.guild.id):
+            self.bot._help_cache.clear()
             await ctx.send(_("{cogname} has been disabled in this guild.").format(cogname=cogname))
         else:
             await ctx.send(
@@ -4779,6 +5214,7 @@ class Core(commands.commands._RuleDropper, commands.Cog, CoreLogic):
             - `<cog>` - The name of the cog to enable on this server. Must be title-case.
         """
         if await self.bot._disabled_cog_cache.enable_cog_in_guild(cogname, ctx.guild.id):
+            self.bot._help_cache.clear()
             await ctx.send(_("{cogname} has been enabled in this guild.").format(cogname=cogname))
         else:
             # putting this here allows enabling a cog that isn't loaded but was disabled.
@@ -4920,9 +5356,11 @@ class Core(commands.commands._RuleDropper, commands.Cog, CoreLogic):
             )
             return
 
-        async with ctx.bot._config.disabled_commands() as disabled_commands:
-            if command.qualified_name not in disabled_commands:
-                disabled_commands.append(command.qualified_name)
+        await ctx.bot._disabled_command_cache.disable_globally(command.qualified_name)
+        ctx.bot._help_cache.clear()
+        await ctx.bot._notify_cluster(
+            "command_state_changed", command=command.qualified_name, enabled=False
+        )
 
         if not command.enabled:
             await ctx.send(_("That command is already disabled globally."))
@@ -4961,9 +5399,10 @@ class Core(commands.commands._RuleDropper, commands.Cog, CoreLogic):
                 await ctx.send(_("You are not allowed to disable that command."))
                 return
 
-        async with ctx.bot._config.guild(ctx.guild).disabled_commands() as disabled_commands:
-            if command.qualified_name not in disabled_commands:
-                disabled_commands.append(command.qualified_name)
+        await ctx.bot._disabled_command_cache.disable_in_guild(
+            command.qualified_name, ctx.guild.id
+        )
+        ctx.bot._help_cache.clear()
 
         done = command.disable_in(ctx.guild)
 
@@ -5004,9 +5443,11 @@ class Core(commands.commands._RuleDropper, commands.Cog, CoreLogic):
         **Arguments:**
             - `<command>` - The command to enable globally.
         """
-        async with ctx.bot._config.disabled_commands() as disabled_commands:
-            with contextlib.suppress(ValueError):
-                disabled_commands.remove(command.qualified_name)
+        await ctx.bot._disabled_command_cache.enable_globally(command.qualified_name)
+        ctx.bot._help_cache.clear()
+        await ctx.bot._notify_cluster(
+            "command_state_changed", command=command.qualified_name, enabled=True
+        )
 
         if command.enabled:
             await ctx.send(_("That command is already enabled globally."))
@@ -5033,9 +5474,8 @@ class Core(commands.commands._RuleDropper, commands.Cog, CoreLogic):
                 await ctx.send(_("You are not allowed to enable that command."))
                 return
 
-        async with ctx.bot._config.guild(ctx.guild).disabled_commands() as disabled_commands:
-            with contextlib.suppress(ValueError):
-                disabled_commands.remove(command.qualified_name)
+        await ctx.bot._disabled_command_cache.enable_in_guild(command.qualified_name, ctx.guild.id)
+        ctx.bot._help_cache.clear()
 
         done = command.enable_in(ctx.guild)
 
@@ -5248,6 +5688,7 @@ class Core(commands.commands._RuleDropper, commands.Cog, CoreLogic):
         """
         if not await self.bot._ignored_cache.get_ignored_channel(channel):
             await self.bot._ignored_cache.set_ignored_channel(channel, True)
+            self.bot._access_policy_cache.invalidate(channel.guild.id)
             await ctx.send(_("Channel added to ignore list."))
         else:
             await ctx.send(_("Channel already in ignore list."))
@@ -5266,6 +5707,7 @@ class Core(commands.commands._RuleDropper, commands.Cog, CoreLogic):
         guild = ctx.guild
         if not await self.bot._ignored_cache.get_ignored_guild(guild):
             await self.bot._ignored_cache.set_ignored_guild(guild, True)
+            self.bot._access_policy_cache.invalidate(guild.id)
             await ctx.send(_("This server has been added to the ignore list."))
         else:
             await ctx.send(_("This server is already being ignored."))
@@ -5304,6 +5746,7 @@ class Core(commands.commands._RuleDropper, commands.Cog, CoreLogic):
         """
         if await self.bot._ignored_cache.get_ignored_channel(channel):
             await self.bot._ignored_cache.set_ignored_channel(channel, False)
+            self.bot._access_policy_cache.invalidate(channel.guild.id)
             await ctx.send(_("Channel removed from ignore list."))
         else:
             await ctx.send(_("That channel is not in the ignore list."))
@@ -5320,6 +5763,7 @@ class Core(commands.commands._RuleDropper, commands.Cog, CoreLogic):
         guild = ctx.message.guild
         if await self.bot._ignored_cache.get_ignored_guild(guild):
             await self.bot._ignored_cache.set_ignored_guild(guild, False)
+            self.bot._access_policy_cache.invalidate(guild.id)
             await ctx.send(_("This server has been removed from the ignore list."))
         else:
             await ctx.send(_("This server is not in the ignore list."))
@@ -5411,7 +5855,7 @@ class Core(commands.commands._RuleDropper, commands.Cog, CoreLogic):
         else:
             activity = None
 
-        await ctx.bot.change_presence(status = status, activity = activity)
+        await self._change_presence(status = status, activity = activity)
 
         if activity:
             await ctx.send(_(activity_msg))
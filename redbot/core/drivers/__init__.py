@@ -4,7 +4,9 @@ from typing import Optional, Type
 from .. import data_manager
 from .base import IdentifierData, BaseDriver, ConfigCategory
 from .json import JsonDriver
+from .journal import JournaledJsonDriver
 from .postgres import PostgresDriver
+from .sqlite import SqliteDriver
 
 __all__ = [
     "get_driver",
@@ -12,7 +14,9 @@ __all__ = [
     "IdentifierData",
     "BaseDriver",
     "JsonDriver",
+    "JournaledJsonDriver",
     "PostgresDriver",
+    "SqliteDriver",
     "BackendType",
 ]
 
@@ -24,12 +28,21 @@ class BackendType(enum.Enum):
     JSON = "JSON"
     #: Postgres storage backend.
     POSTGRES = "Postgres"
+    #: Journaled JSON storage backend.
+    JSON_JOURNAL = "JSONJournal"
+    #: SQLite storage backend.
+    SQLITE = "SQLite"
     # Dead drivers below retained for error handling.
     MONGOV1 = "MongoDB"
     MONGO = "MongoDBV2"
 
 
-_DRIVER_CLASSES = {BackendType.JSON: JsonDriver, BackendType.POSTGRES: PostgresDriver}
+_DRIVER_CLASSES = {
+    BackendType.JSON: JsonDriver,
+    BackendType.POSTGRES: PostgresDriver,
+    BackendType.JSON_JOURNAL: JournaledJsonDriver,
+    BackendType.SQLITE: SqliteDriver,
+}
 
 
 def _get_driver_class_include_old(storage_type: Optional[BackendType] = None) -> Type[BaseDriver]:
@@ -5,7 +5,19 @@ import contextlib
 import itertools
 import re
 from getpass import getpass
-from typing import Match, Pattern, Tuple, Optional, AsyncIterator, Any, Dict, Iterator, List
+from typing import (
+    Match,
+    Pattern,
+    Tuple,
+    Optional,
+    AsyncIterator,
+    Any,
+    Dict,
+    Iterator,
+    List,
+    Sequence,
+    Union,
+)
 from urllib.parse import quote_plus
 
 try:
@@ -18,7 +30,7 @@ except ModuleNotFoundError:
     pymongo = None
 
 from .. import errors
-from .base import BaseDriver, IdentifierData
+from .base import BaseDriver, IdentifierData, _incremented
 
 __all__ = ["MongoDriver"]
 
@@ -176,6 +188,18 @@ class MongoDriver(BaseDriver):
             return self._unescape_dict_keys(partial)
         return partial
 
+    async def aiter_documents(
+        self, identifier_data: IdentifierData, *, batch_size: int = 500
+    ) -> AsyncIterator[Tuple[Tuple[str, ...], Any]]:
+        mongo_collection = self.get_collection(identifier_data.category)
+        pkey_filter = self.generate_primary_key_filter(identifier_data)
+        num_pkeys = len(identifier_data.primary_key)
+        cursor = mongo_collection.find(filter=pkey_filter, batch_size=batch_size)
+        async for doc in cursor:
+            pkeys = doc["_id"]["RED_primary_key"]
+            del doc["_id"]
+            yield tuple(pkeys[num_pkeys:]), self._unescape_dict_keys(doc)
+
     async def set(self, identifier_data: IdentifierData, value=None):
         uuid = self._escape_key(identifier_data.uuid)
         primary_key = list(map(self._escape_key, self.get_primary_key(identifier_data)))
@@ -284,6 +308,127 @@ class MongoDriver(BaseDriver):
                     # atomic.
                     await mongo_collection.bulk_write(requests, ordered=False)
 
+    async def set_many(self, items: Sequence[Tuple[IdentifierData, Any]]) -> None:
+        # Values at the document level or below are sent as a single bulk_write() per
+        # collection. Anything else goes through `set`, since it may replace whole documents.
+        requests: Dict[str, List[pymongo.UpdateOne]] = {}
+        others: List[Tuple[IdentifierData, Any]] = []
+        for identifier_data, value in items:
+            primary_key = list(map(self._escape_key, self.get_primary_key(identifier_data)))
+            if len(primary_key) < identifier_data.primary_key_len or (
+                isinstance(value, dict) and len(value) == 0
+            ):
+                others.append((identifier_data, value))
+                continue
+            if isinstance(value, dict):
+                value = self._escape_dict_keys(value)
+            dot_identifiers = ".".join(map(self._escape_key, identifier_data.identifiers))
+            if dot_identifiers:
+                update_stmt = {"$set": {dot_identifiers: value}}
+            else:
+                update_stmt = {"$set": value}
+            uuid = self._escape_key(identifier_data.uuid)
+            requests.setdefault(identifier_data.category, []).append(
+                pymongo.UpdateOne(
+                    {"_id": {"RED_uuid": uuid, "RED_primary_key": primary_key}},
+                    update_stmt,
+                    upsert=True,
+                )
+            )
+
+        for category, category_requests in requests.items():
+            try:
+                await self.get_collection(category).bulk_write(category_requests, ordered=True)
+            except pymongo.errors.BulkWriteError as exc:
+                write_errors = exc.details.get("writeErrors", [])
+                if write_errors and write_errors[0].get("errmsg", "").startswith(
+                    "Cannot create field"
+                ):
+                    raise errors.CannotSetSubfield
+                raise
+
+        for identifier_data, value in others:
+            await self.set(identifier_data, value=value)
+
+    async def inc(
+        self,
+        identifier_data: IdentifierData,
+        value: Union[int, float],
+        default: Union[int, float],
+        *,
+        min_value: Optional[Union[int, float]] = None,
+        max_value: Optional[Union[int, float]] = None,
+    ) -> Union[int, float]:
+        # Plain `$inc` would start missing values from 0, rather than from `default`.
+        if min_value is None and max_value is None:
+            return await self._update_value(
+                identifier_data, lambda field: {"$add": [{"$ifNull": [field, default]}, value]}
+            )
+
+        # Values which would end up out of range are left as they are. The value from before
+        # the update tells whether it was, and is checked again below.
+        def incremented(field):
+            current = {"$ifNull": [field, default]}
+            result = {"$add": [current, value]}
+            conditions = []
+            if min_value is not None:
+                conditions.append({"$gte": [result, min_value]})
+            if max_value is not None:
+                conditions.append({"$lte": [result, max_value]})
+            return {"$cond": [{"$and": conditions}, result, current]}
+
+        existing = await self._update_value(identifier_data, incremented, before=default)
+        return _incremented(identifier_data, existing, value, min_value, max_value)
+
+    async def toggle(self, identifier_data: IdentifierData, default: bool) -> bool:
+        # Non-boolean values are left as they are, and rejected below.
+        def toggled(field):
+            current = {"$ifNull": [field, default]}
+            return {"$cond": [{"$eq": [{"$type": current}, "bool"]}, {"$not": [current]}, current]}
+
+        result = await self._update_value(identifier_data, toggled)
+        if not isinstance(result, bool):
+            raise errors.StoredTypeError(f"Cannot toggle non-boolean value {result!r}")
+        return result
+
+    async def _update_value(
+        self, identifier_data: IdentifierData, expression, *, before: Any = ...
+    ) -> Any:
+        # Returns the updated value or, if `before` is given, the value from before the update,
+        # with `before` standing in for a value which didn't exist.
+        if not identifier_data.identifiers:
+            raise errors.StoredTypeError("Cannot update document(s)")
+        uuid = self._escape_key(identifier_data.uuid)
+        primary_key = list(map(self._escape_key, self.get_primary_key(identifier_data)))
+        escaped_identifiers = list(map(self._escape_key, identifier_data.identifiers))
+        dot_identifiers = ".".join(escaped_identifiers)
+        mongo_collection = self.get_collection(identifier_data.category)
+
+        try:
+            # An update pipeline reads and writes the value in a single atomic operation.
+            partial = await mongo_collection.find_one_and_update(
+                {"_id": {"RED_uuid": uuid, "RED_primary_key": primary_key}},
+                [{"$set": {dot_identifiers: expression(f"${dot_identifiers}")}}],
+                projection={"_id": False, dot_identifiers: True},
+                upsert=True,
+                return_document=(
+                    pymongo.ReturnDocument.AFTER
+                    if before is ...
+                    else pymongo.ReturnDocument.BEFORE
+                ),
+            )
+        except pymongo.errors.OperationFailure as exc:
+            raise errors.StoredTypeError(*exc.args)
+
+        try:
+            for i in escaped_identifiers:
+                partial = partial[i]
+        except (KeyError, TypeError):
+            if before is ...:
+                raise
+            return before
+        return partial
+
     def generate_primary_key_filter(self, identifier_data: IdentifierData):
         uuid = self._escape_key(identifier_data.uuid)
         primary_key = list(map(self._escape_key, self.get_primary_key(identifier_data)))
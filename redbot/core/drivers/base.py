@@ -1,9 +1,25 @@
 import abc
+import asyncio
 import enum
-from typing import Tuple, Dict, Any, Union, List, AsyncIterator, Type
+import json
+from pathlib import Path
+from typing import (
+    Tuple,
+    Dict,
+    Any,
+    Union,
+    List,
+    AsyncIterator,
+    Iterator,
+    Optional,
+    Type,
+    Sequence,
+    Set,
+)
 
 import rich.progress
 
+from redbot.core import errors
 from redbot.core.utils._internal_utils import RichIndefiniteBarColumn
 
 __all__ = ["BaseDriver", "IdentifierData", "ConfigCategory"]
@@ -192,6 +208,21 @@ class BaseDriver(abc.ABC):
         """
         raise NotImplementedError
 
+    @classmethod
+    def cache_stats(cls) -> Optional[Dict[str, int]]:
+        """
+        Get the statistics of this driver's cache.
+
+        Drivers which cache data in memory should override this.
+        The default implementation returns ``None``, meaning there's no cache.
+
+        Returns
+        -------
+        Optional[Dict[str, int]]
+            Counters such as the number of cache ``hits`` and ``misses``.
+        """
+        return None
+
     @staticmethod
     @abc.abstractmethod
     def get_config_details() -> Dict[str, Any]:
@@ -222,6 +253,27 @@ class BaseDriver(abc.ABC):
         """
         raise NotImplementedError
 
+    async def get_view(self, identifier_data: IdentifierData) -> Any:
+        """
+        Finds the value indicated by the given identifiers, for read-only use.
+
+        Unlike `get`, the returned object may be shared with the driver's
+        internal state, so the caller must not modify it. Config only ever
+        exposes it wrapped in read-only views.
+
+        The default implementation simply calls `get`.
+
+        Parameters
+        ----------
+        identifier_data
+
+        Returns
+        -------
+        Any
+            Stored value.
+        """
+        return await self.get(identifier_data)
+
     @abc.abstractmethod
     async def set(self, identifier_data: IdentifierData, value=None) -> None:
         """
@@ -235,6 +287,52 @@ class BaseDriver(abc.ABC):
         """
         raise NotImplementedError
 
+    async def get_many(
+        self, identifier_data_list: Sequence[IdentifierData]
+    ) -> Dict[IdentifierData, Any]:
+        """
+        Finds the values indicated by each of the given identifiers.
+
+        The BaseDriver provides a generic method which may be overridden
+        by subclasses. It calls `get` once for each value, so drivers which
+        can fetch several values in one round trip should override it.
+
+        Parameters
+        ----------
+        identifier_data_list
+            The identifier data of each value to get.
+
+        Returns
+        -------
+        Dict[IdentifierData, Any]
+            Stored values, keyed by their identifier data. Values which
+            aren't stored are left out.
+        """
+        ret = {}
+        for identifier_data in identifier_data_list:
+            try:
+                ret[identifier_data] = await self.get(identifier_data)
+            except KeyError:
+                pass
+        return ret
+
+    async def set_many(self, items: Sequence[Tuple[IdentifierData, Any]]) -> None:
+        """
+        Sets the values of the keys indicated by each of the given identifiers.
+
+        The BaseDriver provides a generic method which may be overridden
+        by subclasses. It calls `set` once for each value, in order, so drivers
+        which can write several values in one round trip should override it.
+
+        Parameters
+        ----------
+        items
+            Pairs of identifier data and the value to set it to.
+            Values must be JSON serializable python objects.
+        """
+        for identifier_data, value in items:
+            await self.set(identifier_data, value=value)
+
     @abc.abstractmethod
     async def clear(self, identifier_data: IdentifierData) -> None:
         """
@@ -248,6 +346,132 @@ class BaseDriver(abc.ABC):
         """
         raise NotImplementedError
 
+    async def inc(
+        self,
+        identifier_data: IdentifierData,
+        value: Union[int, float],
+        default: Union[int, float],
+        *,
+        min_value: Optional[Union[int, float]] = None,
+        max_value: Optional[Union[int, float]] = None,
+    ) -> Union[int, float]:
+        """
+        Increments the number indicated by the given identifiers.
+
+        The BaseDriver provides a generic method which may be overridden
+        by subclasses. It gets the value and sets it again, so it is not
+        atomic. Drivers should override it with an atomic operation.
+
+        Parameters
+        ----------
+        identifier_data
+        value : Union[int, float]
+            The amount to increment by.
+        default : Union[int, float]
+            The value to increment when there's no value stored.
+        min_value : Optional[Union[int, float]]
+            The lowest value the number may be incremented to.
+        max_value : Optional[Union[int, float]]
+            The highest value the number may be incremented to.
+
+        Returns
+        -------
+        Union[int, float]
+            The new value.
+
+        Raises
+        ------
+        StoredTypeError
+            If the stored value is not a number.
+        OutOfRangeError
+            If the new value would be out of the bounds. Nothing is stored then.
+        """
+        try:
+            existing = await self.get(identifier_data)
+        except KeyError:
+            existing = default
+        result = _incremented(identifier_data, existing, value, min_value, max_value)
+        await self.set(identifier_data, value=result)
+        return result
+
+    async def toggle(self, identifier_data: IdentifierData, default: bool) -> bool:
+        """
+        Toggles the boolean indicated by the given identifiers.
+
+        The BaseDriver provides a generic method which may be overridden
+        by subclasses. It gets the value and sets it again, so it is not
+        atomic. Drivers should override it with an atomic operation.
+
+        Parameters
+        ----------
+        identifier_data
+        default : bool
+            The value to toggle when there's no value stored.
+
+        Returns
+        -------
+        bool
+            The new value.
+
+        Raises
+        ------
+        StoredTypeError
+            If the stored value is not a boolean.
+        """
+        try:
+            existing = await self.get(identifier_data)
+        except KeyError:
+            existing = default
+        result = _toggled(identifier_data, existing)
+        await self.set(identifier_data, value=result)
+        return result
+
+    async def wait_until_durable(self) -> None:
+        """Wait until all writes made through this driver so far are persisted.
+
+        Drivers which acknowledge writes before they are durable (such as
+        `JsonDriver` with group commit enabled) should override this.
+        The default implementation returns immediately.
+        """
+        return
+
+    async def aiter_documents(
+        self, identifier_data: IdentifierData, *, batch_size: int = 500
+    ) -> AsyncIterator[Tuple[Tuple[str, ...], Any]]:
+        """Iterate over the documents below the given partial primary key.
+
+        This lets callers process a whole scope (such as all guilds or all
+        members of a guild) without loading it all at once.
+
+        The BaseDriver provides a generic method which may be overridden
+        by subclasses. It gets the whole scope in one go, so drivers which
+        can page through their data should override it.
+
+        Parameters
+        ----------
+        identifier_data
+            Identifier data for the scope. It must have fewer primary keys than
+            its full primary key length and no identifiers.
+        batch_size : int
+            How many documents to fetch or yield at a time. Drivers may give
+            control back to the event loop after each batch.
+
+        Yields
+        ------
+        Tuple[Tuple[str, ...], Any]
+            Tuples of the missing primary keys and the document.
+
+        """
+        try:
+            data = await self.get(identifier_data)
+        except KeyError:
+            return
+        num_missing_pkeys = identifier_data.primary_key_len - len(identifier_data.primary_key)
+        for idx, item in enumerate(_iter_documents(data, num_missing_pkeys), start=1):
+            yield item
+            if idx % batch_size == 0:
+                await asyncio.sleep(0)
+
     @classmethod
     @abc.abstractmethod
     def aiter_cogs(cls) -> AsyncIterator[Tuple[str, str]]:
@@ -266,6 +490,9 @@ class BaseDriver(abc.ABC):
         cls,
         new_driver_cls: Type["BaseDriver"],
         all_custom_group_data: Dict[str, Dict[str, Dict[str, int]]],
+        *,
+        workers: int = 1,
+        checkpoint_path: Optional[Path] = None,
     ) -> None:
         """Migrate data from this backend to another.
 
@@ -281,9 +508,18 @@ class BaseDriver(abc.ABC):
         all_custom_group_data : Dict[str, Dict[str, Dict[str, int]]]
             Dict mapping cog names, to cog IDs, to custom groups, to
             primary key lengths.
+        workers : int
+            How many cogs to migrate at the same time. Defaults to 1.
+        checkpoint_path : Optional[pathlib.Path]
+            A file to record finished cogs in. If the migration is
+            interrupted, running it again with the same file skips the cogs
+            which were already migrated. The file is deleted once the
+            migration is complete.
 
         """
         # Backend-agnostic method of migrating from one driver to another.
+        done = _load_checkpoint(checkpoint_path, cls, new_driver_cls)
+        semaphore = asyncio.Semaphore(workers)
         with rich.progress.Progress(
             rich.progress.SpinnerColumn(),
             rich.progress.TextColumn("[progress.description]{task.description}"),
@@ -293,18 +529,36 @@ class BaseDriver(abc.ABC):
         ) as progress:
             cog_count = 0
             tid = progress.add_task("[yellow]Migrating", completed=cog_count, total=cog_count + 1)
-            async for cog_name, cog_id in cls.aiter_cogs():
-                progress.console.print(f"Working on {cog_name}...")
-
-                this_driver = cls(cog_name, cog_id)
-                other_driver = new_driver_cls(cog_name, cog_id)
-                custom_group_data = all_custom_group_data.get(cog_name, {}).get(cog_id, {})
-                exported_data = await this_driver.export_data(custom_group_data)
-                await other_driver.import_data(exported_data, custom_group_data)
 
+            async def migrate_cog(cog_name: str, cog_id: str) -> None:
+                nonlocal cog_count
+                async with semaphore:
+                    progress.console.print(f"Working on {cog_name}...")
+                    this_driver = cls(cog_name, cog_id)
+                    other_driver = new_driver_cls(cog_name, cog_id)
+                    custom_group_data = all_custom_group_data.get(cog_name, {}).get(cog_id, {})
+                    exported_data = await this_driver.export_data(custom_group_data)
+                    await other_driver.import_data(exported_data, custom_group_data)
+
+                done.add((cog_name, cog_id))
+                _save_checkpoint(checkpoint_path, cls, new_driver_cls, done)
                 cog_count += 1
                 progress.update(tid, completed=cog_count, total=cog_count + 1)
+
+            tasks = []
+            try:
+                async for cog_name, cog_id in cls.aiter_cogs():
+                    if (cog_name, cog_id) in done:
+                        progress.console.print(f"Skipping {cog_name}, it was already migrated.")
+                        continue
+                    tasks.append(asyncio.create_task(migrate_cog(cog_name, cog_id)))
+                await asyncio.gather(*tasks)
+            finally:
+                for task in tasks:
+                    task.cancel()
             progress.update(tid, total=cog_count)
+        if checkpoint_path is not None:
+            checkpoint_path.unlink(missing_ok=True)
         print()
 
     @classmethod
@@ -378,6 +632,13 @@ class BaseDriver(abc.ABC):
     async def import_data(
         self, cog_data: List[Tuple[str, Dict[str, Any]]], custom_group_data: Dict[str, int]
     ) -> None:
+        """Import data exported by `export_data`.
+
+        The BaseDriver provides a generic method which may be overridden
+        by subclasses. It sets all documents with a single call to `set_many`,
+        drivers which have a faster way to bulk load data should override it.
+        """
+        items = []
         for category, all_data in cog_data:
             splitted_pkey = self._split_primary_key(category, custom_group_data, all_data)
             for pkey, data in splitted_pkey:
@@ -389,4 +650,83 @@ class BaseDriver(abc.ABC):
                     (),
                     *ConfigCategory.get_pkey_info(category, custom_group_data),
                 )
-                await self.set(ident_data, data)
+                items.append((ident_data, data))
+        await self.set_many(items)
+
+
+def _load_checkpoint(
+    path: Optional[Path], source: Type[BaseDriver], target: Type[BaseDriver]
+) -> Set[Tuple[str, str]]:
+    if path is None:
+        return set()
+    try:
+        with path.open(encoding="utf-8") as fs:
+            data = json.load(fs)
+    except FileNotFoundError:
+        return set()
+    if data.get("source") != source.__name__ or data.get("target") != target.__name__:
+        # Left over from a different migration.
+        return set()
+    return {tuple(cog) for cog in data.get("done", [])}
+
+
+def _save_checkpoint(
+    path: Optional[Path],
+    source: Type[BaseDriver],
+    target: Type[BaseDriver],
+    done: Set[Tuple[str, str]],
+) -> None:
+    if path is None:
+        return
+    data = {"source": source.__name__, "target": target.__name__, "done": sorted(done)}
+    tmp_path = path.with_name(f"{path.name}.tmp")
+    with tmp_path.open("w", encoding="utf-8") as fs:
+        json.dump(data, fs)
+    tmp_path.replace(path)
+
+
+def _incremented(
+    identifier_data: IdentifierData,
+    existing: Any,
+    value: Union[int, float],
+    min_value: Optional[Union[int, float]] = None,
+    max_value: Optional[Union[int, float]] = None,
+) -> Union[int, float]:
+    # These checks mirror those in the PostgreSQL driver's `red_config.inc()`.
+    if not identifier_data.identifiers:
+        raise errors.StoredTypeError("Cannot increment document(s)")
+    if isinstance(existing, bool) or not isinstance(existing, (int, float)):
+        raise errors.StoredTypeError(f"Cannot increment non-numeric value {existing!r}")
+    result = existing + value
+    if (min_value is not None and result < min_value) or (
+        max_value is not None and result > max_value
+    ):
+        raise errors.OutOfRangeError(
+            existing, f"Cannot increment {existing!r} by {value!r}, the result is out of range"
+        )
+    return result
+
+
+def _toggled(identifier_data: IdentifierData, existing: Any) -> bool:
+    if not identifier_data.identifiers:
+        raise errors.StoredTypeError("Cannot toggle document(s)")
+    if not isinstance(existing, bool):
+        raise errors.StoredTypeError(f"Cannot toggle non-boolean value {existing!r}")
+    return not existing
+
+
+def _iter_documents(
+    data: Dict[str, Any], num_missing_pkeys: int, parent_key: Tuple[str, ...] = ()
+) -> Iterator[Tuple[Tuple[str, ...], Any]]:
+    # Keys are copied at each level and their values looked up lazily, so that the
+    # data can be modified by the caller in between documents.
+    for key in list(data):
+        try:
+            value = data[key]
+        except KeyError:
+            continue
+        if num_missing_pkeys > 1:
+            if isinstance(value, dict):
+                yield from _iter_documents(value, num_missing_pkeys - 1, parent_key + (key,))
+        else:
+            yield parent_key + (key,), value
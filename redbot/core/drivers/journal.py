@@ -0,0 +1,425 @@
+import asyncio
+import json
+import logging
+import os
+import weakref
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence, Tuple
+from uuid import uuid4
+
+from .. import data_manager, errors
+from .base import IdentifierData, ConfigCategory
+from .json import JsonDriver, _save_json
+
+__all__ = ["JournaledJsonDriver"]
+
+
+_shared_datastore = {}
+_driver_counts = {}
+_finalizers = []
+_locks = defaultdict(asyncio.Lock)
+_journal_sizes: Dict[str, int] = {}
+_snapshot_sizes: Dict[str, int] = {}
+_generations: Dict[str, int] = {}
+_compaction_tasks: Dict[str, asyncio.Task] = {}
+
+log = logging.getLogger("redbot.json_driver")
+
+SNAPSHOT_FILE_NAME = "journaled_settings.json"
+JOURNAL_SUFFIX = ".log"
+
+
+def finalize_driver(cog_name):
+    if cog_name not in _driver_counts:
+        return
+
+    _driver_counts[cog_name] -= 1
+
+    if _driver_counts[cog_name] == 0:
+        for mapping in (_shared_datastore, _locks, _journal_sizes, _snapshot_sizes, _generations):
+            mapping.pop(cog_name, None)
+
+    for f in _finalizers:
+        if not f.alive:
+            _finalizers.remove(f)
+
+
+# noinspection PyProtectedMember
+class JournaledJsonDriver(JsonDriver):
+    """
+    Subclass of :py:class:`.JsonDriver` which appends changes to a journal.
+
+    Rather than rewriting the whole document on every write, each `set` and
+    `clear` appends a small record with the changed path and value to the cog's
+    journal file. On load, the cog's data is rebuilt by replaying the journal on
+    top of the last snapshot, and once the journal grows past
+    ``compaction_ratio`` times the size of the snapshot, a background task
+    writes a new snapshot and starts a fresh journal.
+
+    .. py:attribute:: file_name
+
+        The name of the file in which to store the snapshot.
+
+    .. py:attribute:: data_path
+
+        The path to the snapshot file. The journal is stored next to it,
+        with a ``.log`` suffix.
+    """
+
+    _compaction_ratio: float = 1.0
+    _compaction_min_size: int = 64 * 1024
+
+    def __init__(
+        self,
+        cog_name: str,
+        identifier: str,
+        *,
+        data_path_override: Optional[Path] = None,
+        file_name_override: str = SNAPSHOT_FILE_NAME,
+    ):
+        super().__init__(
+            cog_name,
+            identifier,
+            data_path_override=data_path_override,
+            file_name_override=file_name_override,
+        )
+
+    @property
+    def journal_path(self) -> Path:
+        return self.data_path.with_suffix(JOURNAL_SUFFIX)
+
+    @property
+    def _lock(self):
+        return _locks[self.cog_name]
+
+    @property
+    def data(self):
+        return _shared_datastore.get(self.cog_name)
+
+    @data.setter
+    def data(self, value):
+        _shared_datastore[self.cog_name] = value
+
+    @classmethod
+    async def initialize(cls, **storage_details) -> None:
+        cls._compaction_ratio = float(storage_details.get("compaction_ratio", 1.0))
+        cls._compaction_min_size = int(storage_details.get("compaction_min_size", 64 * 1024))
+
+    @classmethod
+    async def teardown(cls) -> None:
+        tasks = list(_compaction_tasks.values())
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    def _load_data(self):
+        if self.cog_name not in _driver_counts:
+            _driver_counts[self.cog_name] = 0
+        _driver_counts[self.cog_name] += 1
+
+        _finalizers.append(weakref.finalize(self, finalize_driver, self.cog_name))
+
+        if self.data is not None:
+            return
+
+        generation, data, snapshot_size, journal_size = _read_journaled_data(
+            self.data_path, self.journal_path
+        )
+        if snapshot_size is None or journal_size is None:
+            # New records can only be appended to a journal which belongs to the snapshot.
+            snapshot_size = _write_snapshot(self.data_path, self.journal_path, generation, data)
+            journal_size = 0
+        self.data = data
+        _generations[self.cog_name] = generation
+        _snapshot_sizes[self.cog_name] = snapshot_size
+        _journal_sizes[self.cog_name] = journal_size
+
+    def migrate_identifier(self, raw_identifier: int):
+        if self.unique_cog_identifier in self.data:
+            # Data has already been migrated
+            return
+        poss_identifiers = [str(raw_identifier), str(hash(raw_identifier))]
+        for ident in poss_identifiers:
+            if ident in self.data:
+                self.data[self.unique_cog_identifier] = self.data[ident]
+                del self.data[ident]
+                self._compact_sync()
+                break
+
+    async def set(self, identifier_data: IdentifierData, value=None):
+        partial = self.data
+        full_identifiers = identifier_data.to_tuple()[1:]
+        # This is both our deepcopy() and our way of making sure this value is actually JSON
+        # serializable.
+        value_json = json.dumps(value)
+        value_copy = json.loads(value_json)
+
+        async with self._lock:
+            for i in full_identifiers[:-1]:
+                try:
+                    partial = partial.setdefault(i, {})
+                except AttributeError:
+                    # Tried to set sub-field of non-object
+                    raise errors.CannotSetSubfield
+
+            partial[full_identifiers[-1]] = value_copy
+            await self._append(_encode_record("set", full_identifiers, value_json))
+
+    async def set_many(self, items: Sequence[Tuple[IdentifierData, Any]]) -> None:
+        # Same as `set`, but all records are appended to the journal in a single write.
+        prepared = []
+        for identifier_data, value in items:
+            value_json = json.dumps(value)
+            prepared.append((identifier_data.to_tuple()[1:], value_json, json.loads(value_json)))
+
+        async with self._lock:
+            records = []
+            try:
+                for full_identifiers, value_json, value_copy in prepared:
+                    partial = self.data
+                    for i in full_identifiers[:-1]:
+                        try:
+                            partial = partial.setdefault(i, {})
+                        except AttributeError:
+                            # Tried to set sub-field of non-object
+                            raise errors.CannotSetSubfield
+
+                    partial[full_identifiers[-1]] = value_copy
+                    records.append(_encode_record("set", full_identifiers, value_json))
+            finally:
+                if records:
+                    await self._append("".join(records))
+
+    async def _write_value(self, full_identifiers: Tuple[str, ...], value: Any) -> None:
+        # This must be called with the cog's lock acquired.
+        partial = self.data
+        for i in full_identifiers[:-1]:
+            partial = partial.setdefault(i, {})
+        partial[full_identifiers[-1]] = value
+        await self._append(_encode_record("set", full_identifiers, json.dumps(value)))
+
+    async def clear(self, identifier_data: IdentifierData):
+        partial = self.data
+        full_identifiers = identifier_data.to_tuple()[1:]
+        try:
+            for i in full_identifiers[:-1]:
+                partial = partial[i]
+        except KeyError:
+            pass
+        else:
+            async with self._lock:
+                try:
+                    del partial[full_identifiers[-1]]
+                except KeyError:
+                    pass
+                else:
+                    await self._append(_encode_record("clear", full_identifiers))
+
+    @classmethod
+    async def aiter_cogs(cls) -> AsyncIterator[Tuple[str, str]]:
+        yield "Core", "0"
+        for _dir in data_manager.cog_data_path().iterdir():
+            fpath = _dir / SNAPSHOT_FILE_NAME
+            if not fpath.exists():
+                continue
+            try:
+                data = _read_journaled_data(fpath, fpath.with_suffix(JOURNAL_SUFFIX))[1]
+            except json.JSONDecodeError:
+                continue
+            if not isinstance(data, dict):
+                continue
+            cog_name = _dir.stem
+            for cog_id, inner in data.items():
+                if not isinstance(inner, dict):
+                    continue
+                yield cog_name, cog_id
+
+    async def import_data(self, cog_data, custom_group_data):
+        def update_write_data(identifier_data: IdentifierData, _data):
+            partial = self.data
+            idents = identifier_data.to_tuple()[1:]
+            for ident in idents[:-1]:
+                partial = partial.setdefault(ident, {})
+            partial[idents[-1]] = _data
+
+        async with self._lock:
+            for category, all_data in cog_data:
+                splitted_pkey = self._split_primary_key(category, custom_group_data, all_data)
+                for pkey, data in splitted_pkey:
+                    ident_data = IdentifierData(
+                        self.cog_name,
+                        self.unique_cog_identifier,
+                        category,
+                        pkey,
+                        (),
+                        *ConfigCategory.get_pkey_info(category, custom_group_data),
+                    )
+                    update_write_data(ident_data, data)
+            # Bulk imports go straight into a new snapshot instead of the journal.
+            await self._compact()
+
+    async def wait_until_durable(self) -> None:
+        # Journal records are synced to disk before `set` and `clear` return.
+        return
+
+    async def _append(self, record: str) -> None:
+        # This must be called with the cog's lock acquired.
+        loop = asyncio.get_running_loop()
+        written = await loop.run_in_executor(None, _append_record, self.journal_path, record)
+        journal_size = _journal_sizes.get(self.cog_name, 0) + written
+        _journal_sizes[self.cog_name] = journal_size
+
+        threshold = max(
+            self._compaction_min_size,
+            self._compaction_ratio * _snapshot_sizes.get(self.cog_name, 0),
+        )
+        if journal_size > threshold and self.cog_name not in _compaction_tasks:
+            _compaction_tasks[self.cog_name] = asyncio.create_task(self._background_compact())
+
+    async def _background_compact(self) -> None:
+        try:
+            async with self._lock:
+                await self._compact()
+        except Exception as exc:
+            log.exception("Compaction of %s's journal failed.", self.cog_name, exc_info=exc)
+        finally:
+            _compaction_tasks.pop(self.cog_name, None)
+
+    async def _compact(self) -> None:
+        # This must be called with the cog's lock acquired.
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self._compact_sync)
+
+    def _compact_sync(self) -> None:
+        generation = _generations.get(self.cog_name, 0) + 1
+        _snapshot_sizes[self.cog_name] = _write_snapshot(
+            self.data_path, self.journal_path, generation, self.data
+        )
+        _generations[self.cog_name] = generation
+        _journal_sizes[self.cog_name] = 0
+
+
+def _encode_record(op: str, path: Tuple[str, ...], value_json: Optional[str] = None) -> str:
+    # The value is already serialized by the caller, so we avoid encoding it twice.
+    encoded_path = json.dumps(path)
+    if value_json is None:
+        return f'["{op}", {encoded_path}]\n'
+    return f'["{op}", {encoded_path}, {value_json}]\n'
+
+
+def _append_record(path: Path, record: str) -> int:
+    data = record.encode("utf-8")
+    with path.open("ab") as fs:
+        fs.write(data)
+        fs.flush()
+        os.fsync(fs.fileno())
+    return len(data)
+
+
+def _apply_record(data: Dict[str, Any], record: List[Any]) -> None:
+    op, path = record[0], record[1]
+    partial = data
+    try:
+        for key in path[:-1]:
+            partial = partial.setdefault(key, {}) if op == "set" else partial[key]
+        if op == "set":
+            partial[path[-1]] = record[2]
+        else:
+            del partial[path[-1]]
+    except (KeyError, TypeError, AttributeError):
+        # A later record has replaced one of the parent objects, this one can be skipped.
+        pass
+
+
+def _read_journaled_data(
+    snapshot_path: Path, journal_path: Path
+) -> Tuple[int, Dict[str, Any], Optional[int], Optional[int]]:
+    """Rebuild a cog's data from its snapshot and journal.
+
+    Returns the snapshot's generation, the data, and the sizes of the snapshot
+    and journal files. The snapshot size is ``None`` when there's no snapshot yet,
+    and the journal size is ``None`` when there's no journal for the snapshot.
+
+    A torn record at the end of the journal is cut off, so that the records
+    appended after it can be read back.
+    """
+    try:
+        with snapshot_path.open("r", encoding="utf-8") as fs:
+            snapshot = json.load(fs)
+    except FileNotFoundError:
+        generation, data, snapshot_size = 0, {}, None
+    else:
+        generation, data = snapshot["generation"], snapshot["data"]
+        snapshot_size = snapshot_path.stat().st_size
+
+    try:
+        fs = journal_path.open("r", encoding="utf-8")
+    except FileNotFoundError:
+        return generation, data, snapshot_size, None
+
+    with fs:
+        header = fs.readline()
+        try:
+            journal_generation = json.loads(header)["generation"]
+        except (json.JSONDecodeError, KeyError, TypeError):
+            journal_generation = None
+        if journal_generation != generation:
+            # The journal predates the snapshot, i.e. compaction was interrupted
+            # after the new snapshot was written.
+            return generation, data, snapshot_size, None
+        journal_size = len(header.encode("utf-8"))
+        torn = False
+        for line in fs:
+            try:
+                # A record without its newline is torn even if it happens to parse.
+                record = json.loads(line) if line.endswith("\n") else None
+            except json.JSONDecodeError:
+                record = None
+            if not isinstance(record, list):
+                # Torn write at the end of the journal, everything before it is intact.
+                log.warning("Discarding incomplete record at the end of %s", journal_path)
+                torn = True
+                break
+            _apply_record(data, record)
+            journal_size += len(line.encode("utf-8"))
+
+    if torn:
+        with journal_path.open("r+b") as fs:
+            fs.truncate(journal_size)
+            fs.flush()
+            os.fsync(fs.fileno())
+    return generation, data, snapshot_size, journal_size
+
+
+def _write_snapshot(
+    snapshot_path: Path, journal_path: Path, generation: int, data: Dict[str, Any]
+) -> int:
+    """Write a new snapshot and start an empty journal for it.
+
+    Both files are replaced atomically, see `_save_json()` for details.
+    Returns the size of the new snapshot.
+    """
+    _save_json(snapshot_path, {"generation": generation, "data": data})
+
+    tmp_path = journal_path.with_name(f"{journal_path.stem}-{uuid4().fields[0]}.tmp")
+    with tmp_path.open(encoding="utf-8", mode="w") as fs:
+        fs.write(json.dumps({"generation": generation}) + "\n")
+        fs.flush()
+        os.fsync(fs.fileno())
+    tmp_path.replace(journal_path)
+    _fsync_directory(journal_path.parent)
+
+    return snapshot_path.stat().st_size
+
+
+def _fsync_directory(path: Path) -> None:
+    try:
+        flag = os.O_DIRECTORY  # pylint: disable=no-member
+    except AttributeError:
+        pass
+    else:
+        fd = os.open(path, flag)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
@@ -6,11 +6,18 @@ import pickle
 import weakref
 from collections import defaultdict
 from pathlib import Path
-from typing import Any, AsyncIterator, Dict, Optional, Tuple
+from typing import Any, AsyncIterator, Callable, Dict, Optional, Sequence, Tuple, Union
 from uuid import uuid4
 
 from .. import data_manager, errors
-from .base import BaseDriver, IdentifierData, ConfigCategory
+from .base import (
+    BaseDriver,
+    IdentifierData,
+    ConfigCategory,
+    _incremented,
+    _iter_documents,
+    _toggled,
+)
 
 __all__ = ["JsonDriver"]
 
@@ -19,10 +26,22 @@ _shared_datastore = {}
 _driver_counts = {}
 _finalizers = []
 _locks = defaultdict(asyncio.Lock)
+_pending_flushes: Dict[str, "_PendingFlush"] = {}
 
 log = logging.getLogger("redbot.json_driver")
 
 
+class _PendingFlush:
+    """Bookkeeping for a cog whose in-memory data is ahead of its file."""
+
+    __slots__ = ("path", "count", "task")
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.count = 0
+        self.task: Optional[asyncio.Task] = None
+
+
 def finalize_driver(cog_name):
     if cog_name not in _driver_counts:
         return
@@ -30,6 +49,13 @@ def finalize_driver(cog_name):
     _driver_counts[cog_name] -= 1
 
     if _driver_counts[cog_name] == 0:
+        pending = _pending_flushes.pop(cog_name, None)
+        if pending is not None:
+            # Last driver for this cog is gone, don't lose writes still waiting for the flusher.
+            if pending.task is not None:
+                pending.task.cancel()
+            if cog_name in _shared_datastore:
+                _save_json(pending.path, _shared_datastore[cog_name])
         if cog_name in _shared_datastore:
             del _shared_datastore[cog_name]
         if cog_name in _locks:
@@ -52,8 +78,23 @@ class JsonDriver(BaseDriver):
     .. py:attribute:: data_path
 
         The path in which to store the file indicated by :py:attr:`file_name`.
+
+    By default, every write is persisted to disk before `set` or `clear` returns.
+    Group commit can be enabled through the storage details passed to `initialize`:
+
+    - ``group_commit_interval`` - the maximum number of seconds a cog's data may stay
+      unsaved after a write. Writes update the in-memory data immediately and the cog's
+      file is rewritten at most once per interval.
+    - ``group_commit_max_pending`` - the number of pending writes after which the cog's
+      file is saved right away, without waiting for the interval to pass.
+
+    Data is still written atomically, and all pending writes are flushed on `teardown`.
+    Use `wait_until_durable` when a write needs to be on disk before continuing.
     """
 
+    _group_commit_interval: Optional[float] = None
+    _group_commit_max_pending: int = 100
+
     def __init__(
         self,
         cog_name: str,
@@ -88,13 +129,17 @@ class JsonDriver(BaseDriver):
 
     @classmethod
     async def initialize(cls, **storage_details) -> None:
-        # No initializing to do
-        return
+        interval = storage_details.get("group_commit_interval")
+        cls._group_commit_interval = float(interval) if interval else None
+        cls._group_commit_max_pending = max(
+            int(storage_details.get("group_commit_max_pending", 100)), 1
+        )
 
     @classmethod
     async def teardown(cls) -> None:
-        # No tearing down to do
-        return
+        for cog_name in list(_pending_flushes):
+            async with _locks[cog_name]:
+                await _flush(cog_name)
 
     @staticmethod
     def get_config_details() -> Dict[str, Any]:
@@ -138,6 +183,31 @@ class JsonDriver(BaseDriver):
             partial = partial[i]
         return pickle.loads(pickle.dumps(partial, -1))
 
+    async def get_view(self, identifier_data: IdentifierData):
+        # This hands out our own objects without copying them,
+        # Config only ever exposes them through read-only views.
+        partial = self.data
+        full_identifiers = identifier_data.to_tuple()[1:]
+        for i in full_identifiers:
+            partial = partial[i]
+        return partial
+
+    async def aiter_documents(self, identifier_data: IdentifierData, *, batch_size: int = 500):
+        partial = self.data
+        try:
+            for i in identifier_data.to_tuple()[1:]:
+                partial = partial[i]
+        except KeyError:
+            return
+        num_missing_pkeys = identifier_data.primary_key_len - len(identifier_data.primary_key)
+        # Only copy one document at a time, rather than the whole scope.
+        for idx, (pkey, document) in enumerate(
+            _iter_documents(partial, num_missing_pkeys), start=1
+        ):
+            yield pkey, pickle.loads(pickle.dumps(document, -1))
+            if idx % batch_size == 0:
+                await asyncio.sleep(0)
+
     async def set(self, identifier_data: IdentifierData, value=None):
         partial = self.data
         full_identifiers = identifier_data.to_tuple()[1:]
@@ -156,6 +226,76 @@ class JsonDriver(BaseDriver):
             partial[full_identifiers[-1]] = value_copy
             await self._save()
 
+    async def set_many(self, items: Sequence[Tuple[IdentifierData, Any]]) -> None:
+        # Same as `set`, but all values are written out with a single save.
+        prepared = [
+            (identifier_data.to_tuple()[1:], json.loads(json.dumps(value)))
+            for identifier_data, value in items
+        ]
+
+        async with self._lock:
+            try:
+                for full_identifiers, value_copy in prepared:
+                    partial = self.data
+                    for i in full_identifiers[:-1]:
+                        try:
+                            partial = partial.setdefault(i, {})
+                        except AttributeError:
+                            # Tried to set sub-field of non-object
+                            raise errors.CannotSetSubfield
+
+                    partial[full_identifiers[-1]] = value_copy
+            finally:
+                # Values set before a failure are kept, like with consecutive `set` calls.
+                await self._save()
+
+    async def inc(
+        self,
+        identifier_data: IdentifierData,
+        value: Union[int, float],
+        default: Union[int, float],
+        *,
+        min_value: Optional[Union[int, float]] = None,
+        max_value: Optional[Union[int, float]] = None,
+    ) -> Union[int, float]:
+        return await self._update_value(
+            identifier_data,
+            lambda existing: _incremented(identifier_data, existing, value, min_value, max_value),
+            default,
+        )
+
+    async def toggle(self, identifier_data: IdentifierData, default: bool) -> bool:
+        return await self._update_value(
+            identifier_data, lambda existing: _toggled(identifier_data, existing), default
+        )
+
+    async def _update_value(
+        self, identifier_data: IdentifierData, func: Callable[[Any], Any], default: Any
+    ) -> Any:
+        # Reading and writing under the same lock makes this atomic.
+        full_identifiers = identifier_data.to_tuple()[1:]
+        async with self._lock:
+            partial = self.data
+            try:
+                for i in full_identifiers:
+                    partial = partial[i]
+            except KeyError:
+                partial = default
+            except TypeError:
+                # Tried to get sub-field of non-object
+                raise errors.CannotSetSubfield
+            result = func(partial)
+            await self._write_value(full_identifiers, result)
+        return result
+
+    async def _write_value(self, full_identifiers: Tuple[str, ...], value: Any) -> None:
+        # This must be called with the cog's lock acquired.
+        partial = self.data
+        for i in full_identifiers[:-1]:
+            partial = partial.setdefault(i, {})
+        partial[full_identifiers[-1]] = value
+        await self._save()
+
     async def clear(self, identifier_data: IdentifierData):
         partial = self.data
         full_identifiers = identifier_data.to_tuple()[1:]
@@ -216,9 +356,67 @@ class JsonDriver(BaseDriver):
                     update_write_data(ident_data, data)
             await self._save()
 
+    async def wait_until_durable(self) -> None:
+        """Wait until all writes made to this cog's data so far are saved to disk.
+
+        When group commit is enabled, this flushes the cog's pending writes
+        immediately instead of waiting for the flush interval to pass.
+        Otherwise, this returns right away.
+        """
+        if self.cog_name not in _pending_flushes:
+            return
+        async with self._lock:
+            await _flush(self.cog_name)
+
     async def _save(self) -> None:
-        loop = asyncio.get_running_loop()
-        await loop.run_in_executor(None, _save_json, self.data_path, self.data)
+        # This must be called with the cog's lock acquired.
+        if self._group_commit_interval is None:
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(None, _save_json, self.data_path, self.data)
+            return
+
+        pending = _pending_flushes.get(self.cog_name)
+        if pending is None:
+            pending = _pending_flushes[self.cog_name] = _PendingFlush(self.data_path)
+        pending.count += 1
+        if pending.count >= self._group_commit_max_pending:
+            await _flush(self.cog_name)
+        elif pending.task is None:
+            pending.task = asyncio.create_task(
+                _delayed_flush(self.cog_name, self._group_commit_interval)
+            )
+
+
+async def _delayed_flush(cog_name: str, delay: float) -> None:
+    await asyncio.sleep(delay)
+    async with _locks[cog_name]:
+        pending = _pending_flushes.get(cog_name)
+        if pending is not None and pending.task is asyncio.current_task():
+            pending.task = None
+        await _flush(cog_name)
+
+
+async def _flush(cog_name: str) -> None:
+    """Save the cog's data if it has pending writes.
+
+    This must be called with the cog's lock acquired.
+    """
+    pending = _pending_flushes.pop(cog_name, None)
+    if pending is None:
+        return
+    if pending.task is not None and pending.task is not asyncio.current_task():
+        pending.task.cancel()
+        pending.task = None
+    data = _shared_datastore.get(cog_name)
+    if data is None:
+        return
+    loop = asyncio.get_running_loop()
+    try:
+        await loop.run_in_executor(None, _save_json, pending.path, data)
+    except BaseException:
+        # Keep the writes marked as pending so that the next flush can retry them.
+        _pending_flushes.setdefault(cog_name, pending)
+        raise
 
 
 def _save_json(path: Path, data: Dict[str, Any]) -> None:
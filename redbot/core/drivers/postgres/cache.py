@@ -0,0 +1,115 @@
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+__all__ = ["DocumentCache", "DocumentKey", "MISSING"]
+
+#: The schema name, category and primary keys of a document.
+DocumentKey = Tuple[str, str, Tuple[str, ...]]
+
+#: Cached in place of documents which don't exist.
+MISSING = object()
+
+
+class DocumentCache:
+    """An LRU cache of whole config documents.
+
+    The cache is bounded by the total size of the cached documents, measured
+    as the length of their JSON representation, plus `ENTRY_OVERHEAD` for each
+    of them, so that the documents cached as `MISSING` count towards the limit too.
+
+    Every invalidation bumps `generation`. Readers should take note of it
+    before fetching a document and pass it back to `put`, so that a document
+    which might have changed in the meantime isn't cached.
+    """
+
+    #: The size charged for every cached document on top of its own.
+    ENTRY_OVERHEAD = 64
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.generation = 0
+        self._documents: "OrderedDict[DocumentKey, Tuple[Any, int]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._documents)
+
+    def get(self, key: DocumentKey) -> Any:
+        """Get a cached document, or `MISSING` if it's known not to exist.
+
+        Raises `KeyError` when the document isn't cached.
+        """
+        try:
+            document, _size = self._documents[key]
+        except KeyError:
+            self.misses += 1
+            raise
+        self._documents.move_to_end(key)
+        self.hits += 1
+        return document
+
+    def put(self, key: DocumentKey, document: Any, size: int, generation: int) -> None:
+        size += self.ENTRY_OVERHEAD
+        if generation != self.generation or size > self.max_size:
+            return
+        self._pop(key)
+        self._documents[key] = (document, size)
+        self.size += size
+        while self.size > self.max_size:
+            _key, (_document, evicted_size) = self._documents.popitem(last=False)
+            self.size -= evicted_size
+
+    def discard(self, key: DocumentKey) -> None:
+        """Drop a single cached document."""
+        self.generation += 1
+        self._pop(key)
+
+    def invalidate(
+        self,
+        schemaname: Optional[str],
+        category: Optional[str] = None,
+        pkeys: Tuple[str, ...] = (),
+    ) -> None:
+        """Drop cached documents.
+
+        Documents are dropped when they are in the given schema and category,
+        and their primary keys start with ``pkeys``. When ``category`` is
+        ``None``, the whole schema is dropped, and when ``schemaname`` is
+        ``None``, the whole cache is cleared.
+
+        This has to look at every cached document, use `discard` when
+        the full primary key is known.
+        """
+        self.generation += 1
+        if schemaname is None:
+            self._documents.clear()
+            self.size = 0
+            return
+        num_pkeys = len(pkeys)
+        for key in list(self._documents):
+            if key[0] != schemaname:
+                continue
+            if category is None or (key[1] == category and key[2][:num_pkeys] == pkeys):
+                self._pop(key)
+
+    def clear(self) -> None:
+        self.invalidate(None)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "documents": len(self._documents),
+            "size": self.size,
+            "max_size": self.max_size,
+        }
+
+    def _pop(self, key: DocumentKey) -> None:
+        try:
+            _document, size = self._documents.pop(key)
+        except KeyError:
+            pass
+        else:
+            self.size -= size
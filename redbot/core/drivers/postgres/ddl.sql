@@ -108,10 +108,85 @@ CREATE OR REPLACE FUNCTION
       pkey_column_definitions,
       constraintname,
       pkey_columns);
+    PERFORM red_config.create_notify_trigger(schemaname, id_data.category);
   END;
 $$;
 
 
+CREATE OR REPLACE FUNCTION
+  /*
+   * Create the trigger which announces changes to the given config
+   * table on the `red_config_changes` channel.
+   */
+  red_config.create_notify_trigger(schemaname text, tablename text)
+    RETURNS void
+    LANGUAGE 'plpgsql'
+  AS $$
+  BEGIN
+    EXECUTE format(
+      'DROP TRIGGER IF EXISTS red_config_notify_change ON %I.%I', schemaname, tablename);
+    EXECUTE format(
+      $query$
+      CREATE TRIGGER red_config_notify_change
+        AFTER INSERT OR UPDATE OR DELETE ON %I.%I
+        FOR EACH ROW EXECUTE PROCEDURE red_config.notify_change()
+      $query$,
+      schemaname,
+      tablename);
+  END;
+$$;
+
+
+CREATE OR REPLACE FUNCTION
+  /*
+   * Trigger function which announces a changed document on the
+   * `red_config_changes` channel.
+   *
+   * The payload is a JSON object with the `schema` and `category` of
+   * the document, and its `pkeys` as an array of strings. Identical
+   * notifications within a transaction are only delivered once.
+   */
+  red_config.notify_change()
+    RETURNS trigger
+    LANGUAGE 'plpgsql'
+  AS $$
+  DECLARE
+    changed_row jsonb;
+    pkeys jsonb;
+  BEGIN
+    IF TG_OP = 'DELETE' THEN
+      changed_row := to_jsonb(OLD);
+    ELSE
+      changed_row := to_jsonb(NEW);
+    END IF;
+
+    SELECT coalesce(jsonb_agg(t.value ORDER BY substr(t.key, 13)::integer), '[]')
+    INTO pkeys
+    FROM jsonb_each_text(changed_row - 'json_data') t;
+
+    PERFORM red_config.notify(TG_TABLE_SCHEMA, TG_TABLE_NAME, pkeys);
+    RETURN NULL;
+  END;
+$$;
+
+
+CREATE OR REPLACE FUNCTION
+  /*
+   * Announce a change on the `red_config_changes` channel.
+   *
+   * A NULL `category` means the whole schema has changed, and a NULL
+   * `schemaname` means all schemas have changed.
+   */
+  red_config.notify(schemaname text, category text, pkeys jsonb DEFAULT '[]')
+    RETURNS void
+    LANGUAGE 'sql'
+  AS $$
+    SELECT pg_notify(
+      'red_config_changes',
+      json_build_object('schema', schemaname, 'category', category, 'pkeys', pkeys)::text);
+$$;
+
+
 CREATE OR REPLACE FUNCTION
   /*
    * Get config data.
@@ -347,10 +422,13 @@ CREATE OR REPLACE FUNCTION
       END IF;
       -- Deleting an entire category
       EXECUTE format('DROP TABLE %I.%I CASCADE', schemaname, id_data.category);
+      -- Row triggers don't fire for dropped tables
+      PERFORM red_config.notify(schemaname, id_data.category);
 
     ELSE
       -- Deleting an entire cog's data
       EXECUTE format('DROP SCHEMA %I CASCADE', schemaname);
+      PERFORM red_config.notify(schemaname, NULL);
 
       DELETE FROM red_config.red_cogs
       WHERE cog_name = id_data.cog_name AND cog_id = id_data.cog_id;
@@ -359,6 +437,9 @@ CREATE OR REPLACE FUNCTION
 $$;
 
 
+-- The bounds were added to red_config.inc, which replaces the old function.
+DROP FUNCTION IF EXISTS red_config.inc(red_config.identifier_data, numeric, numeric);
+
 CREATE OR REPLACE FUNCTION
   /*
    * Increment a number within a document.
@@ -368,11 +449,17 @@ CREATE OR REPLACE FUNCTION
    *
    * Raises 'wrong_object_type' error when trying to increment a
    * non-numeric value.
+   *
+   * Raises 'numeric_value_out_of_range' error, with the current value
+   * as its detail, when the result would be lower than `min_value` or
+   * higher than `max_value`. Either bound may be NULL.
    */
   red_config.inc(
     id_data red_config.identifier_data,
     amount numeric,
     default_value numeric,
+    min_value numeric,
+    max_value numeric,
     OUT result numeric
   )
     LANGUAGE 'plpgsql'
@@ -386,6 +473,7 @@ CREATE OR REPLACE FUNCTION
     new_document jsonb;
     existing_document jsonb;
     existing_value jsonb;
+    current_value numeric;
     pkey_placeholders text;
 
   BEGIN
@@ -397,52 +485,52 @@ CREATE OR REPLACE FUNCTION
 
     PERFORM red_config.maybe_create_table(id_data);
 
-    -- Look for the existing document
+    -- Make sure the document exists, then lock it so that concurrent calls can't
+    -- interleave between reading and updating it.
+    pkey_placeholders := red_utils.gen_pkey_placeholders(id_data.pkey_len, pkey_type);
     EXECUTE format(
-        'SELECT json_data FROM %I.%I WHERE %s',
+        'INSERT INTO %I.%I VALUES(%s, $2) ON CONFLICT DO NOTHING',
         schemaname,
         id_data.category,
-        whereclause)
-    INTO existing_document USING id_data.pkeys;
-
-    IF existing_document IS NULL THEN
-      -- We need to insert a new document
-      result := default_value + amount;
-      new_document := red_utils.jsonb_set2('{}', result, VARIADIC id_data.identifiers);
-      pkey_placeholders := red_utils.gen_pkey_placeholders(id_data.pkey_len, pkey_type);
+        pkey_placeholders)
+    USING id_data.pkeys, '{}'::jsonb;
 
-      EXECUTE format(
-        'INSERT INTO %I.%I VALUES(%s, $2)',
+    EXECUTE format(
+        'SELECT json_data FROM %I.%I WHERE %s FOR UPDATE',
         schemaname,
         id_data.category,
-        pkey_placeholders)
-      USING id_data.pkeys, new_document;
+        whereclause)
+    INTO existing_document USING id_data.pkeys;
 
-    ELSE
-      -- We need to update the existing document
-      existing_value := existing_document #> id_data.identifiers;
+    existing_value := existing_document #> id_data.identifiers;
 
-      IF existing_value IS NULL THEN
-        result := default_value + amount;
+    IF existing_value IS NULL THEN
+      current_value := default_value;
 
-      ELSIF jsonb_typeof(existing_value) = 'number' THEN
-        result := existing_value::text::numeric + amount;
+    ELSIF jsonb_typeof(existing_value) = 'number' THEN
+      current_value := existing_value::text::numeric;
 
-      ELSE
-        RAISE EXCEPTION 'Cannot increment non-numeric value %', existing_value
-        USING ERRCODE = 'wrong_object_type';
-      END IF;
-
-      new_document := red_utils.jsonb_set2(
-        existing_document, to_jsonb(result), id_data.identifiers);
+    ELSE
+      RAISE EXCEPTION 'Cannot increment non-numeric value %', existing_value
+      USING ERRCODE = 'wrong_object_type';
+    END IF;
 
-      EXECUTE format(
-        'UPDATE %I.%I SET json_data = $2 WHERE %s',
-        schemaname,
-        id_data.category,
-        whereclause)
-      USING id_data.pkeys, new_document;
+    result := current_value + amount;
+    IF result < min_value OR result > max_value THEN
+      -- This also undoes inserting the document above.
+      RAISE EXCEPTION 'Cannot increment % by %, the result is out of range', current_value, amount
+      USING ERRCODE = 'numeric_value_out_of_range', DETAIL = to_jsonb(current_value)::text;
     END IF;
+
+    new_document := red_utils.jsonb_set2(
+      existing_document, to_jsonb(result), id_data.identifiers);
+
+    EXECUTE format(
+      'UPDATE %I.%I SET json_data = $2 WHERE %s',
+      schemaname,
+      id_data.category,
+      whereclause)
+    USING id_data.pkeys, new_document;
   END;
 $$;
 
@@ -484,52 +572,45 @@ CREATE OR REPLACE FUNCTION
 
     PERFORM red_config.maybe_create_table(id_data);
 
-    -- Look for the existing document
+    -- Make sure the document exists, then lock it so that concurrent calls can't
+    -- interleave between reading and updating it.
+    pkey_placeholders := red_utils.gen_pkey_placeholders(id_data.pkey_len, pkey_type);
     EXECUTE format(
-      'SELECT json_data FROM %I.%I WHERE %s',
+      'INSERT INTO %I.%I VALUES(%s, $2) ON CONFLICT DO NOTHING',
+      schemaname,
+      id_data.category,
+      pkey_placeholders)
+    USING id_data.pkeys, '{}'::jsonb;
+
+    EXECUTE format(
+      'SELECT json_data FROM %I.%I WHERE %s FOR UPDATE',
       schemaname,
       id_data.category,
       whereclause)
     INTO existing_document USING id_data.pkeys;
 
-    IF existing_document IS NULL THEN
-      -- We need to insert a new document
+    existing_value := existing_document #> id_data.identifiers;
+
+    IF existing_value IS NULL THEN
       result := NOT default_value;
-      new_document := red_utils.jsonb_set2('{}', result, VARIADIC id_data.identifiers);
-      pkey_placeholders := red_utils.gen_pkey_placeholders(id_data.pkey_len, pkey_type);
 
-      EXECUTE format(
-        'INSERT INTO %I.%I VALUES(%s, $2)',
-        schemaname,
-        id_data.category,
-        pkey_placeholders)
-      USING id_data.pkeys, new_document;
+    ELSIF jsonb_typeof(existing_value) = 'boolean' THEN
+      result := NOT existing_value::text::boolean;
 
     ELSE
-      -- We need to update the existing document
-      existing_value := existing_document #> id_data.identifiers;
-
-      IF existing_value IS NULL THEN
-        result := NOT default_value;
-
-      ELSIF jsonb_typeof(existing_value) = 'boolean' THEN
-        result := NOT existing_value::text::boolean;
-
-      ELSE
-        RAISE EXCEPTION 'Cannot increment non-boolean value %', existing_value
-        USING ERRCODE = 'wrong_object_type';
-      END IF;
+      RAISE EXCEPTION 'Cannot increment non-boolean value %', existing_value
+      USING ERRCODE = 'wrong_object_type';
+    END IF;
 
-      new_document := red_utils.jsonb_set2(
-        existing_document, to_jsonb(result), id_data.identifiers);
+    new_document := red_utils.jsonb_set2(
+      existing_document, to_jsonb(result), id_data.identifiers);
 
-      EXECUTE format(
-        'UPDATE %I.%I SET json_data = $2 WHERE %s',
-        schemaname,
-        id_data.category,
-        whereclause)
-      USING id_data.pkeys, new_document;
-    END IF;
+    EXECUTE format(
+      'UPDATE %I.%I SET json_data = $2 WHERE %s',
+      schemaname,
+      id_data.category,
+      whereclause)
+    USING id_data.pkeys, new_document;
   END;
 $$;
 
@@ -639,6 +720,7 @@ CREATE OR REPLACE FUNCTION
     END LOOP;
     -- Clear out red_config.red_cogs table
     DELETE FROM red_config.red_cogs WHERE TRUE;
+    PERFORM red_config.notify(NULL, NULL);
   END;
 $$;
 
@@ -865,3 +947,25 @@ CREATE TABLE IF NOT EXISTS
     PRIMARY KEY (cog_name, cog_id)
 )
 ;
+
+
+DO $$
+DECLARE
+  config_table record;
+BEGIN
+  -- Tables created before change notifications were added don't have the trigger yet.
+  FOR config_table IN
+    SELECT t.table_schema, t.table_name
+    FROM information_schema.tables t
+    JOIN red_config.red_cogs c ON c.schemaname = t.table_schema
+    WHERE NOT exists(
+      SELECT 1
+      FROM information_schema.triggers tr
+      WHERE tr.event_object_schema = t.table_schema
+        AND tr.event_object_table = t.table_name
+        AND tr.trigger_name = 'red_config_notify_change')
+  LOOP
+    PERFORM red_config.create_notify_trigger(config_table.table_schema, config_table.table_name);
+  END LOOP;
+END;
+$$;
@@ -1,8 +1,10 @@
+import asyncio
 import getpass
 import json
+import pickle
 import sys
 from pathlib import Path
-from typing import Optional, Any, AsyncIterator, Tuple, Union, Callable, List
+from typing import Optional, Any, AsyncIterator, Dict, Tuple, Union, Callable, List, Sequence
 
 try:
     # pylint: disable=import-error
@@ -13,12 +15,16 @@ except ModuleNotFoundError:
 from ... import data_manager, errors
 from ..base import BaseDriver, IdentifierData, ConfigCategory
 from ..log import log
+from .cache import DocumentCache, DocumentKey, MISSING
 
 __all__ = ["PostgresDriver"]
 
 _PKG_PATH = Path(__file__).parent
 DDL_SCRIPT_PATH = _PKG_PATH / "ddl.sql"
 DROP_DDL_SCRIPT_PATH = _PKG_PATH / "drop_ddl.sql"
+NOTIFY_CHANNEL = "red_config_changes"
+DEFAULT_CACHE_MAX_SIZE = 32 * 1024 * 1024
+LISTENER_RECONNECT_DELAY = 5.0
 
 
 def encode_identifier_data(
@@ -35,9 +41,68 @@ def encode_identifier_data(
     )
 
 
+def _document_key(id_data: IdentifierData) -> DocumentKey:
+    encoded = encode_identifier_data(id_data)
+    return f"{id_data.cog_name}.{id_data.uuid}", id_data.category, tuple(encoded[3])
+
+
+def _is_document_level(id_data: IdentifierData) -> bool:
+    return len(id_data.primary_key) >= id_data.primary_key_len
+
+
+def _document_identifier_data(id_data: IdentifierData) -> IdentifierData:
+    return IdentifierData(
+        id_data.cog_name,
+        id_data.uuid,
+        id_data.category,
+        id_data.primary_key,
+        (),
+        id_data.primary_key_len,
+        id_data.is_custom,
+    )
+
+
+def _get_from_document(document: Any, identifiers: Tuple[str, ...]) -> Any:
+    # This mirrors what the `#>` operator does in `red_config.get()`.
+    if document is MISSING:
+        raise KeyError
+    partial = document
+    try:
+        for i in identifiers:
+            if isinstance(partial, list):
+                partial = partial[int(i)]
+            else:
+                partial = partial[i]
+    except (KeyError, IndexError, TypeError, ValueError):
+        raise KeyError
+    return pickle.loads(pickle.dumps(partial, -1))
+
+
+def _quote_ident(identifier: str) -> str:
+    return '"' + identifier.replace('"', '""') + '"'
+
+
 class PostgresDriver(BaseDriver):
+    """
+    Config driver which stores data in a PostgreSQL database.
+
+    Documents which are read are kept in an in-memory LRU cache, so that
+    frequently read settings don't need a query every time. Writes made
+    through this driver drop the affected documents from the cache, and
+    the database announces changes made by other processes with
+    ``NOTIFY`` on the ``red_config_changes`` channel.
+
+    The cache's size is limited by the ``cache_max_size`` storage detail,
+    in bytes of JSON data, with every cached document (including the ones
+    which don't exist) charged a fixed overhead on top. Setting it to ``0``, or passing the
+    ``--no-config-cache`` flag, disables the cache.
+    """
 
     _pool: Optional["asyncpg.pool.Pool"] = None
+    _cache: Optional[DocumentCache] = None
+    _listener: Optional["asyncpg.Connection"] = None
+    _listener_task: Optional[asyncio.Task] = None
+    _connect_kwargs: Dict[str, Any] = {}
 
     @classmethod
     async def initialize(cls, **storage_details) -> None:
@@ -45,15 +110,108 @@ class PostgresDriver(BaseDriver):
             raise errors.MissingExtraRequirements(
                 "Red must be installed with the [postgres] extra to use the PostgreSQL driver"
             )
+        storage_details = dict(storage_details)
+        cache_max_size = storage_details.pop("cache_max_size", DEFAULT_CACHE_MAX_SIZE)
         cls._pool = await asyncpg.create_pool(**storage_details)
         with DDL_SCRIPT_PATH.open() as fs:
             await cls._pool.execute(fs.read())
 
+        if cache_max_size:
+            cls._connect_kwargs = storage_details
+            cls._cache = DocumentCache(cache_max_size)
+            await cls._start_listener()
+
     @classmethod
     async def teardown(cls) -> None:
+        if cls._listener_task is not None:
+            cls._listener_task.cancel()
+            cls._listener_task = None
+        if cls._listener is not None:
+            listener, cls._listener = cls._listener, None
+            listener.remove_termination_listener(cls._on_listener_terminated)
+            await listener.close()
+        cls._cache = None
         if cls._pool is not None:
             await cls._pool.close()
 
+    @classmethod
+    def cache_stats(cls) -> Optional[Dict[str, int]]:
+        """Get the statistics of the document cache.
+
+        Returns
+        -------
+        Optional[Dict[str, int]]
+            The number of cache ``hits`` and ``misses``, the number of cached
+            ``documents``, and their total ``size`` and ``max_size``.
+            ``None`` when the cache is disabled.
+
+        """
+        if cls._cache is None:
+            return None
+        return cls._cache.stats()
+
+    @classmethod
+    async def _start_listener(cls) -> None:
+        conn = await asyncpg.connect(**cls._connect_kwargs)
+        await conn.add_listener(NOTIFY_CHANNEL, cls._on_notification)
+        conn.add_termination_listener(cls._on_listener_terminated)
+        cls._listener = conn
+        # Changes made while we weren't listening were missed.
+        cls._cache.clear()
+
+    @classmethod
+    def _on_notification(cls, conn, pid: int, channel: str, payload: str) -> None:
+        if cls._cache is None:
+            return
+        change = json.loads(payload)
+        if change["category"] is None:
+            cls._cache.invalidate(change["schema"])
+        elif change["pkeys"]:
+            cls._cache.discard((change["schema"], change["category"], tuple(change["pkeys"])))
+        else:
+            cls._cache.invalidate(change["schema"], change["category"])
+
+    @classmethod
+    def _on_listener_terminated(cls, conn) -> None:
+        # Without notifications, cached documents could go stale at any time,
+        # so the cache is bypassed until we're listening again.
+        cls._listener = None
+        if cls._cache is not None:
+            cls._cache.clear()
+            log.warning("Lost the connection used for cache invalidation, reconnecting.")
+            cls._listener_task = asyncio.create_task(cls._reconnect_listener())
+
+    @classmethod
+    async def _reconnect_listener(cls) -> None:
+        while cls._cache is not None:
+            await asyncio.sleep(LISTENER_RECONNECT_DELAY)
+            try:
+                await cls._start_listener()
+            except (OSError, asyncpg.PostgresError) as exc:
+                log.debug("Failed to reconnect the cache invalidation listener: %s", exc)
+            else:
+                log.info("Reconnected the cache invalidation listener.")
+                break
+        cls._listener_task = None
+
+    @classmethod
+    def _active_cache(cls) -> Optional[DocumentCache]:
+        if cls._listener is None:
+            return None
+        return cls._cache
+
+    @classmethod
+    def _invalidate(cls, identifier_data: IdentifierData) -> None:
+        if cls._cache is None:
+            return
+        if not identifier_data.category:
+            cls._cache.invalidate(f"{identifier_data.cog_name}.{identifier_data.uuid}")
+        elif _is_document_level(identifier_data):
+            cls._cache.discard(_document_key(identifier_data))
+        else:
+            schemaname, category, pkeys = _document_key(identifier_data)
+            cls._cache.invalidate(schemaname, category, pkeys)
+
     @staticmethod
     def get_config_details():
         unixmsg = (
@@ -137,17 +295,26 @@ class PostgresDriver(BaseDriver):
         }
 
     async def get(self, identifier_data: IdentifierData):
-        result = await self._execute(
-            "SELECT red_config.get($1)",
-            encode_identifier_data(identifier_data),
-            method=self._pool.fetchval,
-        )
+        cache = self._active_cache()
+        if cache is None or not _is_document_level(identifier_data):
+            result = await self._fetch(identifier_data)
+            if result is None:
+                # The result is None both when postgres yields no results, or when it yields a
+                # NULL row. A 'null' JSON value would be returned as encoded JSON, i.e. the
+                # string 'null'
+                raise KeyError
+            return json.loads(result)
 
-        if result is None:
-            # The result is None both when postgres yields no results, or when it yields a NULL row
-            # A 'null' JSON value would be returned as encoded JSON, i.e. the string 'null'
-            raise KeyError
-        return json.loads(result)
+        # Whole documents are cached, so that they cover reads of any of their keys.
+        key = _document_key(identifier_data)
+        try:
+            document = cache.get(key)
+        except KeyError:
+            generation = cache.generation
+            result = await self._fetch(_document_identifier_data(identifier_data))
+            document = MISSING if result is None else json.loads(result)
+            cache.put(key, document, len(result or ""), generation)
+        return _get_from_document(document, identifier_data.identifiers)
 
     async def set(self, identifier_data: IdentifierData, value=None):
         try:
@@ -158,34 +325,271 @@ class PostgresDriver(BaseDriver):
             )
         except asyncpg.ErrorInAssignmentError:
             raise errors.CannotSetSubfield
+        finally:
+            self._invalidate(identifier_data)
+
+    async def get_many(
+        self, identifier_data_list: Sequence[IdentifierData]
+    ) -> Dict[IdentifierData, Any]:
+        cache = self._active_cache()
+        if cache is None:
+            results = await self._fetch_many(identifier_data_list)
+            return {
+                id_data: json.loads(result)
+                for id_data, result in zip(identifier_data_list, results)
+                if result is not None
+            }
+
+        generation = cache.generation
+        documents: Dict[DocumentKey, Any] = {}
+        to_fetch: Dict[Union[DocumentKey, IdentifierData], IdentifierData] = {}
+        for id_data in identifier_data_list:
+            if not _is_document_level(id_data):
+                to_fetch[id_data] = id_data
+                continue
+            key = _document_key(id_data)
+            if key in documents or key in to_fetch:
+                continue
+            try:
+                documents[key] = cache.get(key)
+            except KeyError:
+                to_fetch[key] = _document_identifier_data(id_data)
+
+        fetched = {}
+        if to_fetch:
+            results = await self._fetch_many(list(to_fetch.values()))
+            for fetch_key, result in zip(to_fetch, results):
+                if isinstance(fetch_key, IdentifierData):
+                    if result is not None:
+                        fetched[fetch_key] = json.loads(result)
+                    continue
+                document = MISSING if result is None else json.loads(result)
+                cache.put(fetch_key, document, len(result or ""), generation)
+                documents[fetch_key] = document
+
+        ret = {}
+        for id_data in identifier_data_list:
+            if not _is_document_level(id_data):
+                if id_data in fetched:
+                    ret[id_data] = fetched[id_data]
+                continue
+            try:
+                ret[id_data] = _get_from_document(
+                    documents[_document_key(id_data)], id_data.identifiers
+                )
+            except KeyError:
+                pass
+        return ret
+
+    async def set_many(self, items: Sequence[Tuple[IdentifierData, Any]]) -> None:
+        args = [
+            (encode_identifier_data(identifier_data), json.dumps(value))
+            for identifier_data, value in items
+        ]
+        try:
+            async with self._pool.acquire() as conn, conn.transaction():
+                try:
+                    await self._execute(
+                        "SELECT red_config.set($1, $2::jsonb)", args, method=conn.executemany
+                    )
+                except asyncpg.ErrorInAssignmentError:
+                    raise errors.CannotSetSubfield
+        finally:
+            for identifier_data, _value in items:
+                self._invalidate(identifier_data)
 
     async def clear(self, identifier_data: IdentifierData):
-        await self._execute("SELECT red_config.clear($1)", encode_identifier_data(identifier_data))
+        try:
+            await self._execute(
+                "SELECT red_config.clear($1)", encode_identifier_data(identifier_data)
+            )
+        finally:
+            self._invalidate(identifier_data)
 
     async def inc(
-        self, identifier_data: IdentifierData, value: Union[int, float], default: Union[int, float]
+        self,
+        identifier_data: IdentifierData,
+        value: Union[int, float],
+        default: Union[int, float],
+        *,
+        min_value: Optional[Union[int, float]] = None,
+        max_value: Optional[Union[int, float]] = None,
     ) -> Union[int, float]:
         try:
-            return await self._execute(
-                f"SELECT red_config.inc($1, $2, $3)",
+            # Going through JSON gives us an int or a float, rather than a Decimal.
+            result = await self._execute(
+                "SELECT to_jsonb(red_config.inc($1, $2, $3, $4, $5))",
                 encode_identifier_data(identifier_data),
                 value,
                 default,
+                min_value,
+                max_value,
                 method=self._pool.fetchval,
             )
         except asyncpg.WrongObjectTypeError as exc:
             raise errors.StoredTypeError(*exc.args)
+        except asyncpg.NumericValueOutOfRangeError as exc:
+            # The detail is the current value, as JSON.
+            raise errors.OutOfRangeError(json.loads(exc.detail), *exc.args)
+        except asyncpg.ErrorInAssignmentError:
+            raise errors.CannotSetSubfield
+        finally:
+            self._invalidate(identifier_data)
+        return json.loads(result)
 
     async def toggle(self, identifier_data: IdentifierData, default: bool) -> bool:
         try:
             return await self._execute(
-                "SELECT red_config.inc($1, $2)",
+                "SELECT red_config.toggle($1, $2)",
                 encode_identifier_data(identifier_data),
                 default,
                 method=self._pool.fetchval,
             )
         except asyncpg.WrongObjectTypeError as exc:
             raise errors.StoredTypeError(*exc.args)
+        except asyncpg.ErrorInAssignmentError:
+            raise errors.CannotSetSubfield
+        finally:
+            self._invalidate(identifier_data)
+
+    async def _fetch(self, identifier_data: IdentifierData) -> Optional[str]:
+        return await self._execute(
+            "SELECT red_config.get($1)",
+            encode_identifier_data(identifier_data),
+            method=self._pool.fetchval,
+        )
+
+    async def _fetch_many(
+        self, identifier_data_list: Sequence[IdentifierData]
+    ) -> List[Optional[str]]:
+        results = await self._execute(
+            "SELECT idx, red_config.get(($1::red_config.identifier_data[])[idx]) AS result"
+            " FROM generate_subscripts($1::red_config.identifier_data[], 1) AS idx",
+            [encode_identifier_data(id_data) for id_data in identifier_data_list],
+            method=self._pool.fetch,
+        )
+        ret = [None] * len(identifier_data_list)
+        for row in results:
+            ret[row["idx"] - 1] = row["result"]
+        return ret
+
+    async def aiter_documents(
+        self, identifier_data: IdentifierData, *, batch_size: int = 500
+    ) -> AsyncIterator[Tuple[Tuple[str, ...], Any]]:
+        schemaname = f"{identifier_data.cog_name}.{identifier_data.uuid}"
+        table_exists = await self._execute(
+            "SELECT exists(SELECT 1 FROM information_schema.tables"
+            " WHERE table_schema = $1 AND table_name = $2)",
+            schemaname,
+            identifier_data.category,
+            method=self._pool.fetchval,
+        )
+        if not table_exists:
+            return
+
+        pkey_type = "text" if identifier_data.is_custom else "bigint"
+        num_pkeys = len(identifier_data.primary_key)
+        args = [list(identifier_data.primary_key)] if num_pkeys else []
+        conditions = [
+            f"primary_key_{idx} = ($1::text[])[{idx}]::{pkey_type}"
+            for idx in range(1, num_pkeys + 1)
+        ]
+        missing_pkey_columns = ", ".join(
+            f"primary_key_{idx}"
+            for idx in range(num_pkeys + 1, identifier_data.primary_key_len + 1)
+        )
+        query = (
+            f"SELECT {missing_pkey_columns}, json_data"
+            f" FROM {_quote_ident(schemaname)}.{_quote_ident(identifier_data.category)}"
+        )
+
+        # Each batch is a separate query which starts after the last key of the previous one,
+        # so no connection or transaction is held while the caller processes the documents.
+        num_missing = identifier_data.primary_key_len - num_pkeys
+        last_key_params = ", ".join(
+            f"${idx}::{pkey_type}" for idx in range(len(args) + 1, len(args) + num_missing + 1)
+        )
+        next_batch_condition = f"({missing_pkey_columns}) > ({last_key_params})"
+        order_and_limit = f" ORDER BY {missing_pkey_columns} LIMIT {int(batch_size)}"
+        first_batch_query = f"{query} WHERE {' AND '.join(conditions) or 'TRUE'}{order_and_limit}"
+        next_batch_query = (
+            f"{query} WHERE {' AND '.join([*conditions, next_batch_condition])}{order_and_limit}"
+        )
+        last_key = None
+        while True:
+            if last_key is None:
+                rows = await self._execute(first_batch_query, *args, method=self._pool.fetch)
+            else:
+                rows = await self._execute(
+                    next_batch_query, *args, *last_key, method=self._pool.fetch
+                )
+            for row in rows:
+                yield tuple(str(pkey) for pkey in row[:-1]), json.loads(row[-1])
+            if len(rows) < batch_size:
+                return
+            last_key = tuple(rows[-1][:-1])
+
+    async def import_data(
+        self, cog_data: List[Tuple[str, Dict[str, Any]]], custom_group_data: Dict[str, int]
+    ) -> None:
+        """Import data exported by `export_data`.
+
+        Each category is loaded into a temporary table with ``COPY`` and then
+        upserted into its config table with a single statement.
+        """
+        try:
+            await self._import_data(cog_data, custom_group_data)
+        finally:
+            self._invalidate(
+                IdentifierData(self.cog_name, self.unique_cog_identifier, "", (), (), 0)
+            )
+
+    async def _import_data(self, cog_data, custom_group_data) -> None:
+        schemaname = f"{self.cog_name}.{self.unique_cog_identifier}"
+        async with self._pool.acquire() as conn:
+            for category, all_data in cog_data:
+                pkey_len, is_custom = ConfigCategory.get_pkey_info(category, custom_group_data)
+                identifier_data = IdentifierData(
+                    self.cog_name,
+                    self.unique_cog_identifier,
+                    category,
+                    (),
+                    (),
+                    pkey_len,
+                    is_custom,
+                )
+                encoded = encode_identifier_data(identifier_data)
+                num_pkeys = encoded[5]
+                records = []
+                for pkeys, data in self._split_primary_key(category, custom_group_data, all_data):
+                    if not pkeys:
+                        pkeys = ("0",)
+                    if not is_custom:
+                        pkeys = tuple(map(int, pkeys))
+                    records.append((*pkeys, json.dumps(data)))
+
+                table = f"{_quote_ident(schemaname)}.{_quote_ident(category)}"
+                pkey_columns = ", ".join(f"primary_key_{idx}" for idx in range(1, num_pkeys + 1))
+                await self._execute("SELECT red_config.maybe_create_table($1)", encoded)
+                async with conn.transaction():
+                    await conn.execute(
+                        f"CREATE TEMPORARY TABLE red_config_import (LIKE {table}) ON COMMIT DROP"
+                    )
+                    await conn.copy_records_to_table("red_config_import", records=records)
+                    # One notification for the whole category is enough, rather than one
+                    # for each row.
+                    await conn.execute(
+                        f"ALTER TABLE {table} DISABLE TRIGGER red_config_notify_change"
+                    )
+                    await conn.execute(
+                        f"INSERT INTO {table} SELECT * FROM red_config_import"
+                        f" ON CONFLICT ({pkey_columns}) DO UPDATE"
+                        f" SET json_data = excluded.json_data"
+                    )
+                    await conn.execute(
+                        f"ALTER TABLE {table} ENABLE TRIGGER red_config_notify_change"
+                    )
+                    await conn.execute("SELECT red_config.notify($1, $2)", schemaname, category)
 
     @classmethod
     async def aiter_cogs(cls) -> AsyncIterator[Tuple[str, str]]:
@@ -218,6 +622,8 @@ class PostgresDriver(BaseDriver):
             )
         with DROP_DDL_SCRIPT_PATH.open() as fs:
             await cls._pool.execute(fs.read())
+        if cls._cache is not None:
+            cls._cache.clear()
 
     @classmethod
     async def _execute(cls, query: str, *args, method: Optional[Callable] = None) -> Any:
@@ -0,0 +1,453 @@
+import asyncio
+import concurrent.futures
+import contextlib
+import json
+from pathlib import Path
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+import apsw
+
+from .. import data_manager, errors
+from ..utils.dbtools import APSWConnectionWrapper
+from .base import (
+    BaseDriver,
+    IdentifierData,
+    _incremented,
+    _iter_documents,
+    _toggled,
+)
+
+__all__ = ["SqliteDriver"]
+
+DATABASE_FILE_NAME = "config.db"
+METADATA_TABLE = "red_config_tables"
+
+_T = TypeVar("_T")
+
+
+def _quote_ident(identifier: str) -> str:
+    return '"' + identifier.replace('"', '""') + '"'
+
+
+def _pkey_columns(start: int, stop: int) -> List[str]:
+    return [f"primary_key_{idx}" for idx in range(start, stop + 1)]
+
+
+class _Location:
+    """Where a piece of identifier data lives in the database."""
+
+    __slots__ = ("table", "pkeys", "pkey_len", "identifiers")
+
+    def __init__(self, id_data: IdentifierData):
+        self.table = f"{id_data.cog_name}.{id_data.uuid}.{id_data.category}"
+        if id_data.primary_key_len == 0:
+            # Like in the PostgreSQL driver, categories without primary keys (such as
+            # the global category) are stored as a single document.
+            self.pkeys, self.pkey_len = ("0",), 1
+        else:
+            self.pkeys, self.pkey_len = id_data.primary_key, id_data.primary_key_len
+        self.identifiers = id_data.identifiers
+
+    @property
+    def is_document_level(self) -> bool:
+        return len(self.pkeys) >= self.pkey_len
+
+    @property
+    def whereclause(self) -> str:
+        return " AND ".join(f"{col} = ?" for col in _pkey_columns(1, len(self.pkeys))) or "TRUE"
+
+
+class SqliteDriver(BaseDriver):
+    """
+    Config driver which stores data in a SQLite database.
+
+    The database is stored in the instance's data path. Each category of each
+    cog gets its own table, with one row for each document (i.e. each full
+    primary key, such as a guild or a member). Reads and writes only touch
+    the rows they need.
+
+    The database runs in WAL mode, so other connections (such as backups)
+    can read while the bot writes. All queries are run on a single dedicated
+    thread, so they don't block the event loop.
+
+    The database file defaults to ``config.db`` in the core data path. It can
+    be overridden with the ``path`` storage detail.
+    """
+
+    _executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
+    _conn: Optional[APSWConnectionWrapper] = None
+    _tables: Set[str] = set()
+
+    @classmethod
+    async def initialize(cls, **storage_details) -> None:
+        cls._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="red_config_sqlite"
+        )
+        path = storage_details.get("path") or data_manager.core_data_path() / DATABASE_FILE_NAME
+        await cls._run(cls._connect, Path(path))
+
+    @classmethod
+    async def teardown(cls) -> None:
+        if cls._executor is None:
+            return
+        if cls._conn is not None:
+            await cls._run(cls._close)
+        cls._executor.shutdown(wait=True)
+        cls._executor = None
+
+    @staticmethod
+    def get_config_details() -> Dict[str, Any]:
+        # The database is stored in the instance's data path, there's nothing to configure.
+        return {}
+
+    @classmethod
+    def _connect(cls, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        conn = APSWConnectionWrapper(path)
+        conn.setbusytimeout(5000)
+        with conn.with_cursor() as cursor:
+            cursor.execute("PRAGMA journal_mode = wal")
+            # In WAL mode, this is still safe from corruption, but only syncs on checkpoints.
+            cursor.execute("PRAGMA synchronous = normal")
+            cursor.execute(
+                f"CREATE TABLE IF NOT EXISTS {METADATA_TABLE} ("
+                " table_name TEXT PRIMARY KEY,"
+                " cog_name TEXT NOT NULL,"
+                " cog_id TEXT NOT NULL,"
+                " category TEXT NOT NULL)"
+            )
+            cls._tables = {
+                row[0] for row in cursor.execute(f"SELECT table_name FROM {METADATA_TABLE}")
+            }
+        cls._conn = conn
+
+    @classmethod
+    def _close(cls) -> None:
+        with cls._conn.with_cursor() as cursor:
+            # Leave a self-contained database file behind, e.g. for backups.
+            cursor.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        cls._conn.close()
+        cls._conn = None
+
+    @classmethod
+    @contextlib.contextmanager
+    def _transaction(cls) -> Iterator[apsw.Cursor]:
+        try:
+            with cls._conn.transaction() as cursor:
+                yield cursor
+        except Exception:
+            # Tables created or dropped in the transaction were rolled back too.
+            with cls._conn.with_cursor() as cursor:
+                cls._tables = {
+                    row[0] for row in cursor.execute(f"SELECT table_name FROM {METADATA_TABLE}")
+                }
+            raise
+
+    @classmethod
+    async def _run(cls, func: Callable[..., _T], *args) -> _T:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(cls._executor, func, *args)
+
+    # The methods below are run on the driver's thread.
+
+    @classmethod
+    def _create_table(cls, cursor: apsw.Cursor, id_data: IdentifierData, loc: _Location) -> None:
+        if loc.table in cls._tables:
+            return
+        columns = _pkey_columns(1, loc.pkey_len)
+        cursor.execute(
+            f"CREATE TABLE IF NOT EXISTS {_quote_ident(loc.table)} ("
+            + "".join(f"{col} TEXT NOT NULL, " for col in columns)
+            + f"json_data TEXT NOT NULL, PRIMARY KEY ({', '.join(columns)})) WITHOUT ROWID"
+        )
+        cursor.execute(
+            f"INSERT OR IGNORE INTO {METADATA_TABLE} VALUES (?, ?, ?, ?)",
+            (loc.table, id_data.cog_name, id_data.uuid, id_data.category),
+        )
+        cls._tables.add(loc.table)
+
+    @classmethod
+    def _get_sync(cls, loc: _Location) -> Any:
+        if loc.table not in cls._tables:
+            raise KeyError
+        with cls._conn.with_cursor() as cursor:
+            if loc.is_document_level:
+                row = cursor.execute(
+                    f"SELECT json_data FROM {_quote_ident(loc.table)} WHERE {loc.whereclause}",
+                    loc.pkeys,
+                ).fetchone()
+                if row is None:
+                    raise KeyError
+                partial = json.loads(row[0])
+                try:
+                    for i in loc.identifiers:
+                        partial = partial[i]
+                except TypeError:
+                    # Tried to get sub-field of non-object
+                    raise KeyError
+                return partial
+
+            missing_columns = _pkey_columns(len(loc.pkeys) + 1, loc.pkey_len)
+            ret = {}
+            for row in cursor.execute(
+                f"SELECT {', '.join(missing_columns)}, json_data"
+                f" FROM {_quote_ident(loc.table)} WHERE {loc.whereclause}",
+                loc.pkeys,
+            ):
+                partial = ret
+                for pkey in row[:-2]:
+                    partial = partial.setdefault(pkey, {})
+                partial[row[-2]] = json.loads(row[-1])
+        if not ret:
+            raise KeyError
+        return ret
+
+    @classmethod
+    def _set_sync(
+        cls, cursor: apsw.Cursor, id_data: IdentifierData, loc: _Location, value: Any
+    ) -> None:
+        if not id_data.category:
+            raise ValueError("Cannot set the data of a whole cog.")
+        cls._create_table(cursor, id_data, loc)
+        table = _quote_ident(loc.table)
+
+        if not loc.is_document_level:
+            # Replacing many documents at once
+            cursor.execute(f"DELETE FROM {table} WHERE {loc.whereclause}", loc.pkeys)
+            if not isinstance(value, dict):
+                raise errors.CannotSetSubfield
+            num_missing_pkeys = loc.pkey_len - len(loc.pkeys)
+            placeholders = ", ".join("?" * (loc.pkey_len + 1))
+            cursor.executemany(
+                f"INSERT INTO {table} VALUES ({placeholders})",
+                (
+                    (*loc.pkeys, *pkeys, json.dumps(document))
+                    for pkeys, document in _iter_documents(value, num_missing_pkeys)
+                ),
+            )
+            return
+
+        if not loc.identifiers:
+            document = value
+        else:
+            row = cursor.execute(
+                f"SELECT json_data FROM {table} WHERE {loc.whereclause}", loc.pkeys
+            ).fetchone()
+            document = {} if row is None else json.loads(row[0])
+            partial = document
+            for i in loc.identifiers[:-1]:
+                try:
+                    partial = partial.setdefault(i, {})
+                except AttributeError:
+                    # Tried to set sub-field of non-object
+                    raise errors.CannotSetSubfield
+            if not isinstance(partial, dict):
+                raise errors.CannotSetSubfield
+            partial[loc.identifiers[-1]] = value
+
+        placeholders = ", ".join("?" * (loc.pkey_len + 1))
+        cursor.execute(
+            f"INSERT OR REPLACE INTO {table} VALUES ({placeholders})",
+            (*loc.pkeys, json.dumps(document)),
+        )
+
+    @classmethod
+    def _clear_sync(cls, cursor: apsw.Cursor, id_data: IdentifierData, loc: _Location) -> None:
+        if not id_data.category:
+            # Deleting an entire cog's data
+            tables = [
+                row[0]
+                for row in cursor.execute(
+                    f"SELECT table_name FROM {METADATA_TABLE} WHERE cog_name = ? AND cog_id = ?",
+                    (id_data.cog_name, id_data.uuid),
+                )
+            ]
+            for table in tables:
+                cls._drop_table(cursor, table)
+            return
+
+        if loc.table not in cls._tables:
+            return
+        table = _quote_ident(loc.table)
+
+        if loc.identifiers:
+            # Popping a key from a document
+            row = cursor.execute(
+                f"SELECT json_data FROM {table} WHERE {loc.whereclause}", loc.pkeys
+            ).fetchone()
+            if row is None:
+                return
+            document = json.loads(row[0])
+            partial = document
+            try:
+                for i in loc.identifiers[:-1]:
+                    partial = partial[i]
+                del partial[loc.identifiers[-1]]
+            except (KeyError, TypeError):
+                return
+            cursor.execute(
+                f"UPDATE {table} SET json_data = ? WHERE {loc.whereclause}",
+                (json.dumps(document), *loc.pkeys),
+            )
+        elif id_data.primary_key or id_data.primary_key_len == 0:
+            # Deleting one or many documents
+            cursor.execute(f"DELETE FROM {table} WHERE {loc.whereclause}", loc.pkeys)
+        else:
+            # Deleting an entire category
+            cls._drop_table(cursor, loc.table)
+
+    @classmethod
+    def _drop_table(cls, cursor: apsw.Cursor, table: str) -> None:
+        cursor.execute(f"DROP TABLE IF EXISTS {_quote_ident(table)}")
+        cursor.execute(f"DELETE FROM {METADATA_TABLE} WHERE table_name = ?", (table,))
+        cls._tables.discard(table)
+
+    @classmethod
+    def _update_sync(
+        cls,
+        id_data: IdentifierData,
+        func: Callable[[Any], Any],
+        default: Any,
+    ) -> Any:
+        loc = _Location(id_data)
+        with cls._transaction() as cursor:
+            try:
+                existing = cls._get_sync(loc)
+            except KeyError:
+                existing = default
+            result = func(existing)
+            cls._set_sync(cursor, id_data, loc, result)
+        return result
+
+    @classmethod
+    def _write_many_sync(cls, items: Sequence[Tuple[IdentifierData, Any]]) -> None:
+        with cls._transaction() as cursor:
+            for id_data, value in items:
+                cls._set_sync(cursor, id_data, _Location(id_data), value)
+
+    @classmethod
+    def _clear_one_sync(cls, id_data: IdentifierData) -> None:
+        with cls._transaction() as cursor:
+            cls._clear_sync(cursor, id_data, _Location(id_data))
+
+    @classmethod
+    def _get_many_sync(
+        cls, identifier_data_list: Sequence[IdentifierData]
+    ) -> Dict[IdentifierData, Any]:
+        ret = {}
+        # A read transaction gives all values from the same snapshot.
+        with cls._conn.transaction():
+            for id_data in identifier_data_list:
+                try:
+                    ret[id_data] = cls._get_sync(_Location(id_data))
+                except KeyError:
+                    pass
+        return ret
+
+    @classmethod
+    def _fetch_documents_sync(
+        cls, loc: _Location, after: Optional[Tuple[str, ...]], limit: int
+    ) -> List[Tuple[str, ...]]:
+        if loc.table not in cls._tables:
+            return []
+        missing_columns = _pkey_columns(len(loc.pkeys) + 1, loc.pkey_len)
+        whereclause = loc.whereclause
+        args: Tuple[str, ...] = loc.pkeys
+        if after is not None:
+            # Keyset pagination picks up after the last document, even if rows were
+            # added or removed in the meantime.
+            whereclause += f" AND ({', '.join(missing_columns)}) > ({', '.join('?' * len(after))})"
+            args += after
+        with cls._conn.with_cursor() as cursor:
+            return cursor.execute(
+                f"SELECT {', '.join(missing_columns)}, json_data"
+                f" FROM {_quote_ident(loc.table)} WHERE {whereclause}"
+                f" ORDER BY {', '.join(missing_columns)} LIMIT ?",
+                (*args, limit),
+            ).fetchall()
+
+    # Driver API
+
+    async def get(self, identifier_data: IdentifierData):
+        return await self._run(self._get_sync, _Location(identifier_data))
+
+    async def get_many(
+        self, identifier_data_list: Sequence[IdentifierData]
+    ) -> Dict[IdentifierData, Any]:
+        return await self._run(self._get_many_sync, identifier_data_list)
+
+    async def set(self, identifier_data: IdentifierData, value=None):
+        # This is both our deepcopy() and our way of making sure this value is actually JSON
+        # serializable.
+        value_copy = json.loads(json.dumps(value))
+        await self._run(self._write_many_sync, [(identifier_data, value_copy)])
+
+    async def set_many(self, items: Sequence[Tuple[IdentifierData, Any]]) -> None:
+        items = [(id_data, json.loads(json.dumps(value))) for id_data, value in items]
+        await self._run(self._write_many_sync, items)
+
+    async def clear(self, identifier_data: IdentifierData):
+        await self._run(self._clear_one_sync, identifier_data)
+
+    async def inc(
+        self,
+        identifier_data: IdentifierData,
+        value: Union[int, float],
+        default: Union[int, float],
+        *,
+        min_value: Optional[Union[int, float]] = None,
+        max_value: Optional[Union[int, float]] = None,
+    ) -> Union[int, float]:
+        return await self._run(
+            self._update_sync,
+            identifier_data,
+            lambda existing: _incremented(identifier_data, existing, value, min_value, max_value),
+            default,
+        )
+
+    async def toggle(self, identifier_data: IdentifierData, default: bool) -> bool:
+        return await self._run(
+            self._update_sync,
+            identifier_data,
+            lambda existing: _toggled(identifier_data, existing),
+            default,
+        )
+
+    async def aiter_documents(
+        self, identifier_data: IdentifierData, *, batch_size: int = 500
+    ) -> AsyncIterator[Tuple[Tuple[str, ...], Any]]:
+        loc = _Location(identifier_data)
+        after = None
+        while True:
+            rows = await self._run(self._fetch_documents_sync, loc, after, batch_size)
+            for row in rows:
+                yield tuple(row[:-1]), json.loads(row[-1])
+            if len(rows) < batch_size:
+                return
+            after = tuple(rows[-1][:-1])
+
+    @classmethod
+    async def aiter_cogs(cls) -> AsyncIterator[Tuple[str, str]]:
+        def fetch_cogs():
+            with cls._conn.with_cursor() as cursor:
+                return cursor.execute(
+                    f"SELECT DISTINCT cog_name, cog_id FROM {METADATA_TABLE}"
+                ).fetchall()
+
+        yield "Core", "0"
+        for cog_name, cog_id in await cls._run(fetch_cogs):
+            if (cog_name, cog_id) != ("Core", "0"):
+                yield cog_name, cog_id
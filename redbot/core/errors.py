@@ -1,4 +1,5 @@
 import importlib.machinery
+from typing import Union
 
 import discord
 
@@ -72,6 +73,22 @@ class StoredTypeError(ConfigError, TypeError):
     """
 
 
+class OutOfRangeError(ConfigError, ValueError):
+    """Raised when incrementing a stored number would take it out of the given bounds.
+
+    The stored number is left unchanged.
+
+    Attributes
+    ----------
+    current : Union[int, float]
+        The stored number, or the default if there was none.
+    """
+
+    def __init__(self, current: Union[int, float], *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.current: Union[int, float] = current
+
+
 class CannotSetSubfield(StoredTypeError):
     """Tried to set sub-field of an invalid data structure.
 
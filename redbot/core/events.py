@@ -13,15 +13,15 @@ import pkg_resources
 from pkg_resources import DistributionNotFound
 from redbot.core import data_manager
 
-from redbot.core.commands import RedHelpFormatter, HelpSettings
+from redbot.core.commands import HelpSettings
 from redbot.core.i18n import (
     Translator,
     set_contextual_locale,
     set_contextual_regional_format,
     set_contextual_locales_from_guild,
 )
-from .utils import AsyncIter
 from .. import __version__ as red_version, version_info as red_version_info, VersionInfo
+from .._startup_profiler import startup_profiler
 from . import commands
 from .config import get_latest_confs
 from .utils._internal_utils import (
@@ -65,6 +65,8 @@ def init_events(bot, cli_flags):
         if bot._uptime is not None:
             return
 
+        startup_profiler.end("connect")
+        startup_profiler.begin("on_ready")
         bot._uptime = datetime.utcnow()
 
         guilds = len(bot.guilds)
@@ -188,6 +190,7 @@ def init_events(bot, cli_flags):
         if rich_outdated_message:
             rich_console.print(rich_outdated_message)
 
+        startup_profiler.finish(data_manager.core_data_path() / "logs")
         bot._red_ready.set()
         if outdated_red_message:
             await send_to_owners_with_prefix_replaced(bot, outdated_red_message)
@@ -256,12 +259,7 @@ def init_events(bot, cli_flags):
             await ctx.send(inline(message))
         elif isinstance(error, commands.CommandNotFound):
             help_settings = await HelpSettings.from_context(ctx)
-            fuzzy_commands = await fuzzy_command_search(
-                ctx,
-                commands=RedHelpFormatter.help_filter_func(
-                    ctx, bot.walk_commands(), help_settings=help_settings
-                ),
-            )
+            fuzzy_commands = await fuzzy_command_search(ctx, help_settings=help_settings)
             if not fuzzy_commands:
                 pass
             elif await ctx.embed_requested():
@@ -340,6 +338,7 @@ def init_events(bot, cli_flags):
 
     @bot.event
     async def on_message(message, /):
+        bot._messages_metric.inc()
         await set_contextual_locales_from_guild(bot, message.guild)
 
         await bot.process_commands(message)
@@ -360,17 +359,14 @@ def init_events(bot, cli_flags):
 
     @bot.event
     async def on_command_add(command: commands.Command):
-        disabled_commands = await bot._config.disabled_commands()
-        if command.qualified_name in disabled_commands:
+        cache = bot._disabled_command_cache
+        if await cache.disabled_globally(command.qualified_name):
             command.enabled = False
-        guild_data = await bot._config.all_guilds()
-        async for guild_id, data in AsyncIter(guild_data.items(), steps=100):
-            disabled_commands = data.get("disabled_commands", [])
-            if command.qualified_name in disabled_commands:
-                command.disable_in(discord.Object(id=guild_id))
+        for guild_id in await cache.get_guilds_disabled_in(command.qualified_name):
+            command.disable_in(discord.Object(id=guild_id))
 
     async def _guild_added(guild: discord.Guild):
-        disabled_commands = await bot._config.guild(guild).disabled_commands()
+        disabled_commands = await bot._disabled_command_cache.get_commands_disabled_in(guild.id)
         for command_name in disabled_commands:
             command_obj = bot.get_command(command_name)
             if command_obj is not None:
@@ -388,13 +384,53 @@ def init_events(bot, cli_flags):
 
     @bot.event
     async def on_guild_remove(guild: discord.Guild):
+        bot._access_policy_cache.invalidate(guild.id)
+        bot._privilege_cache.invalidate(guild.id)
+        # The settings stay in Config, but there's no point keeping them in memory.
+        bot._prefix_cache.forget_guild(guild.id)
+        bot._i18n_cache.forget_guild(guild.id)
+        bot._ignored_cache.forget_guild(guild)
+        bot._whiteblacklist_cache.forget_guild(guild.id)
+        bot._disabled_cog_cache.forget_guild(guild.id)
         # Clean up any unneeded checks
-        disabled_commands = await bot._config.guild(guild).disabled_commands()
+        disabled_commands = await bot._disabled_command_cache.get_commands_disabled_in(guild.id)
         for command_name in disabled_commands:
             command_obj = bot.get_command(command_name)
             if command_obj is not None:
                 command_obj.enable_in(guild)
 
+    @bot.event
+    async def on_guild_role_delete(role: discord.Role):
+        # Admin roles and allowlisted roles are part of the guild's access policy.
+        bot._access_policy_cache.invalidate(role.guild.id)
+        bot._privilege_cache.invalidate(role.guild.id)
+
+    @bot.event
+    async def on_guild_role_update(before: discord.Role, after: discord.Role):
+        # The position of roles decides which of the author's roles has precedence
+        # when resolving permission rules.
+        if before.position != after.position:
+            commands.Requires.role_positions_changed()
+
+    @bot.event
+    async def on_member_update(before: discord.Member, after: discord.Member):
+        # DEP-WARN
+        if before._roles != after._roles:
+            bot._privilege_cache.invalidate(after.guild.id, after.id)
+
+    @bot.event
+    async def on_member_remove(member: discord.Member):
+        bot._privilege_cache.invalidate(member.guild.id, member.id)
+
+    @bot.event
+    async def on_guild_channel_delete(channel: discord.abc.GuildChannel):
+        bot._access_policy_cache.invalidate(channel.guild.id)
+        bot._ignored_cache.forget_channel(channel.id)
+
+    @bot.event
+    async def on_raw_thread_delete(payload: discord.RawThreadDeleteEvent):
+        bot._ignored_cache.forget_channel(payload.thread_id)
+
     @bot.event
     async def on_cog_add(cog: commands.Cog):
         confs = get_latest_confs()
@@ -0,0 +1,404 @@
+"""
+Metrics which can be scraped by Prometheus.
+
+The bot's registry is available as `Red.metrics`. When the bot is started with
+``--rpc --rpc-metrics``, the RPC server serves the registry's metrics in the
+Prometheus text format at ``/metrics``.
+"""
+import logging
+import math
+import re
+from typing import (
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
+
+__all__ = ("Counter", "Gauge", "Histogram", "MetricsRegistry", "DEFAULT_BUCKETS")
+
+log = logging.getLogger("red.metrics")
+
+#: The default upper bounds of the buckets of histograms, in seconds.
+DEFAULT_BUCKETS: Tuple[float, ...] = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+_NAME_RE = re.compile(r"[a-zA-Z_:][a-zA-Z0-9_:]*")
+_LABEL_NAME_RE = re.compile(r"[a-zA-Z_][a-zA-Z0-9_]*")
+
+LabelValues = Tuple[str, ...]
+#: What the function of a function-backed metric returns: either a single value,
+#: or a mapping of label values to values.
+MetricFunction = Callable[[], Union[float, Mapping[Any, float]]]
+
+_MetricT = TypeVar("_MetricT", bound="_Metric")
+
+
+def _format_value(value: float) -> str:
+    if math.isnan(value):
+        return "NaN"
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value))
+
+
+def _escape_label_value(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+class _Metric:
+    kind: ClassVar[str]
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        *,
+        function: Optional[MetricFunction] = None,
+    ) -> None:
+        if not _NAME_RE.fullmatch(name):
+            raise ValueError(f"Invalid metric name: {name!r}")
+        for labelname in labelnames:
+            if not _LABEL_NAME_RE.fullmatch(labelname) or labelname.startswith("__"):
+                raise ValueError(f"Invalid label name: {labelname!r}")
+        self.name = name
+        self.documentation = documentation
+        self.labelnames: Tuple[str, ...] = tuple(labelnames)
+        self.function = function
+        self._values: Dict[LabelValues, Any] = {}
+
+    def _key(self, values: Sequence[Any], labels: Mapping[str, Any]) -> LabelValues:
+        if values and labels:
+            raise TypeError("Label values can't be passed both positionally and by name.")
+        if labels:
+            if set(labels) != set(self.labelnames):
+                raise ValueError(f"Expected the labels {', '.join(self.labelnames)}.")
+            values = [labels[labelname] for labelname in self.labelnames]
+        if len(values) != len(self.labelnames):
+            raise ValueError(f"Expected {len(self.labelnames)} label values.")
+        return tuple(map(str, values))
+
+    def labels(self, *values: Any, **labels: Any) -> "_Child":
+        """Get the child of this metric with the given label values.
+
+        The label values can be given either positionally,
+        in the order of the metric's label names, or by name.
+        """
+        if self.function is not None:
+            raise TypeError("The values of function-backed metrics can't be changed.")
+        return _Child(self, self._key(values, labels))
+
+    def remove(self, *values: Any) -> None:
+        """Remove the child with the given label values."""
+        self._values.pop(self._key(values, {}), None)
+
+    def clear(self) -> None:
+        """Remove all of the children."""
+        self._values.clear()
+
+    def _check_unlabelled(self) -> None:
+        if self.labelnames:
+            raise TypeError("This metric has labels, use `labels()` to get its children.")
+        if self.function is not None:
+            raise TypeError("The values of function-backed metrics can't be changed.")
+
+    def _samples(self) -> Iterator[Tuple[str, LabelValues, Dict[str, str], float]]:
+        # Yields (name suffix, label values, extra labels, value) tuples.
+        if self.function is None:
+            for key, value in list(self._values.items()):
+                yield "", key, {}, value
+            return
+        result = self.function()
+        if not isinstance(result, Mapping):
+            result = {(): result}
+        for key, value in result.items():
+            if not isinstance(key, tuple):
+                key = (key,)
+            yield "", tuple(map(str, key)), {}, value
+
+    def render(self) -> List[str]:
+        """Render the metric in the Prometheus text format."""
+        documentation = self.documentation.replace("\\", "\\\\").replace("\n", "\\n")
+        lines = [f"# HELP {self.name} {documentation}", f"# TYPE {self.name} {self.kind}"]
+        for suffix, key, extra_labels, value in self._samples():
+            labels = [
+                f'{labelname}="{_escape_label_value(label_value)}"'
+                for labelname, label_value in zip(self.labelnames, key)
+            ]
+            labels.extend(f'{labelname}="{extra}"' for labelname, extra in extra_labels.items())
+            label_str = "{" + ",".join(labels) + "}" if labels else ""
+            lines.append(f"{self.name}{suffix}{label_str} {_format_value(value)}")
+        return lines
+
+
+class Counter(_Metric):
+    """A value which only goes up, such as the number of processed messages.
+
+    By convention, the names of counters end with ``_total``.
+    """
+
+    kind = "counter"
+
+    def inc(self, amount: float = 1.0) -> None:
+        """Increase the counter, which mustn't have labels."""
+        self._check_unlabelled()
+        self._inc((), amount)
+
+    def _inc(self, key: LabelValues, amount: float) -> None:
+        if amount < 0:
+            raise ValueError("Counters can only be increased.")
+        self._values[key] = self._values.get(key, 0.0) + amount
+
+
+class Gauge(_Metric):
+    """A value which can go up and down, such as the number of connected voice clients."""
+
+    kind = "gauge"
+
+    def set(self, value: float) -> None:
+        """Set the value of the gauge, which mustn't have labels."""
+        self._check_unlabelled()
+        self._set((), value)
+
+    def inc(self, amount: float = 1.0) -> None:
+        """Increase the gauge, which mustn't have labels."""
+        self._check_unlabelled()
+        self._inc((), amount)
+
+    def dec(self, amount: float = 1.0) -> None:
+        """Decrease the gauge, which mustn't have labels."""
+        self._check_unlabelled()
+        self._inc((), -amount)
+
+    def _set(self, key: LabelValues, value: float) -> None:
+        self._values[key] = float(value)
+
+    def _inc(self, key: LabelValues, amount: float) -> None:
+        self._values[key] = self._values.get(key, 0.0) + amount
+
+
+class Histogram(_Metric):
+    """The distribution of observed values, such as the time commands take, in buckets."""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        *,
+        buckets: Iterable[float] = DEFAULT_BUCKETS,
+    ) -> None:
+        if "le" in labelnames:
+            raise ValueError("Histograms can't have a label named 'le'.")
+        super().__init__(name, documentation, labelnames)
+        self.buckets: Tuple[float, ...] = tuple(sorted(buckets))
+        if not self.buckets or self.buckets[-1] != math.inf:
+            self.buckets += (math.inf,)
+
+    def observe(self, value: float) -> None:
+        """Record a value in the histogram, which mustn't have labels."""
+        self._check_unlabelled()
+        self._observe((), value)
+
+    def _observe(self, key: LabelValues, value: float) -> None:
+        try:
+            counts, total = self._values[key]
+        except KeyError:
+            counts, total = [0] * len(self.buckets), 0.0
+        for idx, bound in enumerate(self.buckets):
+            if value <= bound:
+                counts[idx] += 1
+                break
+        self._values[key] = (counts, total + value)
+
+    def _samples(self) -> Iterator[Tuple[str, LabelValues, Dict[str, str], float]]:
+        for key, (counts, total) in list(self._values.items()):
+            cumulative = 0
+            for bound, count in zip(self.buckets, counts):
+                cumulative += count
+                yield "_bucket", key, {"le": _format_value(bound)}, cumulative
+            yield "_sum", key, {}, total
+            yield "_count", key, {}, cumulative
+
+
+class _Child:
+    """A metric bound to label values, as returned by ``labels()``."""
+
+    __slots__ = ("_metric", "_key")
+
+    def __init__(self, metric: _Metric, key: LabelValues) -> None:
+        self._metric = metric
+        self._key = key
+
+    def inc(self, amount: float = 1.0) -> None:
+        self._metric._inc(self._key, amount)
+
+    def dec(self, amount: float = 1.0) -> None:
+        self._metric._inc(self._key, -amount)
+
+    def set(self, value: float) -> None:
+        self._metric._set(self._key, value)
+
+    def observe(self, value: float) -> None:
+        self._metric._observe(self._key, value)
+
+
+class MetricsRegistry:
+    """
+    The metrics of a bot.
+
+    Registering a metric with the name of an existing metric of the same type
+    and labels returns the existing metric, so that cogs can be reloaded.
+    """
+
+    def __init__(self) -> None:
+        self._metrics: Dict[str, _Metric] = {}
+
+    def _register(self, cls: Type[_MetricT], name: str, *args: Any, **kwargs: Any) -> _MetricT:
+        metric = cls(name, *args, **kwargs)
+        existing = self._metrics.get(name)
+        if existing is not None:
+            if type(existing) is not cls or existing.labelnames != metric.labelnames:
+                raise ValueError(f"A different metric named {name!r} is already registered.")
+            # The function of a reloaded cog refers to its new instance.
+            existing.function = metric.function
+            return existing
+        self._metrics[name] = metric
+        return metric
+
+    def counter(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        *,
+        function: Optional[MetricFunction] = None,
+    ) -> Counter:
+        """
+        Register a counter.
+
+        Parameters
+        ----------
+        name : str
+            The name of the metric, which should start with the name of the cog.
+        documentation : str
+            What the metric measures.
+        labelnames : Sequence[str]
+            The names of the labels of the metric.
+        function : Optional[Callable]
+            If given, the counter's values are the return value of this function,
+            which is called whenever the metrics are scraped.
+            It can return a number, or a mapping of label values to numbers.
+
+        Returns
+        -------
+        Counter
+            The counter.
+
+        Raises
+        ------
+        ValueError
+            If a name is invalid, or another metric with this name is registered.
+        """
+        return self._register(Counter, name, documentation, labelnames, function=function)
+
+    def gauge(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        *,
+        function: Optional[MetricFunction] = None,
+    ) -> Gauge:
+        """
+        Register a gauge.
+
+        The parameters are the same as the ones of `counter()`.
+
+        Returns
+        -------
+        Gauge
+            The gauge.
+
+        Raises
+        ------
+        ValueError
+            If a name is invalid, or another metric with this name is registered.
+        """
+        return self._register(Gauge, name, documentation, labelnames, function=function)
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        *,
+        buckets: Iterable[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        """
+        Register a histogram.
+
+        Parameters
+        ----------
+        name : str
+            The name of the metric, which should start with the name of the cog.
+        documentation : str
+            What the metric measures.
+        labelnames : Sequence[str]
+            The names of the labels of the metric.
+        buckets : Iterable[float]
+            The upper bounds of the buckets. Defaults to `DEFAULT_BUCKETS`.
+
+        Returns
+        -------
+        Histogram
+            The histogram.
+
+        Raises
+        ------
+        ValueError
+            If a name is invalid, or another metric with this name is registered.
+        """
+        return self._register(Histogram, name, documentation, labelnames, buckets=buckets)
+
+    def unregister(self, name: str) -> None:
+        """Remove a metric, if it's registered."""
+        self._metrics.pop(name, None)
+
+    def get(self, name: str) -> Optional[_Metric]:
+        """Get a registered metric by name."""
+        return self._metrics.get(name)
+
+    def render(self) -> str:
+        """Render all of the metrics in the Prometheus text format."""
+        lines = []
+        for metric in list(self._metrics.values()):
+            try:
+                lines.extend(metric.render())
+            except Exception:
+                log.exception("Failed to collect the metric %s", metric.name)
+        return "\n".join(lines) + "\n"
@@ -878,7 +878,10 @@ async def get_latest_case(guild: discord.Guild, bot: Red) -> Optional[Case]:
         The latest case object. `None` if it the guild has no cases.
 
     """
-    case_number = await _config.guild(guild).latest_case_number()
+    latest_case_number = _config.guild(guild).latest_case_number
+    # The lock is held by `create_case` from taking a case number until the case is saved.
+    async with latest_case_number.get_lock():
+        case_number = await latest_case_number()
     if case_number:
         return await get_case(case_number, guild, bot)
 
@@ -1031,10 +1034,11 @@ async def create_case(
 
     parent_channel_id = channel.parent_id if isinstance(channel, discord.Thread) else None
 
-    async with _config.guild(guild).latest_case_number.get_lock():
-        # We're getting the case number from config, incrementing it, awaiting something, then
-        # setting it again. This warrants acquiring the lock.
-        next_case_number = await _config.guild(guild).latest_case_number() + 1
+    latest_case_number = _config.guild(guild).latest_case_number
+    # Incrementing is atomic, so concurrent cases (even from other processes) never share
+    # a number, and the lock makes `get_latest_case` wait until the new case is saved.
+    async with latest_case_number.get_lock():
+        next_case_number = await latest_case_number.inc()
 
         case = Case(
             bot,
@@ -1054,7 +1058,6 @@ async def create_case(
             last_known_username=last_known_username,
         )
         await _config.custom(_CASES, str(guild.id), str(next_case_number)).set(case.to_json())
-        await _config.guild(guild).latest_case_number.set(next_case_number)
 
     await set_contextual_locales_from_guild(bot, guild)
     bot.dispatch("modlog_case_create", case)
@@ -1,6 +1,6 @@
 import asyncio
 import sys
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 from aiohttp import web
 from aiohttp_json_rpc import JsonRpc
@@ -8,6 +8,9 @@ from aiohttp_json_rpc.rpc import JsonRpcMethod
 
 import logging
 
+if TYPE_CHECKING:
+    from .metrics import MetricsRegistry
+
 log = logging.getLogger("red.rpc")
 
 __all__ = ["RPC", "RPCMixin", "get_name"]
@@ -94,6 +97,21 @@ class RPC:
             await self._site.start()
             log.debug("Created RPC server listener on port %s", port)
 
+    def add_metrics_route(self, registry: "MetricsRegistry"):
+        """
+        Serves the metrics of the registry at ``/metrics``, in the Prometheus text format.
+
+        This has to be called before `initialize()`.
+        """
+
+        async def metrics(request: web.Request) -> web.Response:
+            return web.Response(
+                body=registry.render().encode("utf-8"),
+                headers={"Content-Type": "text/plain; version=0.0.4; charset=utf-8"},
+            )
+
+        self.app.router.add_get("/metrics", metrics)
+
     async def close(self):
         """
         Closes the RPC server.
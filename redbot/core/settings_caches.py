@@ -1,32 +1,72 @@
 from __future__ import annotations
 
-from typing import Dict, List, Optional, Union, Set, Iterable, Tuple, overload
+from typing import (
+    AbstractSet,
+    Callable,
+    Dict,
+    FrozenSet,
+    List,
+    Optional,
+    Union,
+    Set,
+    Iterable,
+    Tuple,
+    overload,
+)
 import asyncio
+import contextlib
 from argparse import Namespace
 from collections import defaultdict
+from dataclasses import dataclass
 
 import discord
 
+from ._cache import BoundedCache
+from .commands.requires import PrivilegeLevel
 from .config import Config
 from .utils import AsyncIter
 
+#: The maximum number of guilds each of the per-guild caches holds.
+GUILD_CACHE_SIZE = 25_000
+#: The maximum number of channels, categories and threads the ignore cache holds.
+CHANNEL_CACHE_SIZE = 100_000
+#: The maximum number of members whose privilege level is cached.
+MEMBER_CACHE_SIZE = 100_000
+#: How long, in seconds, an entry of a cache can stay unused before it's dropped.
+IDLE_TTL = 6 * 60 * 60
 
-class PrefixManager:
+
+def _guild_cache(name: str) -> BoundedCache:
+    return BoundedCache(name, maxsize=GUILD_CACHE_SIZE, ttl=IDLE_TTL)
+
+
+class _SettingsManager:
+    # Called with the ID of the guild (or None for the global settings) after
+    # a setting changed, when the bot runs in several clusters.
+    # See `Red._start_cluster()`.
+    _change_hook: Optional[Callable[[Optional[int]], None]] = None
+
+    def _changed(self, guild_id: Optional[int]) -> None:
+        if self._change_hook is not None:
+            self._change_hook(guild_id)
+
+
+class PrefixManager(_SettingsManager):
     def __init__(self, config: Config, cli_flags: Namespace):
         self._config: Config = config
         self._global_prefix_overide: Optional[List[str]] = (
             sorted(cli_flags.prefix, reverse=True) or None
         )
-        self._cached: Dict[Optional[int], List[str]] = {}
+        self._cached: BoundedCache[Optional[int], List[str]] = _guild_cache("prefixes")
 
     async def get_prefixes(self, guild: Optional[discord.Guild] = None) -> List[str]:
         ret: List[str]
 
         gid: Optional[int] = guild.id if guild else None
 
-        if gid in self._cached:
+        try:
             ret = self._cached[gid].copy()
-        else:
+        except KeyError:
             if gid is not None:
                 ret = await self._config.guild_from_id(gid).prefix()
                 if not ret:
@@ -58,37 +98,42 @@ class PrefixManager:
         else:
             self._cached.pop(gid, None)
             await self._config.guild_from_id(gid).prefix.set(prefixes)
+        self._changed(gid)
+
+    def forget_guild(self, guild_id: int) -> None:
+        """Drop the cached prefixes of a guild."""
+        self._cached.pop(guild_id, None)
 
 
-class I18nManager:
+class I18nManager(_SettingsManager):
     def __init__(self, config: Config):
         self._config: Config = config
-        self._guild_locale: Dict[Union[int, None], Union[str, None]] = {}
-        self._guild_regional_format: Dict[Union[int, None], Union[str, None]] = {}
+        # The global settings are kept separately, so that they're never evicted.
+        self._global_locale: Optional[str] = None
+        self._global_regional_format: Optional[str] = None
+        self._global_regional_format_loaded = False
+        self._guild_locale: BoundedCache[int, Optional[str]] = _guild_cache("locales")
+        self._guild_regional_format: BoundedCache[int, Optional[str]] = _guild_cache(
+            "regional_formats"
+        )
 
     async def get_locale(self, guild: Union[discord.Guild, None]) -> str:
         """Get the guild locale from the cache"""
         # Ensure global locale is in the cache
-        if None not in self._guild_locale:
-            global_locale = await self._config.locale()
-            self._guild_locale[None] = global_locale
+        if self._global_locale is None:
+            self._global_locale = await self._config.locale()
 
         if guild is None:  # Not a guild so cannot support guild locale
             # Return the bot's globally set locale if its None on a guild scope.
-            return self._guild_locale[None]
-        elif guild.id in self._guild_locale:  # Cached guild
-            if self._guild_locale[guild.id] is None:
-                return self._guild_locale[None]
-            else:
-                return self._guild_locale[guild.id]
-        else:  # Uncached guild
-            out = await self._config.guild(guild).locale()  # No locale set
-            if out is None:
-                self._guild_locale[guild.id] = None
-                return self._guild_locale[None]
-            else:
-                self._guild_locale[guild.id] = out
-                return out
+            return self._global_locale
+        try:  # Cached guild
+            out = self._guild_locale[guild.id]
+        except KeyError:  # Uncached guild
+            out = await self._config.guild(guild).locale()  # None if no locale set
+            self._guild_locale[guild.id] = out
+        if out is None:
+            return self._global_locale
+        return out
 
     @overload
     async def set_locale(self, guild: None, locale: str):
@@ -106,52 +151,66 @@ class I18nManager:
             if locale is None:
                 # this method should never be called like this
                 raise ValueError("Global locale can't be None!")
-            self._guild_locale[None] = locale
+            self._global_locale = locale
             await self._config.locale.set(locale)
+            self._changed(None)
             return
         self._guild_locale[guild.id] = locale
         await self._config.guild(guild).locale.set(locale)
+        self._changed(guild.id)
 
     async def get_regional_format(self, guild: Union[discord.Guild, None]) -> Optional[str]:
         """Get the regional format from the cache"""
-        # Ensure global locale is in the cache
-        if None not in self._guild_regional_format:
-            global_regional_format = await self._config.regional_format()
-            self._guild_regional_format[None] = global_regional_format
+        # Ensure global regional format is in the cache
+        if not self._global_regional_format_loaded:
+            self._global_regional_format = await self._config.regional_format()
+            self._global_regional_format_loaded = True
 
         if guild is None:  # Not a guild so cannot support guild locale
-            return self._guild_regional_format[None]
-        elif guild.id in self._guild_regional_format:  # Cached guild
-            if self._guild_regional_format[guild.id] is None:
-                return self._guild_regional_format[None]
-            else:
-                return self._guild_regional_format[guild.id]
-        else:  # Uncached guild
-            out = await self._config.guild(guild).regional_format()  # No locale set
-            if out is None:
-                self._guild_regional_format[guild.id] = None
-                return self._guild_regional_format[None]
-            else:  # Not cached, got a custom regional format.
-                self._guild_regional_format[guild.id] = out
-                return out
+            return self._global_regional_format
+        try:  # Cached guild
+            out = self._guild_regional_format[guild.id]
+        except KeyError:  # Uncached guild
+            out = await self._config.guild(guild).regional_format()  # None if no format set
+            self._guild_regional_format[guild.id] = out
+        if out is None:
+            return self._global_regional_format
+        return out
 
     async def set_regional_format(
         self, guild: Union[discord.Guild, None], regional_format: Union[str, None]
     ) -> None:
         """Set the regional format in the config and cache"""
         if guild is None:
-            self._guild_regional_format[None] = regional_format
+            self._global_regional_format = regional_format
+            self._global_regional_format_loaded = True
             await self._config.regional_format.set(regional_format)
+            self._changed(None)
             return
         self._guild_regional_format[guild.id] = regional_format
         await self._config.guild(guild).regional_format.set(regional_format)
+        self._changed(guild.id)
+
+    def forget_global(self) -> None:
+        """Drop the cached global locale and regional format."""
+        self._global_locale = None
+        self._global_regional_format = None
+        self._global_regional_format_loaded = False
 
+    def forget_guild(self, guild_id: int) -> None:
+        """Drop the cached locale and regional format of a guild."""
+        self._guild_locale.pop(guild_id, None)
+        self._guild_regional_format.pop(guild_id, None)
 
-class IgnoreManager:
+
+class IgnoreManager(_SettingsManager):
     def __init__(self, config: Config):
         self._config: Config = config
-        self._cached_channels: Dict[int, bool] = {}
-        self._cached_guilds: Dict[int, bool] = {}
+        self._cached_channels: BoundedCache[int, bool] = BoundedCache(
+            "ignored_channels", maxsize=CHANNEL_CACHE_SIZE, ttl=IDLE_TTL
+        )
+        self._cached_guilds: BoundedCache[int, bool] = _guild_cache("ignored_guilds")
+        self._ignored_channel_ids: Optional[FrozenSet[int]] = None
 
     async def get_ignored_channel(
         self,
@@ -166,19 +225,19 @@ class IgnoreManager:
         cat_id: Optional[int] = (
             channel.category.id if check_category and channel.category else None
         )
-        if cid in self._cached_channels:
+        try:
             chan_ret = self._cached_channels[cid]
-        else:
+        except KeyError:
             chan_ret = await self._config.channel_from_id(cid).ignored()
             self._cached_channels[cid] = chan_ret
-        if cat_id and cat_id in self._cached_channels:
-            cat_ret = self._cached_channels[cat_id]
-        else:
-            if cat_id:
+        if cat_id:
+            try:
+                cat_ret = self._cached_channels[cat_id]
+            except KeyError:
                 cat_ret = await self._config.channel_from_id(cat_id).ignored()
                 self._cached_channels[cat_id] = cat_ret
-            else:
-                cat_ret = False
+        else:
+            cat_ret = False
         ret = chan_ret or cat_ret
 
         return ret
@@ -196,19 +255,33 @@ class IgnoreManager:
     ):
         cid: int = channel.id
         self._cached_channels[cid] = set_to
+        if self._ignored_channel_ids is not None:
+            if set_to:
+                self._ignored_channel_ids = self._ignored_channel_ids.union((cid,))
+            else:
+                self._ignored_channel_ids = self._ignored_channel_ids.difference((cid,))
         if set_to:
             await self._config.channel_from_id(cid).ignored.set(set_to)
         else:
             await self._config.channel_from_id(cid).ignored.clear()
+        self._changed(channel.guild.id)
+
+    async def get_ignored_channel_ids(self) -> FrozenSet[int]:
+        if self._ignored_channel_ids is None:
+            all_channels = await self._config.all_channels()
+            self._ignored_channel_ids = frozenset(
+                cid for cid, data in all_channels.items() if data["ignored"]
+            )
+        return self._ignored_channel_ids
 
     async def get_ignored_guild(self, guild: discord.Guild) -> bool:
         ret: bool
 
         gid: int = guild.id
 
-        if gid in self._cached_guilds:
+        try:
             ret = self._cached_guilds[gid]
-        else:
+        except KeyError:
             ret = await self._config.guild_from_id(gid).ignored()
             self._cached_guilds[gid] = ret
 
@@ -221,13 +294,24 @@ class IgnoreManager:
             await self._config.guild_from_id(gid).ignored.set(set_to)
         else:
             await self._config.guild_from_id(gid).ignored.clear()
+        self._changed(gid)
+
+    def forget_channel(self, channel_id: int) -> None:
+        """Drop the cached ignore setting of a channel."""
+        self._cached_channels.pop(channel_id, None)
 
+    def forget_guild(self, guild: discord.Guild) -> None:
+        """Drop the cached ignore settings of a guild and of its channels and threads."""
+        self._cached_guilds.pop(guild.id, None)
+        for channel in (*guild.channels, *guild.threads):
+            self._cached_channels.pop(channel.id, None)
 
-class WhitelistBlacklistManager:
+
+class WhitelistBlacklistManager(_SettingsManager):
     def __init__(self, config: Config):
         self._config: Config = config
-        self._cached_whitelist: Dict[Optional[int], Set[int]] = {}
-        self._cached_blacklist: Dict[Optional[int], Set[int]] = {}
+        self._cached_whitelist: BoundedCache[Optional[int], Set[int]] = _guild_cache("allowlists")
+        self._cached_blacklist: BoundedCache[Optional[int], Set[int]] = _guild_cache("blocklists")
         # because of discord deletion
         # we now have sync and async access that may need to happen at the
         # same time.
@@ -264,13 +348,15 @@ class WhitelistBlacklistManager:
                         except (ValueError, KeyError):
                             pass  # this is raw access not filled with defaults
 
+            self._changed(None)
+
     async def get_whitelist(self, guild: Optional[discord.Guild] = None) -> Set[int]:
         async with self._access_lock:
             ret: Set[int]
             gid: Optional[int] = guild.id if guild else None
-            if gid in self._cached_whitelist:
+            try:
                 ret = self._cached_whitelist[gid].copy()
-            else:
+            except KeyError:
                 if gid is not None:
                     ret = set(await self._config.guild_from_id(gid).whitelist())
                 else:
@@ -287,21 +373,20 @@ class WhitelistBlacklistManager:
             if not all(isinstance(r_or_u, int) for r_or_u in role_or_user):
                 raise TypeError("`role_or_user` must be an iterable of `int`s.")
 
+            try:
+                ids = self._cached_whitelist[gid]
+            except KeyError:
+                if gid is None:
+                    ids = set(await self._config.whitelist())
+                else:
+                    ids = set(await self._config.guild_from_id(gid).whitelist())
+                self._cached_whitelist[gid] = ids
+            ids.update(role_or_user)
             if gid is None:
-                if gid not in self._cached_whitelist:
-                    self._cached_whitelist[gid] = set(await self._config.whitelist())
-                self._cached_whitelist[gid].update(role_or_user)
-                await self._config.whitelist.set(list(self._cached_whitelist[gid]))
-
+                await self._config.whitelist.set(list(ids))
             else:
-                if gid not in self._cached_whitelist:
-                    self._cached_whitelist[gid] = set(
-                        await self._config.guild_from_id(gid).whitelist()
-                    )
-                self._cached_whitelist[gid].update(role_or_user)
-                await self._config.guild_from_id(gid).whitelist.set(
-                    list(self._cached_whitelist[gid])
-                )
+                await self._config.guild_from_id(gid).whitelist.set(list(ids))
+            self._changed(gid)
 
     async def clear_whitelist(self, guild: Optional[discord.Guild] = None):
         async with self._access_lock:
@@ -311,6 +396,7 @@ class WhitelistBlacklistManager:
                 await self._config.whitelist.clear()
             else:
                 await self._config.guild_from_id(gid).whitelist.clear()
+            self._changed(gid)
 
     async def remove_from_whitelist(
         self, guild: Optional[discord.Guild], role_or_user: Iterable[int]
@@ -321,29 +407,28 @@ class WhitelistBlacklistManager:
             if not all(isinstance(r_or_u, int) for r_or_u in role_or_user):
                 raise TypeError("`role_or_user` must be an iterable of `int`s.")
 
+            try:
+                ids = self._cached_whitelist[gid]
+            except KeyError:
+                if gid is None:
+                    ids = set(await self._config.whitelist())
+                else:
+                    ids = set(await self._config.guild_from_id(gid).whitelist())
+                self._cached_whitelist[gid] = ids
+            ids.difference_update(role_or_user)
             if gid is None:
-                if gid not in self._cached_whitelist:
-                    self._cached_whitelist[gid] = set(await self._config.whitelist())
-                self._cached_whitelist[gid].difference_update(role_or_user)
-                await self._config.whitelist.set(list(self._cached_whitelist[gid]))
-
+                await self._config.whitelist.set(list(ids))
             else:
-                if gid not in self._cached_whitelist:
-                    self._cached_whitelist[gid] = set(
-                        await self._config.guild_from_id(gid).whitelist()
-                    )
-                self._cached_whitelist[gid].difference_update(role_or_user)
-                await self._config.guild_from_id(gid).whitelist.set(
-                    list(self._cached_whitelist[gid])
-                )
+                await self._config.guild_from_id(gid).whitelist.set(list(ids))
+            self._changed(gid)
 
     async def get_blacklist(self, guild: Optional[discord.Guild] = None) -> Set[int]:
         async with self._access_lock:
             ret: Set[int]
             gid: Optional[int] = guild.id if guild else None
-            if gid in self._cached_blacklist:
+            try:
                 ret = self._cached_blacklist[gid].copy()
-            else:
+            except KeyError:
                 if gid is not None:
                     ret = set(await self._config.guild_from_id(gid).blacklist())
                 else:
@@ -359,20 +444,20 @@ class WhitelistBlacklistManager:
             role_or_user = role_or_user or []
             if not all(isinstance(r_or_u, int) for r_or_u in role_or_user):
                 raise TypeError("`role_or_user` must be an iterable of `int`s.")
+            try:
+                ids = self._cached_blacklist[gid]
+            except KeyError:
+                if gid is None:
+                    ids = set(await self._config.blacklist())
+                else:
+                    ids = set(await self._config.guild_from_id(gid).blacklist())
+                self._cached_blacklist[gid] = ids
+            ids.update(role_or_user)
             if gid is None:
-                if gid not in self._cached_blacklist:
-                    self._cached_blacklist[gid] = set(await self._config.blacklist())
-                self._cached_blacklist[gid].update(role_or_user)
-                await self._config.blacklist.set(list(self._cached_blacklist[gid]))
+                await self._config.blacklist.set(list(ids))
             else:
-                if gid not in self._cached_blacklist:
-                    self._cached_blacklist[gid] = set(
-                        await self._config.guild_from_id(gid).blacklist()
-                    )
-                self._cached_blacklist[gid].update(role_or_user)
-                await self._config.guild_from_id(gid).blacklist.set(
-                    list(self._cached_blacklist[gid])
-                )
+                await self._config.guild_from_id(gid).blacklist.set(list(ids))
+            self._changed(gid)
 
     async def clear_blacklist(self, guild: Optional[discord.Guild] = None):
         async with self._access_lock:
@@ -382,6 +467,7 @@ class WhitelistBlacklistManager:
                 await self._config.blacklist.clear()
             else:
                 await self._config.guild_from_id(gid).blacklist.clear()
+            self._changed(gid)
 
     async def remove_from_blacklist(
         self, guild: Optional[discord.Guild], role_or_user: Iterable[int]
@@ -391,26 +477,284 @@ class WhitelistBlacklistManager:
             role_or_user = role_or_user or []
             if not all(isinstance(r_or_u, int) for r_or_u in role_or_user):
                 raise TypeError("`role_or_user` must be an iterable of `int`s.")
+            try:
+                ids = self._cached_blacklist[gid]
+            except KeyError:
+                if gid is None:
+                    ids = set(await self._config.blacklist())
+                else:
+                    ids = set(await self._config.guild_from_id(gid).blacklist())
+                self._cached_blacklist[gid] = ids
+            ids.difference_update(role_or_user)
             if gid is None:
-                if gid not in self._cached_blacklist:
-                    self._cached_blacklist[gid] = set(await self._config.blacklist())
-                self._cached_blacklist[gid].difference_update(role_or_user)
-                await self._config.blacklist.set(list(self._cached_blacklist[gid]))
+                await self._config.blacklist.set(list(ids))
             else:
-                if gid not in self._cached_blacklist:
-                    self._cached_blacklist[gid] = set(
-                        await self._config.guild_from_id(gid).blacklist()
-                    )
-                self._cached_blacklist[gid].difference_update(role_or_user)
-                await self._config.guild_from_id(gid).blacklist.set(
-                    list(self._cached_blacklist[gid])
-                )
+                await self._config.guild_from_id(gid).blacklist.set(list(ids))
+            self._changed(gid)
+
+    def forget_guild(self, guild_id: int) -> None:
+        """Drop the cached allowlist and blocklist of a guild."""
+        self._cached_whitelist.pop(guild_id, None)
+        self._cached_blacklist.pop(guild_id, None)
+
+
+@dataclass(frozen=True)
+class GuildAccessPolicy:
+    """
+    An immutable snapshot of the settings which decide whether
+    a message may be treated as a command.
+
+    This is what `Red.ignored_channel_or_guild()` and
+    `Red.allowed_by_whitelist_blacklist()` check, compiled into sets
+    so that it can be evaluated without awaiting anything.
+    A policy is never updated: `AccessPolicyCache` drops it whenever
+    one of the settings it was compiled from changes.
+
+    Attributes
+    ----------
+    guild_id : Optional[int]
+        The guild this policy applies in, or ``None`` for DMs.
+    global_whitelist : FrozenSet[int]
+        The ids of the users in the global allowlist.
+    global_blacklist : FrozenSet[int]
+        The ids of the users in the global blocklist.
+    ignored : bool
+        Whether the guild is ignored.
+    ignored_channels : FrozenSet[int]
+        The ids of the ignored channels, categories and threads.
+    admin_role_ids : FrozenSet[int]
+        The ids of the guild's admin roles.
+    whitelist : FrozenSet[int]
+        The ids of the users and roles in the guild's allowlist.
+    blacklist : FrozenSet[int]
+        The ids of the users and roles in the guild's blocklist.
+    """
+
+    guild_id: Optional[int]
+    global_whitelist: FrozenSet[int] = frozenset()
+    global_blacklist: FrozenSet[int] = frozenset()
+    ignored: bool = False
+    ignored_channels: FrozenSet[int] = frozenset()
+    admin_role_ids: FrozenSet[int] = frozenset()
+    whitelist: FrozenSet[int] = frozenset()
+    blacklist: FrozenSet[int] = frozenset()
+
+    def allows(self, message: discord.Message, owner_ids: AbstractSet[int]) -> bool:
+        """
+        Check whether the message's author may use commands in the message's channel.
+
+        Parameters
+        ----------
+        message : discord.Message
+            The message to check.
+        owner_ids : AbstractSet[int]
+            The ids of the bot owners.
 
+        Returns
+        -------
+        bool
+            `True` if neither the ignore settings nor the allowlists
+            and blocklists prevent using commands, `False` otherwise.
+        """
+        author = message.author
+        if author.id in owner_ids:
+            return True
+
+        if self.global_whitelist:
+            if author.id not in self.global_whitelist:
+                return False
+        elif author.id in self.global_blacklist:
+            return False
 
-class DisabledCogCache:
+        guild = message.guild
+        if guild is None:
+            return True
+        # DEP-WARN
+        # This uses member._roles (getattr is for the user case),
+        # see `Red.allowed_by_whitelist_blacklist()`.
+        role_ids = getattr(author, "_roles", ())
+        channel = message.channel
+        perms = channel.permissions_for(author)
+
+        if not (perms.manage_guild or not self.admin_role_ids.isdisjoint(role_ids)):
+            if self.ignored:
+                return False
+            if not perms.manage_channels:
+                if isinstance(channel, discord.Thread):
+                    parent_id = channel.parent_id
+                    parent = channel.parent
+                    category_id = parent.category_id if parent is not None else None
+                else:
+                    parent_id = channel.id
+                    category_id = channel.category_id
+                if parent_id in self.ignored_channels or category_id in self.ignored_channels:
+                    return False
+                if (
+                    parent_id != channel.id
+                    and not perms.manage_threads
+                    and channel.id in self.ignored_channels
+                ):
+                    return False
+
+        if getattr(author, "guild", None) is None or guild.owner_id == author.id:
+            return True
+        # The guild's id is the id of its @everyone role, which is never checked,
+        # so it has already been left out of these lists.
+        if self.whitelist:
+            return author.id in self.whitelist or not self.whitelist.isdisjoint(role_ids)
+        return author.id not in self.blacklist and self.blacklist.isdisjoint(role_ids)
+
+
+class AccessPolicyCache:
+    def __init__(
+        self,
+        config: Config,
+        ignored_cache: IgnoreManager,
+        whiteblacklist_cache: WhitelistBlacklistManager,
+    ):
+        self._config: Config = config
+        self._ignored_cache = ignored_cache
+        self._whiteblacklist_cache = whiteblacklist_cache
+        self._cached_policies: BoundedCache[Optional[int], GuildAccessPolicy] = _guild_cache(
+            "access_policies"
+        )
+        # Bumped on every invalidation, so that a policy compiled
+        # while its settings changed doesn't get cached.
+        self._generation = 0
+
+    async def get_policy(self, guild: Optional[discord.Guild] = None) -> GuildAccessPolicy:
+        gid: Optional[int] = guild.id if guild else None
+        try:
+            return self._cached_policies[gid]
+        except KeyError:
+            pass
+        generation = self._generation
+        policy = await self._compile(guild)
+        if generation == self._generation:
+            self._cached_policies[gid] = policy
+        return policy
+
+    def invalidate(self, guild_id: Optional[int] = None) -> None:
+        """Drop the policy of the given guild, or of all guilds if ``guild_id`` is ``None``."""
+        self._generation += 1
+        if guild_id is None:
+            self._cached_policies.clear()
+        else:
+            self._cached_policies.pop(guild_id, None)
+
+    async def _compile(self, guild: Optional[discord.Guild]) -> GuildAccessPolicy:
+        global_whitelist = frozenset(await self._whiteblacklist_cache.get_whitelist())
+        global_blacklist = frozenset(await self._whiteblacklist_cache.get_blacklist())
+        if guild is None:
+            return GuildAccessPolicy(
+                None, global_whitelist=global_whitelist, global_blacklist=global_blacklist
+            )
+        excluded = (guild.id,)
+        return GuildAccessPolicy(
+            guild.id,
+            global_whitelist=global_whitelist,
+            global_blacklist=global_blacklist,
+            ignored=await self._ignored_cache.get_ignored_guild(guild),
+            ignored_channels=await self._ignored_cache.get_ignored_channel_ids(),
+            admin_role_ids=frozenset(await self._config.guild(guild).admin_role()),
+            whitelist=frozenset(await self._whiteblacklist_cache.get_whitelist(guild)).difference(
+                excluded
+            ),
+            blacklist=frozenset(await self._whiteblacklist_cache.get_blacklist(guild)).difference(
+                excluded
+            ),
+        )
+
+
+def _has_any_role(member_roles, role_ids: FrozenSet[int]) -> bool:
+    # Iterate over whichever collection is smaller, using the binary search
+    # of the member's sorted role list or the hash lookup of the frozenset.
+    if len(role_ids) < len(member_roles):
+        return any(member_roles.has(role_id) for role_id in role_ids)
+    return not role_ids.isdisjoint(member_roles)
+
+
+class PrivilegeCache:
+    def __init__(self, config: Config):
+        self._config: Config = config
+        # Guild ID -> (admin role IDs, mod role IDs)
+        self._cached_role_ids: BoundedCache[
+            int, Tuple[FrozenSet[int], FrozenSet[int]]
+        ] = _guild_cache("privileged_roles")
+        # (guild ID, member ID) -> (member's role IDs, privilege level granted by them)
+        self._cached_levels: BoundedCache[
+            Tuple[int, int], Tuple[Iterable[int], PrivilegeLevel]
+        ] = BoundedCache("privilege_levels", maxsize=MEMBER_CACHE_SIZE, ttl=IDLE_TTL)
+        # Bumped on every invalidation, so that a result computed
+        # while the settings changed doesn't get cached.
+        self._generation = 0
+
+    async def get_role_ids(self, guild_id: int) -> Tuple[FrozenSet[int], FrozenSet[int]]:
+        try:
+            return self._cached_role_ids[guild_id]
+        except KeyError:
+            pass
+        generation = self._generation
+        guild_settings = self._config.guild_from_id(guild_id)
+        admin_roles, mod_roles = await self._config.get_many(
+            guild_settings.admin_role, guild_settings.mod_role
+        )
+        ret = (frozenset(admin_roles), frozenset(mod_roles))
+        if generation == self._generation:
+            self._cached_role_ids[guild_id] = ret
+        return ret
+
+    async def get_level(self, member: discord.Member) -> PrivilegeLevel:
+        """
+        Get the privilege level granted by a member's roles.
+
+        This only considers the guild's admin and mod roles,
+        so the returned level is one of ``ADMIN``, ``MOD`` or ``NONE``.
+        """
+        guild_id: int = member.guild.id
+        # DEP-WARN
+        # This uses member._roles, a sorted `discord.utils.SnowflakeList`.
+        member_roles = member._roles
+        key = (guild_id, member.id)
+        cached = self._cached_levels.get(key)
+        # Comparing the roles keeps this correct when role updates are missed,
+        # e.g. without the members intent.
+        if cached is not None and cached[0] == member_roles:
+            return cached[1]
+
+        generation = self._generation
+        admin_role_ids, mod_role_ids = await self.get_role_ids(guild_id)
+        if _has_any_role(member_roles, admin_role_ids):
+            level = PrivilegeLevel.ADMIN
+        elif _has_any_role(member_roles, mod_role_ids):
+            level = PrivilegeLevel.MOD
+        else:
+            level = PrivilegeLevel.NONE
+        if generation == self._generation:
+            self._cached_levels[key] = (member_roles[:], level)
+        return level
+
+    def invalidate(self, guild_id: int, member_id: Optional[int] = None) -> None:
+        """
+        Drop the cached level of a member,
+        or the cached roles and levels of a whole guild if ``member_id`` is ``None``.
+        """
+        self._generation += 1
+        if member_id is not None:
+            self._cached_levels.pop((guild_id, member_id), None)
+            return
+        self._cached_role_ids.pop(guild_id, None)
+        for key in [key for key in self._cached_levels if key[0] == guild_id]:
+            del self._cached_levels[key]
+
+
+class DisabledCogCache(_SettingsManager):
     def __init__(self, config: Config):
         self._config = config
-        self._disable_map: Dict[str, Dict[int, bool]] = defaultdict(dict)
+        # (cog name, guild ID) -> whether the cog is disabled in the guild
+        self._disable_map: BoundedCache[Tuple[str, int], bool] = BoundedCache(
+            "disabled_cogs", maxsize=GUILD_CACHE_SIZE * 4, ttl=IDLE_TTL
+        )
 
     async def cog_disabled_in_guild(self, cog_name: str, guild_id: int) -> bool:
         """
@@ -427,8 +771,8 @@ class DisabledCogCache:
         bool
         """
 
-        if guild_id in self._disable_map[cog_name]:
-            return self._disable_map[cog_name][guild_id]
+        with contextlib.suppress(KeyError):
+            return self._disable_map[cog_name, guild_id]
 
         gset = await self._config.custom("COG_DISABLE_SETTINGS", cog_name, guild_id).disabled()
         if gset is None:
@@ -436,7 +780,7 @@ class DisabledCogCache:
             if gset is None:
                 gset = False
 
-        self._disable_map[cog_name][guild_id] = gset
+        self._disable_map[cog_name, guild_id] = gset
         return gset
 
     async def default_disable(self, cog_name: str):
@@ -449,7 +793,8 @@ class DisabledCogCache:
             This should be the cog's qualified name, not necessarily the classname
         """
         await self._config.custom("COG_DISABLE_SETTINGS", cog_name, 0).disabled.set(True)
-        self._disable_map.pop(cog_name, None)
+        self._forget_cog(cog_name)
+        self._changed(None)
 
     async def default_enable(self, cog_name: str):
         """
@@ -461,7 +806,8 @@ class DisabledCogCache:
             This should be the cog's qualified name, not necessarily the classname
         """
         await self._config.custom("COG_DISABLE_SETTINGS", cog_name, 0).disabled.clear()
-        self._disable_map.pop(cog_name, None)
+        self._forget_cog(cog_name)
+        self._changed(None)
 
     async def disable_cog_in_guild(self, cog_name: str, guild_id: int) -> bool:
         """
@@ -483,8 +829,9 @@ class DisabledCogCache:
         if await self.cog_disabled_in_guild(cog_name, guild_id):
             return False
 
-        self._disable_map[cog_name][guild_id] = True
+        self._disable_map[cog_name, guild_id] = True
         await self._config.custom("COG_DISABLE_SETTINGS", cog_name, guild_id).disabled.set(True)
+        self._changed(guild_id)
         return True
 
     async def enable_cog_in_guild(self, cog_name: str, guild_id: int) -> bool:
@@ -507,6 +854,94 @@ class DisabledCogCache:
         if not await self.cog_disabled_in_guild(cog_name, guild_id):
             return False
 
-        self._disable_map[cog_name][guild_id] = False
+        self._disable_map[cog_name, guild_id] = False
         await self._config.custom("COG_DISABLE_SETTINGS", cog_name, guild_id).disabled.set(False)
+        self._changed(guild_id)
         return True
+
+    def _forget_cog(self, cog_name: str) -> None:
+        for key in [key for key in self._disable_map if key[0] == cog_name]:
+            del self._disable_map[key]
+
+    def forget_guild(self, guild_id: int) -> None:
+        """Drop the cached settings of all cogs in a guild."""
+        for key in [key for key in self._disable_map if key[1] == guild_id]:
+            del self._disable_map[key]
+
+
+class DisabledCommandCache:
+    def __init__(self, config: Config):
+        self._config = config
+        self._disabled_globally: Set[str] = set()
+        # Command's qualified name -> IDs of the guilds it's disabled in
+        self._guilds_by_command: Dict[str, Set[int]] = defaultdict(set)
+        # Guild ID -> qualified names of the commands disabled in it
+        self._commands_by_guild: Dict[int, Set[str]] = defaultdict(set)
+        self._loaded = False
+        self._load_lock = asyncio.Lock()
+
+    async def load(self) -> None:
+        """
+        Load the disabled commands of all guilds into the cache.
+
+        This only reads the data once, all later calls return immediately.
+        """
+        if self._loaded:
+            return
+        async with self._load_lock:
+            if self._loaded:
+                return
+            self._disabled_globally = set(await self._config.disabled_commands())
+            async for guild_id, guild_data in self._config.iter_guilds():
+                for command_name in guild_data["disabled_commands"]:
+                    self._guilds_by_command[command_name].add(guild_id)
+                    self._commands_by_guild[guild_id].add(command_name)
+            self._loaded = True
+
+    async def reload_globally_disabled(self) -> None:
+        """Read the globally disabled commands again, after another cluster changed them."""
+        self._disabled_globally = set(await self._config.disabled_commands())
+
+    async def disabled_globally(self, command_name: str) -> bool:
+        await self.load()
+        return command_name in self._disabled_globally
+
+    async def get_guilds_disabled_in(self, command_name: str) -> FrozenSet[int]:
+        await self.load()
+        return frozenset(self._guilds_by_command.get(command_name, ()))
+
+    async def get_commands_disabled_in(self, guild_id: int) -> FrozenSet[str]:
+        await self.load()
+        return frozenset(self._commands_by_guild.get(guild_id, ()))
+
+    async def disable_globally(self, command_name: str) -> None:
+        await self.load()
+        self._disabled_globally.add(command_name)
+        async with self._config.disabled_commands() as disabled_commands:
+            if command_name not in disabled_commands:
+                disabled_commands.append(command_name)
+
+    async def enable_globally(self, command_name: str) -> None:
+        await self.load()
+        self._disabled_globally.discard(command_name)
+        async with self._config.disabled_commands() as disabled_commands:
+            with contextlib.suppress(ValueError):
+                disabled_commands.remove(command_name)
+
+    async def disable_in_guild(self, command_name: str, guild_id: int) -> None:
+        await self.load()
+        self._guilds_by_command[command_name].add(guild_id)
+        self._commands_by_guild[guild_id].add(command_name)
+        async with self._config.guild_from_id(guild_id).disabled_commands() as disabled_commands:
+            if command_name not in disabled_commands:
+                disabled_commands.append(command_name)
+
+    async def enable_in_guild(self, command_name: str, guild_id: int) -> None:
+        await self.load()
+        if command_name in self._guilds_by_command:
+            self._guilds_by_command[command_name].discard(guild_id)
+        if guild_id in self._commands_by_guild:
+            self._commands_by_guild[guild_id].discard(command_name)
+        async with self._config.guild_from_id(guild_id).disabled_commands() as disabled_commands:
+            with contextlib.suppress(ValueError):
+                disabled_commands.remove(command_name)
@@ -17,6 +17,7 @@ from typing import (
     AsyncIterator,
     Awaitable,
     Callable,
+    Dict,
     Generator,
     Iterable,
     Iterator,
@@ -32,7 +33,7 @@ from typing import (
 import aiohttp
 import discord
 import pkg_resources
-from fuzzywuzzy import fuzz, process
+from fuzzywuzzy import fuzz, utils as fuzz_utils
 from rich.progress import ProgressColumn
 from rich.progress_bar import ProgressBar
 from red_commons.logging import VERBOSE, TRACE
@@ -43,12 +44,13 @@ from redbot.core.utils.chat_formatting import box
 
 if TYPE_CHECKING:
     from redbot.core.bot import Red
-    from redbot.core.commands import Command, Context
+    from redbot.core.commands import Command, Context, HelpSettings
 
 main_log = logging.getLogger("red")
 
 __all__ = (
     "safe_delete",
+    "CommandIndex",
     "fuzzy_command_search",
     "format_fuzzy_results",
     "create_backup",
@@ -85,12 +87,73 @@ def _fuzzy_log_filter(record):
 logging.getLogger().addFilter(_fuzzy_log_filter)
 
 
+class CommandIndex:
+    """The normalized names of commands, for fuzzy matching.
+
+    The names are normalized once, when the index is built, rather than on
+    every search, and grouped by length: the score of two names can't be
+    higher than ``200 * min(len1, len2) / (len1 + len2)``, so the names
+    whose length is too far from the term's are skipped without comparing them.
+
+    Parameters
+    ----------
+    commands : Iterable[`commands.Command <redbot.core.commands.Command>`]
+        The commands to index.
+
+    """
+
+    def __init__(self, commands: Iterable[Command]) -> None:
+        self._by_length: Dict[int, List[Tuple[str, Command]]] = {}
+        for command in commands:
+            name = fuzz_utils.full_process(command.qualified_name, force_ascii=True)
+            if name:
+                self._by_length.setdefault(len(name), []).append((name, command))
+
+    def __len__(self) -> int:
+        return sum(map(len, self._by_length.values()))
+
+    def search(self, term: str, min_score: int) -> List[Tuple[Command, int]]:
+        """Get the commands whose name is similar to the term.
+
+        The commands are scored with fuzzywuzzy's ``QRatio``.
+
+        Parameters
+        ----------
+        term : str
+            The term to search for.
+        min_score : int
+            The minimum score for matched commands to reach.
+
+        Returns
+        -------
+        List[Tuple[`commands.Command <redbot.core.commands.Command>`, int]]
+            The matched commands and their scores, in decreasing order of score.
+
+        """
+        query = fuzz_utils.full_process(term, force_ascii=True)
+        if not query:
+            return []
+        query_length = len(query)
+        matches = []
+        for length, entries in self._by_length.items():
+            best_score = fuzz_utils.intr(200 * min(query_length, length) / (query_length + length))
+            if best_score < min_score:
+                continue
+            for name, command in entries:
+                score = fuzz.QRatio(query, name, full_process=False)
+                if score >= min_score:
+                    matches.append((command, score))
+        matches.sort(key=lambda match: match[1], reverse=True)
+        return matches
+
+
 async def fuzzy_command_search(
     ctx: Context,
     term: Optional[str] = None,
     *,
     commands: Optional[Union[AsyncIterator[Command], Iterator[Command]]] = None,
     min_score: int = 80,
+    help_settings: Optional[HelpSettings] = None,
 ) -> Optional[List[Command]]:
     """Search for commands which are similar in name to the one invoked.
 
@@ -106,9 +169,13 @@ async def fuzzy_command_search(
         `Context.invoked_with` will be used instead.
     commands : Optional[Union[AsyncIterator[commands.Command], Iterator[commands.Command]]]
         The commands available to choose from when doing a fuzzy match.
-        When omitted, `Bot.walk_commands` will be used instead.
+        When omitted, the bot's prebuilt index of all of its commands will be used,
+        and only the commands the user can see will be returned.
     min_score : int
         The minimum score for matched commands to reach. Defaults to 80.
+    help_settings : Optional[HelpSettings]
+        If given, the matched commands are filtered like the help would filter them
+        with these settings, instead of only keeping the ones the user can see.
 
     Returns
     -------
@@ -136,36 +203,39 @@ async def fuzzy_command_search(
         if alias:
             return None
     customcom_cog = ctx.bot.get_cog("CustomCommands")
-    if customcom_cog is not None:
-        cmd_obj = customcom_cog.commandobj
-
-        try:
-            await cmd_obj.get(ctx.message, term)
-        except:
-            pass
-        else:
+    if customcom_cog is not None and ctx.guild is not None:
+        if term in await customcom_cog.commandobj.get_names(ctx.guild):
             return None
 
     if commands is None:
-        choices = set(ctx.bot.walk_commands())
+        index = ctx.bot._get_command_index()
     elif isinstance(commands, collections.abc.AsyncIterator):
-        choices = {c async for c in commands}
+        index = CommandIndex({c async for c in commands})
     else:
-        choices = set(commands)
+        index = CommandIndex(set(commands))
 
-    # Do the scoring. `extracted` is a list of tuples in the form `(command, score)`
-    extracted = process.extract(term, choices, limit=5, scorer=fuzz.QRatio)
+    extracted = index.search(term, min_score)
     if not extracted:
         return None
 
-    # Filter through the fuzzy-matched commands.
+    # Filter through the fuzzy-matched commands, which are in decreasing order of score.
     matched_commands = []
-    for command, score in extracted:
-        if score < min_score:
-            # Since the list is in decreasing order of score, we can exit early.
-            break
-        if await command.can_see(ctx):
+    if help_settings is not None:
+        from redbot.core.commands import RedHelpFormatter
+
+        async for command in RedHelpFormatter.help_filter_func(
+            ctx, (command for command, score in extracted), help_settings=help_settings
+        ):
             matched_commands.append(command)
+            if len(matched_commands) == 5:
+                break
+    else:
+        # Only check whether the best ones are visible until there are 5 of them.
+        for command, score in extracted:
+            if await command.can_see(ctx):
+                matched_commands.append(command)
+                if len(matched_commands) == 5:
+                    break
 
     return matched_commands
 
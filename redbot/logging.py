@@ -380,3 +380,14 @@ def init_logging(level: int, location: pathlib.Path, cli_flags: argparse.Namespa
     for fhandler in (latest_fhandler, all_fhandler):
         fhandler.setFormatter(file_formatter)
         root_logger.addHandler(fhandler)
+
+    # Slow commands also get their own file, so that they can be reviewed without the noise.
+    slow_commands_fhandler = RotatingFileHandler(
+        stem="slow-commands",
+        directory=location,
+        maxBytes=1_000_000,
+        backupCount=MAX_OLD_LOGS,
+        encoding="utf-8",
+    )
+    slow_commands_fhandler.setFormatter(file_formatter)
+    logging.getLogger("red.slow_commands").addHandler(slow_commands_fhandler)
@@ -26,6 +26,8 @@ from redbot.core.drivers import BackendType, IdentifierData
 
 conversion_log = logging.getLogger("red.converter")
 
+CONVERT_CHECKPOINT_FILE = "convert_checkpoint.json"
+
 try:
     config_dir.mkdir(parents=True, exist_ok=True)
 except PermissionError:
@@ -102,13 +104,22 @@ def get_storage_type(backend: Optional[str], *, interactive: bool):
         return get_target_backend(backend)
     if not interactive:
         return BackendType.JSON
-    storage_dict = {1: BackendType.JSON, 2: BackendType.POSTGRES}
+    storage_dict = {
+        1: BackendType.JSON,
+        2: BackendType.POSTGRES,
+        3: BackendType.JSON_JOURNAL,
+        4: BackendType.SQLITE,
+    }
     storage = None
     while storage is None:
         print()
         print("Please choose your storage backend.")
         print("1. JSON (file storage, requires no database).")
         print("2. PostgreSQL (Requires a database server)")
+        print(
+            "3. Journaled JSON (file storage, writes only the changes instead of the whole file)."
+        )
+        print("4. SQLite (file storage, requires no database server, scales to large bots).")
         print("If you're unsure, press [ENTER] to use the recommended default - JSON.")
 
         storage = input("> ")
@@ -232,6 +243,10 @@ def basic_setup(
         print("Your basic configuration has been saved.")
 
 
+# Backends which store the data in the instance's data path.
+_FILE_BACKENDS = (BackendType.JSON, BackendType.JSON_JOURNAL, BackendType.SQLITE)
+
+
 def get_current_backend(instance: str) -> BackendType:
     return BackendType(instance_data[instance]["STORAGE_TYPE"])
 
@@ -241,10 +256,18 @@ def get_target_backend(backend: str) -> BackendType:
         return BackendType.JSON
     elif backend == "postgres":
         return BackendType.POSTGRES
+    elif backend == "json-journal":
+        return BackendType.JSON_JOURNAL
+    elif backend == "sqlite":
+        return BackendType.SQLITE
 
 
 async def do_migration(
-    current_backend: BackendType, target_backend: BackendType
+    current_backend: BackendType,
+    target_backend: BackendType,
+    *,
+    workers: int = 1,
+    checkpoint_path: Optional[Path] = None,
 ) -> Dict[str, Any]:
     cur_driver_cls = drivers._get_driver_class_include_old(current_backend)
     new_driver_cls = drivers.get_driver_class(target_backend)
@@ -254,7 +277,9 @@ async def do_migration(
     await cur_driver_cls.initialize(**cur_storage_details)
     await new_driver_cls.initialize(**new_storage_details)
 
-    await config.migrate(cur_driver_cls, new_driver_cls)
+    await config.migrate(
+        cur_driver_cls, new_driver_cls, workers=workers, checkpoint_path=checkpoint_path
+    )
 
     await cur_driver_cls.teardown()
     await new_driver_cls.teardown()
@@ -265,7 +290,7 @@ async def do_migration(
 async def create_backup(instance: str, destination_folder: Path = Path.home()) -> None:
     data_manager.load_basic_configuration(instance)
     backend_type = get_current_backend(instance)
-    if backend_type != BackendType.JSON:
+    if backend_type not in _FILE_BACKENDS:
         await do_migration(backend_type, BackendType.JSON)
     print("Backing up the instance's data...")
     driver_cls = drivers.get_driver_class()
@@ -291,13 +316,13 @@ async def remove_instance(
 
     if interactive is True and delete_data is None:
         msg = "Would you like to delete this instance's data?"
-        if backend != BackendType.JSON:
+        if backend not in _FILE_BACKENDS:
             msg += " The database server must be running for this to work."
         delete_data = click.confirm(msg, default=False)
 
     if interactive is True and _create_backup is None:
         msg = "Would you like to make a backup of the data for this instance?"
-        if backend != BackendType.JSON:
+        if backend not in _FILE_BACKENDS:
             msg += " The database server must be running for this to work."
         _create_backup = click.confirm(msg, default=False)
 
@@ -376,7 +401,7 @@ async def remove_instance_interaction() -> None:
 )
 @click.option(
     "--backend",
-    type=click.Choice(["json", "postgres"]),
+    type=click.Choice(["json", "postgres", "json-journal", "sqlite"]),
     default=None,
     help=(
         "Choose a backend type for the new instance."
@@ -484,9 +509,20 @@ def delete(
 
 @cli.command()
 @click.argument("instance", type=click.Choice(instance_list), metavar="<INSTANCE_NAME>")
-@click.argument("backend", type=click.Choice(["json", "postgres"]))
-def convert(instance: str, backend: str) -> None:
-    """Convert data backend of an instance."""
+@click.argument("backend", type=click.Choice(["json", "postgres", "json-journal", "sqlite"]))
+@click.option(
+    "--workers",
+    type=click.IntRange(min=1),
+    default=4,
+    show_default=True,
+    help="How many cogs to migrate at the same time.",
+)
+def convert(instance: str, backend: str, workers: int) -> None:
+    """Convert data backend of an instance.
+
+    If the conversion is interrupted, running it again resumes
+    from the cogs which weren't migrated yet.
+    """
     current_backend = get_current_backend(instance)
     target = get_target_backend(backend)
     data_manager.load_basic_configuration(instance)
@@ -497,7 +533,10 @@ def convert(instance: str, backend: str) -> None:
     if current_backend == BackendType.MONGOV1:
         raise RuntimeError("Please see the 3.2 release notes for upgrading a bot using mongo.")
     else:
-        new_storage_details = asyncio.run(do_migration(current_backend, target))
+        checkpoint_path = Path(instance_data[instance]["DATA_PATH"]) / CONVERT_CHECKPOINT_FILE
+        new_storage_details = asyncio.run(
+            do_migration(current_backend, target, workers=workers, checkpoint_path=checkpoint_path)
+        )
 
     if new_storage_details is not None:
         default_dirs["STORAGE_TYPE"] = target.value
@@ -1,4 +1,5 @@
 import pytest
+from redbot.core import errors
 from redbot.pytest.economy import *
 
 
@@ -47,6 +48,19 @@ async def test_bank_can_spend(bank, member_factory):
     assert canspendnow
 
 
+@pytest.mark.asyncio
+async def test_bank_balance_bounds(bank, member_factory):
+    mbr = member_factory.get()
+    await bank.set_balance(mbr, 100)
+    with pytest.raises(ValueError):
+        await bank.withdraw_credits(mbr, 101)
+    max_balance = await bank.get_max_balance(mbr.guild)
+    with pytest.raises(errors.BalanceTooHigh):
+        await bank.deposit_credits(mbr, max_balance)
+    assert await bank.get_balance(mbr) == 100
+    assert await bank.withdraw_credits(mbr, 100) == 0
+
+
 @pytest.mark.asyncio
 async def test_set_bank_name(bank, guild_factory):
     guild = guild_factory.get()
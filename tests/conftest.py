@@ -22,17 +22,36 @@ def event_loop(request):
 def _get_backend_type():
     if os.getenv("RED_STORAGE_TYPE") == "postgres":
         return drivers.BackendType.POSTGRES
+    elif os.getenv("RED_STORAGE_TYPE") == "json-journal":
+        return drivers.BackendType.JSON_JOURNAL
+    elif os.getenv("RED_STORAGE_TYPE") == "sqlite":
+        return drivers.BackendType.SQLITE
     else:
         return drivers.BackendType.JSON
 
 
 @pytest.fixture(scope="session", autouse=True)
-async def _setup_driver():
+async def _setup_driver(tmp_path_factory):
     backend_type = _get_backend_type()
     storage_details = {}
+    if backend_type == drivers.BackendType.SQLITE:
+        storage_details["path"] = tmp_path_factory.mktemp("sqlite") / "config.db"
     data_manager.storage_type = lambda: backend_type.value
     data_manager.storage_details = lambda: storage_details
     driver_cls = drivers.get_driver_class(backend_type)
     await driver_cls.initialize(**storage_details)
     yield
     await driver_cls.teardown()
+
+
+@pytest.fixture(scope="session")
+async def sqlite_backend(tmp_path_factory):
+    """Set up the SQLite driver with a temporary database, unless it's already the backend."""
+    if _get_backend_type() == drivers.BackendType.SQLITE:
+        yield
+        return
+    await drivers.SqliteDriver.initialize(
+        path=tmp_path_factory.mktemp("sqlite-config") / "config.db"
+    )
+    yield
+    await drivers.SqliteDriver.teardown()
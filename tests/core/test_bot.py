@@ -0,0 +1,101 @@
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+
+from redbot.core import commands
+from redbot.core.bot import Red
+from redbot.core.cli import parse_cli_flags
+
+
+def _make_message(content):
+    author = SimpleNamespace(id=2, bot=False)
+    return SimpleNamespace(id=10, content=content, author=author, guild=None, _state=None)
+
+
+@pytest.fixture()
+def bot():
+    bot = Red(cli_flags=parse_cli_flags(["test"]))
+    bot._connection.user = SimpleNamespace(id=1)
+    bot.get_prefix = AsyncMock(return_value=["!"])
+
+    @commands.command()
+    async def ping(ctx):
+        pass
+
+    bot.add_command(ping)
+    return bot
+
+
+@pytest.mark.asyncio
+async def test_get_context_reuses_parsed_message(bot):
+    message = _make_message("!ping now")
+    ctx = await bot.get_context(message)
+    # Like a listener of `on_message_without_command` getting the context again.
+    other_ctx = await bot.get_context(message)
+
+    assert bot.get_prefix.await_count == 1
+    assert other_ctx is not ctx
+    for context in (ctx, other_ctx):
+        assert (context.prefix, context.invoked_with) == ("!", "ping")
+        assert context.command is bot.get_command("ping")
+        assert context.view.read_rest() == " now"
+
+
+@pytest.mark.asyncio
+async def test_get_context_parses_edited_message_again(bot):
+    await bot.get_context(_make_message("!ping"))
+    ctx = await bot.get_context(_make_message("!pong"))
+
+    assert bot.get_prefix.await_count == 2
+    assert (ctx.prefix, ctx.invoked_with, ctx.command) == ("!", "pong", None)
+
+
+@pytest.mark.asyncio
+async def test_package_failing_to_import_is_skipped_on_startup(bot, monkeypatch, caplog):
+    async def find_cog(name):
+        if name == "broken":
+            raise ImportError("broken on import")
+        return None
+
+    monkeypatch.setattr(bot._cog_mgr, "find_cog", find_cog)
+    await bot.add_loaded_package("broken")
+
+    assert await bot._load_package_on_startup("broken") is False
+    assert "Failed to load package broken" in caplog.text
+    assert "broken" not in await bot._config.packages()
+
+
+@pytest.mark.asyncio
+async def test_loading_cog_clears_help_cache(bot):
+    class MyCog(commands.Cog):
+        @commands.command()
+        async def pong(self, ctx):
+            pass
+
+    bot._help_cache["help"] = (0.0, None)
+    await bot.add_cog(MyCog())
+    assert "help" not in bot._help_cache
+
+    bot._help_cache["help"] = (0.0, None)
+    await bot.remove_cog("MyCog")
+    assert "help" not in bot._help_cache
+
+
+@pytest.mark.asyncio
+async def test_disabling_command_clears_help_cache(bot):
+    from redbot.core.core_commands import Core
+
+    core = Core(bot)
+    ctx = SimpleNamespace(bot=bot, send=AsyncMock(), tick=AsyncMock())
+    command = bot.get_command("ping")
+
+    bot._help_cache["help"] = (0.0, None)
+    await Core.command_disable_global.callback(core, ctx, command=command)
+    assert "help" not in bot._help_cache
+    assert not command.enabled
+
+    bot._help_cache["help"] = (0.0, None)
+    await Core.command_enable_global.callback(core, ctx, command=command)
+    assert "help" not in bot._help_cache
+    assert command.enabled
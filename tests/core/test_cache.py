@@ -0,0 +1,34 @@
+import pytest
+
+from redbot.core._cache import BoundedCache
+
+
+def test_bounded_cache_evicts_least_recently_used():
+    cache = BoundedCache("test", maxsize=2)
+    cache[1] = "a"
+    cache[2] = "b"
+    assert cache[1] == "a"
+    cache[3] = "c"
+
+    assert 2 not in cache
+    assert sorted(cache) == [1, 3]
+    assert cache.evictions == 1
+    with pytest.raises(KeyError):
+        cache[2]
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert cache.hit_rate == 0.5
+
+
+def test_bounded_cache_drops_idle_entries():
+    now = 1000.0
+    cache = BoundedCache("test", maxsize=10, ttl=60, clock=lambda: now)
+    cache[1] = "a"
+    cache[2] = "b"
+    now += 45
+    assert cache[1] == "a"
+    now += 30
+
+    assert cache.items() == [(1, "a")]
+    assert cache.expirations == 1
+    now += 60
+    assert len(cache) == 0
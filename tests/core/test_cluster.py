@@ -0,0 +1,51 @@
+import asyncio
+
+import pytest
+
+from redbot.core._cluster import ClusterBus, shard_id_for_guild, shard_ids_for_cluster
+from redbot.core.cli import parse_cli_flags
+
+
+def test_clusters_split_guilds():
+    shard_count = 10
+    clusters = [shard_ids_for_cluster(shard_count, 3, cluster_id) for cluster_id in range(3)]
+    assert clusters == [[0, 1, 2, 3], [4, 5, 6], [7, 8, 9]]
+
+    # Snowflakes of guilds created over a few years.
+    guild_ids = [(timestamp << 22) | 1234 for timestamp in range(10**11, 10**11 + 5000, 7)]
+    for guild_id in guild_ids:
+        shard_id = shard_id_for_guild(guild_id, shard_count)
+        assert sum(shard_id in shard_ids for shard_ids in clusters) == 1
+
+
+def test_cluster_flags_are_validated():
+    flags = parse_cli_flags(["instance", "--shard-count", "4", "--cluster-count", "2"])
+    assert (flags.shard_count, flags.cluster_count, flags.cluster_id) == (4, 2, 0)
+    with pytest.raises(SystemExit):
+        parse_cli_flags(["instance", "--cluster-count", "2"])
+    with pytest.raises(SystemExit):
+        parse_cli_flags(
+            ["instance", "--shard-count", "4", "--cluster-count", "2", "--cluster-id", "2"]
+        )
+
+
+@pytest.mark.asyncio
+async def test_cluster_bus_delivers_to_other_clusters(tmp_path):
+    received = asyncio.Queue()
+    buses = [ClusterBus(tmp_path, cluster_id, 3) for cluster_id in range(3)]
+    for bus in buses:
+
+        async def handler(payload, cluster_id=bus.cluster_id):
+            await received.put((cluster_id, payload))
+
+        bus.add_handler("settings_changed", handler)
+    # Cluster 2 isn't running, which mustn't prevent the others from getting the message.
+    await buses[0].start()
+    await buses[1].start()
+    try:
+        await buses[0].broadcast("settings_changed", {"guild_id": 42})
+        assert await asyncio.wait_for(received.get(), 5) == (1, {"guild_id": 42})
+        assert received.empty()
+    finally:
+        await buses[0].stop()
+        await buses[1].stop()
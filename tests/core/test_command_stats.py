@@ -0,0 +1,81 @@
+import asyncio
+import logging
+from types import SimpleNamespace
+
+import pytest
+
+from redbot.core._command_stats import CommandStatsCollector
+
+
+def _make_ctx(name):
+    return SimpleNamespace(
+        command=SimpleNamespace(qualified_name=name),
+        command_failed=False,
+        author=SimpleNamespace(id=1),
+        channel=SimpleNamespace(id=2),
+        guild=None,
+    )
+
+
+@pytest.mark.asyncio
+async def test_command_phases_are_recorded(caplog):
+    now = 0.0
+    collector = CommandStatsCollector(timer=lambda: now)
+    collector.slow_threshold = 1.0
+    ctx = _make_ctx("cleanup messages")
+
+    trace = collector.start(ctx)
+    with collector.phase(ctx, "checks"):
+        now += 0.25
+        # Nested phases, such as the global checks run by the command's checks, count once.
+        with collector.phase(ctx, "permissions"):
+            now += 0.25
+    with collector.phase(ctx, "conversion"):
+        now += 0.5
+    trace.recording = False
+    # The checks run by the callback, e.g. when sending help, are part of the callback.
+    with collector.phase(ctx, "permissions"):
+        now += 0.5
+    with caplog.at_level(logging.WARNING, logger="red.slow_commands"):
+        collector.finish(ctx, trace, 1.5)
+
+    assert trace.phases == {
+        "checks": 0.5,
+        "permissions": 0.0,
+        "conversion": 0.5,
+        "callback": 0.5,
+    }
+    assert "cleanup messages took 1.50s" in caplog.text
+    stats = collector.get("cleanup messages")
+    assert (stats.calls, stats.max_duration) == (1, 1.5)
+
+
+@pytest.mark.asyncio
+async def test_command_stats_percentiles():
+    collector = CommandStatsCollector()
+    for name, durations in (("ping", range(1, 101)), ("userinfo", [5] * 10)):
+        for duration in durations:
+            ctx = _make_ctx(name)
+            collector.finish(ctx, collector.start(ctx), duration / 1000)
+
+    assert [name for name, stats in collector.top()] == ["ping", "userinfo"]
+    stats = collector.get("ping")
+    assert (stats.percentile(50), stats.percentile(95), stats.percentile(99)) == (
+        0.05,
+        0.095,
+        0.099,
+    )
+
+
+@pytest.mark.asyncio
+async def test_other_tasks_are_not_recorded():
+    collector = CommandStatsCollector()
+    ctx = _make_ctx("ping")
+    trace = collector.start(ctx)
+
+    async def listener():
+        with collector.phase(ctx, "checks"):
+            await asyncio.sleep(0.01)
+
+    await asyncio.create_task(listener())
+    assert trace.phases["checks"] == 0.0
@@ -1,12 +1,20 @@
+import asyncio
+import functools
 import inspect
 import datetime
+from types import SimpleNamespace
 from dateutil.relativedelta import relativedelta
 
+import discord
 import pytest
 from discord.ext import commands as dpy_commands
+from discord.utils import SnowflakeList
 
 from redbot.core import commands
+from redbot.core._cache import BoundedCache
 from redbot.core.commands import converter
+from redbot.core.commands import help as help_module
+from redbot.core.commands.help import HelpSettings, RedHelpFormatter
 
 
 @pytest.fixture(scope="session")
@@ -78,3 +86,136 @@ def test_converter_relativedelta():
     assert converter.parse_relativedelta("1 year 10 days 3 seconds") == relativedelta(
         years=1, days=10, seconds=3
     )
+
+
+def test_requires_rule_from_ctx():
+    guild = SimpleNamespace(id=1, roles={})
+    guild.get_role = guild.roles.get
+    for role_id, position in ((10, 1), (11, 2), (12, 3)):
+        guild.roles[role_id] = discord.Role(
+            guild=guild,
+            state=None,
+            data={"id": role_id, "name": str(role_id), "position": position},
+        )
+    author = SimpleNamespace(id=2, voice=None, _roles=SnowflakeList([10, 11, 12]))
+    ctx = SimpleNamespace(author=author, guild=guild, channel=SimpleNamespace(id=3, category=None))
+    requires = commands.Requires(None, None, {}, [])
+    allow, deny = commands.PermState.ACTIVE_ALLOW, commands.PermState.ACTIVE_DENY
+
+    assert requires._get_rule_from_ctx(ctx) is commands.PermState.NORMAL
+    requires.set_rule(commands.Requires.DEFAULT, deny, guild.id)
+    assert requires._get_rule_from_ctx(ctx) is deny
+    # The highest role with a rule takes precedence.
+    requires.set_rule(10, deny, guild.id)
+    requires.set_rule(11, allow, guild.id)
+    assert requires._get_rule_from_ctx(ctx) is allow
+    guild.roles[10].position = 5
+    commands.Requires.role_positions_changed()
+    assert requires._get_rule_from_ctx(ctx) is deny
+    # The channel takes precedence over roles, and global rules over guild rules.
+    requires.set_rule(3, allow, guild.id)
+    assert requires._get_rule_from_ctx(ctx) is allow
+    requires.set_rule(12, deny, commands.Requires.GLOBAL)
+    assert requires._get_rule_from_ctx(ctx) is deny
+    requires.clear_all_rules(commands.Requires.GLOBAL)
+    assert requires._get_rule_from_ctx(ctx) is allow
+
+
+@pytest.mark.asyncio
+async def test_help_filter_func_runs_checks_concurrently():
+    running = 0
+    max_running = 0
+
+    async def can_see(obj, ctx):
+        nonlocal running, max_running
+        # Like the checks of commands, this changes the context while it runs.
+        ctx.command = obj
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0.01 * (5 - obj.idx % 5))
+        running -= 1
+        return ctx.command is obj and obj.idx % 3 != 0
+
+    objects = []
+    for idx in range(10):
+        obj = SimpleNamespace(idx=idx, enabled=True)
+        obj.can_see = functools.partial(can_see, obj)
+        objects.append(obj)
+    ctx = SimpleNamespace(command=None)
+    settings = HelpSettings()
+
+    visible = [obj.idx async for obj in RedHelpFormatter.help_filter_func(ctx, objects, settings)]
+    assert visible == [1, 2, 4, 5, 7, 8]
+    assert max_running > 1
+    assert ctx.command is None
+
+
+class _HelpFormatter(RedHelpFormatter):
+    async def embed_requested(self, ctx):
+        return False
+
+
+def _help_ctx(author_id: int, channel_id: int):
+    async def is_owner(user):
+        return False
+
+    return SimpleNamespace(
+        author=SimpleNamespace(id=author_id),
+        guild=SimpleNamespace(id=1),
+        channel=SimpleNamespace(id=channel_id),
+        clean_prefix="!",
+        me=SimpleNamespace(display_name="Red", display_avatar="avatar.png"),
+        permissions=discord.Permissions.none(),
+        bot_permissions=discord.Permissions.all(),
+        bot=SimpleNamespace(is_owner=is_owner, _help_cache=BoundedCache("help", maxsize=10)),
+    )
+
+
+@pytest.mark.asyncio
+async def test_help_cache_key():
+    get_key = _HelpFormatter()._get_help_cache_key
+    target = ("ping",)
+    settings = HelpSettings()
+    key = await get_key(_help_ctx(1, 10), target, settings)
+    assert await get_key(_help_ctx(1, 10), target, settings) == key
+    # The checks may depend on the author and the channel.
+    assert await get_key(_help_ctx(2, 10), target, settings) != key
+    assert await get_key(_help_ctx(1, 11), target, settings) != key
+    assert await get_key(_help_ctx(1, 10), ("help",), settings) != key
+
+    requires = commands.Requires(None, None, {}, [])
+    requires.set_rule(1, commands.PermState.ACTIVE_DENY, 1)
+    assert await get_key(_help_ctx(1, 10), target, settings) != key
+
+    # Without the checks, the help is the same for everyone.
+    settings = HelpSettings(verify_checks=False)
+    key = await get_key(_help_ctx(1, 10), target, settings)
+    assert await get_key(_help_ctx(2, 11), target, settings) == key
+
+
+@pytest.mark.asyncio
+async def test_rendered_help_expires(monkeypatch):
+    now = 0.0
+    monkeypatch.setattr(help_module, "time", SimpleNamespace(monotonic=lambda: now))
+    formatter = _HelpFormatter()
+    sent = []
+
+    async def send_pages(ctx, pages, embed=True, help_settings=None):
+        sent.append(pages)
+
+    async def render():
+        nonlocal renders
+        renders += 1
+        return [f"page {renders}"], False
+
+    renders = 0
+    formatter.send_pages = send_pages
+    ctx = _help_ctx(1, 10)
+    settings = HelpSettings()
+    await formatter._send_rendered_help(ctx, ("ping",), settings, render)
+    now = help_module.HELP_CACHE_MAX_AGE - 1
+    await formatter._send_rendered_help(ctx, ("ping",), settings, render)
+    assert sent == [["page 1"], ["page 1"]]
+    now = help_module.HELP_CACHE_MAX_AGE + 1
+    await formatter._send_rendered_help(ctx, ("ping",), settings, render)
+    assert sent[-1] == ["page 2"]
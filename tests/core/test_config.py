@@ -1,7 +1,23 @@
 import asyncio
+import random
+import uuid
+from pathlib import Path
 from unittest.mock import patch
 import pytest
 
+from redbot.core import drivers, errors
+
+
+@pytest.fixture(params=["default", "sqlite"])
+def driver(request, tmpdir_factory):
+    # Every Config test runs against the configured backend and against SQLite.
+    identifier = str(random.randint(1, 999999))
+    if request.param == "sqlite":
+        request.getfixturevalue("sqlite_backend")
+        return drivers.SqliteDriver("PyTest", identifier)
+    path = Path(str(tmpdir_factory.mktemp(str(uuid.uuid4()))))
+    return drivers.get_driver("PyTest", identifier, data_path_override=path)
+
 
 # region Register Tests
 @pytest.mark.asyncio
@@ -727,3 +743,315 @@ async def test_config_custom_clear_identifiers_that_do_not_exist(config, pkeys,
         # Clear needed to be able to differ between missing config data and missing scope data
         await scope.clear_raw(*to_set)
     await group.clear_raw(*raw_args)
+
+
+@pytest.mark.asyncio
+async def test_json_group_commit_defers_save(config, monkeypatch):
+    from redbot.core.drivers import JsonDriver
+
+    if type(config.driver) is not JsonDriver:
+        pytest.skip("Group commit is specific to the JSON driver.")
+    monkeypatch.setattr(JsonDriver, "_group_commit_interval", 60.0)
+    config.register_global(foo=0)
+
+    await config.foo.set(1)
+    await config.foo.set(2)
+    assert await config.foo() == 2
+    # The file isn't created on load when another driver has already loaded the cog's data.
+    path = config.driver.data_path
+    assert not path.exists() or '"foo": 2' not in path.read_text()
+
+    await config.driver.wait_until_durable()
+    assert '"foo": 2' in path.read_text()
+
+
+@pytest.mark.asyncio
+async def test_json_group_commit_max_pending(config, monkeypatch):
+    from redbot.core.drivers import JsonDriver
+
+    if type(config.driver) is not JsonDriver:
+        pytest.skip("Group commit is specific to the JSON driver.")
+    monkeypatch.setattr(JsonDriver, "_group_commit_interval", 60.0)
+    monkeypatch.setattr(JsonDriver, "_group_commit_max_pending", 3)
+    config.register_global(foo=0)
+
+    for i in range(1, 4):
+        await config.foo.set(i)
+    assert '"foo": 3' in config.driver.data_path.read_text()
+
+
+@pytest.mark.asyncio
+async def test_journaled_json_replays_journal(tmp_path):
+    from redbot.core import Config
+    from redbot.core.drivers import journal
+
+    driver = journal.JournaledJsonDriver("PyTestJournal", "0", data_path_override=tmp_path)
+    conf = Config(cog_name="PyTestJournal", unique_identifier="0", driver=driver)
+    conf.register_global(foo=0, bar={})
+    await conf.foo.set(5)
+    await conf.bar.set_raw("a", "b", value=[1, 2])
+    await conf.bar.clear_raw("a", "b")
+    await conf.bar.set_raw("c", value=True)
+
+    generation, data, _, journal_size = journal._read_journaled_data(
+        driver.data_path, driver.journal_path
+    )
+    assert journal_size > 0
+    assert data == {"0": {"GLOBAL": {"foo": 5, "bar": {"a": {}, "c": True}}}}
+
+
+@pytest.mark.asyncio
+async def test_journaled_json_compaction(tmp_path, monkeypatch):
+    from redbot.core import Config
+    from redbot.core.drivers import journal
+
+    monkeypatch.setattr(journal.JournaledJsonDriver, "_compaction_min_size", 0)
+    driver = journal.JournaledJsonDriver("PyTestJournal2", "0", data_path_override=tmp_path)
+    conf = Config(cog_name="PyTestJournal2", unique_identifier="0", driver=driver)
+    conf.register_global(foo=0)
+    for i in range(10):
+        await conf.foo.set(i)
+    await journal.JournaledJsonDriver.teardown()
+
+    generation, data, _, journal_size = journal._read_journaled_data(
+        driver.data_path, driver.journal_path
+    )
+    assert generation > 0
+    assert data == {"0": {"GLOBAL": {"foo": 9}}}
+
+
+@pytest.mark.asyncio
+async def test_journaled_json_discards_torn_record(tmp_path):
+    from redbot.core import Config
+    from redbot.core.drivers import journal
+
+    driver = journal.JournaledJsonDriver("PyTestJournal3", "0", data_path_override=tmp_path)
+    conf = Config(cog_name="PyTestJournal3", unique_identifier="0", driver=driver)
+    conf.register_global(foo=0, bar=0)
+    await conf.foo.set(1)
+    # Simulate a crash in the middle of appending a record.
+    with driver.journal_path.open("a", encoding="utf-8") as fs:
+        fs.write('["set", ["0", "GLOBAL", "foo"], 2')
+
+    journal._shared_datastore.pop("PyTestJournal3")
+    driver = journal.JournaledJsonDriver("PyTestJournal3", "0", data_path_override=tmp_path)
+    conf = Config(cog_name="PyTestJournal3", unique_identifier="0", driver=driver)
+    conf.register_global(foo=0, bar=0)
+    assert await conf.foo() == 1
+    await conf.bar.set(3)
+
+    generation, data, _, journal_size = journal._read_journaled_data(
+        driver.data_path, driver.journal_path
+    )
+    assert journal_size == driver.journal_path.stat().st_size
+    assert data == {"0": {"GLOBAL": {"foo": 1, "bar": 3}}}
+
+
+@pytest.mark.asyncio
+async def test_value_view_is_read_only(config):
+    config.register_global(foo=[1, 2], bar={"a": {"b": 1}})
+    await config.bar.set_raw("a", "c", value=[3])
+
+    foo = await config.foo.view()
+    assert foo == [1, 2]
+    with pytest.raises(TypeError):
+        foo[0] = 5
+
+    bar = await config.bar.view()
+    assert bar == {"a": {"b": 1, "c": [3]}}
+    assert bar.to_dict() == await config.bar()
+    with pytest.raises(TypeError):
+        bar["a"]["b"] = 2
+    assert await config.bar.view_raw("a", "c") == [3]
+
+
+@pytest.mark.asyncio
+async def test_all_members_as_views(config, empty_member):
+    config.register_member(foo=False, bar={"baz": 1})
+    await config.member(empty_member).foo.set(True)
+
+    views = await config.all_members(empty_member.guild, as_views=True)
+    copies = await config.all_members(empty_member.guild)
+    assert views == copies
+    assert views[empty_member.id]["bar"]["baz"] == 1
+
+
+@pytest.mark.asyncio
+async def test_iter_guilds_matches_all_guilds(config, guild_factory):
+    config.register_guild(foo=False, bar=1)
+    for _ in range(5):
+        await config.guild(guild_factory.get()).foo.set(True)
+
+    streamed = {guild_id: data async for guild_id, data in config.iter_guilds(batch=2)}
+    assert streamed == await config.all_guilds()
+
+
+@pytest.mark.asyncio
+async def test_iter_members(config, member_factory):
+    config.register_member(foo=0)
+    members = [member_factory.get() for _ in range(3)]
+    for idx, member in enumerate(members):
+        await config.member(member).foo.set(idx)
+
+    streamed = [(g, m, d["foo"]) async for g, m, d in config.iter_members()]
+    assert sorted(streamed) == sorted((m.guild.id, m.id, idx) for idx, m in enumerate(members))
+
+    guild_members = [m async for m in config.iter_members(members[0].guild)]
+    assert guild_members == [(members[0].guild.id, members[0].id, {"foo": 0})]
+
+
+@pytest.mark.asyncio
+async def test_get_many(config, empty_guild):
+    config.register_global(foo=1, bar=[])
+    config.register_guild(baz={"a": 1})
+    await config.foo.set(5)
+    await config.guild(empty_guild).baz.set({"b": 2})
+
+    foo, bar, baz, group = await config.get_many(
+        config.foo, config.bar, config.guild(empty_guild).baz, config.guild(empty_guild)
+    )
+    assert (foo, bar) == (5, [])
+    assert baz == await config.guild(empty_guild).baz() == {"a": 1, "b": 2}
+    assert group == await config.guild(empty_guild)()
+
+    # Defaults must be copies, just like with __call__
+    bar.append(1)
+    assert await config.bar() == []
+
+
+@pytest.mark.asyncio
+async def test_set_many(config, empty_guild):
+    config.register_global(foo=1)
+    config.register_guild(bar={})
+    await config.set_many({config.foo: 2, config.guild(empty_guild).bar: {1: True}})
+    assert await config.foo() == 2
+    assert await config.guild(empty_guild).bar() == {"1": True}
+
+    with pytest.raises(ValueError):
+        await config.set_many({config.guild(empty_guild): 1})
+
+
+def test_postgres_document_cache_eviction():
+    from redbot.core.drivers.postgres.cache import DocumentCache
+
+    overhead = DocumentCache.ENTRY_OVERHEAD
+    cache = DocumentCache(max_size=10 + overhead)
+    cache.put(("Cog.1", "GUILD", ("1",)), {"a": 1}, 6, cache.generation)
+    cache.put(("Cog.1", "GUILD", ("2",)), {"b": 2}, 6, cache.generation)
+    with pytest.raises(KeyError):
+        cache.get(("Cog.1", "GUILD", ("1",)))
+    assert cache.get(("Cog.1", "GUILD", ("2",))) == {"b": 2}
+    assert cache.stats()["size"] == 6 + overhead
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_postgres_document_cache_bounds_missing_documents():
+    from redbot.core.drivers.postgres.cache import DocumentCache, MISSING
+
+    cache = DocumentCache(max_size=3 * DocumentCache.ENTRY_OVERHEAD)
+    for member_id in range(10):
+        cache.put(("Cog.1", "MEMBER", ("1", str(member_id))), MISSING, 0, cache.generation)
+    assert len(cache) == 3
+    assert cache.get(("Cog.1", "MEMBER", ("1", "9"))) is MISSING
+
+
+def test_postgres_document_cache_invalidation():
+    from redbot.core.drivers.postgres.cache import DocumentCache
+
+    cache = DocumentCache(max_size=100)
+    generation = cache.generation
+    for key in (("Cog.1", "MEMBER", ("1", "2")), ("Cog.1", "MEMBER", ("3", "4"))):
+        cache.put(key, {}, 2, generation)
+    cache.invalidate("Cog.1", "MEMBER", ("1",))
+    assert len(cache) == 1
+
+    # Documents fetched before an invalidation must not be cached.
+    cache.put(("Cog.1", "MEMBER", ("1", "2")), {}, 2, generation)
+    assert len(cache) == 1
+    cache.invalidate("Cog.1")
+    assert len(cache) == 0
+
+
+@pytest.mark.asyncio
+async def test_value_inc(config, empty_guild):
+    config.register_guild(count=5)
+    assert await config.guild(empty_guild).count.inc() == 6
+    assert await config.guild(empty_guild).count.inc(-2.5) == 3.5
+    assert await config.guild(empty_guild).count() == 3.5
+
+    await asyncio.gather(*(config.guild(empty_guild).count.inc() for _ in range(10)))
+    assert await config.guild(empty_guild).count() == 13.5
+
+
+@pytest.mark.asyncio
+async def test_value_inc_default_and_errors(config):
+    config.register_global(foo=0, bar="baz")
+    assert await config.foo.inc(1, default=10) == 11
+    with pytest.raises(TypeError):
+        await config.foo.inc("1")
+    await config.bar.set("baz")
+    with pytest.raises(errors.StoredTypeError):
+        await config.bar.inc(1, default=0)
+
+
+@pytest.mark.asyncio
+async def test_value_inc_bounds(config, empty_guild):
+    config.register_guild(count=5)
+    count = config.guild(empty_guild).count
+    with pytest.raises(errors.OutOfRangeError) as exc_info:
+        await count.inc(-6, min_value=0)
+    assert exc_info.value.current == 5
+    assert await count.inc(-5, min_value=0) == 0
+    with pytest.raises(errors.OutOfRangeError):
+        await count.inc(11, min_value=0, max_value=10)
+    assert await count() == 0
+    assert await count.inc(10, max_value=10) == 10
+
+    results = await asyncio.gather(
+        *(count.inc(-1, min_value=0) for _ in range(15)), return_exceptions=True
+    )
+    assert sum(isinstance(result, errors.OutOfRangeError) for result in results) == 5
+    assert await count() == 0
+
+
+@pytest.mark.asyncio
+async def test_value_toggle(config):
+    config.register_global(enabled=False, count=0)
+    assert await config.enabled.toggle() is True
+    assert await config.enabled.toggle() is False
+    assert await config.enabled() is False
+
+    await config.count.set(1)
+    with pytest.raises(errors.StoredTypeError):
+        await config.count.toggle(default=False)
+
+
+@pytest.mark.asyncio
+async def test_config_stats(config, empty_guild):
+    from redbot.core._config_stats import config_stats
+
+    config.register_guild(foo=0)
+    config_stats.reset()
+    with patch.object(config_stats, "sample_rate", 1.0):
+        await config.guild(empty_guild).foo.set(12345)
+        await config.guild(empty_guild).foo()
+        await config.guild(empty_guild).get_raw("foo")
+        await config.all_guilds()
+        await config.guild(empty_guild).foo.clear()
+    await config.guild(empty_guild).foo()
+
+    ops = {
+        (entry["category"], entry["op"]): entry
+        for entry in config_stats.to_dict()["operations"]
+        if entry["cog_name"] == config.cog_name
+    }
+    config_stats.reset()
+    assert set(ops) == {
+        ("GUILD", "set"),
+        ("GUILD", "get"),
+        ("GUILD", "get_all"),
+        ("GUILD", "clear"),
+    }
+    assert ops[("GUILD", "get")]["estimated_count"] == 2
+    assert ops[("GUILD", "set")]["estimated_bytes"] == len("12345")
+    assert ops[("GUILD", "clear")]["samples"] == 1
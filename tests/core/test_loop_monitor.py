@@ -0,0 +1,106 @@
+import asyncio
+import time
+
+import pytest
+
+from redbot.core._loop_monitor import LoopMonitor
+
+
+class _Cog:
+    qualified_name = "MyCog"
+
+    async def on_something(self, value):
+        await asyncio.sleep(0)
+        time.sleep(0.02)
+        return value
+
+
+@pytest.mark.asyncio
+async def test_loop_monitor_times_listener_steps():
+    monitor = LoopMonitor()
+    monitor.threshold = 0.01
+    stalls = []
+    monitor.on_stall = stalls.append
+    monitor.start()
+    monitor.set_step_attribution(True)
+    try:
+        cog = _Cog()
+        coro = monitor.time_listener(cog.on_something(5), cog.on_something, "on_something")
+        assert await asyncio.create_task(coro) == 5
+    finally:
+        monitor.stop()
+
+    ((key, stats),) = monitor.top()
+    assert key == ("listener", "MyCog", "_Cog.on_something")
+    assert stats.calls == 1
+    assert stats.steps == 2
+    assert stats.max_step >= 0.02
+    assert [stall.key for stall in stalls] == [key]
+
+
+@pytest.mark.asyncio
+async def test_loop_monitor_times_tasks_transparently():
+    monitor = LoopMonitor()
+    monitor.start()
+    monitor.set_step_attribution(True)
+    try:
+
+        async def fails():
+            await asyncio.sleep(0)
+            raise ValueError
+
+        async def waits():
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                return "cancelled"
+
+        with pytest.raises(ValueError):
+            await asyncio.create_task(fails())
+        coro = waits()
+        task = asyncio.create_task(coro)
+        assert task.get_coro() is coro
+        await asyncio.sleep(0)
+        task.cancel()
+        assert await task == "cancelled"
+    finally:
+        monitor.stop()
+
+    names = {key for key, stats in monitor.top()}
+    assert (
+        "task",
+        __name__,
+        "test_loop_monitor_times_tasks_transparently.<locals>.fails",
+    ) in names
+    assert (
+        "task",
+        __name__,
+        "test_loop_monitor_times_tasks_transparently.<locals>.waits",
+    ) in names
+    assert asyncio.get_running_loop().get_task_factory() is None
+
+
+@pytest.mark.asyncio
+async def test_loop_monitor_reports_stalls_without_step_attribution():
+    monitor = LoopMonitor()
+    monitor.threshold = 0.05
+    stalls = []
+    monitor.on_stall = stalls.append
+    monitor.start()
+    try:
+        assert asyncio.get_running_loop().get_task_factory() is None
+        cog = _Cog()
+        coro = cog.on_something(5)
+        assert monitor.time_listener(coro, cog.on_something, "on_something") is coro
+        await asyncio.sleep(0)
+        time.sleep(0.3)
+        await asyncio.sleep(0.2)
+    finally:
+        monitor.stop()
+        coro.close()
+
+    assert monitor.top() == []
+    assert monitor.lag().max_lag >= 0.2
+    (stall,) = stalls
+    assert stall.key is None
+    assert "test_loop_monitor_reports_stalls_without_step_attribution" in stall.stack
@@ -0,0 +1,43 @@
+import pytest
+
+from redbot.core.metrics import MetricsRegistry
+
+
+def test_metrics_render_in_prometheus_format():
+    metrics = MetricsRegistry()
+    commands = metrics.counter("red_commands_total", "Invoked commands.", ["command"])
+    commands.labels("ping").inc()
+    commands.labels(command='say "hi"').inc(2)
+    metrics.gauge("red_guilds", "Guilds.", function=lambda: 3)
+    duration = metrics.histogram("red_duration_seconds", "Durations.", buckets=(0.1, 1))
+    duration.observe(0.05)
+    duration.observe(0.5)
+
+    assert metrics.render().splitlines() == [
+        "# HELP red_commands_total Invoked commands.",
+        "# TYPE red_commands_total counter",
+        'red_commands_total{command="ping"} 1.0',
+        'red_commands_total{command="say \\"hi\\""} 2.0',
+        "# HELP red_guilds Guilds.",
+        "# TYPE red_guilds gauge",
+        "red_guilds 3.0",
+        "# HELP red_duration_seconds Durations.",
+        "# TYPE red_duration_seconds histogram",
+        'red_duration_seconds_bucket{le="0.1"} 1.0',
+        'red_duration_seconds_bucket{le="1.0"} 2.0',
+        'red_duration_seconds_bucket{le="+Inf"} 2.0',
+        "red_duration_seconds_sum 0.55",
+        "red_duration_seconds_count 2.0",
+    ]
+
+
+def test_metrics_registration_is_idempotent():
+    metrics = MetricsRegistry()
+    counter = metrics.counter("mycog_requests_total", "Requests.", ["endpoint"])
+    assert metrics.counter("mycog_requests_total", "Requests.", ["endpoint"]) is counter
+    with pytest.raises(ValueError):
+        metrics.gauge("mycog_requests_total", "Requests.", ["endpoint"])
+    with pytest.raises(ValueError):
+        metrics.counter("mycog-requests", "Requests.")
+    with pytest.raises(ValueError):
+        counter.labels("a").inc(-1)
@@ -0,0 +1,21 @@
+import sys
+
+import pytest
+
+import redbot
+from redbot import _startup_profiler
+
+
+@pytest.mark.parametrize(
+    "argv, enabled", [(["redbot", "--profile-startup"], True), (["redbot", "--debug"], False)]
+)
+def test_startup_profiler_is_enabled_by_flag(monkeypatch, tmp_path, argv, enabled):
+    profiler = _startup_profiler.StartupProfiler()
+    monkeypatch.setattr(_startup_profiler, "startup_profiler", profiler)
+    monkeypatch.setattr(sys, "argv", argv)
+    try:
+        redbot._maybe_enable_startup_profiler()
+        assert profiler.enabled is enabled
+    finally:
+        profiler.finish(tmp_path)
+    assert profiler._import_timer not in sys.meta_path
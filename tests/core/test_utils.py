@@ -2,6 +2,10 @@ import asyncio
 import pytest
 import random
 import textwrap
+from collections import namedtuple
+
+from fuzzywuzzy import fuzz, process
+
 from redbot.core.utils import (
     chat_formatting,
     bounded_gather,
@@ -9,6 +13,7 @@ from redbot.core.utils import (
     deduplicate_iterables,
     common_filters,
 )
+from redbot.core.utils._internal_utils import CommandIndex
 
 
 def test_bordered_symmetrical():
@@ -196,3 +201,22 @@ async def test_bounded_gather_iter_cancel():
 def test_normalize_smartquotes():
     assert common_filters.normalize_smartquotes("Should\u2018 normalize") == "Should' normalize"
     assert common_filters.normalize_smartquotes("Same String") == "Same String"
+
+
+def test_command_index_matches_process_extract():
+    names = ["ping", "info", "set prefix", "set nickname", "cleanup messages", "help", "?"]
+    FakeCommand = namedtuple("FakeCommand", "qualified_name")
+    commands = [FakeCommand(name) for name in names]
+    index = CommandIndex(commands)
+
+    for term in ("pign", "set prefx", "cleanupmessages", "nick", "?!"):
+        extracted = process.extract(
+            term, {c: c.qualified_name for c in commands}, limit=None, scorer=fuzz.QRatio
+        )
+        expected = sorted(
+            (score, command.qualified_name) for _, score, command in extracted if score >= 75
+        )
+        result = sorted(
+            (score, command.qualified_name) for command, score in index.search(term, 75)
+        )
+        assert result == expected
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3.8
+"""Script to measure the per-message cost of Red's global command gate.
+
+The gate is the part of ``Red.message_eligible_as_command()`` which checks
+the ignore settings and the allowlists and blocklists.
+
+What this script does
+---------------------
+The script creates a bot with a temporary JSON data path and fills the
+settings of ``--guilds`` guilds: an admin role, some allowlisted and
+blocklisted roles, and ignored channels. It then checks ``--messages``
+fake messages from members with ``--roles`` roles each, spread over
+those guilds, first with the separate ``Red.ignored_channel_or_guild()``
+and ``Red.allowed_by_whitelist_blacklist()`` calls and then with the
+compiled per-guild access policies, and reports the time per message.
+
+Usage
+-----
+python tools/bench_command_gate.py --messages 100000
+"""
+import argparse
+import asyncio
+import random
+import tempfile
+import time
+from types import SimpleNamespace
+
+import discord
+
+from redbot.core import data_manager, drivers
+from redbot.core.bot import Red
+from redbot.core.cli import parse_cli_flags
+
+
+class _Member(SimpleNamespace):
+    def get_role(self, role_id):
+        return role_id if role_id in self._roles else None
+
+
+class _Channel(SimpleNamespace):
+    def permissions_for(self, member):
+        return self.perms
+
+
+async def _make_messages(bot: Red, args: argparse.Namespace):
+    rng = random.Random(args.seed)
+    no_perms = discord.Permissions.none()
+    messages = []
+    for guild_id in range(1, args.guilds + 1):
+        guild = SimpleNamespace(id=guild_id, owner_id=0)
+        role_ids = [guild_id * 1000 + role for role in range(50)]
+        channels = [
+            _Channel(
+                id=guild_id * 1000 + 900 + idx,
+                guild=guild,
+                category=None,
+                category_id=None,
+                perms=no_perms,
+            )
+            for idx in range(10)
+        ]
+        await bot._config.guild(guild).admin_role.set(role_ids[:1])
+        await bot.add_to_blacklist(role_ids[1:4], guild=guild)
+        for channel in channels[:3]:
+            await bot._ignored_cache.set_ignored_channel(channel, True)
+        for _ in range(args.messages // args.guilds):
+            author = _Member(
+                id=rng.randrange(10**6, 10**7),
+                bot=False,
+                guild=guild,
+                _roles=discord.utils.SnowflakeList(rng.sample(role_ids, args.roles)),
+            )
+            channel = rng.choice(channels)
+            messages.append(SimpleNamespace(author=author, channel=channel, guild=guild))
+    return messages
+
+
+async def before(bot: Red, messages) -> int:
+    allowed = 0
+    for message in messages:
+        if await bot.ignored_channel_or_guild(message) and (
+            await bot.allowed_by_whitelist_blacklist(message.author)
+        ):
+            allowed += 1
+    return allowed
+
+
+async def after(bot: Red, messages) -> int:
+    allowed = 0
+    for message in messages:
+        policy = await bot._access_policy_cache.get_policy(message.guild)
+        if policy.allows(message, bot.owner_ids):
+            allowed += 1
+    return allowed
+
+
+async def _timed(bench, bot: Red, messages):
+    start = time.perf_counter()
+    allowed = await bench(bot, messages)
+    return (time.perf_counter() - start) / len(messages), allowed
+
+
+async def main(args: argparse.Namespace) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        data_manager.basic_config = data_manager.basic_config_default.copy()
+        data_manager.basic_config["DATA_PATH"] = tmp
+        data_manager.basic_config["STORAGE_TYPE"] = drivers.BackendType.JSON.value
+        await drivers.JsonDriver.initialize()
+
+        bot = Red(cli_flags=parse_cli_flags(["bench"]))
+        messages = await _make_messages(bot, args)
+        # Warm up the settings caches.
+        await before(bot, messages[:1000])
+        await after(bot, messages[:1000])
+
+        before_time, before_allowed = await _timed(before, bot, messages)
+        after_time, after_allowed = await _timed(after, bot, messages)
+        assert before_allowed == after_allowed, "the compiled policies gave a different result"
+
+        print(f"{len(messages)} messages in {args.guilds} guilds, {args.roles} roles per member")
+        print(f"separate checks:   {before_time * 1e6:>8.2f} us/message")
+        print(f"compiled policies: {after_time * 1e6:>8.2f} us/message")
+        await drivers.JsonDriver.teardown()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n", 1)[0])
+    parser.add_argument("--messages", type=int, default=100_000)
+    parser.add_argument("--guilds", type=int, default=100)
+    parser.add_argument("--roles", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=0)
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3.8
+"""Script to compare the performance of file-based Config backends.
+
+It fills each backend with member data and times the operations
+cogs commonly use on it.
+
+What this script does
+---------------------
+For each backend (JSON and SQLite by default), the script:
+    - stores ``--members`` members spread over ``--guilds`` guilds,
+    - times the first read after (re)initializing the driver,
+      which is when the JSON backend has to load its whole file,
+    - times ``--ops`` random single-member reads and writes,
+    - times iterating over all members with ``Config.iter_members()``.
+
+All data is written to a temporary directory which is removed afterwards.
+
+Usage
+-----
+python tools/bench_config_backends.py --members 100000 --guilds 100
+"""
+import argparse
+import asyncio
+import gc
+import random
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from redbot.core import drivers
+from redbot.core.config import Config
+
+BACKENDS = {"json": drivers.BackendType.JSON, "sqlite": drivers.BackendType.SQLITE}
+
+
+def _storage_details(backend: drivers.BackendType, path: Path) -> Dict[str, str]:
+    if backend == drivers.BackendType.SQLITE:
+        return {"path": str(path / "config.db")}
+    return {}
+
+
+def _get_config(backend: drivers.BackendType, path: Path) -> Config:
+    cog_name = f"Benchmark{backend.name}"
+    kwargs = {"data_path_override": path} if backend == drivers.BackendType.JSON else {}
+    driver = drivers.get_driver(cog_name, "0", backend, **kwargs)
+    config = Config(cog_name, "0", driver)
+    config.register_member(balance=0, name="", created_at=0)
+    return config
+
+
+async def _timed(coro) -> float:
+    start = time.perf_counter()
+    await coro
+    return time.perf_counter() - start
+
+
+async def bench_backend(
+    backend: drivers.BackendType, path: Path, members: List[Tuple[int, int]], ops: int
+) -> Dict[str, float]:
+    driver_cls = drivers.get_driver_class(backend)
+    storage_details = _storage_details(backend, path)
+    results = {}
+
+    await driver_cls.initialize(**storage_details)
+    config = _get_config(backend, path)
+    data = {}
+    for guild_id, member_id in members:
+        data.setdefault(str(guild_id), {})[str(member_id)] = {
+            "balance": member_id % 1000,
+            "name": f"member{member_id}",
+            "created_at": member_id,
+        }
+    results["fill"] = await _timed(config._get_base_group(Config.MEMBER).set(data))
+    # Drop the config and its driver, so that the JSON backend forgets its cached data.
+    del data, config
+    gc.collect()
+    await driver_cls.teardown()
+
+    await driver_cls.initialize(**storage_details)
+    start = time.perf_counter()
+    config = _get_config(backend, path)
+    guild_id, member_id = members[0]
+    await config.member_from_ids(guild_id, member_id).balance()
+    results["first read"] = time.perf_counter() - start
+
+    sample = random.choices(members, k=ops)
+
+    async def reads():
+        for guild_id, member_id in sample:
+            await config.member_from_ids(guild_id, member_id).balance()
+
+    async def writes():
+        for guild_id, member_id in sample:
+            await config.member_from_ids(guild_id, member_id).balance.set(member_id)
+
+    async def iterate():
+        async for _ in config.iter_members():
+            pass
+
+    results[f"{ops} reads"] = await _timed(reads())
+    results[f"{ops} writes"] = await _timed(writes())
+    results["iterate all"] = await _timed(iterate())
+    await driver_cls.teardown()
+    return results
+
+
+async def main(args: argparse.Namespace) -> None:
+    rng = random.Random(args.seed)
+    members = [(rng.randrange(1, args.guilds + 1), member_id) for member_id in range(args.members)]
+    all_results = {}
+    for name in args.backends:
+        with tempfile.TemporaryDirectory() as tmp:
+            all_results[name] = await bench_backend(BACKENDS[name], Path(tmp), members, args.ops)
+
+    operations = list(next(iter(all_results.values())))
+    print(f"{args.members} members in {args.guilds} guilds, times in seconds")
+    print(f"{'operation':<15}" + "".join(f"{name:>12}" for name in all_results))
+    for operation in operations:
+        print(
+            f"{operation:<15}"
+            + "".join(f"{results[operation]:>12.4f}" for results in all_results.values())
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n", 1)[0])
+    parser.add_argument("--members", type=int, default=100_000)
+    parser.add_argument("--guilds", type=int, default=100)
+    parser.add_argument("--ops", type=int, default=100)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--backends", nargs="+", choices=list(BACKENDS), default=list(BACKENDS))
+    asyncio.run(main(parser.parse_args()))
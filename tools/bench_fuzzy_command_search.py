@@ -0,0 +1,140 @@
+#!/usr/bin/env python3.8
+"""Script to measure the cost of matching an unknown command against the bot's commands.
+
+This is what Red does for every message which starts with a prefix
+but doesn't invoke a command, to suggest similar commands.
+
+What this script does
+---------------------
+The script creates a bot with a temporary JSON data path and registers
+``--commands`` commands in cogs of 20 commands, half of them as
+subcommands of a group. It then makes ``--searches`` search terms: mostly
+command names with a typo in them, the rest random words. Each term is
+matched with ``process.extract()`` over the set of all commands, like
+the fuzzy command search used to do, and then with the bot's prebuilt
+command index. The script checks that both give the same scores, and
+reports the time per search and the time it takes to build the index.
+
+Usage
+-----
+python tools/bench_fuzzy_command_search.py --commands 2000
+"""
+import argparse
+import asyncio
+import random
+import string
+import tempfile
+import time
+
+from fuzzywuzzy import fuzz, process
+
+from redbot.core import commands, data_manager, drivers
+from redbot.core.bot import Red
+from redbot.core.cli import parse_cli_flags
+from redbot.core.utils._internal_utils import CommandIndex
+
+MIN_SCORE = 80
+
+
+async def _callback(self, ctx):
+    pass
+
+
+def _random_word(rng: random.Random) -> str:
+    return "".join(rng.choices(string.ascii_lowercase, k=rng.randint(3, 12)))
+
+
+def _make_typo(rng: random.Random, name: str) -> str:
+    idx = rng.randrange(len(name))
+    action = rng.choice(("drop", "swap", "replace"))
+    if action == "drop":
+        return name[:idx] + name[idx + 1 :]
+    if action == "swap" and idx + 1 < len(name):
+        return name[:idx] + name[idx + 1] + name[idx] + name[idx + 2 :]
+    return name[:idx] + rng.choice(string.ascii_lowercase) + name[idx + 1 :]
+
+
+async def _add_cogs(bot: Red, args: argparse.Namespace, rng: random.Random) -> None:
+    names = set()
+    while len(names) < args.commands:
+        names.add(_random_word(rng))
+    names = sorted(names)
+    for cog_idx, start in enumerate(range(0, len(names), 20)):
+        attrs = {}
+        cog_names = names[start : start + 20]
+        group_name = f"group{cog_idx}"
+        group = commands.Group(_callback, name=group_name)
+        attrs[group_name] = group
+        for idx, name in enumerate(cog_names):
+            if idx % 2:
+                attrs[name] = group.command(name=name)(_callback)
+            else:
+                attrs[name] = commands.Command(_callback, name=name)
+        cog_cls = type(f"Cog{cog_idx}", (commands.Cog,), attrs)
+        await bot.add_cog(cog_cls())
+
+
+def _make_terms(bot: Red, args: argparse.Namespace, rng: random.Random):
+    names = [command.name for command in bot.walk_commands()]
+    return [
+        _make_typo(rng, rng.choice(names)) if rng.random() < 0.8 else _random_word(rng)
+        for _ in range(args.searches)
+    ]
+
+
+def before(bot: Red, terms):
+    results = []
+    for term in terms:
+        choices = set(bot.walk_commands())
+        extracted = process.extract(term, choices, limit=5, scorer=fuzz.QRatio)
+        results.append(sorted(score for command, score in extracted if score >= MIN_SCORE))
+    return results
+
+
+def after(bot: Red, terms):
+    results = []
+    for term in terms:
+        extracted = bot._get_command_index().search(term, MIN_SCORE)[:5]
+        results.append(sorted(score for command, score in extracted))
+    return results
+
+
+def _timed(bench, bot: Red, terms):
+    start = time.perf_counter()
+    results = bench(bot, terms)
+    return (time.perf_counter() - start) / len(terms), results
+
+
+async def main(args: argparse.Namespace) -> None:
+    rng = random.Random(args.seed)
+    with tempfile.TemporaryDirectory() as tmp:
+        data_manager.basic_config = data_manager.basic_config_default.copy()
+        data_manager.basic_config["DATA_PATH"] = tmp
+        data_manager.basic_config["STORAGE_TYPE"] = drivers.BackendType.JSON.value
+        await drivers.JsonDriver.initialize()
+
+        bot = Red(cli_flags=parse_cli_flags(["bench"]))
+        await _add_cogs(bot, args, rng)
+        terms = _make_terms(bot, args, rng)
+
+        start = time.perf_counter()
+        index = CommandIndex(bot.walk_commands())
+        build_time = time.perf_counter() - start
+
+        before_time, before_results = _timed(before, bot, terms)
+        after_time, after_results = _timed(after, bot, terms)
+        assert before_results == after_results, "the index gave different scores"
+
+        print(f"{len(index)} commands, {len(terms)} searches")
+        print(f"building the index: {build_time * 1e3:>8.2f} ms")
+        print(f"process.extract():  {before_time * 1e3:>8.2f} ms/search")
+        print(f"command index:      {after_time * 1e3:>8.2f} ms/search")
+        await drivers.JsonDriver.teardown()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n", 1)[0])
+    parser.add_argument("--commands", type=int, default=2000)
+    parser.add_argument("--searches", type=int, default=500)
+    parser.add_argument("--seed", type=int, default=0)
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3.8
+"""Script to measure how many chat messages per second Red can process.
+
+It runs non-command messages through the same steps as a running bot:
+``Red.process_commands()`` followed by the ``on_message_without_command``
+listeners of Alias and CustomCom, which both look at the message's prefix.
+
+What this script does
+---------------------
+The script creates a bot with a temporary JSON data path, loads Alias and
+CustomCom, and feeds it ``--messages`` fake messages, a mix of plain chat
+and messages which start with a prefix without being commands.
+
+It reports the throughput with and without the bot's cache of parsed
+messages, which lets the listeners reuse the prefix resolution done by
+``process_commands()`` instead of repeating it.
+
+Usage
+-----
+python tools/bench_message_pipeline.py --messages 20000
+"""
+import argparse
+import asyncio
+import tempfile
+import time
+from collections import OrderedDict
+from types import SimpleNamespace
+
+from redbot.core import data_manager, drivers
+from redbot.core.bot import Red
+from redbot.core.cli import parse_cli_flags
+from redbot.cogs.alias import Alias
+from redbot.cogs.customcom import CustomCommands
+
+
+class _NoCache(OrderedDict):
+    def __setitem__(self, key, value):
+        pass
+
+
+def _make_messages(bot: Red, count: int):
+    guild = SimpleNamespace(id=1, me=SimpleNamespace(id=0))
+    channel = SimpleNamespace(id=2, guild=guild)
+    author = SimpleNamespace(id=3, bot=False)
+    contents = ["hello there", "!notacommand with args", "just chatting", "!!what"]
+    return [
+        SimpleNamespace(
+            id=message_id,
+            content=contents[message_id % len(contents)],
+            guild=guild,
+            channel=channel,
+            author=author,
+            _state=bot._connection,
+        )
+        for message_id in range(count)
+    ]
+
+
+async def bench(bot: Red, listeners, messages, *, cache: bool) -> float:
+    bot._parsed_messages = OrderedDict() if cache else _NoCache()
+    start = time.perf_counter()
+    for message in messages:
+        await bot.process_commands(message)
+        for listener in listeners:
+            await listener(message)
+    return len(messages) / (time.perf_counter() - start)
+
+
+async def main(args: argparse.Namespace) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        data_manager.basic_config = data_manager.basic_config_default.copy()
+        data_manager.basic_config["DATA_PATH"] = tmp
+        data_manager.basic_config["STORAGE_TYPE"] = drivers.BackendType.JSON.value
+        await drivers.JsonDriver.initialize()
+
+        bot = Red(cli_flags=parse_cli_flags(["bench", "--prefix", "!", "--prefix", "!!"]))
+        bot._connection.user = SimpleNamespace(id=0)
+        # Listeners are called directly, so that their time is measured.
+        bot.dispatch = lambda *args, **kwargs: None
+        alias = Alias(bot)
+        await alias.cog_load()
+        customcom = CustomCommands(bot)
+        listeners = (alias.on_message_without_command, customcom.on_message_without_command)
+
+        messages = _make_messages(bot, args.messages)
+        # Warm up the settings caches.
+        await bench(bot, listeners, messages[:100], cache=False)
+        without_cache = await bench(bot, listeners, messages, cache=False)
+        with_cache = await bench(bot, listeners, messages, cache=True)
+
+        print(f"{args.messages} messages")
+        print(f"without parsed message cache: {without_cache:>10.0f} messages/s")
+        print(f"with parsed message cache:    {with_cache:>10.0f} messages/s")
+        await drivers.JsonDriver.teardown()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n", 1)[0])
+    parser.add_argument("--messages", type=int, default=20000)
+    asyncio.run(main(parser.parse_args()))
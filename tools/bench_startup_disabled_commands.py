@@ -0,0 +1,109 @@
+#!/usr/bin/env python3.8
+"""Script to measure how long applying disabled commands takes at startup.
+
+Every command added to the bot has to be disabled in the guilds which
+disabled it, which used to require reading the data of all guilds for
+each command.
+
+What this script does
+---------------------
+The script creates a bot with a temporary JSON data path, stores data for
+``--guilds`` guilds which each disabled a few of ``--commands`` commands,
+and then times applying the disabled commands to all of the commands:
+    - the way ``on_command_add`` used to, reading all guild data per command,
+    - with the bot's disabled command index, which reads it only once.
+
+It checks that both approaches disabled the same commands in the same guilds.
+
+Usage
+-----
+python tools/bench_startup_disabled_commands.py --guilds 5000 --commands 300
+"""
+import argparse
+import asyncio
+import random
+import tempfile
+import time
+
+import discord
+
+from redbot.core import commands, data_manager, drivers
+from redbot.core.bot import Red
+from redbot.core.cli import parse_cli_flags
+from redbot.core.config import Config
+from redbot.core.settings_caches import DisabledCommandCache
+
+
+def _make_commands(count: int):
+    async def callback(ctx):
+        pass
+
+    return [commands.command(name=f"command{idx}")(callback) for idx in range(count)]
+
+
+def _disabled_in(command_list):
+    # The checks added by `Command.disable_in()` are shared between commands.
+    return {command.qualified_name: set(command.checks) for command in command_list}
+
+
+async def before(bot: Red, command_list) -> None:
+    for command in command_list:
+        disabled_commands = await bot._config.disabled_commands()
+        if command.qualified_name in disabled_commands:
+            command.enabled = False
+        guild_data = await bot._config.all_guilds()
+        for guild_id, data in guild_data.items():
+            disabled_commands = data.get("disabled_commands", [])
+            if command.qualified_name in disabled_commands:
+                command.disable_in(discord.Object(id=guild_id))
+
+
+async def after(bot: Red, command_list) -> None:
+    cache = DisabledCommandCache(bot._config)
+    for command in command_list:
+        if await cache.disabled_globally(command.qualified_name):
+            command.enabled = False
+        for guild_id in await cache.get_guilds_disabled_in(command.qualified_name):
+            command.disable_in(discord.Object(id=guild_id))
+
+
+async def main(args: argparse.Namespace) -> None:
+    rng = random.Random(args.seed)
+    with tempfile.TemporaryDirectory() as tmp:
+        data_manager.basic_config = data_manager.basic_config_default.copy()
+        data_manager.basic_config["DATA_PATH"] = tmp
+        data_manager.basic_config["STORAGE_TYPE"] = drivers.BackendType.JSON.value
+        await drivers.JsonDriver.initialize()
+
+        bot = Red(cli_flags=parse_cli_flags(["bench"]))
+        names = [f"command{idx}" for idx in range(args.commands)]
+        guild_data = {
+            str(guild_id): {
+                "prefix": ["!"],
+                "admin_role": [guild_id * 10],
+                "disabled_commands": rng.sample(names, rng.randrange(0, 4)),
+            }
+            for guild_id in range(1, args.guilds + 1)
+        }
+        await bot._config._get_base_group(Config.GUILD).set(guild_data)
+
+        results = {}
+        for name, bench in (("before", before), ("after", after)):
+            command_list = _make_commands(args.commands)
+            start = time.perf_counter()
+            await bench(bot, command_list)
+            results[name] = (time.perf_counter() - start, _disabled_in(command_list))
+        assert results["before"][1] == results["after"][1], "the disabled commands differ"
+
+        print(f"{args.commands} commands, {args.guilds} guilds")
+        print(f"all guild data per command: {results['before'][0]:>10.3f}s")
+        print(f"disabled command index:     {results['after'][0]:>10.3f}s")
+        await drivers.JsonDriver.teardown()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n", 1)[0])
+    parser.add_argument("--guilds", type=int, default=5000)
+    parser.add_argument("--commands", type=int, default=300)
+    parser.add_argument("--seed", type=int, default=0)
+    asyncio.run(main(parser.parse_args()))